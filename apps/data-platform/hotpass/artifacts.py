@@ -3,13 +3,128 @@
 from __future__ import annotations
 
 import hashlib
+import io
+import json
 import logging
+import os
+import tarfile
+import uuid
 import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import IO, cast
+
+try:  # pragma: no cover - optional dependency guard
+    import zstandard
+except ImportError:  # pragma: no cover - tar.zst archives are unavailable
+    ZSTANDARD_AVAILABLE = False
+else:
+    ZSTANDARD_AVAILABLE = True
 
 logger = logging.getLogger(__name__)
 
+ARCHIVE_FORMATS = ("zip", "tar.zst")
+MANIFEST_NAME = "manifest.json"
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """A file packaged into an archive, hashed while it was written."""
+
+    name: str
+    size: int
+    sha256: str
+
+
+class _HashingReader:
+    """File wrapper hashing every chunk as it is read by an archive writer."""
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._handle.read(size)
+        self._digest.update(data)
+        self.size += len(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def _copy_hashed(source: Path, target: IO[bytes], name: str) -> ArchiveMember:
+    with source.open("rb") as handle:
+        reader = _HashingReader(handle)
+        while chunk := reader.read(CHUNK_SIZE):
+            target.write(chunk)
+    return ArchiveMember(name=name, size=reader.size, sha256=reader.hexdigest())
+
+
+class _ZipWriter:
+    def __init__(self, path: Path) -> None:
+        self._zip = zipfile.ZipFile(path, mode="w", compression=zipfile.ZIP_DEFLATED)
+
+    def add_file(self, source: Path, name: str) -> ArchiveMember:
+        info = zipfile.ZipInfo.from_file(source, name)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with self._zip.open(info, mode="w", force_zip64=True) as entry:
+            return _copy_hashed(source, entry, name)
+
+    def add_bytes(self, name: str, data: bytes) -> None:
+        self._zip.writestr(name, data)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class _TarZstdWriter:
+    def __init__(self, path: Path, *, level: int | None, threads: int) -> None:
+        if not ZSTANDARD_AVAILABLE:
+            msg = "tar.zst archives require the 'zstandard' package"
+            raise RuntimeError(msg)
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=threads)
+        # The compression writer is file-like; typing it as IO[bytes] lets tarfile accept it.
+        self._stream = cast(IO[bytes], compressor.stream_writer(path.open("wb")))
+        self._tar = tarfile.open(fileobj=self._stream, mode="w|")
+
+    def add_file(self, source: Path, name: str) -> ArchiveMember:
+        info = self._tar.gettarinfo(str(source), arcname=name)
+        with source.open("rb") as handle:
+            reader = _HashingReader(handle)
+            self._tar.addfile(info, fileobj=reader)
+        return ArchiveMember(name=name, size=reader.size, sha256=reader.hexdigest())
+
+    def add_bytes(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(datetime.now(UTC).timestamp())
+        self._tar.addfile(info, fileobj=io.BytesIO(data))
+
+    def close(self) -> None:
+        self._tar.close()
+        self._stream.close()
+
+
+@contextmanager
+def _open_archive(
+    path: Path, archive_format: str, *, level: int | None, threads: int
+) -> Iterator[_ZipWriter | _TarZstdWriter]:
+    writer = (
+        _ZipWriter(path)
+        if archive_format == "zip"
+        else _TarZstdWriter(path, level=level, threads=threads)
+    )
+    try:
+        yield writer
+    finally:
+        writer.close()
+
 
 def create_refined_archive(
     excel_path: Path,
@@ -19,8 +134,17 @@ def create_refined_archive(
     checksum_prefix_length: int = 12,
     include_version_metadata: bool = False,
     version_metadata_path: Path | None = None,
+    archive_format: str = "zip",
+    compression_level: int | None = None,
+    compression_threads: int = -1,
 ) -> Path:
-    """Package the refined Excel output into a timestamped, checksum-stamped zip archive.
+    """Package the refined Excel output into a timestamped, checksum-stamped archive.
+
+    Each file is read once, in chunks, and hashed as it is compressed, so
+    multi-gigabyte outputs are never held in memory. The archive is written
+    under a temporary name and renamed once the checksum for its final name is
+    known. Besides ``SHA256SUMS`` it carries a ``manifest.json`` listing the
+    size and full SHA256 of every packaged file.
 
     Parameters
     ----------
@@ -37,33 +161,53 @@ def create_refined_archive(
         Whether to include version metadata in the archive.
     version_metadata_path:
         Optional path to version metadata file to include in archive.
+    archive_format:
+        ``"zip"`` (deflate) or ``"tar.zst"``, which needs the ``zstandard`` package.
+    compression_level:
+        zstd level for ``tar.zst`` archives; zstd's default of 3 when omitted.
+    compression_threads:
+        zstd worker threads for ``tar.zst`` archives; ``-1`` uses every CPU and
+        ``0`` compresses on the calling thread.
     """
 
+    if archive_format not in ARCHIVE_FORMATS:
+        msg = f"Unsupported archive format '{archive_format}'; expected one of {ARCHIVE_FORMATS}"
+        raise ValueError(msg)
+
     if not excel_path.exists():  # pragma: no cover - defensive guard
         msg = f"Refined workbook not found at {excel_path}"
         raise FileNotFoundError(msg)
 
     archive_dir.mkdir(parents=True, exist_ok=True)
 
-    excel_bytes = excel_path.read_bytes()
-    checksum = hashlib.sha256(excel_bytes).hexdigest()[:checksum_prefix_length]
-
     if timestamp is None:
         timestamp = datetime.now(UTC)
     timestamp_label = timestamp.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
 
-    archive_name = f"refined-data-{timestamp_label}-{checksum}.zip"
-    archive_path = archive_dir / archive_name
-
-    with zipfile.ZipFile(archive_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file:
-        zip_file.write(excel_path, excel_path.name)
-        zip_file.writestr("SHA256SUMS", f"{checksum}  {excel_path.name}\n")
-
-        if include_version_metadata and version_metadata_path and version_metadata_path.exists():
-            zip_file.write(version_metadata_path, "version.json")
-            logger.info(f"Included version metadata in archive from {version_metadata_path}")
+    version_path = version_metadata_path if include_version_metadata else None
+    temp_path = archive_dir / f".refined-data-{timestamp_label}.{uuid.uuid4().hex}.partial"
+    try:
+        with _open_archive(
+            temp_path, archive_format, level=compression_level, threads=compression_threads
+        ) as archive:
+            members = [archive.add_file(excel_path, excel_path.name)]
+            checksum = members[0].sha256[:checksum_prefix_length]
+            archive.add_bytes("SHA256SUMS", f"{checksum}  {excel_path.name}\n".encode())
+
+            if version_path is not None and version_path.exists():
+                members.append(archive.add_file(version_path, "version.json"))
+                logger.info(f"Included version metadata in archive from {version_path}")
+
+            manifest = {"algorithm": "sha256", "files": [asdict(member) for member in members]}
+            archive.add_bytes(MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+
+        archive_path = archive_dir / f"refined-data-{timestamp_label}-{checksum}.{archive_format}"
+        os.replace(temp_path, archive_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
     return archive_path
 
 
-__all__ = ["create_refined_archive"]
+__all__ = ["ARCHIVE_FORMATS", "ArchiveMember", "create_refined_archive"]
@@ -11,6 +11,7 @@ import pandas as pd
 from rich.console import Console
 from rich.table import Table
 
+from ...pipeline.conflicts import query_conflicts
 from ..builder import CLICommand, SharedParsers
 from ..configuration import CLIProfile
 
@@ -49,6 +50,11 @@ def build(
         required=True,
         help="Row index (0-based) or identifier from the dataset's 'id' column",
     )
+    parser.add_argument(
+        "--conflicts",
+        type=Path,
+        help="Conflict ledger (Arrow IPC) to search for the row's organisation slug",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -89,6 +95,12 @@ def _command_handler(namespace: argparse.Namespace, profile: CLIProfile | None)
         return 1
 
     payload = _build_payload(row_identifier, row_index, row)
+    if namespace.conflicts is not None:
+        try:
+            payload["conflicts"] = _row_conflicts(namespace.conflicts, row)
+        except ValueError as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            return 1
 
     if namespace.output:
         namespace.output.parent.mkdir(parents=True, exist_ok=True)
@@ -154,6 +166,24 @@ def _build_payload(row_identifier: str, row_index: int, row: pd.Series) -> dict[
     return payload
 
 
+def _row_conflicts(ledger_path: Path, row: pd.Series) -> list[dict[str, Any]]:
+    if not ledger_path.exists():
+        raise ValueError(f"Conflict ledger not found: {ledger_path}")
+    slug = row.get("organization_slug")
+    if slug is None or pd.isna(slug):
+        return []
+    frame = query_conflicts(ledger_path, slug=str(slug))
+    return [
+        {
+            "field": entry["field"],
+            "chosen_source": entry["chosen_source"],
+            "value": entry["value"],
+            "alternatives": entry["alternatives"],
+        }
+        for entry in frame.to_dicts()
+    ]
+
+
 def _render_table(console: Console, payload: dict[str, Any]) -> None:
     console.print(
         f"[cyan]Row:[/cyan] {payload.get('row_id')} "
@@ -171,3 +201,19 @@ def _render_table(console: Console, payload: dict[str, Any]) -> None:
     for key, value in provenance.items():
         table.add_row(key, str(value))
     console.print(table)
+
+    conflicts = payload.get("conflicts")
+    if isinstance(conflicts, list) and conflicts:
+        conflict_table = Table(title="Resolved conflicts")
+        conflict_table.add_column("Field", style="magenta")
+        conflict_table.add_column("Chosen Source", style="cyan")
+        conflict_table.add_column("Value", style="white")
+        conflict_table.add_column("Alternatives", justify="right")
+        for conflict in conflicts:
+            conflict_table.add_row(
+                str(conflict.get("field")),
+                str(conflict.get("chosen_source")),
+                str(conflict.get("value")),
+                str(len(conflict.get("alternatives") or [])),
+            )
+        console.print(conflict_table)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 from collections.abc import Iterable, Mapping
@@ -57,6 +56,9 @@ LEGACY_PIPELINE_KEYS: frozenset[str] = frozenset(
         "excel_chunk_size",
         "excel_engine",
         "excel_stage_dir",
+        "excel_columnar",
+        "excel_max_workers",
+        "excel_contract_engine",
         "qa_mode",
         "observability",
         "sensitive_fields",
@@ -257,10 +259,7 @@ def _command_handler(namespace: argparse.Namespace, profile: CLIProfile | None)
 
                 if options.party_store_path is not None and result.party_store is not None:
                     options.party_store_path.parent.mkdir(parents=True, exist_ok=True)
-                    payload = result.party_store.as_dict()
-                    options.party_store_path.write_text(
-                        json.dumps(payload, indent=2), encoding="utf-8"
-                    )
+                    result.party_store.write_json(options.party_store_path)
                     logger.log_party_store(options.party_store_path)
 
                 if (
@@ -318,7 +317,11 @@ def _command_handler(namespace: argparse.Namespace, profile: CLIProfile | None)
 
                 if config.pipeline.archive:
                     config.pipeline.dist_dir.mkdir(parents=True, exist_ok=True)
-                    archive_path = create_refined_archive(output_path, config.pipeline.dist_dir)
+                    archive_path = create_refined_archive(
+                        output_path,
+                        config.pipeline.dist_dir,
+                        archive_format=config.pipeline.archive_format,
+                    )
                     logger.log_archive(archive_path)
                     lineage_outputs = build_output_datasets(base_config.output_path, archive_path)
             except DataContractError as exc:
@@ -498,6 +501,12 @@ def _resolve_options(namespace: argparse.Namespace, profile: CLIProfile | None)
         pipeline_updates["excel_engine"] = namespace.excel_engine
     if getattr(namespace, "excel_stage_dir", None) is not None:
         pipeline_updates["excel_stage_dir"] = Path(namespace.excel_stage_dir)
+    if getattr(namespace, "excel_columnar", None):
+        pipeline_updates["excel_columnar"] = True
+    if getattr(namespace, "excel_workers", None) is not None:
+        pipeline_updates["excel_max_workers"] = int(namespace.excel_workers)
+    if getattr(namespace, "excel_contract_engine", None):
+        pipeline_updates["excel_contract_engine"] = namespace.excel_contract_engine
     if getattr(namespace, "qa_mode", None) is not None:
         pipeline_updates["qa_mode"] = namespace.qa_mode
     if getattr(namespace, "observability", None) is not None:
@@ -505,6 +514,14 @@ def _resolve_options(namespace: argparse.Namespace, profile: CLIProfile | None)
         telemetry_updates["enabled"] = bool(namespace.observability)
     if getattr(namespace, "archive", None) is not None:
         pipeline_updates["archive"] = bool(namespace.archive)
+    if getattr(namespace, "archive_format", None):
+        pipeline_updates["archive_format"] = namespace.archive_format
+    if getattr(namespace, "incremental", None):
+        pipeline_updates["incremental"] = True
+    if getattr(namespace, "incremental_state_dir", None) is not None:
+        pipeline_updates["incremental_state_dir"] = Path(namespace.incremental_state_dir)
+    if getattr(namespace, "strict_ge", None):
+        pipeline_updates["strict_ge"] = True
 
     if "timeout" not in automation_http_updates:
         env_timeout = os.getenv("HOTPASS_AUTOMATION_HTTP_TIMEOUT")
@@ -57,6 +57,7 @@ _PERFORMANCE_FIELDS: list[tuple[str, str]] = [
     ("Load seconds", "load_seconds"),
     ("Aggregation seconds", "aggregation_seconds"),
     ("Expectations seconds", "expectations_seconds"),
+    ("Expectations setup seconds", "expectations_setup_seconds"),
     ("Write seconds", "write_seconds"),
     ("Total seconds", "total_seconds"),
     ("Rows per second", "rows_per_second"),
@@ -276,6 +276,30 @@ def make_pipeline_parser() -> argparse.ArgumentParser:
         action="store_false",
         help="Disable archive packaging even if configured by profiles",
     )
+    parser.add_argument(
+        "--archive-format",
+        choices=["zip", "tar.zst"],
+        help="Archive format; tar.zst uses multithreaded zstd and needs 'zstandard'",
+    )
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        default=None,
+        help="Only re-read changed workbooks and re-aggregate changed organisations",
+    )
+    parser.add_argument(
+        "--incremental-state-dir",
+        type=Path,
+        help="Directory holding the incremental checkpoint (default: <dist-dir>/incremental)",
+    )
+    parser.add_argument(
+        "--strict-ge",
+        dest="strict_ge",
+        action="store_true",
+        default=None,
+        help="Also run Great Expectations and report its results (parity/audit mode)",
+    )
     parser.set_defaults(archive=None, automation_http_dead_letter_enabled=None)
     return parser
 
@@ -304,7 +328,7 @@ def make_excel_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--excel-chunk-size",
         type=int,
-        help="Chunk size for streaming Excel sheets (enables chunked reading)",
+        help="Stream Excel sheets in one read-only pass and validate them in batches of N rows",
     )
     parser.add_argument(
         "--excel-engine",
@@ -315,6 +339,22 @@ def make_excel_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Directory to stage chunked Excel reads to parquet for reuse",
     )
+    parser.add_argument(
+        "--excel-columnar",
+        action="store_true",
+        default=None,
+        help="Build source records with the columnar (Polars) loaders instead of row iteration",
+    )
+    parser.add_argument(
+        "--excel-workers",
+        type=int,
+        help="Read and validate Excel sheets across N worker processes",
+    )
+    parser.add_argument(
+        "--excel-contract-engine",
+        choices=["polars", "frictionless"],
+        help="Engine used to validate sheets against their table schemas (frictionless for audits)",
+    )
     return parser
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import (
     AnyHttpUrl,
@@ -25,6 +25,32 @@ from hotpass.aws import resolve_localstack_endpoint, resolve_s3_endpoint
 from hotpass.compliance import DataClassification, LawfulBasis, PIIRedactionConfig
 
 
+class SurvivorshipSettings(BaseModel):
+    """Declarative source priorities used when aggregation picks surviving values.
+
+    ``fields`` maps SSOT fields such as ``contact_primary_email`` to priorities
+    that override ``source_priorities`` for that field only. When
+    ``source_priorities`` is empty the built-in aviation ranking applies.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    source_priorities: Mapping[str, int] = Field(default_factory=dict)
+    fields: Mapping[str, Mapping[str, int]] = Field(default_factory=dict)
+
+    def to_policy(self) -> Any:
+        """Compile the rules into a ``SurvivorshipPolicy`` for the aggregation engines."""
+
+        from hotpass.pipeline.survivorship import SurvivorshipPolicy
+
+        if not self.source_priorities:
+            return SurvivorshipPolicy(field_priorities=dict(self.fields))
+        return SurvivorshipPolicy(
+            source_priorities=dict(self.source_priorities),
+            field_priorities=dict(self.fields),
+        )
+
+
 class ProfileConfig(BaseModel):
     """Industry profile describing terminology, validation, and synonyms."""
 
@@ -55,6 +81,7 @@ class ProfileConfig(BaseModel):
     phone_validation_threshold: float = 0.85
     website_validation_threshold: float = 0.75
     source_priorities: Mapping[str, int] = Field(default_factory=dict)
+    survivorship: SurvivorshipSettings | None = None
     column_synonyms: Mapping[str, Sequence[str]] = Field(default_factory=dict)
     required_fields: Sequence[str] = Field(default_factory=list)
     optional_fields: Sequence[str] = Field(default_factory=list)
@@ -346,9 +373,11 @@ class PipelineRuntimeConfig(BaseModel):
     output_path: Path = Field(default_factory=lambda: Path.cwd() / "dist" / "refined.xlsx")
     dist_dir: Path = Field(default_factory=lambda: Path.cwd() / "dist")
     archive: bool = False
+    archive_format: Literal["zip", "tar.zst"] = "zip"
     backfill: bool = False
     incremental: bool = False
     since: datetime | None = None
+    incremental_state_dir: Path | None = None
     run_id: str | None = None
     expectation_suite: str = "default"
     country_code: str = "ZA"
@@ -360,6 +389,26 @@ class PipelineRuntimeConfig(BaseModel):
     excel_chunk_size: int | None = Field(default=None, ge=1)
     excel_engine: str | None = None
     excel_stage_dir: Path | None = None
+    excel_columnar: bool = False
+    excel_max_workers: int | None = Field(default=None, ge=1)
+    excel_contract_engine: Literal["polars", "frictionless"] = "polars"
+    phone_cache_path: Path | None = None
+    aggregation_engine: Literal["polars", "python"] = "polars"
+    aggregation_workers: Annotated[int, Field(ge=1)] | Literal["auto"] | None = None
+    conflict_ledger_path: Path | None = None
+    survivorship: SurvivorshipSettings | None = None
+    validation_backend: Literal["pandas", "polars"] = "pandas"
+    strict_ge: bool = False
+    ge_audit_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    duckdb_threads: int | None = Field(default=None, ge=1)
+    duckdb_memory_limit: str | None = None
+    duckdb_temp_directory: Path | None = None
+    excel_writer: Literal["openpyxl", "xlsxwriter"] = "openpyxl"
+    export_workers: int | None = Field(default=None, ge=1)
+    parquet_partition_by: tuple[str, ...] = Field(default_factory=tuple)
+    parquet_sort_by: tuple[str, ...] = Field(default_factory=tuple)
+    parquet_row_group_size: int | None = Field(default=None, ge=1)
+    parquet_bloom_filters: bool = False
     sensitive_fields: tuple[str, ...] = Field(default_factory=tuple)
     observability: bool | None = None
     acquisition: AcquisitionSettings | None = None
@@ -389,9 +438,11 @@ class PipelineRuntimeConfig(BaseModel):
                     normalised.append(cleaned)
         return tuple(normalised)
 
-    @field_validator("intent_webhooks", mode="before")
+    @field_validator(
+        "intent_webhooks", "parquet_partition_by", "parquet_sort_by", mode="before"
+    )
     @classmethod
-    def _normalise_webhooks(cls, values: Iterable[str] | str | None) -> tuple[str, ...]:
+    def _normalise_strings(cls, values: Iterable[str] | str | None) -> tuple[str, ...]:
         if values is None:
             return ()
         if isinstance(values, str):
@@ -577,12 +628,18 @@ class HotpassConfig(BaseModel):
             self.pipeline.excel_chunk_size
             or self.pipeline.excel_engine
             or self.pipeline.excel_stage_dir is not None
+            or self.pipeline.excel_columnar
+            or self.pipeline.excel_max_workers
+            or self.pipeline.excel_contract_engine != "polars"
         ):
             excel_options = ExcelReadOptions(
                 chunk_size=self.pipeline.excel_chunk_size,
                 engine=self.pipeline.excel_engine,
                 stage_to_parquet=self.pipeline.excel_stage_dir is not None,
                 stage_dir=self.pipeline.excel_stage_dir,
+                columnar=self.pipeline.excel_columnar,
+                max_workers=self.pipeline.excel_max_workers,
+                contract_engine=self.pipeline.excel_contract_engine,
             )
 
         industry_profile: IndustryProfile | None = None
@@ -601,8 +658,30 @@ class HotpassConfig(BaseModel):
             backfill=self.pipeline.backfill,
             incremental=self.pipeline.incremental,
             since=self.pipeline.since,
+            incremental_state_dir=self.pipeline.incremental_state_dir,
             run_id=self.pipeline.run_id,
             dist_dir=self.pipeline.dist_dir,
+            phone_cache_path=self.pipeline.phone_cache_path,
+            aggregation_engine=self.pipeline.aggregation_engine,
+            aggregation_workers=self.pipeline.aggregation_workers,
+            conflict_ledger_path=self.pipeline.conflict_ledger_path,
+            survivorship_policy=(
+                self.pipeline.survivorship.to_policy()
+                if self.pipeline.survivorship is not None
+                else None
+            ),
+            validation_backend=self.pipeline.validation_backend,
+            strict_ge=self.pipeline.strict_ge,
+            ge_audit_rate=self.pipeline.ge_audit_rate,
+            duckdb_threads=self.pipeline.duckdb_threads,
+            duckdb_memory_limit=self.pipeline.duckdb_memory_limit,
+            duckdb_temp_directory=self.pipeline.duckdb_temp_directory,
+            excel_writer=self.pipeline.excel_writer,
+            export_workers=self.pipeline.export_workers,
+            parquet_partition_by=list(self.pipeline.parquet_partition_by),
+            parquet_sort_by=list(self.pipeline.parquet_sort_by),
+            parquet_row_group_size=self.pipeline.parquet_row_group_size,
+            parquet_bloom_filters=self.pipeline.parquet_bloom_filters,
         )
 
         config.automation_http = self.pipeline.automation_http.to_dataclass()
@@ -5,9 +5,12 @@ from __future__ import annotations
 from .datasets import DATASET_BY_NAME, DATASET_CONTRACTS
 from .generator import regenerate_json_schemas, regenerate_reference_doc
 from .types import ContractRowModel, DatasetContract, FieldContract, render_reference_markdown
+from .validator import ContractIssue, ContractValidator
 
 __all__ = [
+    "ContractIssue",
     "ContractRowModel",
+    "ContractValidator",
     "DatasetContract",
     "FieldContract",
     "DATASET_CONTRACTS",
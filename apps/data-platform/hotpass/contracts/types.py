@@ -9,13 +9,16 @@ from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import pandas as pd
 import pandera as pa
 from pydantic import BaseModel, ConfigDict, Field, create_model
 from pydantic.fields import FieldInfo
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .validator import ContractValidator
+
 __all__ = [
     "FieldContract",
     "DatasetContract",
@@ -72,6 +75,8 @@ class FieldContract:
     description: str | None = None
     example: Any | None = None
     python_name: str | None = None
+    enum: tuple[Any, ...] | None = None
+    pattern: str | None = None
 
     def resolved_python_name(self) -> str:
         if self.python_name:
@@ -80,8 +85,15 @@ class FieldContract:
 
     def to_frictionless(self) -> dict[str, Any]:
         payload: dict[str, Any] = {"name": self.name, "type": self.field_type}
+        constraints: dict[str, Any] = {}
         if self.required:
-            payload["constraints"] = {"required": True}
+            constraints["required"] = True
+        if self.pattern is not None:
+            constraints["pattern"] = self.pattern
+        if self.enum is not None:
+            constraints["enum"] = list(self.enum)
+        if constraints:
+            payload["constraints"] = constraints
         if self.description:
             payload["description"] = self.description
         return payload
@@ -100,6 +112,7 @@ class DatasetContract:
     schema_filename: str | None = None
     _row_model: type[ContractRowModel] | None = field(init=False, default=None, repr=False)
     _dataframe_schema: pa.DataFrameSchema | None = field(init=False, default=None, repr=False)
+    _validator: ContractValidator | None = field(init=False, default=None, repr=False)
 
     def __post_init__(self) -> None:
         if not self.schema_filename:
@@ -173,6 +186,50 @@ class DatasetContract:
         object.__setattr__(self, "_dataframe_schema", schema)
         return schema
 
+    @property
+    def validator(self) -> ContractValidator:
+        """Return a cached vectorised validator compiled from this contract."""
+
+        cached = object.__getattribute__(self, "_validator")
+        if cached is not None:
+            return cast("ContractValidator", cached)
+
+        from .validator import ContractValidator
+
+        validator = ContractValidator(self)
+        object.__setattr__(self, "_validator", validator)
+        return validator
+
+    @classmethod
+    def from_frictionless(cls, descriptor: Mapping[str, Any]) -> DatasetContract:
+        """Build a contract from a Frictionless Table Schema mapping."""
+
+        fields: list[FieldContract] = []
+        for payload in descriptor.get("fields", []):
+            constraints = payload.get("constraints", {})
+            enum = constraints.get("enum")
+            fields.append(
+                FieldContract(
+                    name=payload["name"],
+                    field_type=payload.get("type", "string"),
+                    required=bool(constraints.get("required", False)),
+                    description=payload.get("description"),
+                    enum=tuple(enum) if enum is not None else None,
+                    pattern=constraints.get("pattern"),
+                )
+            )
+        primary_key = descriptor.get("primaryKey", [])
+        if isinstance(primary_key, str):
+            primary_key = [primary_key]
+        name = str(descriptor.get("name", "dataset"))
+        return cls(
+            name=name,
+            title=str(descriptor.get("title", name)),
+            description=str(descriptor.get("description", "")),
+            primary_key=tuple(primary_key),
+            fields=tuple(fields),
+        )
+
     def to_frictionless(self) -> dict[str, Any]:
         """Serialise the contract to a Frictionless Table Schema mapping."""
 
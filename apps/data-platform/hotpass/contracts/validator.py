@@ -0,0 +1,403 @@
+"""Vectorised validation of dataframes against dataset contracts.
+
+:class:`ContractValidator` compiles a :class:`~hotpass.contracts.types.DatasetContract`
+into Polars expressions and reports the same issues the frictionless table
+validator raises for inline records (type errors, ``required``/``enum``/
+``pattern`` constraints, blank rows and primary-key violations) without
+materialising a Python dict per row.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .types import DatasetContract, FieldContract
+
+__all__ = ["ContractIssue", "ContractValidator", "DEFAULT_ISSUE_LIMIT"]
+
+DEFAULT_ISSUE_LIMIT = 1000
+"""Maximum issues reported per table, matching frictionless' ``limit_errors``."""
+
+_MISSING_VALUES = frozenset({""})
+_BOOLEAN_VALUES = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "1": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+    "0": False,
+}
+_KEY_DTYPES: dict[str, pl.DataType] = {
+    "string": pl.String(),
+    "number": pl.Float64(),
+    "integer": pl.Float64(),
+    "boolean": pl.Boolean(),
+}
+_ISSUE_SCHEMA = {
+    "row": pl.Int64,
+    "order": pl.Int64,
+    "code": pl.String,
+    "note": pl.String,
+    "field": pl.String,
+}
+
+_ValueReader = Callable[[Any], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ContractIssue:
+    """A single contract violation, numbered like frictionless rows (header is row 1)."""
+
+    code: str
+    note: str
+    row_number: int | None = None
+    field_name: str | None = None
+
+
+def _read_string(value: Any) -> Any:
+    return value if isinstance(value, str) else None
+
+
+def _read_number(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return float(Decimal(value.strip()))
+        except (InvalidOperation, ValueError):
+            return None
+    if value is True or value is False:
+        return None
+    if isinstance(value, int | float | Decimal | np.integer | np.floating):
+        return float(value)
+    return None
+
+
+def _read_integer(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return float(int(value.strip()))
+        except ValueError:
+            return None
+    if value is True or value is False:
+        return None
+    if isinstance(value, int | np.integer):
+        return float(value)
+    if isinstance(value, float | np.floating) and float(value).is_integer():
+        return float(value)
+    if isinstance(value, Decimal) and value.is_finite() and value % 1 == 0:
+        return float(value)
+    return None
+
+
+def _read_boolean(value: Any) -> Any:
+    if value is True or value is False:
+        return value
+    if isinstance(value, str):
+        return _BOOLEAN_VALUES.get(value)
+    return None
+
+
+_VALUE_READERS: dict[str, _ValueReader] = {
+    "string": _read_string,
+    "number": _read_number,
+    "integer": _read_integer,
+    "boolean": _read_boolean,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledField:
+    index: int
+    name: str
+    field_type: str
+    required: bool
+    reader: _ValueReader
+    pattern: re.Pattern[str] | None
+    pattern_note: str | None
+    enum: tuple[Any, ...] | None
+    enum_note: str | None
+
+    @property
+    def type_note(self) -> str:
+        return f'type is "{self.field_type}/default"'
+
+    def read(self, column: pd.Series | None, height: int) -> pl.DataFrame:
+        """Return ``missing``/``type_error``/``value`` columns for ``column``."""
+
+        if column is None:
+            return pl.DataFrame(
+                {
+                    "missing": pl.repeat(True, height, eager=True),
+                    "type_error": pl.repeat(False, height, eager=True),
+                    "value": pl.repeat(
+                        None, height, dtype=_KEY_DTYPES[self.field_type], eager=True
+                    ),
+                }
+            )
+        # Mirror the sanitising step applied before frictionless sees the data.
+        column = column.where(pd.notnull(column), None)
+        if self.field_type == "string":
+            column = column.astype("string")
+            values = pl.from_pandas(column).cast(pl.String)
+            missing = values.is_null() | (values == "")
+            return pl.DataFrame(
+                {
+                    "missing": missing,
+                    "type_error": pl.repeat(False, height, eager=True),
+                    "value": _mask(values, missing),
+                }
+            )
+        numeric = isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf"
+        if numeric and self.field_type in {"number", "integer"}:
+            numbers = pl.Series(column.to_numpy(dtype=np.float64))
+            valid = (
+                pl.repeat(True, height, eager=True)
+                if self.field_type == "number" or column.dtype.kind in "iu"
+                else numbers.is_finite() & (numbers == numbers.floor())
+            )
+            return pl.DataFrame(
+                {
+                    "missing": pl.repeat(False, height, eager=True),
+                    "type_error": ~valid,
+                    "value": _mask(numbers, ~valid),
+                }
+            )
+        return self._read_cells(column.tolist())
+
+    def _read_cells(self, cells: Sequence[Any]) -> pl.DataFrame:
+        cache: dict[tuple[type, Any], tuple[bool, bool, Any]] = {}
+        missing: list[bool] = []
+        type_error: list[bool] = []
+        values: list[Any] = []
+        for cell in cells:
+            try:
+                key: Any = (type(cell), cell)
+                result = cache.get(key)
+            except TypeError:
+                key, result = None, None
+            if result is None:
+                if cell is None or str(cell) in _MISSING_VALUES:
+                    result = (True, False, None)
+                else:
+                    value = self.reader(cell)
+                    result = (False, value is None, value)
+                if key is not None:
+                    cache[key] = result
+            missing.append(result[0])
+            type_error.append(result[1])
+            values.append(result[2])
+        return pl.DataFrame(
+            {
+                "missing": pl.Series(missing, dtype=pl.Boolean),
+                "type_error": pl.Series(type_error, dtype=pl.Boolean),
+                "value": pl.Series(values, dtype=_KEY_DTYPES[self.field_type]),
+            }
+        )
+
+    def constraint_flags(self, cells: pl.DataFrame) -> list[tuple[str, pl.Series]]:
+        """Return ``(note, failing mask)`` pairs in frictionless constraint order."""
+
+        flags: list[tuple[str, pl.Series]] = []
+        checked = ~cells["missing"] & ~cells["type_error"]
+        if self.required:
+            flags.append(('constraint "required" is "True"', cells["missing"]))
+        if self.pattern is not None and self.pattern_note is not None:
+            pattern = self.pattern
+            distinct = cells["value"].drop_nulls().unique().to_list()
+            failing = [value for value in distinct if not pattern.match(value)]
+            flags.append((self.pattern_note, checked & cells["value"].is_in(failing)))
+        if self.enum is not None and self.enum_note is not None:
+            allowed = list(self.enum)
+            flags.append((self.enum_note, checked & ~cells["value"].is_in(allowed)))
+        return flags
+
+
+def _compile_field(index: int, field: FieldContract) -> _CompiledField:
+    reader = _VALUE_READERS.get(field.field_type)
+    if reader is None:
+        msg = f"Unsupported contract field type {field.field_type!r} for {field.name!r}"
+        raise ValueError(msg)
+    pattern = re.compile(f"^{field.pattern}$") if field.pattern is not None else None
+    enum: tuple[Any, ...] | None = None
+    if field.enum is not None:
+        enum = tuple(value for value in map(reader, field.enum) if value is not None)
+    return _CompiledField(
+        index=index,
+        name=field.name,
+        field_type=field.field_type,
+        required=field.required,
+        reader=reader,
+        pattern=pattern,
+        pattern_note=(
+            f'constraint "pattern" is "{field.pattern}"' if field.pattern is not None else None
+        ),
+        enum=enum,
+        enum_note=(
+            f'constraint "enum" is "{list(field.enum)}"' if field.enum is not None else None
+        ),
+    )
+
+
+class ContractValidator:
+    """Validate dataframes against a compiled :class:`DatasetContract`."""
+
+    def __init__(self, contract: DatasetContract) -> None:
+        self.contract = contract
+        self._fields = tuple(
+            _compile_field(index, field) for index, field in enumerate(contract.fields)
+        )
+        by_name = {field.name: field for field in self._fields}
+        self._primary_key = tuple(by_name[name] for name in contract.primary_key)
+        # Frictionless reads primary-key cells first, so their issues lead each row.
+        self._issue_order = {
+            field.name: position
+            for position, field in enumerate(
+                self._primary_key
+                + tuple(field for field in self._fields if field not in self._primary_key)
+            )
+        }
+
+    def validate(
+        self, frame: pd.DataFrame, *, limit: int = DEFAULT_ISSUE_LIMIT
+    ) -> list[ContractIssue]:
+        """Return the issues found in ``frame`` in frictionless row order."""
+
+        height = len(frame)
+        if height == 0 or frame.columns.empty:
+            # Frictionless cannot infer a header from empty inline data.
+            return [ContractIssue(code="source-error", note="")]
+
+        rows = pl.int_range(2, height + 2, eager=True).alias("row")
+        cells = {
+            field.index: field.read(_column(frame, field.name), height) for field in self._fields
+        }
+        blank = pl.repeat(True, height, eager=True)
+        for column in cells.values():
+            blank = blank & column["missing"]
+
+        field_count = len(self._fields)
+        issues: list[pl.DataFrame] = []
+        for field in self._fields:
+            column = cells[field.index]
+            order = self._issue_order[field.name] * 8
+            issues.append(
+                _issues(
+                    rows,
+                    column["type_error"] & ~blank,
+                    order,
+                    "type-error",
+                    field.type_note,
+                    field.name,
+                )
+            )
+            for offset, (note, mask) in enumerate(field.constraint_flags(column), start=1):
+                issues.append(
+                    _issues(
+                        rows, mask & ~blank, order + offset, "constraint-error", note, field.name
+                    )
+                )
+        issues.append(_issues(rows, blank, field_count * 8, "blank-row", "", None))
+        if self._primary_key:
+            issues.extend(self._primary_key_issues(rows, cells, field_count * 8 + 1))
+
+        report = pl.concat(issues).sort("row", "order", maintain_order=True).head(limit)
+        return [
+            ContractIssue(code=code, note=note, row_number=row, field_name=field)
+            for row, code, note, field in zip(
+                report["row"].to_list(),
+                report["code"].to_list(),
+                report["note"].to_list(),
+                report["field"].to_list(),
+                strict=True,
+            )
+        ]
+
+    def _primary_key_issues(
+        self, rows: pl.Series, cells: dict[int, pl.DataFrame], order: int
+    ) -> list[pl.DataFrame]:
+        keys = pl.DataFrame(
+            [rows]
+            + [cells[field.index]["value"].alias(f"k{field.index}") for field in self._primary_key]
+        )
+        key_columns = [f"k{field.index}" for field in self._primary_key]
+        all_null = pl.all_horizontal(pl.col(key_columns).is_null())
+        nan_key = pl.any_horizontal(
+            [
+                pl.col(f"k{field.index}").is_nan()
+                for field in self._primary_key
+                if field.field_type in {"number", "integer"}
+            ]
+            or [pl.lit(False)]
+        )
+        null_rows = keys.filter(all_null)["row"]
+        duplicates = (
+            keys.filter(~all_null & ~nan_key.fill_null(False))
+            .with_columns(previous=pl.col("row").shift(1).over(key_columns))
+            .filter(pl.col("previous").is_not_null())
+        )
+        return [
+            _issues(
+                null_rows,
+                None,
+                order,
+                "primary-key",
+                'cells composing the primary keys are all "None"',
+                None,
+            ),
+            pl.DataFrame(
+                {
+                    "row": duplicates["row"],
+                    "order": pl.repeat(order, duplicates.height, dtype=pl.Int64, eager=True),
+                    "code": pl.repeat("primary-key", duplicates.height, eager=True),
+                    "note": "the same as in the row at position "
+                    + duplicates["previous"].cast(pl.String),
+                    "field": pl.repeat(None, duplicates.height, dtype=pl.String, eager=True),
+                },
+                schema=_ISSUE_SCHEMA,
+            ),
+        ]
+
+
+def _mask(values: pl.Series, mask: pl.Series) -> pl.Series:
+    return values.zip_with(~mask, pl.repeat(None, len(values), dtype=values.dtype, eager=True))
+
+
+def _column(frame: pd.DataFrame, name: str) -> pd.Series | None:
+    if name not in frame.columns:
+        return None
+    column = frame[name]
+    if isinstance(column, pd.DataFrame):
+        # Records built from duplicate labels keep the last column.
+        column = column.iloc[:, -1]
+    return column
+
+
+def _issues(
+    rows: pl.Series,
+    mask: pl.Series | None,
+    order: int,
+    code: str,
+    note: str,
+    field: str | None,
+) -> pl.DataFrame:
+    selected = rows if mask is None else rows.filter(mask)
+    return pl.DataFrame(
+        {
+            "row": selected,
+            "order": pl.repeat(order, len(selected), dtype=pl.Int64, eager=True),
+            "code": pl.repeat(code, len(selected), eager=True),
+            "note": pl.repeat(note, len(selected), eager=True),
+            "field": pl.repeat(field, len(selected), dtype=pl.String, eager=True),
+        },
+        schema=_ISSUE_SCHEMA,
+    )
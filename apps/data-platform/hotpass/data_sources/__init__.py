@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import glob
+import hashlib
+import json
 import re
-from collections.abc import Iterable
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
 
 from ..enrichment.validators import ContactValidationService
 from ..normalization import (
@@ -17,12 +30,20 @@ from ..normalization import (
     normalize_email,
     normalize_phone,
     normalize_province,
+    normalize_values,
     normalize_website,
 )
-from ..validation import validate_with_expectations, validate_with_frictionless
+from ..parallel import worker_context
+from ..validation import (
+    validate_with_contract,
+    validate_with_expectations,
+    validate_with_frictionless,
+)
 
 _CONTACT_VALIDATOR = ContactValidationService()
 
+CONTRACT_ENGINES: tuple[str, ...] = ("polars", "frictionless")
+
 
 @dataclass(frozen=True)
 class ExcelReadOptions:
@@ -32,11 +53,20 @@ class ExcelReadOptions:
     chunk_size: int | None = None
     stage_to_parquet: bool = False
     stage_dir: Path | None = None
+    columnar: bool = False
+    max_workers: int | None = None
+    contract_engine: str = "polars"
 
     def __post_init__(self) -> None:
         if self.chunk_size is not None and self.chunk_size <= 0:
             msg = "chunk_size must be greater than zero when provided"
             raise ValueError(msg)
+        if self.max_workers is not None and self.max_workers <= 0:
+            msg = "max_workers must be greater than zero when provided"
+            raise ValueError(msg)
+        if self.contract_engine not in CONTRACT_ENGINES:
+            msg = f"contract_engine must be one of {', '.join(CONTRACT_ENGINES)}"
+            raise ValueError(msg)
 
     def as_reader_kwargs(self) -> dict[str, Any]:
         kwargs: dict[str, Any] = {}
@@ -44,6 +74,9 @@ class ExcelReadOptions:
             kwargs["engine"] = self.engine
         return kwargs
 
+    def should_parallelise(self) -> bool:
+        return self.max_workers is not None and self.max_workers > 1
+
     def should_stage(self) -> bool:
         return self.stage_to_parquet and (self.stage_dir is not None)
 
@@ -51,6 +84,10 @@ class ExcelReadOptions:
         return self.stage_dir or workbook_path.parent
 
 
+def _validation_batch_size(options: ExcelReadOptions | None) -> int | None:
+    return options.chunk_size if options else None
+
+
 def _sanitise_sheet_name(sheet_name: str) -> str:
     clean = re.sub(r"[^A-Za-z0-9]+", "_", sheet_name.strip() or "sheet")
     return clean.strip("_") or "sheet"
@@ -61,13 +98,17 @@ def _read_excel(
     sheet_name: str,
     options: ExcelReadOptions | None,
 ) -> pd.DataFrame:
+    stage_path: Path | None = None
+    if options and options.should_stage():
+        stage_path = _stage_cache_path(workbook_path, sheet_name, options)
+        cached = _read_staged_frame(stage_path)
+        if cached is not None:
+            return cached
+
     engine = options.engine if options and options.engine else None
     if options and options.chunk_size:
         frame = _read_excel_chunked(
-            workbook_path,
-            sheet_name,
-            chunk_size=options.chunk_size,
-            engine=engine,
+            workbook_path, sheet_name, engine=engine, chunk_size=options.chunk_size
         )
     else:
         kwargs: dict[str, Any] = {"sheet_name": sheet_name}
@@ -75,52 +116,281 @@ def _read_excel(
             kwargs["engine"] = engine
         frame = pd.read_excel(workbook_path, **kwargs)
 
-    if options and options.should_stage():
-        stage_dir = options.resolve_stage_dir(workbook_path)
-        stage_dir.mkdir(parents=True, exist_ok=True)
-        stage_path = stage_dir / f"{workbook_path.stem}__{_sanitise_sheet_name(sheet_name)}.parquet"
-        try:
-            frame.to_parquet(stage_path, index=False)
-        except ImportError as exc:  # pragma: no cover - optional dependency
-            msg = "Staging to parquet requires the optional pyarrow dependency"
-            raise RuntimeError(msg) from exc
+    if stage_path is not None:
+        _write_staged_frame(frame, stage_path)
     return frame
 
 
+_STAGE_CACHE_VERSION = 1
+_WORKBOOK_DIGESTS: dict[tuple[str, int, int], str] = {}
+
+
+def _workbook_digest(workbook_path: Path) -> str:
+    """Return the SHA-256 of a workbook, memoised on its size and mtime."""
+
+    stat = workbook_path.stat()
+    memo_key = (str(workbook_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    digest = _WORKBOOK_DIGESTS.get(memo_key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with workbook_path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        _WORKBOOK_DIGESTS[memo_key] = digest
+    return digest
+
+
+def _stage_cache_path(workbook_path: Path, sheet_name: str, options: ExcelReadOptions) -> Path:
+    """Return the content-addressed Parquet path for a staged sheet.
+
+    The key covers the workbook bytes, the sheet and the reader options, so a
+    changed workbook or engine always maps to a new entry.
+    """
+
+    payload = json.dumps(
+        {
+            "version": _STAGE_CACHE_VERSION,
+            "workbook": _workbook_digest(workbook_path),
+            "sheet": sheet_name,
+            "reader": options.as_reader_kwargs(),
+        },
+        sort_keys=True,
+    )
+    key = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    stage_dir = options.resolve_stage_dir(workbook_path)
+    return stage_dir / f"{_stage_prefix(workbook_path, sheet_name)}__{key}.parquet"
+
+
+def _stage_prefix(workbook_path: Path, sheet_name: str) -> str:
+    return f"{workbook_path.stem}__{_sanitise_sheet_name(sheet_name)}"
+
+
+def _read_staged_frame(stage_path: Path) -> pd.DataFrame | None:
+    if not stage_path.exists():
+        return None
+    try:
+        table = pq.read_table(stage_path, memory_map=True)
+    except (OSError, pa.ArrowException):
+        stage_path.unlink(missing_ok=True)
+        return None
+    return table.to_pandas()
+
+
+def _write_staged_frame(frame: pd.DataFrame, stage_path: Path) -> None:
+    stage_dir = stage_path.parent
+    stage_dir.mkdir(parents=True, exist_ok=True)
+    prefix = stage_path.name.rsplit("__", 1)[0]
+    # Entries for the same workbook and sheet under any other key are stale.
+    stale = [
+        *stage_dir.glob(f"{glob.escape(prefix)}__*.parquet"),
+        stage_dir / f"{prefix}.parquet",
+    ]
+    for path in stale:
+        if path != stage_path:
+            path.unlink(missing_ok=True)
+
+    temp_path = stage_path.with_name(f".{stage_path.name}.tmp")
+    try:
+        frame.to_parquet(temp_path, index=False)
+        temp_path.replace(stage_path)
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        msg = "Staging to parquet requires the optional pyarrow dependency"
+        raise RuntimeError(msg) from exc
+    except (OSError, TypeError, ValueError, pa.ArrowException):
+        # Staging is best effort: sheets that cannot round-trip through Arrow
+        # (mixed-type or non-string headers) or cannot be written are simply read
+        # from Excel next time.
+        temp_path.unlink(missing_ok=True)
+
+
 def _read_excel_chunked(
     workbook_path: Path,
     sheet_name: str,
     *,
-    chunk_size: int,
     engine: str | None,
+    chunk_size: int,
 ) -> pd.DataFrame:
-    frames: list[pd.DataFrame] = []
-    columns: list[str] | None = None
-    data_rows_consumed = 0
-
-    with pd.ExcelFile(workbook_path, engine=engine) as excel_file:
-        while True:
-            skip_value = 0 if columns is None else data_rows_consumed + 1
-            chunk = pd.read_excel(
-                excel_file,
-                sheet_name=sheet_name,
-                header=0 if columns is None else None,
-                names=columns if columns is not None else None,
-                skiprows=skip_value,
-                nrows=chunk_size,
-            )
-            if chunk.empty:
-                break
-            if columns is None:
-                columns = list(chunk.columns)
-            frames.append(chunk)
-            data_rows_consumed += len(chunk)
-            if len(chunk) < chunk_size:
-                break
+    """Read a sheet through :func:`iter_excel_batches` as a single frame.
+
+    The sheet is parsed once, ``chunk_size`` rows at a time, and each batch is
+    folded into per-column lists of raw cell values. The result still holds
+    the whole sheet, because the loaders and contract validation work on
+    complete sheets, so memory is bounded by the sheet as with
+    ``pd.read_excel``. Dtypes are inferred once per column over the whole
+    sheet, exactly like ``pd.read_excel``; inferring per batch would, for
+    example, turn a phone number such as ``0215550000`` into an integer
+    whenever its batch holds no other text.
+    """
+
+    if engine not in (None, "openpyxl"):
+        return pd.read_excel(workbook_path, sheet_name=sheet_name, engine=engine)
+    batch: pd.DataFrame | None = None
+    names: list[Any] = []
+    values: list[list[Any]] = []
+    row_count = 0
+    for batch in iter_excel_batches(workbook_path, sheet_name, batch_size=chunk_size, dtype=object):
+        # Columns first seen in a wider batch are blank in the earlier rows.
+        values.extend([np.nan] * row_count for _ in range(len(names), batch.shape[1]))
+        names = list(batch.columns)
+        for index, column in enumerate(values):
+            column.extend(batch.iloc[:, index].tolist())
+        row_count += len(batch)
+    if batch is None:
+        return pd.DataFrame()
+    if row_count == 0:
+        # A header without rows: the single batch already is the sheet.
+        return batch
+    return _infer_sheet_dtypes(names, values)
+
+
+def _infer_sheet_dtypes(names: list[Any], values: list[list[Any]]) -> pd.DataFrame:
+    """Build a frame from raw columns with the inference ``TextParser`` applies.
+
+    Each raw column is released as soon as it has been converted.
+    """
+
+    columns: list[pd.Series] = []
+    for index in range(len(values)):
+        raw, values[index] = values[index], []
+        columns.append(
+            TextParser(
+                [[value] for value in raw], header=None, names=[0], skip_blank_lines=False
+            ).read()[0]
+        )
+    frame = pd.concat(columns, axis=1, ignore_index=True)
+    frame.columns = names
+    return frame
+
+
+def iter_excel_batches(
+    workbook_path: Path,
+    sheet_name: str,
+    *,
+    batch_size: int,
+    engine: str | None = None,
+    dtype: Any = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a worksheet as ``batch_size``-row frames while parsing it only once.
+
+    The openpyxl engine streams rows from a read-only workbook, so memory is
+    bounded by the batch size rather than the sheet size. Cell conversion and
+    header handling follow ``pandas.read_excel`` but dtypes are inferred per
+    batch; pass ``dtype=object`` to keep the raw cell values instead. Other
+    engines cannot stream and fall back to a single full-sheet read that is
+    then sliced into batches. A batch gains columns when one of its rows is
+    wider than every earlier row; they are named as ``pd.read_excel`` names them.
+    """
+
+    if batch_size <= 0:
+        msg = "batch_size must be greater than zero"
+        raise ValueError(msg)
+
+    if engine not in (None, "openpyxl"):
+        frame = pd.read_excel(workbook_path, sheet_name=sheet_name, engine=engine, dtype=dtype)
+        if frame.empty:
+            yield frame
+            return
+        for start in range(0, len(frame), batch_size):
+            yield frame.iloc[start : start + batch_size].reset_index(drop=True)
+        return
+
+    rows = _iter_sheet_rows(workbook_path, sheet_name)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns: list[Any] | None = None
+    for batch in _row_batches(rows, batch_size):
+        if columns is None:
+            frame = _parse_sheet_rows(header, batch, dtype=dtype)
+        else:
+            width = max([len(columns), *(len(row) for row in batch)])
+            if width > len(columns):
+                # A later row is wider than every earlier one: name the new columns
+                # as pandas does from the header padded to the full width.
+                columns = list(_parse_sheet_rows(header, [], width=width).columns)
+            frame = _parse_sheet_rows(None, batch, names=columns, width=width, dtype=dtype)
+        columns = list(frame.columns)
+        yield frame
+    if columns is None:
+        yield _parse_sheet_rows(header, [], dtype=dtype)
+
+
+def _row_batches(rows: Iterator[list[Any]], batch_size: int) -> Iterator[list[list[Any]]]:
+    batch: list[list[Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _convert_excel_cell(cell: Any) -> Any:
+    """Convert an openpyxl cell exactly as ``pandas.read_excel`` does."""
+
+    value = cell.value
+    if value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC:
+        integer = int(value)
+        return integer if integer == value else float(value)
+    return value
+
+
+def _iter_sheet_rows(workbook_path: Path, sheet_name: str) -> Iterator[list[Any]]:
+    """Stream converted rows from a read-only workbook, header first.
+
+    Trailing empty cells are trimmed and blank rows are only emitted once a
+    later row carries data, mirroring how pandas drops trailing blank rows.
+    A sheet without any data yields nothing.
+    """
+
+    workbook = load_workbook(workbook_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        if sheet_name not in workbook.sheetnames:
+            msg = f"Worksheet named '{sheet_name}' not found"
+            raise ValueError(msg)
+        sheet = workbook[sheet_name]
+        sheet.reset_dimensions()
+        blank_rows = 0
+        for row in sheet.iter_rows():
+            converted = [_convert_excel_cell(cell) for cell in row]
+            while converted and converted[-1] == "":
+                converted.pop()
+            if not converted:
+                blank_rows += 1
+                continue
+            for _ in range(blank_rows):
+                yield []
+            blank_rows = 0
+            yield converted
+    finally:
+        workbook.close()
 
-    if not frames:
-        return pd.DataFrame(columns=columns or None)
-    return pd.concat(frames, ignore_index=True)
+
+def _parse_sheet_rows(
+    header: list[Any] | None,
+    rows: list[list[Any]],
+    *,
+    names: list[Any] | None = None,
+    width: int | None = None,
+    dtype: Any = None,
+) -> pd.DataFrame:
+    """Parse streamed rows with the same ``TextParser`` settings as ``pd.read_excel``."""
+
+    if width is None:
+        width = max([len(header or []), *(len(row) for row in rows)])
+    data = [row + [""] * (width - len(row)) for row in rows]
+    if header is not None:
+        padded_header = header + [""] * (width - len(header))
+        return TextParser(
+            [padded_header, *data], header=0, skip_blank_lines=False, dtype=dtype
+        ).read()
+    return TextParser(data, header=None, names=names, skip_blank_lines=False, dtype=dtype).read()
 
 
 @dataclass
@@ -250,36 +520,324 @@ def _split_contact_fields(
     return names, roles, emails, phones
 
 
-def load_reachout_database(
-    input_dir: Path, country_code: str, options: ExcelReadOptions | None = None
-) -> pd.DataFrame:
-    org_path = input_dir / "Reachout Database.xlsx"
-    organisation_df = _read_excel(org_path, "Organisation", options)
-    contacts_df = _read_excel(org_path, "Contact Info", options)
-
-    validate_with_frictionless(
-        organisation_df,
-        schema_descriptor="reachout_organisation.schema.json",
-        table_name="Reachout Organisation",
-        source_file=f"{org_path.name}#Organisation",
+_RAW_RECORD_COLUMNS: tuple[str, ...] = tuple(field.name for field in fields(RawRecord))
+_CONTACT_LIST_COLUMNS: tuple[str, ...] = (
+    "contact_names",
+    "contact_roles",
+    "contact_emails",
+    "contact_phones",
+)
+_STRING_LIST = pl.List(pl.String)
+
+
+def _column_values(df: pd.DataFrame, column: str | None) -> list[object | None]:
+    if column is None or column not in df.columns:
+        return [None] * len(df)
+    values: list[object | None] = df[column].tolist()
+    return values
+
+
+def _map_distinct(func: Callable[..., Any], *columns: Sequence[object | None]) -> list[Any]:
+    """Evaluate ``func`` once per distinct combination of cell values.
+
+    Cache keys include the value type so ``1`` and ``1.0`` keep producing the
+    same strings as the row-wise loaders.
+    """
+
+    cache: dict[tuple[tuple[type, object], ...], Any] = {}
+    results: list[Any] = []
+    for cells in zip(*columns, strict=True):
+        key = tuple((type(cell), cell) for cell in cells)
+        if key in cache:
+            results.append(cache[key])
+            continue
+        value = func(*cells)
+        cache[key] = value
+        results.append(value)
+    return results
+
+
+def _string_frame(columns: dict[str, list[Any]]) -> pl.DataFrame:
+    return pl.DataFrame(columns, schema={name: pl.String for name in columns})
+
+
+def _aggregate_contacts_columnar(
+    df: pd.DataFrame,
+    *,
+    key_field: str,
+    country_code: str,
+    name_fields: Sequence[str],
+    email_field: str,
+    phone_fields: Sequence[str],
+    role_field: str | None = None,
+) -> tuple[pl.DataFrame, dict[object, int]]:
+    """Group contact rows into per-organisation contact lists in one pass."""
+
+    codes: npt.NDArray[np.int64] = np.full(len(df), -1, dtype=np.int64)
+    group_codes: dict[object, int] = {}
+    for code, (key, positions) in enumerate(df.groupby(key_field).indices.items()):
+        codes[positions] = code
+        group_codes[key] = code
+
+    phone_columns = [f"_phone_{position}" for position in range(len(phone_fields))]
+    contacts = _string_frame(
+        {
+            "_name": _map_distinct(
+                lambda *parts: join_non_empty([clean_string(part) for part in parts]),
+                *(_column_values(df, field) for field in name_fields),
+            ),
+            "_role": normalize_values(clean_string, _column_values(df, role_field)),
+            **{
+                column: normalize_values(
+                    normalize_phone,
+                    _column_values(df, field),
+                    country_code=country_code,
+                )
+                for column, field in zip(phone_columns, phone_fields, strict=True)
+            },
+        }
+    ).with_columns(
+        pl.Series(
+            "_emails",
+            _map_distinct(_extract_normalized_emails, _column_values(df, email_field)),
+            dtype=_STRING_LIST,
+        ),
+        pl.Series("_contact_group", codes, dtype=pl.Int64),
     )
-    validate_with_expectations(
-        organisation_df,
-        suite_descriptor="reachout_organisation.json",
-        source_file=f"{org_path.name}#Organisation",
+
+    aggregated = (
+        contacts.filter(pl.col("_contact_group") >= 0)
+        .group_by("_contact_group", maintain_order=True)
+        .agg(
+            pl.col("_name").drop_nulls().alias("contact_names"),
+            pl.col("_role").drop_nulls().alias("contact_roles"),
+            pl.col("_emails").explode().drop_nulls().alias("contact_emails"),
+            pl.concat_list(phone_columns).explode().drop_nulls().alias("contact_phones"),
+        )
+    )
+    return aggregated, group_codes
+
+
+def _attach_contacts(
+    frame: pl.DataFrame,
+    keys: list[object | None],
+    contacts: pl.DataFrame,
+    group_codes: dict[object, int],
+) -> pl.DataFrame:
+    frame = frame.with_columns(
+        pl.Series(
+            "_contact_group",
+            _map_distinct(lambda key: group_codes.get(key, -1), keys),
+            dtype=pl.Int64,
+        )
+    )
+    return frame.join(contacts, on="_contact_group", how="left", maintain_order="left").drop(
+        "_contact_group"
     )
 
-    validate_with_frictionless(
+
+def _raw_records_frame(frame: pl.DataFrame) -> pd.DataFrame:
+    """Materialise a columnar loader frame with the ``RawRecord.as_dict`` layout."""
+
+    frame = frame.filter(pl.col("organization_name").is_not_null())
+    if frame.is_empty():
+        return pd.DataFrame()
+
+    frame = frame.with_columns(
+        (
+            pl.col(column).fill_null(pl.lit([], dtype=_STRING_LIST))
+            if column in frame.columns
+            else pl.lit([], dtype=_STRING_LIST).alias(column)
+        )
+        for column in _CONTACT_LIST_COLUMNS
+    )
+    data: dict[str, list[Any]] = {}
+    for column in _RAW_RECORD_COLUMNS:
+        if column == "provenance":
+            data[column] = [[] for _ in range(frame.height)]
+        elif column in frame.columns:
+            data[column] = frame.get_column(column).to_list()
+        else:
+            data[column] = [None] * frame.height
+    return pd.DataFrame(data)
+
+
+def _build_reachout_columnar(
+    organisation_df: pd.DataFrame, contacts_df: pd.DataFrame, country_code: str
+) -> pd.DataFrame:
+    contacts, group_codes = _aggregate_contacts_columnar(
         contacts_df,
-        schema_descriptor="reachout_contact_info.schema.json",
-        table_name="Reachout Contact Info",
-        source_file=f"{org_path.name}#Contact Info",
+        key_field="ID",
+        country_code=country_code,
+        name_fields=("Firstname", "Surname"),
+        email_field="Email",
+        phone_fields=("Phone", "WhatsApp"),
+        role_field="Position",
     )
-    validate_with_expectations(
+
+    org_ids = _column_values(organisation_df, "ID")
+    areas = _column_values(organisation_df, "Area")
+    org_types = normalize_values(clean_string, _column_values(organisation_df, "Type"))
+    notes = normalize_values(clean_string, _column_values(organisation_df, "Notes"))
+    frame = _string_frame(
+        {
+            "organization_name": normalize_values(
+                clean_string, _column_values(organisation_df, "Organisation Name")
+            ),
+            "source_record_id": _map_distinct(lambda value: f"reachout:{value}", org_ids),
+            "province": normalize_values(normalize_province, areas),
+            "area": normalize_values(clean_string, areas),
+            "address": normalize_values(clean_string, _column_values(organisation_df, "Address")),
+            "category": org_types,
+            "organization_type": org_types,
+            "website": normalize_values(
+                normalize_website, _column_values(organisation_df, "Website")
+            ),
+            "planes": normalize_values(clean_string, _column_values(organisation_df, "Planes")),
+            "description": _map_distinct(
+                lambda primary, note: join_non_empty([primary, note], separator=" | "),
+                normalize_values(clean_string, _column_values(organisation_df, "Description Type")),
+                notes,
+            ),
+            "notes": _map_distinct(
+                lambda note, question: join_non_empty([note, question], separator=" | "),
+                notes,
+                normalize_values(clean_string, _column_values(organisation_df, "Open Questions")),
+            ),
+            "last_interaction_date": normalize_values(
+                clean_string, _column_values(organisation_df, "Reachout Date")
+            ),
+        }
+    ).with_columns(pl.lit("Reachout Database").alias("source_dataset"))
+    return _raw_records_frame(_attach_contacts(frame, org_ids, contacts, group_codes))
+
+
+def _build_contact_columnar(
+    company_df: pd.DataFrame,
+    contacts_df: pd.DataFrame,
+    addresses_df: pd.DataFrame,
+    capture_df: pd.DataFrame,
+    country_code: str,
+) -> pd.DataFrame:
+    contacts, group_codes = _aggregate_contacts_columnar(
         contacts_df,
-        suite_descriptor="reachout_contact_info.json",
-        source_file=f"{org_path.name}#Contact Info",
+        key_field="C_ID",
+        country_code=country_code,
+        name_fields=("FirstName", "Surname"),
+        email_field="Email",
+        phone_fields=("Cellnumber", "Landline"),
+        role_field="Position",
+    )
+
+    addresses = pd.DataFrame(
+        {
+            "key": addresses_df["C_ID"] if "C_ID" in addresses_df.columns else None,
+            "address": _map_distinct(
+                lambda airport, detail: join_non_empty([airport, detail], separator=", "),
+                _column_values(addresses_df, "Airport"),
+                _column_values(addresses_df, "Unnamed: 4"),
+            ),
+        },
+        index=addresses_df.index,
+    ).dropna()
+    addresses = addresses.loc[~addresses["key"].duplicated()]
+    address_map: dict[object, str] = dict(
+        zip(addresses["key"].tolist(), addresses["address"].tolist(), strict=True)
+    )
+
+    capture_notes = (
+        _string_frame(
+            {
+                "organization_name": normalize_values(
+                    clean_string, _column_values(capture_df, "School")
+                ),
+                "description": _map_distinct(
+                    lambda description, kind: join_non_empty(
+                        [clean_string(description), clean_string(kind)], separator=" | "
+                    ),
+                    _column_values(capture_df, "Description"),
+                    _column_values(capture_df, "Type"),
+                ),
+            }
+        )
+        .drop_nulls()
+        .unique(subset="organization_name", keep="last", maintain_order=True)
+    )
+
+    company_ids = _column_values(company_df, "C_ID")
+    categories = normalize_values(clean_string, _column_values(company_df, "Category"))
+    frame = _string_frame(
+        {
+            "organization_name": normalize_values(
+                clean_string, _column_values(company_df, "Company")
+            ),
+            "source_record_id": _map_distinct(lambda value: f"contact:{value}", company_ids),
+            "address": _map_distinct(address_map.get, company_ids),
+            "category": categories,
+            "organization_type": categories,
+            "status": normalize_values(clean_string, _column_values(company_df, "Status")),
+            "website": normalize_values(normalize_website, _column_values(company_df, "Website")),
+            "last_interaction_date": normalize_values(
+                clean_string, _column_values(company_df, "LoadDate")
+            ),
+            "priority": normalize_values(clean_string, _column_values(company_df, "Priority")),
+        }
+    ).with_columns(pl.lit("Contact Database").alias("source_dataset"))
+    frame = frame.join(capture_notes, on="organization_name", how="left", maintain_order="left")
+    return _raw_records_frame(_attach_contacts(frame, company_ids, contacts, group_codes))
+
+
+def _build_sacaa_columnar(df: pd.DataFrame, country_code: str) -> pd.DataFrame:
+    provinces = normalize_values(normalize_province, _column_values(df, "Province"))
+    statuses = normalize_values(clean_string, _column_values(df, "Status"))
+    organisation_names = normalize_values(clean_string, _column_values(df, "Name of Organisation"))
+    frame = _string_frame(
+        {
+            "organization_name": organisation_names,
+            "source_record_id": _map_distinct(lambda name: f"sacaa:{name}", organisation_names),
+            "province": provinces,
+            "area": provinces,
+            "organization_type": statuses,
+            "status": statuses,
+            "website": normalize_values(normalize_website, _column_values(df, "Website URL")),
+            "_name": normalize_values(clean_string, _column_values(df, "Contact Person")),
+            "_phone": normalize_values(
+                normalize_phone,
+                _column_values(df, "Contact Number"),
+                country_code=country_code,
+            ),
+        }
+    ).with_columns(
+        pl.lit("SACAA Cleaned").alias("source_dataset"),
+        pl.lit("Flight School").alias("category"),
+        pl.Series(
+            "contact_emails",
+            _map_distinct(_extract_normalized_emails, _column_values(df, "Contact Email Address")),
+            dtype=_STRING_LIST,
+        ),
     )
+    frame = frame.with_columns(
+        pl.concat_list("_name").list.drop_nulls().alias("contact_names"),
+        pl.concat_list("_phone").list.drop_nulls().alias("contact_phones"),
+    ).drop("_name", "_phone")
+    return _raw_records_frame(frame)
+
+
+def load_reachout_database(
+    input_dir: Path, country_code: str, options: ExcelReadOptions | None = None
+) -> pd.DataFrame:
+    return _load_source(_REACHOUT_SOURCE, input_dir, country_code, options)
+
+
+def _build_reachout(
+    organisation_df: pd.DataFrame,
+    contacts_df: pd.DataFrame,
+    *,
+    country_code: str,
+    options: ExcelReadOptions | None,
+) -> pd.DataFrame:
+    if options is not None and options.columnar:
+        return _build_reachout_columnar(organisation_df, contacts_df, country_code)
 
     contact_groups = contacts_df.groupby("ID")
     records: list[RawRecord] = []
@@ -334,60 +892,22 @@ def load_reachout_database(
 def load_contact_database(
     input_dir: Path, country_code: str, options: ExcelReadOptions | None = None
 ) -> pd.DataFrame:
-    path = input_dir / "Contact Database.xlsx"
-    company_df = _read_excel(path, "Company_Cat", options)
-    contacts_df = _read_excel(path, "Company_Contacts", options)
-    addresses_df = _read_excel(path, "Company_Addresses", options)
-    capture_df = _read_excel(path, "10-10-25 Capture", options)
-
-    validate_with_frictionless(
-        company_df,
-        schema_descriptor="contact_company_cat.schema.json",
-        table_name="Contact Company Catalogue",
-        source_file=f"{path.name}#Company_Cat",
-    )
-    validate_with_expectations(
-        company_df,
-        suite_descriptor="contact_company_cat.json",
-        source_file=f"{path.name}#Company_Cat",
-    )
+    return _load_source(_CONTACT_SOURCE, input_dir, country_code, options)
 
-    validate_with_frictionless(
-        contacts_df,
-        schema_descriptor="contact_company_contacts.schema.json",
-        table_name="Contact Company Contacts",
-        source_file=f"{path.name}#Company_Contacts",
-    )
-    contacts_df = _annotate_contact_verification(contacts_df, country_code=country_code)
-    validate_with_expectations(
-        contacts_df,
-        suite_descriptor="contact_company_contacts.json",
-        source_file=f"{path.name}#Company_Contacts",
-    )
-
-    validate_with_frictionless(
-        addresses_df,
-        schema_descriptor="contact_company_addresses.schema.json",
-        table_name="Contact Company Addresses",
-        source_file=f"{path.name}#Company_Addresses",
-    )
-    validate_with_expectations(
-        addresses_df,
-        suite_descriptor="contact_company_addresses.json",
-        source_file=f"{path.name}#Company_Addresses",
-    )
 
-    validate_with_frictionless(
-        capture_df,
-        schema_descriptor="contact_capture.schema.json",
-        table_name="Contact Capture Log",
-        source_file=f"{path.name}#10-10-25 Capture",
-    )
-    validate_with_expectations(
-        capture_df,
-        suite_descriptor="contact_capture.json",
-        source_file=f"{path.name}#10-10-25 Capture",
-    )
+def _build_contact(
+    company_df: pd.DataFrame,
+    contacts_df: pd.DataFrame,
+    addresses_df: pd.DataFrame,
+    capture_df: pd.DataFrame,
+    *,
+    country_code: str,
+    options: ExcelReadOptions | None,
+) -> pd.DataFrame:
+    if options is not None and options.columnar:
+        return _build_contact_columnar(
+            company_df, contacts_df, addresses_df, capture_df, country_code
+        )
 
     contacts_grouped = contacts_df.groupby("C_ID")
     address_map: dict[str, str] = {}
@@ -489,20 +1009,18 @@ def _annotate_contact_verification(df: pd.DataFrame, *, country_code: str) -> pd
 def load_sacaa_cleaned(
     input_dir: Path, country_code: str, options: ExcelReadOptions | None = None
 ) -> pd.DataFrame:
-    path = input_dir / "SACAA Flight Schools - Refined copy__CLEANED.xlsx"
-    df = _read_excel(path, "Cleaned", options)
-
-    validate_with_frictionless(
-        df,
-        schema_descriptor="sacaa_cleaned.schema.json",
-        table_name="SACAA Cleaned",
-        source_file=f"{path.name}#Cleaned",
-    )
-    validate_with_expectations(
-        df,
-        suite_descriptor="sacaa_cleaned.json",
-        source_file=f"{path.name}#Cleaned",
-    )
+    return _load_source(_SACAA_SOURCE, input_dir, country_code, options)
+
+
+def _build_sacaa(
+    df: pd.DataFrame,
+    *,
+    country_code: str,
+    options: ExcelReadOptions | None,
+) -> pd.DataFrame:
+    if options is not None and options.columnar:
+        return _build_sacaa_columnar(df, country_code)
+
     records: list[RawRecord] = []
     for _, row in df.iterrows():
         org_name = clean_string(row.get("Name of Organisation"))
@@ -546,3 +1064,256 @@ def load_sacaa_cleaned(
             )
         )
     return pd.DataFrame([record.as_dict() for record in records])
+
+
+@dataclass(frozen=True)
+class _SheetSpec:
+    """A worksheet and the contracts it is validated against."""
+
+    sheet_name: str
+    table_name: str
+    schema_descriptor: str
+    suite_descriptor: str
+    annotate_contacts: bool = False
+
+
+@dataclass(frozen=True)
+class _SourceSpec:
+    """A source workbook, its sheets and the builder that joins them into records."""
+
+    label: str
+    workbook: str
+    sheets: tuple[_SheetSpec, ...]
+    build: Callable[..., pd.DataFrame]
+
+
+_REACHOUT_SOURCE = _SourceSpec(
+    label="Reachout Database",
+    workbook="Reachout Database.xlsx",
+    sheets=(
+        _SheetSpec(
+            "Organisation",
+            "Reachout Organisation",
+            "reachout_organisation.schema.json",
+            "reachout_organisation.json",
+        ),
+        _SheetSpec(
+            "Contact Info",
+            "Reachout Contact Info",
+            "reachout_contact_info.schema.json",
+            "reachout_contact_info.json",
+        ),
+    ),
+    build=_build_reachout,
+)
+
+_CONTACT_SOURCE = _SourceSpec(
+    label="Contact Database",
+    workbook="Contact Database.xlsx",
+    sheets=(
+        _SheetSpec(
+            "Company_Cat",
+            "Contact Company Catalogue",
+            "contact_company_cat.schema.json",
+            "contact_company_cat.json",
+        ),
+        _SheetSpec(
+            "Company_Contacts",
+            "Contact Company Contacts",
+            "contact_company_contacts.schema.json",
+            "contact_company_contacts.json",
+            annotate_contacts=True,
+        ),
+        _SheetSpec(
+            "Company_Addresses",
+            "Contact Company Addresses",
+            "contact_company_addresses.schema.json",
+            "contact_company_addresses.json",
+        ),
+        _SheetSpec(
+            "10-10-25 Capture",
+            "Contact Capture Log",
+            "contact_capture.schema.json",
+            "contact_capture.json",
+        ),
+    ),
+    build=_build_contact,
+)
+
+_SACAA_SOURCE = _SourceSpec(
+    label="SACAA Cleaned",
+    workbook="SACAA Flight Schools - Refined copy__CLEANED.xlsx",
+    sheets=(
+        _SheetSpec(
+            "Cleaned",
+            "SACAA Cleaned",
+            "sacaa_cleaned.schema.json",
+            "sacaa_cleaned.json",
+        ),
+    ),
+    build=_build_sacaa,
+)
+
+_SOURCES: tuple[_SourceSpec, ...] = (_REACHOUT_SOURCE, _CONTACT_SOURCE, _SACAA_SOURCE)
+
+
+def _load_sheet(
+    workbook_path: Path,
+    sheet: _SheetSpec,
+    options: ExcelReadOptions | None,
+    country_code: str,
+) -> pd.DataFrame:
+    """Read a worksheet and validate it against its table schema and GE contracts."""
+
+    source_file = f"{workbook_path.name}#{sheet.sheet_name}"
+    frame = _read_excel(workbook_path, sheet.sheet_name, options)
+    validate_schema = (
+        validate_with_frictionless
+        if options is not None and options.contract_engine == "frictionless"
+        else validate_with_contract
+    )
+    validate_schema(
+        frame,
+        schema_descriptor=sheet.schema_descriptor,
+        table_name=sheet.table_name,
+        source_file=source_file,
+        batch_size=_validation_batch_size(options),
+    )
+    if sheet.annotate_contacts:
+        frame = _annotate_contact_verification(frame, country_code=country_code)
+    validate_with_expectations(
+        frame,
+        suite_descriptor=sheet.suite_descriptor,
+        source_file=source_file,
+    )
+    return frame
+
+
+def _load_source(
+    source: _SourceSpec,
+    input_dir: Path,
+    country_code: str,
+    options: ExcelReadOptions | None,
+) -> pd.DataFrame:
+    started = time.perf_counter()
+    workbook_path = input_dir / source.workbook
+    sheets = [_load_sheet(workbook_path, sheet, options, country_code) for sheet in source.sheets]
+    frame = source.build(*sheets, country_code=country_code, options=options)
+    frame.attrs["load_seconds"] = time.perf_counter() - started
+    return frame
+
+
+@dataclass(frozen=True)
+class _SheetPayload:
+    """A validated sheet shipped back from a worker process.
+
+    Frames travel as an Arrow IPC stream when they convert cleanly; sheets with
+    mixed-type columns fall back to a pickled frame.
+    """
+
+    ipc: bytes
+    frame: pd.DataFrame | None
+    attrs: dict[str, Any]
+    seconds: float
+
+    def to_frame(self) -> pd.DataFrame:
+        if self.frame is not None:
+            return self.frame
+        with pa.ipc.open_stream(self.ipc) as reader:
+            frame = reader.read_all().to_pandas()
+        frame.attrs = self.attrs
+        return frame
+
+
+def _encode_sheet(frame: pd.DataFrame, seconds: float) -> _SheetPayload:
+    if all(isinstance(column, str) for column in frame.columns):
+        try:
+            table = pa.Table.from_pandas(frame)
+        except (TypeError, ValueError, pa.ArrowException):
+            pass
+        else:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return _SheetPayload(sink.getvalue().to_pybytes(), None, dict(frame.attrs), seconds)
+    return _SheetPayload(b"", frame, {}, seconds)
+
+
+def _load_sheet_task(
+    workbook_path: Path,
+    sheet: _SheetSpec,
+    options: ExcelReadOptions | None,
+    country_code: str,
+) -> _SheetPayload:
+    started = time.perf_counter()
+    frame = _load_sheet(workbook_path, sheet, options, country_code)
+    return _encode_sheet(frame, time.perf_counter() - started)
+
+
+def source_fingerprints(input_dir: Path) -> dict[str, str]:
+    """Return the SHA-256 of every source workbook present in ``input_dir``, by source label."""
+
+    return {
+        source.label: _workbook_digest(input_dir / source.workbook)
+        for source in _SOURCES
+        if (input_dir / source.workbook).is_file()
+    }
+
+
+def load_sources_parallel(
+    input_dir: Path,
+    country_code: str,
+    options: ExcelReadOptions,
+    *,
+    labels: Iterable[str] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Load every source workbook, reading and validating each sheet in a worker process.
+
+    Sources are returned in the same order as the sequential loaders and missing
+    workbooks are skipped. ``labels`` restricts loading to those sources.
+    ``load_seconds`` on each frame is the sheet time spent in the workers plus
+    the time spent joining the sheets into records.
+    """
+
+    wanted = None if labels is None else set(labels)
+    sources = [source for source in _SOURCES if wanted is None or source.label in wanted]
+    if not sources:
+        return {}
+    task_count = sum(len(source.sheets) for source in sources)
+    max_workers = min(options.max_workers or 1, task_count)
+    frames: dict[str, pd.DataFrame] = {}
+    context = worker_context(__name__)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        submitted = [
+            (
+                source,
+                [
+                    executor.submit(
+                        _load_sheet_task,
+                        input_dir / source.workbook,
+                        sheet,
+                        options,
+                        country_code,
+                    )
+                    for sheet in source.sheets
+                ],
+            )
+            for source in sources
+        ]
+        try:
+            for source, futures in submitted:
+                try:
+                    payloads = [future.result() for future in futures]
+                except FileNotFoundError:
+                    continue
+                started = time.perf_counter()
+                sheets = [payload.to_frame() for payload in payloads]
+                frame = source.build(*sheets, country_code=country_code, options=options)
+                frame.attrs["load_seconds"] = (
+                    sum(payload.seconds for payload in payloads) + time.perf_counter() - started
+                )
+                frames[source.label] = frame
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+    return frames
@@ -16,6 +16,7 @@ from .models import (
     Provenance,
     ValidityWindow,
     generate_uuid7,
+    generate_uuid7_array,
 )
 
 __all__ = [
@@ -31,6 +32,7 @@ __all__ = [
     "Provenance",
     "ValidityWindow",
     "generate_uuid7",
+    "generate_uuid7_array",
     "build_party_store_from_refined",
     "render_dictionary",
     "schemas",
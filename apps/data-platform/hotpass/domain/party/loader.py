@@ -3,29 +3,114 @@
 from __future__ import annotations
 
 import json
-import re
-from collections.abc import Iterable, Iterator
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
+from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-
-from hotpass.normalization import clean_string, slugify
+import pyarrow as pa
 
 from .models import (
     AliasType,
     ConfidenceBand,
-    ContactMethod,
     ContactMethodType,
-    Party,
-    PartyAlias,
     PartyKind,
-    PartyRole,
     PartyStore,
-    Provenance,
-    ValidityWindow,
-    generate_uuid7,
+    generate_uuid7_array,
+)
+from .schemas import (
+    CONTACT_METHOD_ARROW_SCHEMA,
+    PARTY_ALIAS_ARROW_SCHEMA,
+    PARTY_ARROW_SCHEMA,
+    PARTY_ROLE_ARROW_SCHEMA,
+)
+
+_PARTY_REFERENCES = ("party_id", "subject_party_id", "object_party_id")
+
+# Selection document keys, in the order of the ``provenance_*`` table columns.
+_PROVENANCE_KEYS = (
+    "source_dataset",
+    "source_record_id",
+    "last_interaction_date",
+    "source_priority",
+    "quality_score",
 )
 
+_PROVENANCE_FIELDS = (
+    "organization_name",
+    "contact_primary_name",
+    "contact_primary_role",
+    "contact_primary_email",
+    "contact_primary_phone",
+    "website",
+    "address_primary",
+)
+
+
+def _column(frame: pd.DataFrame, name: str) -> pd.Series:
+    if name in frame.columns:
+        return frame[name].astype(object)
+    return pd.Series(None, index=frame.index, dtype=object)
+
+
+def _is_text(column: pd.Series) -> pd.Series:
+    return column.apply(isinstance, args=(str,)).astype(bool)
+
+
+def _non_blank(text: pd.Series) -> npt.NDArray[np.object_]:
+    values: npt.NDArray[np.object_] = text.to_numpy(dtype=object, copy=True)
+    values[values == ""] = None
+    return values
+
+
+def _coalesce(*columns: pd.Series, default: object = None) -> pd.Series:
+    """Take each row from the first of ``columns`` with a value, else ``default``."""
+
+    values: npt.NDArray[np.object_] = np.full(len(columns[0]), default, dtype=object)
+    for column in reversed(columns):
+        values = np.where(column.notna().to_numpy(), column.to_numpy(dtype=object), values)
+    return pd.Series(values, index=columns[0].index, dtype=object)
+
+
+def _clean_text(column: pd.Series) -> pd.Series:
+    """Column-wise :func:`hotpass.normalization.clean_string`; blanks become missing."""
+
+    present = column.notna().to_numpy()
+    text = column[present].astype(str).str.strip().str.slice(0, 10000).str.normalize("NFKC")
+    values: npt.NDArray[np.object_] = np.full(len(column), None, dtype=object)
+    values[present] = _non_blank(text)
+    return pd.Series(values, index=column.index, dtype=object)
+
+
+def _slugify(column: pd.Series) -> pd.Series:
+    """Column-wise :func:`hotpass.normalization.slugify` of cleaned text."""
+
+    slug = (
+        column.str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace(r"[^a-z0-9]+", "-", regex=True)
+        .str.strip("-")
+    )
+    return pd.Series(_non_blank(slug), index=column.index, dtype=object)
+
+
+def _split_multi(column: pd.Series) -> pd.Series:
+    """Split ``;``/``,`` separated text or lists into one cleaned token per entry.
+
+    The result is indexed by the row each token came from.
+    """
+
+    is_text = _is_text(column).to_numpy()
+    is_list = column.apply(pd.api.types.is_list_like).to_numpy(dtype=bool)
+    tokens = column.to_numpy(dtype=object).copy()
+    tokens[is_text] = column[is_text].str.split(r"[;,]", regex=True).to_numpy(dtype=object)
+    tokens[~is_text & ~is_list] = None
+    return _clean_text(pd.Series(tokens, index=column.index, dtype=object).explode()).dropna()
+
 
 def _parse_iso_datetime(value: object | None) -> datetime | None:
     if value is None or (isinstance(value, str) and not value.strip()):
@@ -43,23 +128,24 @@ def _parse_iso_datetime(value: object | None) -> datetime | None:
     return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
 
 
-def _confidence_band(score: float) -> ConfidenceBand:
-    if score >= 0.75:
-        return ConfidenceBand.HIGH
-    if score >= 0.5:
-        return ConfidenceBand.MEDIUM
-    return ConfidenceBand.LOW
+def _parse_iso_datetimes(column: pd.Series, default: datetime | None = None) -> pd.Series:
+    """Parse ``column`` with :func:`_parse_iso_datetime`, once per distinct value."""
 
+    present = column.notna()
+    texts = column[present].astype(str)
+    parsed = {text: _parse_iso_datetime(text) or default for text in texts.unique()}
+    values: npt.NDArray[np.object_] = np.full(len(column), default, dtype=object)
+    values[present.to_numpy()] = [parsed[text] for text in texts]
+    return pd.Series(values, index=column.index, dtype=object)
 
-def _coerce_confidence(provenance: Provenance | None, default: float = 0.5) -> float:
-    if provenance is None:
-        return default
-    base = default
-    if provenance.selection_priority:
-        base = max(base, min(1.0, 0.25 + 0.2 * provenance.selection_priority))
-    if provenance.quality_score is not None:
-        base = max(base, min(1.0, provenance.quality_score))
-    return float(max(0.05, min(1.0, base)))
+
+def _confidence_band(confidence: pd.Series) -> pd.Series:
+    bands = np.select(
+        [confidence >= 0.75, confidence >= 0.5],
+        [ConfidenceBand.HIGH.value, ConfidenceBand.MEDIUM.value],
+        ConfidenceBand.LOW.value,
+    )
+    return pd.Series(bands, index=confidence.index, dtype=object)
 
 
 def _parse_selection_provenance(raw: str | None) -> dict[str, dict[str, object]]:
@@ -74,65 +160,130 @@ def _parse_selection_provenance(raw: str | None) -> dict[str, dict[str, object]]
     return {key: value for key, value in data.items() if isinstance(value, dict)}
 
 
-def _provenance_from(selection: dict[str, object]) -> Provenance | None:
-    if not selection:
-        return None
-    source = clean_string(selection.get("source_dataset")) or "Unknown"
-    record_id = clean_string(selection.get("source_record_id"))
-    captured = selection.get("last_interaction_date")
-    timestamp = None
-    if isinstance(captured, str):
-        timestamp = _parse_iso_datetime(captured)
-    priority = selection.get("source_priority")
-    if isinstance(priority, str) and priority.isdigit():
-        priority_value = int(priority)
-    elif isinstance(priority, int | float):
-        priority_value = int(priority)
-    else:
-        priority_value = 0
-    quality_score = selection.get("quality_score")
-    if isinstance(quality_score, str):
-        try:
-            quality_score_value = float(quality_score)
-        except ValueError:
-            quality_score_value = None
-    elif isinstance(quality_score, int | float):
-        quality_score_value = float(quality_score)
-    else:
-        quality_score_value = None
-    if quality_score_value is not None and quality_score_value > 1.0:
-        quality_score_value = min(1.0, quality_score_value / 5.0)
-    return Provenance(
-        source=source,
-        record_id=record_id,
-        captured_at=timestamp,
-        selection_priority=priority_value,
-        quality_score=quality_score_value,
+def _provenance(selections: Sequence[Mapping[str, object]]) -> pd.DataFrame:
+    """Coerce one field's selection documents into ``provenance_*`` columns.
+
+    Rows without a selection are missing throughout; every other row has a
+    ``provenance_source``.
+    """
+
+    present = pd.Series([bool(selection) for selection in selections], dtype=bool)
+    raw = pd.DataFrame(
+        {
+            key: pd.Series([selection.get(key) for selection in selections], dtype=object)
+            for key in _PROVENANCE_KEYS
+        }
     )
 
+    captured = raw["last_interaction_date"]
+    captured = _parse_iso_datetimes(captured[_is_text(captured)]).reindex(raw.index)
 
-def _split_multi(value: object | None) -> Iterator[str]:
-    if not value:
-        return
-    if isinstance(value, str):
-        tokens: Iterable[object] = re.split(r"[;,]", value)
-    elif isinstance(value, Iterable):
-        tokens = list(value)
-    else:
-        return
-    for token in tokens:
-        cleaned = clean_string(token)
-        if cleaned:
-            yield cleaned
+    # Digit strings are taken as they are; other numbers are truncated at zero.
+    priority = raw["source_priority"]
+    is_text = _is_text(priority).to_numpy()
+    texts = priority[is_text].astype(str)
+    numbers = pd.to_numeric(priority[~is_text], errors="coerce").fillna(0)
+    ranks: npt.NDArray[np.int64] = np.zeros(len(priority), dtype=np.int64)
+    ranks[~is_text] = np.trunc(numbers).clip(lower=0)
+    ranks[is_text] = pd.to_numeric(texts.where(texts.str.isdigit(), "0"))
 
+    quality = pd.to_numeric(raw["quality_score"], errors="coerce")
+    quality = quality.where(quality <= 1.0, (quality / 5.0).clip(upper=1.0)).clip(lower=0.0)
 
-def _normalise_person_name(name: str | None) -> str | None:
-    if not name:
-        return None
-    cleaned = clean_string(name)
-    if not cleaned:
-        return None
-    return " ".join(part for part in cleaned.split() if part)
+    frame = pd.DataFrame(
+        {
+            "provenance_source": _coalesce(_clean_text(raw["source_dataset"]), default="Unknown"),
+            "provenance_record_id": _clean_text(raw["source_record_id"]),
+            "provenance_captured_at": captured,
+            "provenance_selection_priority": ranks,
+            "provenance_quality_score": quality,
+        }
+    ).astype(object)
+    frame.loc[~present] = None
+    return frame
+
+
+def _first_present(*frames: pd.DataFrame) -> pd.DataFrame:
+    """Take each row from the first of ``frames`` that has provenance for it."""
+
+    values = frames[-1].to_numpy(dtype=object)
+    for frame in reversed(frames[:-1]):
+        present = frame["provenance_source"].notna().to_numpy()
+        values = np.where(present[:, None], frame.to_numpy(dtype=object), values)
+    return pd.DataFrame(values, index=frames[0].index, columns=frames[0].columns, dtype=object)
+
+
+def _confidence(provenance: pd.DataFrame, default: float) -> pd.Series:
+    """Derive a confidence from selection priority and quality, or ``default``."""
+
+    priority = provenance["provenance_selection_priority"].astype(float)
+    quality = provenance["provenance_quality_score"].astype(float)
+    base = np.full(len(provenance), default)
+    base = np.where(priority > 0, np.maximum(base, np.minimum(1.0, 0.25 + 0.2 * priority)), base)
+    base = np.where(quality.notna(), np.maximum(base, np.minimum(1.0, quality)), base)
+    present = provenance["provenance_source"].notna()
+    return pd.Series(np.where(present, np.clip(base, 0.05, 1.0), default), index=provenance.index)
+
+
+_Entries = dict[str, npt.NDArray[Any]]
+
+
+def _entries(rows: pd.Index, order: int, provenance: pd.DataFrame, **columns: object) -> _Entries:
+    """Build one table entry per source row in ``rows``.
+
+    Series are looked up by source row, arrays are already aligned with ``rows``
+    and anything else is repeated. ``_row`` and ``_order`` keep each row's
+    entries together, in the order the callers list them.
+    """
+
+    positions = rows.to_numpy(dtype=np.int64)
+    entries: _Entries = {
+        "_row": positions,
+        "_order": np.full(len(positions), order, dtype=np.int64),
+    }
+    for name, value in columns.items():
+        if isinstance(value, pd.Series):
+            entries[name] = value.to_numpy(dtype=object)[positions]
+        elif isinstance(value, np.ndarray):
+            entries[name] = value
+        else:
+            entries[name] = np.full(len(positions), value, dtype=object)
+    for name in provenance.columns:
+        entries[name] = provenance[name].to_numpy(dtype=object)[positions]
+    return entries
+
+
+def _stack(*pieces: _Entries) -> _Entries:
+    return {name: np.concatenate([piece[name] for piece in pieces]) for name in pieces[0]}
+
+
+def _by_row(entries: _Entries) -> _Entries:
+    order = np.argsort(entries["_row"] * 8 + entries["_order"], kind="stable")
+    return {name: values[order] for name, values in entries.items()}
+
+
+def _arrow_table(
+    schema: pa.Schema,
+    entries: _Entries,
+    *,
+    ids: pa.Array | None = None,
+    party_ids: pa.Array | None = None,
+) -> pa.Table:
+    """Convert ``entries`` to ``schema``, resolving party row numbers to identifiers."""
+
+    rows = len(entries["_row"])
+    id_column = schema.names[0]
+    arrays = []
+    for field in schema:
+        if field.name == id_column:
+            arrays.append(ids if ids is not None else generate_uuid7_array(rows))
+        elif field.name in _PARTY_REFERENCES and party_ids is not None:
+            arrays.append(party_ids.take(pa.array(entries[field.name].astype(np.int64))))
+        elif field.name in entries:
+            arrays.append(pa.array(entries[field.name], type=field.type, from_pandas=True))
+        else:
+            arrays.append(pa.nulls(rows, field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
 
 
 def build_party_store_from_refined(
@@ -140,214 +291,226 @@ def build_party_store_from_refined(
     *,
     default_country: str | None = None,
     execution_time: datetime | None = None,
+    selections: Sequence[Mapping[str, Mapping[str, object]]] | None = None,
 ) -> PartyStore:
-    """Translate the refined SSOT dataframe into canonical party records."""
+    """Translate the refined SSOT dataframe into canonical party records.
+
+    ``selections`` supplies the per-row provenance documents directly (for
+    example from :class:`hotpass.pipeline.provenance.ProvenanceTable`); when it
+    is omitted the ``selection_provenance`` JSON column is parsed instead.
+    Each table is derived from whole columns of ``refined`` and identifiers are
+    generated per table in one batch, so no Pydantic model is created until the
+    store is read.
+    """
 
     if refined.empty:
         return PartyStore()
 
+    frame = refined.reset_index(drop=True)
+    rows = frame.index
     timestamp = execution_time or datetime.now(tz=UTC)
-    selection_cache = [
-        _parse_selection_provenance(value) for value in refined.get("selection_provenance", [])
-    ]
-
-    organisation_parties: dict[str, Party] = {}
-    person_parties: dict[str, Party] = {}
-    aliases: list[PartyAlias] = []
-    roles: list[PartyRole] = []
-    contact_methods: list[ContactMethod] = []
-
-    for index, row in refined.reset_index(drop=True).iterrows():
-        slug = clean_string(row.get("organization_slug")) or str(index)
-        display_name = clean_string(row.get("organization_name")) or slug
-        provenance_map = selection_cache[index] if index < len(selection_cache) else {}
-        org_prov = _provenance_from(provenance_map.get("organization_name", {}))
-        organisation_party = organisation_parties.get(slug)
-        if organisation_party is None:
-            organisation_party = Party(
-                party_id=generate_uuid7(),
-                kind=PartyKind.ORGANISATION,
-                display_name=display_name,
-                normalized_name=slugify(display_name) if display_name else slug,
-                country_code=row.get("country") or default_country,
-                created_at=timestamp,
-                updated_at=timestamp,
-                provenance=org_prov,
-            )
-            organisation_parties[slug] = organisation_party
-            alias_confidence = _coerce_confidence(org_prov, default=0.6)
-            aliases.append(
-                PartyAlias(
-                    party_id=organisation_party.party_id,
-                    alias=display_name,
-                    alias_type=AliasType.LEGAL,
-                    confidence=alias_confidence,
-                    confidence_band=_confidence_band(alias_confidence),
-                    validity=ValidityWindow(start=timestamp),
-                    provenance=org_prov,
-                )
-            )
-            for dataset in _split_multi(row.get("source_datasets")):
-                dataset_confidence = _coerce_confidence(org_prov, default=0.4)
-                dataset_alias = PartyAlias(
-                    party_id=organisation_party.party_id,
-                    alias=dataset,
-                    alias_type=AliasType.HISTORIC,
-                    confidence=dataset_confidence,
-                    confidence_band=_confidence_band(dataset_confidence),
-                    validity=ValidityWindow(start=timestamp),
-                    provenance=org_prov,
-                )
-                aliases.append(dataset_alias)
-
-        primary_contact_name = clean_string(row.get("contact_primary_name"))
-        primary_contact_role = clean_string(row.get("contact_primary_role")) or "Primary contact"
-        primary_email = clean_string(row.get("contact_primary_email"))
-        primary_phone = clean_string(row.get("contact_primary_phone"))
-
-        person_key = None
-        if primary_email:
-            person_key = f"email:{primary_email.lower()}"
-        elif primary_phone:
-            person_key = f"phone:{primary_phone}"
-        elif primary_contact_name:
-            person_key = f"name:{primary_contact_name.lower()}"
-
-        contact_party = None
-        if person_key:
-            contact_party = person_parties.get(person_key)
-            name_provenance = _provenance_from(provenance_map.get("contact_primary_name", {}))
-            if contact_party is None:
-                display_contact = (
-                    primary_contact_name or primary_email or primary_phone or "Unknown"
-                )
-                contact_party = Party(
-                    party_id=generate_uuid7(),
-                    kind=PartyKind.PERSON,
-                    display_name=display_contact,
-                    normalized_name=_normalise_person_name(primary_contact_name),
-                    country_code=default_country or row.get("country"),
-                    created_at=timestamp,
-                    updated_at=timestamp,
-                    provenance=name_provenance,
-                )
-                person_parties[person_key] = contact_party
-                if primary_contact_name:
-                    contact_confidence = _coerce_confidence(name_provenance, default=0.55)
-                    aliases.append(
-                        PartyAlias(
-                            party_id=contact_party.party_id,
-                            alias=primary_contact_name,
-                            alias_type=AliasType.LEGAL,
-                            confidence=contact_confidence,
-                            confidence_band=_confidence_band(contact_confidence),
-                            validity=ValidityWindow(start=timestamp),
-                            provenance=name_provenance,
-                        )
-                    )
-
-            role_provenance = _provenance_from(provenance_map.get("contact_primary_role", {}))
-            last_seen = row.get("last_interaction_date")
-            start_ts = _parse_iso_datetime(last_seen) or timestamp
-            roles.append(
-                PartyRole(
-                    subject_party_id=contact_party.party_id,
-                    object_party_id=organisation_party.party_id,
-                    role_name=primary_contact_role,
-                    role_category="primary_contact",
-                    is_primary=True,
-                    validity=ValidityWindow(start=start_ts),
-                    provenance=role_provenance or name_provenance or org_prov,
-                )
-            )
-
-            if primary_email:
-                email_prov = _provenance_from(provenance_map.get("contact_primary_email", {}))
-                email_confidence = _coerce_confidence(email_prov, default=0.75)
-                contact_methods.append(
-                    ContactMethod(
-                        party_id=contact_party.party_id,
-                        method_type=ContactMethodType.EMAIL,
-                        value=primary_email,
-                        is_primary=True,
-                        confidence=email_confidence,
-                        validity=ValidityWindow(start=timestamp),
-                        provenance=email_prov or name_provenance,
-                    )
-                )
-            if primary_phone:
-                phone_prov = _provenance_from(provenance_map.get("contact_primary_phone", {}))
-                phone_confidence = _coerce_confidence(phone_prov, default=0.65)
-                contact_methods.append(
-                    ContactMethod(
-                        party_id=contact_party.party_id,
-                        method_type=ContactMethodType.PHONE,
-                        value=primary_phone,
-                        is_primary=not primary_email,
-                        confidence=phone_confidence,
-                        validity=ValidityWindow(start=timestamp),
-                        provenance=phone_prov or name_provenance,
-                    )
-                )
-            for email in _split_multi(row.get("contact_secondary_emails")):
-                contact_methods.append(
-                    ContactMethod(
-                        party_id=contact_party.party_id,
-                        method_type=ContactMethodType.EMAIL,
-                        value=email,
-                        is_primary=False,
-                        confidence=0.5,
-                        validity=ValidityWindow(start=timestamp),
-                        provenance=name_provenance,
-                    )
-                )
-            for phone in _split_multi(row.get("contact_secondary_phones")):
-                contact_methods.append(
-                    ContactMethod(
-                        party_id=contact_party.party_id,
-                        method_type=ContactMethodType.PHONE,
-                        value=phone,
-                        is_primary=False,
-                        confidence=0.4,
-                        validity=ValidityWindow(start=timestamp),
-                        provenance=name_provenance,
-                    )
-                )
-
-        website = clean_string(row.get("website"))
-        if website:
-            web_prov = _provenance_from(provenance_map.get("website", {}))
-            contact_methods.append(
-                ContactMethod(
-                    party_id=organisation_party.party_id,
-                    method_type=ContactMethodType.WEBSITE,
-                    value=website,
-                    is_primary=True,
-                    confidence=_coerce_confidence(web_prov, default=0.6),
-                    validity=ValidityWindow(start=timestamp),
-                    provenance=web_prov or org_prov,
-                )
-            )
-
-        address = clean_string(row.get("address_primary"))
-        if address:
-            address_prov = _provenance_from(provenance_map.get("address_primary", {}))
-            contact_methods.append(
-                ContactMethod(
-                    party_id=organisation_party.party_id,
-                    method_type=ContactMethodType.PHYSICAL_ADDRESS,
-                    value=address,
-                    is_primary=True,
-                    confidence=_coerce_confidence(address_prov, default=0.55),
-                    validity=ValidityWindow(start=timestamp),
-                    provenance=address_prov or org_prov,
-                )
-            )
-
-    parties = tuple(organisation_parties.values()) + tuple(person_parties.values())
-    return PartyStore(
-        parties=parties,
-        aliases=tuple(aliases),
-        roles=tuple(roles),
-        contact_methods=tuple(contact_methods),
+    if selections is None:
+        selections = [
+            _parse_selection_provenance(value) for value in frame.get("selection_provenance", [])
+        ]
+    documents = list(selections[: len(rows)]) + [{}] * (len(rows) - len(selections))
+    provenance = {
+        field: _provenance([document.get(field) or {} for document in documents])
+        for field in _PROVENANCE_FIELDS
+    }
+    org_prov = provenance["organization_name"]
+    name_prov = provenance["contact_primary_name"]
+
+    slug = _coalesce(
+        _clean_text(_column(frame, "organization_slug")), pd.Series(rows.astype(str), index=rows)
+    )
+    display_name = _coalesce(_clean_text(_column(frame, "organization_name")), slug)
+    country = _clean_text(_column(frame, "country"))
+    organisation_codes, organisations = pd.factorize(slug)
+    # Party row numbers: organisations first, then people, each in order of first appearance.
+    organisation = pd.Series(organisation_codes, index=rows)
+    new_organisation = ~slug.duplicated()
+
+    contact_name = _clean_text(_column(frame, "contact_primary_name"))
+    contact_role = _coalesce(
+        _clean_text(_column(frame, "contact_primary_role")), default="Primary contact"
+    )
+    email = _clean_text(_column(frame, "contact_primary_email"))
+    phone = _clean_text(_column(frame, "contact_primary_phone"))
+    person_key = _coalesce(
+        "email:" + email.str.lower(), "phone:" + phone, "name:" + contact_name.str.lower()
+    )
+    has_person = person_key.notna()
+    person_codes, _ = pd.factorize(person_key)
+    person = pd.Series(person_codes + len(organisations), index=rows)
+    new_person = has_person & ~person_key.duplicated()
+
+    organisation_rows = rows[new_organisation.to_numpy()]
+    person_rows = rows[new_person.to_numpy()]
+    organisation_entries = _entries(
+        organisation_rows,
+        0,
+        org_prov,
+        kind=PartyKind.ORGANISATION.value,
+        display_name=display_name,
+        normalized_name=_slugify(display_name),
+        country_code=_coalesce(country, default=default_country),
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+    person_entries = _entries(
+        person_rows,
+        0,
+        name_prov,
+        kind=PartyKind.PERSON.value,
+        display_name=_coalesce(contact_name, email, phone, default="Unknown"),
+        normalized_name=contact_name.str.split().str.join(" "),
+        country_code=default_country or country,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+    party_entries = _stack(organisation_entries, person_entries)
+    party_ids = generate_uuid7_array(len(party_entries["_row"]))
+
+    datasets = _split_multi(_column(frame, "source_datasets")[new_organisation])
+    alias_confidence = _confidence(org_prov, default=0.6)
+    dataset_confidence = _confidence(org_prov, default=0.4)
+    contact_confidence = _confidence(name_prov, default=0.55)
+    contact_alias_rows = rows[(new_person & contact_name.notna()).to_numpy()]
+    alias_entries = _by_row(
+        _stack(
+            _entries(
+                organisation_rows,
+                0,
+                org_prov,
+                party_id=organisation,
+                alias=display_name,
+                alias_type=AliasType.LEGAL.value,
+                confidence=alias_confidence,
+                confidence_band=_confidence_band(alias_confidence),
+                valid_start=timestamp,
+            ),
+            _entries(
+                datasets.index,
+                1,
+                org_prov,
+                party_id=organisation,
+                alias=datasets.to_numpy(),
+                alias_type=AliasType.HISTORIC.value,
+                confidence=dataset_confidence,
+                confidence_band=_confidence_band(dataset_confidence),
+                valid_start=timestamp,
+            ),
+            _entries(
+                contact_alias_rows,
+                2,
+                name_prov,
+                party_id=person,
+                alias=contact_name,
+                alias_type=AliasType.LEGAL.value,
+                confidence=contact_confidence,
+                confidence_band=_confidence_band(contact_confidence),
+                valid_start=timestamp,
+            ),
+        )
+    )
+
+    role_entries = _entries(
+        rows[has_person.to_numpy()],
+        0,
+        _first_present(provenance["contact_primary_role"], name_prov, org_prov),
+        subject_party_id=person,
+        object_party_id=organisation,
+        role_name=contact_role,
+        role_category="primary_contact",
+        is_primary=True,
+        valid_start=_parse_iso_datetimes(_column(frame, "last_interaction_date"), timestamp),
+    )
+
+    email_prov = provenance["contact_primary_email"]
+    phone_prov = provenance["contact_primary_phone"]
+    web_prov = provenance["website"]
+    address_prov = provenance["address_primary"]
+    website = _clean_text(_column(frame, "website"))
+    address = _clean_text(_column(frame, "address_primary"))
+    secondary_emails = _split_multi(_column(frame, "contact_secondary_emails")[has_person])
+    secondary_phones = _split_multi(_column(frame, "contact_secondary_phones")[has_person])
+    contact_method_entries = _by_row(
+        _stack(
+            _entries(
+                rows[email.notna().to_numpy()],
+                0,
+                _first_present(email_prov, name_prov),
+                party_id=person,
+                method_type=ContactMethodType.EMAIL.value,
+                value=email,
+                is_primary=True,
+                confidence=_confidence(email_prov, default=0.75),
+                valid_start=timestamp,
+            ),
+            _entries(
+                rows[phone.notna().to_numpy()],
+                1,
+                _first_present(phone_prov, name_prov),
+                party_id=person,
+                method_type=ContactMethodType.PHONE.value,
+                value=phone,
+                is_primary=email.isna(),
+                confidence=_confidence(phone_prov, default=0.65),
+                valid_start=timestamp,
+            ),
+            _entries(
+                secondary_emails.index,
+                2,
+                name_prov,
+                party_id=person,
+                method_type=ContactMethodType.EMAIL.value,
+                value=secondary_emails.to_numpy(),
+                is_primary=False,
+                confidence=0.5,
+                valid_start=timestamp,
+            ),
+            _entries(
+                secondary_phones.index,
+                3,
+                name_prov,
+                party_id=person,
+                method_type=ContactMethodType.PHONE.value,
+                value=secondary_phones.to_numpy(),
+                is_primary=False,
+                confidence=0.4,
+                valid_start=timestamp,
+            ),
+            _entries(
+                rows[website.notna().to_numpy()],
+                4,
+                _first_present(web_prov, org_prov),
+                party_id=organisation,
+                method_type=ContactMethodType.WEBSITE.value,
+                value=website,
+                is_primary=True,
+                confidence=_confidence(web_prov, default=0.6),
+                valid_start=timestamp,
+            ),
+            _entries(
+                rows[address.notna().to_numpy()],
+                5,
+                _first_present(address_prov, org_prov),
+                party_id=organisation,
+                method_type=ContactMethodType.PHYSICAL_ADDRESS.value,
+                value=address,
+                is_primary=True,
+                confidence=_confidence(address_prov, default=0.55),
+                valid_start=timestamp,
+            ),
+        )
+    )
+
+    return PartyStore.from_tables(
+        party=_arrow_table(PARTY_ARROW_SCHEMA, party_entries, ids=party_ids),
+        party_alias=_arrow_table(PARTY_ALIAS_ARROW_SCHEMA, alias_entries, party_ids=party_ids),
+        party_role=_arrow_table(PARTY_ROLE_ARROW_SCHEMA, role_entries, party_ids=party_ids),
+        contact_method=_arrow_table(
+            CONTACT_METHOD_ARROW_SCHEMA, contact_method_entries, party_ids=party_ids
+        ),
     )
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import json
+import time
 import uuid
 from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from enum import Enum
-from typing import cast
-
+from pathlib import Path
+from typing import TypeVar, cast
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pydantic import BaseModel, ConfigDict, Field
 
+from .schemas import ARROW_SCHEMAS
+
 
 def generate_uuid7() -> uuid.UUID:
     """Generate a sortable UUID using the UUIDv7 algorithm."""
@@ -24,6 +34,34 @@ def generate_uuid7() -> uuid.UUID:
     return uuid.UUID(int=uuid.uuid1().int)
 
 
+_UUID_GROUPS = ((0, 8), (8, 12), (12, 16), (16, 20), (20, 32))
+
+
+def generate_uuid7_array(count: int) -> pa.StringArray:
+    """Generate ``count`` UUIDv7 strings in one vectorised pass.
+
+    The identifiers share the current millisecond timestamp followed by a
+    42-bit counter from a random start and 32 random bits (RFC 9562, method 1),
+    so a batch sorts in the order it was generated.
+    """
+
+    rng = np.random.default_rng()
+    timestamp = np.uint64(time.time_ns() // 1_000_000)
+    start = rng.integers(0, 1 << 41, dtype=np.uint64)
+    counter: npt.NDArray[np.uint64] = start + np.arange(count, dtype=np.uint64)
+    words: npt.NDArray[np.uint64] = np.empty((count, 2), dtype=">u8")
+    words[:, 0] = (timestamp << np.uint64(16)) | np.uint64(0x7000) | (counter >> np.uint64(30))
+    words[:, 1] = (
+        (np.uint64(0b10) << np.uint64(62))
+        | ((counter & np.uint64((1 << 30) - 1)) << np.uint64(32))
+        | rng.integers(0, 1 << 32, size=count, dtype=np.uint64)
+    )
+    digits = pa.array(np.frombuffer(words.tobytes().hex().encode("ascii"), dtype="S32"))
+    digits = digits.cast(pa.string())
+    groups = [pc.utf8_slice_codeunits(digits, start, stop) for start, stop in _UUID_GROUPS]
+    return cast(pa.StringArray, pc.binary_join_element_wise(*groups, "-"))
+
+
 class PartyKind(str, Enum):
     """High-level category describing the type of party."""
 
@@ -225,13 +263,94 @@ class ContactMethod(DomainModel):
     )
 
 
-class PartyStore(DomainModel):
-    """Aggregate of canonical party data."""
+_ModelT = TypeVar("_ModelT", bound=DomainModel)
+
+
+class PartyStore:
+    """Aggregate of canonical party data, held column-wise as Arrow tables.
 
-    parties: tuple[Party, ...] = Field(default_factory=tuple)
-    aliases: tuple[PartyAlias, ...] = Field(default_factory=tuple)
-    roles: tuple[PartyRole, ...] = Field(default_factory=tuple)
-    contact_methods: tuple[ContactMethod, ...] = Field(default_factory=tuple)
+    Each table follows :data:`~hotpass.domain.party.schemas.ARROW_SCHEMAS`, with
+    provenance and validity flattened into ``provenance_*`` and ``valid_*``
+    columns. The Pydantic records exposed by :attr:`parties`, :attr:`aliases`,
+    :attr:`roles` and :attr:`contact_methods` are only built, and validated,
+    when first read; the bulk exports work on the tables directly.
+    """
+
+    def __init__(
+        self,
+        *,
+        parties: Iterable[Party] = (),
+        aliases: Iterable[PartyAlias] = (),
+        roles: Iterable[PartyRole] = (),
+        contact_methods: Iterable[ContactMethod] = (),
+    ) -> None:
+        records = {
+            "party": tuple(parties),
+            "party_alias": tuple(aliases),
+            "party_role": tuple(roles),
+            "contact_method": tuple(contact_methods),
+        }
+        self._tables = {
+            name: _table_from_models(models, ARROW_SCHEMAS[name])
+            for name, models in records.items()
+        }
+        self._records: dict[str, tuple[DomainModel, ...]] = records
+
+    @classmethod
+    def from_tables(
+        cls,
+        *,
+        party: pa.Table | None = None,
+        party_alias: pa.Table | None = None,
+        party_role: pa.Table | None = None,
+        contact_method: pa.Table | None = None,
+    ) -> PartyStore:
+        """Build a store from Arrow tables without creating any records."""
+
+        store = cls()
+        provided = {
+            "party": party,
+            "party_alias": party_alias,
+            "party_role": party_role,
+            "contact_method": contact_method,
+        }
+        for name, table in provided.items():
+            if table is not None:
+                schema = ARROW_SCHEMAS[name]
+                store._tables[name] = table.select(schema.names).cast(schema)
+                store._records.pop(name, None)
+        return store
+
+    @property
+    def tables(self) -> dict[str, pa.Table]:
+        """Arrow tables keyed by their DuckDB table name."""
+
+        return dict(self._tables)
+
+    def _materialise(self, name: str, model: type[_ModelT]) -> tuple[_ModelT, ...]:
+        records = self._records.get(name)
+        if records is None:
+            records = tuple(
+                model.model_validate(_nest(row)) for row in self._tables[name].to_pylist()
+            )
+            self._records[name] = records
+        return cast(tuple[_ModelT, ...], records)
+
+    @property
+    def parties(self) -> tuple[Party, ...]:
+        return self._materialise("party", Party)
+
+    @property
+    def aliases(self) -> tuple[PartyAlias, ...]:
+        return self._materialise("party_alias", PartyAlias)
+
+    @property
+    def roles(self) -> tuple[PartyRole, ...]:
+        return self._materialise("party_role", PartyRole)
+
+    @property
+    def contact_methods(self) -> tuple[ContactMethod, ...]:
+        return self._materialise("contact_method", ContactMethod)
 
     def extend(
         self,
@@ -243,11 +362,17 @@ class PartyStore(DomainModel):
     ) -> PartyStore:
         """Return a new store extended with the provided objects."""
 
-        return PartyStore(
-            parties=tuple(self.parties) + tuple(parties or ()),
-            aliases=tuple(self.aliases) + tuple(aliases or ()),
-            roles=tuple(self.roles) + tuple(roles or ()),
-            contact_methods=tuple(self.contact_methods) + tuple(contact_methods or ()),
+        additions = PartyStore(
+            parties=parties or (),
+            aliases=aliases or (),
+            roles=roles or (),
+            contact_methods=contact_methods or (),
+        )
+        return PartyStore.from_tables(
+            **{
+                name: pa.concat_tables([table, additions._tables[name]])
+                for name, table in self._tables.items()
+            }
         )
 
     def party_index(self) -> dict[uuid.UUID, Party]:
@@ -258,9 +383,79 @@ class PartyStore(DomainModel):
     def as_dict(self) -> dict[str, list[dict[str, object]]]:
         """Return the store as JSON serialisable dictionaries."""
 
-        return {
-            "party": [party.model_dump(mode="json") for party in self.parties],
-            "party_alias": [alias.model_dump(mode="json") for alias in self.aliases],
-            "party_role": [role.model_dump(mode="json") for role in self.roles],
-            "contact_method": [contact.model_dump(mode="json") for contact in self.contact_methods],
-        }
+        return {name: _json_rows(table) for name, table in self._tables.items()}
+
+    def write_json(self, path: Path, *, indent: int | None = 2) -> None:
+        """Write :meth:`as_dict` to ``path`` as one JSON document."""
+
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(self.as_dict(), handle, indent=indent)
+
+    def write_parquet(self, directory: Path) -> dict[str, Path]:
+        """Write each table to ``directory/<table>.parquet`` and return the paths."""
+
+        directory.mkdir(parents=True, exist_ok=True)
+        paths: dict[str, Path] = {}
+        for name, table in self._tables.items():
+            paths[name] = directory / f"{name}.parquet"
+            pq.write_table(table, paths[name], compression="zstd")
+        return paths
+
+
+def _flatten(model: DomainModel, schema: pa.Schema) -> dict[str, object]:
+    provenance = getattr(model, "provenance", None)
+    validity = getattr(model, "validity", None)
+    row: dict[str, object] = {}
+    for name in schema.names:
+        if name.startswith("provenance_"):
+            value = getattr(provenance, name.removeprefix("provenance_"), None)
+        elif name.startswith("valid_"):
+            value = getattr(validity, name.removeprefix("valid_"), None)
+        else:
+            value = getattr(model, name)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        row[name] = value
+    return row
+
+
+def _table_from_models(models: Iterable[DomainModel], schema: pa.Schema) -> pa.Table:
+    return pa.Table.from_pylist([_flatten(model, schema) for model in models], schema=schema)
+
+
+def _nest(row: dict[str, object]) -> dict[str, object]:
+    """Rebuild the nested record layout from a flattened table row."""
+
+    record: dict[str, object] = {}
+    provenance: dict[str, object] = {}
+    for name, value in row.items():
+        if name.startswith("provenance_"):
+            provenance[name.removeprefix("provenance_")] = value
+        elif name.startswith("valid_"):
+            validity = cast(dict[str, object], record.setdefault("validity", {}))
+            validity[name.removeprefix("valid_")] = value
+        else:
+            record[name] = value
+    if provenance:
+        record["provenance"] = provenance if provenance["source"] is not None else None
+    return record
+
+
+def _json_timestamp(value: datetime | None) -> str | None:
+    # Matches Pydantic's JSON rendering of UTC timestamps.
+    return None if value is None else value.isoformat().replace("+00:00", "Z")
+
+
+def _json_rows(table: pa.Table) -> list[dict[str, object]]:
+    columns: dict[str, list[object]] = {}
+    for field in table.schema:
+        values = table.column(field.name).to_pylist()
+        if pa.types.is_timestamp(field.type):
+            values = [_json_timestamp(value) for value in values]
+        columns[field.name] = values
+    names = list(columns)
+    return [
+        _nest(dict(zip(names, row, strict=True))) for row in zip(*columns.values(), strict=True)
+    ]
@@ -1,10 +1,11 @@
-"""DuckDB schema definitions for the canonical party store."""
+"""DuckDB and Arrow schema definitions for the canonical party store."""
 
 from __future__ import annotations
 
 from textwrap import dedent
 
 import duckdb
+import pyarrow as pa
 
 PARTY_TABLE_DDL = dedent(
     """
@@ -97,6 +98,81 @@ ALL_DDL = (
 )
 
 
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+_PROVENANCE_FIELDS = (
+    pa.field("provenance_source", pa.string()),
+    pa.field("provenance_record_id", pa.string()),
+    pa.field("provenance_captured_at", _TIMESTAMP),
+    pa.field("provenance_selection_priority", pa.int32()),
+    pa.field("provenance_quality_score", pa.float64()),
+)
+
+_VALIDITY_FIELDS = (
+    pa.field("valid_start", _TIMESTAMP, nullable=False),
+    pa.field("valid_end", _TIMESTAMP),
+)
+
+PARTY_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("party_id", pa.string(), nullable=False),
+        pa.field("kind", pa.string(), nullable=False),
+        pa.field("display_name", pa.string(), nullable=False),
+        pa.field("normalized_name", pa.string()),
+        pa.field("country_code", pa.string()),
+        pa.field("created_at", _TIMESTAMP, nullable=False),
+        pa.field("updated_at", _TIMESTAMP, nullable=False),
+        *_PROVENANCE_FIELDS,
+    ]
+)
+
+PARTY_ALIAS_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("alias_id", pa.string(), nullable=False),
+        pa.field("party_id", pa.string(), nullable=False),
+        pa.field("alias", pa.string(), nullable=False),
+        pa.field("alias_type", pa.string(), nullable=False),
+        pa.field("confidence", pa.float64(), nullable=False),
+        pa.field("confidence_band", pa.string(), nullable=False),
+        *_VALIDITY_FIELDS,
+        *_PROVENANCE_FIELDS,
+    ]
+)
+
+PARTY_ROLE_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("role_id", pa.string(), nullable=False),
+        pa.field("subject_party_id", pa.string(), nullable=False),
+        pa.field("object_party_id", pa.string(), nullable=False),
+        pa.field("role_name", pa.string(), nullable=False),
+        pa.field("role_category", pa.string()),
+        pa.field("is_primary", pa.bool_(), nullable=False),
+        *_VALIDITY_FIELDS,
+        *_PROVENANCE_FIELDS,
+    ]
+)
+
+CONTACT_METHOD_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("contact_method_id", pa.string(), nullable=False),
+        pa.field("party_id", pa.string(), nullable=False),
+        pa.field("method_type", pa.string(), nullable=False),
+        pa.field("value", pa.string(), nullable=False),
+        pa.field("is_primary", pa.bool_(), nullable=False),
+        pa.field("confidence", pa.float64(), nullable=False),
+        *_VALIDITY_FIELDS,
+        *_PROVENANCE_FIELDS,
+    ]
+)
+
+ARROW_SCHEMAS = {
+    "party": PARTY_ARROW_SCHEMA,
+    "party_alias": PARTY_ALIAS_ARROW_SCHEMA,
+    "party_role": PARTY_ROLE_ARROW_SCHEMA,
+    "contact_method": CONTACT_METHOD_ARROW_SCHEMA,
+}
+
+
 def install_tables(connection: duckdb.DuckDBPyConnection) -> None:
     """Create the canonical party tables within an existing DuckDB connection."""
 
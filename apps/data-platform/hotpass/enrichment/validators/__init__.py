@@ -16,8 +16,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 
-import phonenumbers
-from phonenumbers import carrier, geocoder, number_type
+from ...transform.phone import PhoneBatchService, get_phone_service
 
 try:  # pragma: no cover - optional dependency for MX lookups
     import dns.resolver
@@ -206,8 +205,9 @@ class EmailValidator:
 class PhoneValidator:
     """Validate phone numbers using the phonenumbers library."""
 
-    def __init__(self) -> None:
+    def __init__(self, service: PhoneBatchService | None = None) -> None:
         self._cache: dict[tuple[str, str], PhoneValidationResult] = {}
+        self._service = service or get_phone_service()
 
     def validate(self, number: str | None, *, country_code: str) -> PhoneValidationResult | None:
         if not number:
@@ -218,29 +218,21 @@ class PhoneValidator:
         cache_key = (candidate, country_code.upper())
         if cache_key in self._cache:
             return self._cache[cache_key]
-        try:
-            parsed = phonenumbers.parse(candidate, country_code)
-        except phonenumbers.NumberParseException as exc:
+        parsed = self._service.parse(candidate, country_code)
+        if parsed.e164 is None:
             result = PhoneValidationResult(
                 number=candidate,
                 status=ValidationStatus.UNDELIVERABLE,
                 confidence=0.0,
-                reason=f"parse_error:{getattr(exc.error_type, 'name', 'unknown').lower()}",
+                reason=f"parse_error:{parsed.error}",
             )
             self._cache[cache_key] = result
             return result
-        possible = phonenumbers.is_possible_number(parsed)
-        valid = phonenumbers.is_valid_number(parsed)
-        carrier_name = carrier.name_for_number(parsed, "en") or None
-        region_lookup = getattr(geocoder, "region_code_for_number", None)
-        region_code = region_lookup(parsed) if callable(region_lookup) else None
-        phone_type = number_type(parsed)
-        type_name = getattr(phone_type, "name", None)
-        if valid:
+        if parsed.valid:
             status = ValidationStatus.DELIVERABLE
             confidence = 0.85
             reason = None
-        elif possible:
+        elif parsed.possible:
             status = ValidationStatus.RISKY
             confidence = 0.45
             reason = "number_possible"
@@ -249,13 +241,13 @@ class PhoneValidator:
             confidence = 0.1
             reason = "number_invalid"
         result = PhoneValidationResult(
-            number=phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+            number=parsed.e164,
             status=status,
             confidence=confidence,
             reason=reason,
-            carrier_name=carrier_name,
-            region_code=region_code,
-            number_type=type_name,
+            carrier_name=parsed.carrier,
+            region_code=parsed.region_code,
+            number_type=parsed.number_type,
         )
         self._cache[cache_key] = result
         return result
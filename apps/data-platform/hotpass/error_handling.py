@@ -67,6 +67,10 @@ class HotpassError(Exception):
         self.context = context
         super().__init__(context.message)
 
+    def __reduce__(self) -> tuple[type[HotpassError], tuple[ErrorContext]]:
+        # Rebuild from the context so errors survive worker-process boundaries.
+        return (self.__class__, (self.context,))
+
 
 class FileNotFoundError(HotpassError):
     """Raised when a required file is not found."""
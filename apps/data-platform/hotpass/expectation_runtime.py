@@ -0,0 +1,184 @@
+"""Process-wide Great Expectations runtime shared by the validation entry points."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, cast
+
+import pandas as pd
+
+try:  # pragma: no cover - Great Expectations is an optional dependency
+    from great_expectations.core.batch import Batch
+    from great_expectations.core.expectation_suite import ExpectationSuite
+    from great_expectations.core.expectation_validation_result import (
+        ExpectationSuiteValidationResult,
+    )
+    from great_expectations.data_context.data_context import context_factory as ge_context_factory
+    from great_expectations.data_context.data_context.ephemeral_data_context import (
+        EphemeralDataContext,
+    )
+    from great_expectations.data_context.types.base import (
+        DataContextConfig,
+        InMemoryStoreBackendDefaults,
+    )
+    from great_expectations.execution_engine.pandas_execution_engine import PandasExecutionEngine
+    from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
+    from great_expectations.validator.validator import Validator
+except ImportError:  # pragma: no cover - exercised when GE extras not installed
+    GE_AVAILABLE = False
+else:
+    GE_AVAILABLE = True
+
+
+def _data_docs_sites(data_docs_dir: Path | None) -> dict[str, object]:
+    if data_docs_dir is None:
+        return {}
+    return {
+        "local_site": {
+            "class_name": "SiteBuilder",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": str(data_docs_dir),
+            },
+            "site_index_builder": {
+                "class_name": "DefaultSiteIndexBuilder",
+            },
+        }
+    }
+
+
+class ExpectationRuntime:
+    """Reuse parsed suites and ephemeral data contexts across validation calls.
+
+    Suites are cached by resolved path and modification time so edited files are
+    picked up without a restart. One context is kept per Data Docs directory;
+    validators copy the suite they are given, so cached suites are never mutated.
+    ``setup_seconds`` accumulates the time spent parsing suites and building
+    contexts, which is the cost the cache amortises.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._suites: dict[Path, tuple[int, ExpectationSuite]] = {}
+        self._contexts: dict[Path | None, EphemeralDataContext] = {}
+        self.setup_seconds = 0.0
+
+    def load_suite(self, path: Path) -> ExpectationSuite:
+        """Return the suite stored at ``path``, parsing it only when the file changed."""
+
+        resolved = path.resolve()
+        mtime_ns = resolved.stat().st_mtime_ns
+        with self._lock:
+            cached = self._suites.get(resolved)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            started = time.perf_counter()
+            with resolved.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            suite = ExpectationSuite(
+                name=payload["expectation_suite_name"],
+                expectations=[
+                    ExpectationConfiguration(
+                        type=item["expectation_type"],
+                        kwargs=item.get("kwargs", {}),
+                        meta=item.get("meta"),
+                    )
+                    for item in payload.get("expectations", [])
+                ],
+                meta=payload.get("meta", {}),
+            )
+            self._suites[resolved] = (mtime_ns, suite)
+            self.setup_seconds += time.perf_counter() - started
+            return suite
+
+    def context(self, data_docs_dir: Path | None = None) -> EphemeralDataContext:
+        """Return the shared context, building it on first use."""
+
+        with self._lock:
+            context = self._contexts.get(data_docs_dir)
+            if context is not None:
+                return context
+            if not GE_AVAILABLE:
+                raise RuntimeError("Great Expectations must be installed for contract validation")
+            started = time.perf_counter()
+            config = DataContextConfig(
+                config_version=4,
+                expectations_store_name="expectations_store",
+                validation_results_store_name="validation_results_store",
+                checkpoint_store_name="checkpoint_store",
+                data_docs_sites=_data_docs_sites(data_docs_dir),
+                analytics_enabled=False,
+                store_backend_defaults=InMemoryStoreBackendDefaults(init_temp_docs_sites=False),
+            )
+            context = EphemeralDataContext(project_config=config)
+            self._contexts[data_docs_dir] = context
+            self.setup_seconds += time.perf_counter() - started
+            return context
+
+    @contextmanager
+    def activate(self, data_docs_dir: Path | None = None) -> Iterator[EphemeralDataContext]:
+        """Install the shared context as the active GE project for the duration of a block."""
+
+        with self._lock:
+            context = self.context(data_docs_dir)
+            project_manager = ge_context_factory.project_manager
+            previous_project = project_manager.get_project()
+            project_manager.set_project(context)
+            try:
+                yield context
+            finally:
+                project_manager.set_project(previous_project)
+
+    def validator(
+        self,
+        context: EphemeralDataContext,
+        frame: pd.DataFrame,
+        suite: ExpectationSuite,
+    ) -> Any:
+        """Build a validator for ``frame`` bound to an active shared context."""
+
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            expectation_suite=suite,
+            batches=[Batch(data=frame)],
+            data_context=context,
+        )
+        validator.set_default_expectation_argument("catch_exceptions", True)
+        return validator
+
+    def validate(
+        self,
+        suite: ExpectationSuite,
+        frames: Iterable[pd.DataFrame],
+    ) -> list[ExpectationSuiteValidationResult]:
+        """Validate each frame against ``suite`` through a single context activation."""
+
+        with self.activate() as context:
+            return [
+                cast(
+                    ExpectationSuiteValidationResult,
+                    self.validator(context, frame, suite).validate(),
+                )
+                for frame in frames
+            ]
+
+    def clear(self) -> None:
+        """Drop cached suites and contexts."""
+
+        with self._lock:
+            self._suites.clear()
+            self._contexts.clear()
+
+
+_RUNTIME = ExpectationRuntime()
+
+
+def get_expectation_runtime() -> ExpectationRuntime:
+    """Return the process-wide expectation runtime."""
+
+    return _RUNTIME
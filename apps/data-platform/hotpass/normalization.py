@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import math
 import re
+import threading
 import unicodedata
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
 
 from .transform import clean_text as _clean_text
 from .transform import normalise_identifier
@@ -89,3 +97,127 @@ def join_non_empty(parts: Iterable[str | None], separator: str = " ") -> str | N
 def normalize_identifier(value: str | None) -> str | None:
     """Expose identifier normalisation based on python-stdnum helpers."""
     return normalise_identifier(value)
+
+
+NORMALIZATION_CACHE_SIZE = 65_536
+"""Upper bound on the number of memoised normaliser results kept per process."""
+
+_MISSING = object()
+_NAN_KEY = object()
+
+
+class NormalizationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _NormalizationMemo:
+    """Least-recently-used memo shared by the batch normalisation helpers.
+
+    Keys combine the normaliser, its keyword arguments and the value's type so
+    ``1`` and ``1.0`` keep producing the same strings as the per-cell helpers.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> Any:
+        with self._lock:
+            result = self._entries.get(key, _MISSING)
+            if result is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: tuple[Any, ...], result: Any) -> None:
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> NormalizationCacheInfo:
+        with self._lock:
+            return NormalizationCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_MEMO = _NormalizationMemo(NORMALIZATION_CACHE_SIZE)
+
+
+def normalization_cache_info() -> NormalizationCacheInfo:
+    """Report hit/miss counts for the cross-run normalisation memo."""
+    return _MEMO.info()
+
+
+def clear_normalization_cache() -> None:
+    """Drop every memoised normaliser result."""
+    _MEMO.clear()
+
+
+def _value_key(value: object) -> object:
+    if isinstance(value, float) and math.isnan(value):
+        return _NAN_KEY
+    return value
+
+
+def normalize_values(
+    func: Callable[..., Any], values: Iterable[object], /, **kwargs: Any
+) -> list[Any]:
+    """Apply ``func`` to ``values``, evaluating it once per distinct value.
+
+    ``func`` must be a pure normaliser such as :func:`slugify` or
+    :func:`normalize_phone`; extra keyword arguments are forwarded to it and form
+    part of the memo key. Results are remembered across calls in a bounded
+    least-recently-used memo. Unhashable values are normalised directly.
+    """
+
+    options = tuple(sorted(kwargs.items()))
+    local: dict[tuple[type, object], Any] = {}
+    results: list[Any] = []
+    for value in values:
+        try:
+            local_key = (type(value), _value_key(value))
+            result = local.get(local_key, _MISSING)
+        except TypeError:
+            results.append(func(value, **kwargs))
+            continue
+        if result is _MISSING:
+            memo_key = (func, options, *local_key)
+            result = _MEMO.get(memo_key)
+            if result is _MISSING:
+                result = func(value, **kwargs)
+                _MEMO.put(memo_key, result)
+            local[local_key] = result
+        results.append(result)
+    return results
+
+
+def normalize_series(series: pd.Series, func: Callable[..., Any], /, **kwargs: Any) -> pd.Series:
+    """Dictionary-encode ``series`` and normalise each distinct value once.
+
+    Typed columns (strings, categoricals, numbers, dates) are factorised so
+    ``func`` only sees the dictionary of unique values; object columns, whose
+    cells may mix types, are deduplicated on ``(type, value)`` instead. The
+    result matches ``series.astype(object).apply(func, **kwargs)``.
+    """
+
+    if series.dtype == object:
+        results = normalize_values(func, series.tolist(), **kwargs)
+        return pd.Series(results, index=series.index, name=series.name, dtype=object)
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    dictionary: npt.NDArray[np.object_] = np.empty(len(uniques), dtype=object)
+    dictionary[:] = normalize_values(func, list(uniques), **kwargs)
+    return pd.Series(dictionary[codes], index=series.index, name=series.name, dtype=object)
@@ -455,6 +455,7 @@ def _execute_pipeline(
     runner_kwargs: Mapping[str, Any] | None,
     archive: bool,
     archive_dir: Path | None,
+    archive_format: str = "zip",
 ) -> PipelineRunSummary:
     """Execute the pipeline runner and return a structured summary."""
 
@@ -494,6 +495,7 @@ def _execute_pipeline(
                 archive_path = create_refined_archive(
                     excel_path=config.output_path,
                     archive_dir=archive_root,
+                    archive_format=archive_format,
                 )
             except Exception as exc:  # pragma: no cover - exercised via unit tests
                 raise PipelineOrchestrationError(f"Failed to create archive: {exc}") from exc
@@ -557,6 +559,7 @@ def run_pipeline_once(options: PipelineRunOptions) -> PipelineRunSummary:
             runner_kwargs=runner_kwargs or None,
             archive=config.pipeline.archive,
             archive_dir=config.pipeline.dist_dir,
+            archive_format=config.pipeline.archive_format,
         )
 
 
@@ -0,0 +1,24 @@
+"""Process-pool helpers shared by the parallel ingestion and aggregation paths."""
+
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+
+def worker_context(*preload: str) -> BaseContext:
+    """Return a start method that is safe once Polars or Arrow thread pools exist.
+
+    Forking a parent whose Rust thread pools are live can deadlock the child, so
+    workers come from a fork server that has already imported the ``preload``
+    modules. Platforms without a fork server fall back to ``spawn``.
+    """
+
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(list(preload))
+    return context
+
+
+__all__ = ["worker_context"]
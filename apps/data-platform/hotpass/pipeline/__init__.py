@@ -5,6 +5,7 @@ from __future__ import annotations
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
+from ..quality import build_ssot_polars_schema as _default_build_ssot_polars_schema
 from ..quality import build_ssot_schema as _default_build_ssot_schema
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
@@ -13,6 +14,7 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
     from .base import PipelineConfig, PipelineResult
 
 __all__ = [
+    "AGGREGATION_ENGINES",
     "PIIRedactionConfig",
     "PipelineConfig",
     "PipelineResult",
@@ -35,7 +37,9 @@ __all__ = [
     "PIPELINE_EVENT_WRITE_COMPLETED",
     "PIPELINE_EVENT_COMPLETED",
     "SSOT_COLUMNS",
+    "VALIDATION_BACKENDS",
     "_aggregate_group",
+    "build_ssot_polars_schema",
     "build_ssot_schema",
     "run_pipeline",
 ]
@@ -107,6 +111,8 @@ _LAZY_ATTRS: dict[str, tuple[str, str]] = {
         "hotpass.pipeline.events",
         "PIPELINE_EVENT_COMPLETED",
     ),
+    "AGGREGATION_ENGINES": ("hotpass.pipeline.config", "AGGREGATION_ENGINES"),
+    "VALIDATION_BACKENDS": ("hotpass.pipeline.config", "VALIDATION_BACKENDS"),
     "SSOT_COLUMNS": ("hotpass.pipeline.config", "SSOT_COLUMNS"),
     "_aggregate_group": ("hotpass.pipeline.aggregation", "_aggregate_group"),
     "run_pipeline": ("hotpass.pipeline.orchestrator", "run_pipeline"),
@@ -133,6 +139,12 @@ def build_ssot_schema() -> Any:
     return _default_build_ssot_schema()
 
 
+def build_ssot_polars_schema() -> Any:
+    """Return the default SSOT schema for the Polars validation backend."""
+
+    return _default_build_ssot_polars_schema()
+
+
 def run_pipeline(config: PipelineConfig | HotpassConfig) -> PipelineResult:
     """Execute the pipeline using the orchestrator interface."""
 
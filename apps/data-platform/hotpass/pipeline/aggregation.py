@@ -1,41 +1,48 @@
 from __future__ import annotations
 
-import json
 import logging
-import re
-from collections.abc import Callable, Iterable, Mapping, Sequence
-from dataclasses import dataclass
-from typing import Any, cast
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, cast
 
 import pandas as pd
 import polars as pl
 
 from ..enrichment.intent import IntentOrganizationSummary
-from ..enrichment.validators import ContactValidationService
-from ..normalization import clean_string, coalesce, slugify
+from ..normalization import clean_string, coalesce
 from ..pipeline_reporting import collect_unique
-from ..storage import PolarsDataset
+from ..storage import PandasView, PolarsDataset
 from ..telemetry import pipeline_stage
 from ..transform.scoring import LeadScorer
+from .aggregation_polars import iter_polars_records
+from .aggregation_shards import iter_sharded_records, resolve_aggregation_workers
 from .config import (
+    AGGREGATION_ENGINES,
     DEFAULT_LEAD_SCORER,
     PipelineConfig,
 )
 from .config import SSOT_COLUMNS as CONFIG_SSOT_COLUMNS
-from .quality_summary import summarise_quality as _summarise_quality
+from .conflicts import ConflictLedger
+from .provenance import ProvenanceTable
+from .survivorship import (
+    DEFAULT_SURVIVORSHIP_POLICY,
+    PARSED_INTERACTION_COLUMN,
+    SurvivorshipPolicy,
+    parse_datetime_values,
+)
+from .survivorship import dataset_label as _dataset_label
+from .survivorship import finalise_record as _finalise_record
+from .survivorship import normalise_scalar as _normalise_scalar
+from .survivorship import parse_last_interaction as _parse_last_interaction
+from .survivorship import row_quality_score as _row_quality_score
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .incremental import IncrementalCheckpoint
 
 SSOT_COLUMNS = CONFIG_SSOT_COLUMNS
 
 logger = logging.getLogger(__name__)
 
-CONTACT_VALIDATION = ContactValidationService()
-SOURCE_PRIORITY: dict[str, int] = {
-    "SACAA Cleaned": 3,
-    "Reachout Database": 2,
-    "Contact Database": 1,
-}
-YEAR_FIRST_PATTERN = re.compile(r"^\s*\d{4}")
-
 
 @dataclass(frozen=True)
 class RowMetadata:
@@ -55,11 +62,39 @@ class ValueSelection:
 
 @dataclass
 class AggregationResult:
-    refined_df: pd.DataFrame
+    """Output of the aggregation stage.
+
+    ``conflicts`` holds every conflict unless ``conflict_ledger`` streams them to
+    disk, in which case it only keeps the ledger's leading sample. ``refined_frame``
+    is the canonical output; ``refined_df`` is a pandas view of it built on first
+    access. Their ``selection_provenance`` column is left null: ``provenance``
+    holds the selections, and the JSON column is only built for published records.
+    """
+
     combined_polars: pl.DataFrame
     conflicts: list[dict[str, Any]]
     metrics: dict[str, Any]
     source_breakdown: dict[str, int]
+    provenance: ProvenanceTable | None = None
+    conflict_ledger: ConflictLedger | None = None
+    refined_frame: pl.DataFrame | None = None
+    refined_df: PandasView = PandasView("refined_frame", stage="aggregate")
+
+    @property
+    def refined(self) -> pl.DataFrame | pd.DataFrame:
+        """The refined records, preferring the Polars frame over the pandas view."""
+
+        return self.refined_frame if self.refined_frame is not None else self.refined_df
+
+    @property
+    def record_count(self) -> int:
+        return len(self.refined)
+
+    @property
+    def conflict_total(self) -> int:
+        if self.conflict_ledger is not None:
+            return int(self.conflict_ledger.total)
+        return len(self.conflicts)
 
 
 def _flatten_series_of_lists(series: pd.Series) -> list[str]:
@@ -83,92 +118,25 @@ def _flatten_series_of_lists(series: pd.Series) -> list[str]:
     return unique
 
 
-def _latest_iso_date(values: Iterable[object | None]) -> str | None:
-    candidates: list[object] = []
-    for value in values:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            continue
-        if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                continue
-            candidates.append(stripped)
-        else:
-            candidates.append(value)
-
-    if not candidates:
-        return None
-
-    parsed: list[pd.Timestamp] = []
-    for candidate in candidates:
-        timestamp: pd.Timestamp | None
-        if isinstance(candidate, pd.Timestamp):
-            timestamp = cast(pd.Timestamp, pd.to_datetime(candidate, utc=True))
-        else:
-            text = str(candidate)
-            prefer_dayfirst = not YEAR_FIRST_PATTERN.match(text)
-            timestamp = cast(
-                pd.Timestamp,
-                pd.to_datetime(
-                    text,
-                    errors="coerce",
-                    dayfirst=prefer_dayfirst,
-                    utc=True,
-                ),
-            )
-            if pd.isna(timestamp):
-                timestamp = cast(
-                    pd.Timestamp,
-                    pd.to_datetime(
-                        text,
-                        errors="coerce",
-                        dayfirst=not prefer_dayfirst,
-                        utc=True,
-                    ),
-                )
-        if pd.notna(timestamp):
-            parsed.append(timestamp)
-
-    if not parsed:
-        return None
-
-    latest = max(parsed)
-    if pd.isna(latest):
-        return None
-    return str(latest.date().isoformat())
+def _sort_key(meta: RowMetadata) -> tuple[Any, ...]:
+    timestamp_value = (
+        meta.last_interaction.value if meta.last_interaction is not None else pd.Timestamp.min.value
+    )
+    return (
+        meta.source_priority,
+        meta.quality_score,
+        timestamp_value,
+        -meta.index,
+        meta.source_record_id or "",
+    )
 
 
-def _resolve_intent_summary(
-    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
-    slug: str | None,
-    organization_name: str | None,
-) -> IntentOrganizationSummary | None:
-    if not intent_summaries:
-        return None
-    candidates: list[str] = []
-    if slug:
-        candidates.append(str(slug).lower())
-    if organization_name:
-        slug_candidate = slugify(organization_name)
-        if slug_candidate:
-            candidates.append(slug_candidate)
-        candidates.append(organization_name.lower())
-    for candidate in candidates:
-        summary = intent_summaries.get(candidate)
-        if summary:
-            return summary
-    return None
-
-
-def _row_quality_score(row: Mapping[str, object | None]) -> int:
-    checks = [
-        bool(row.get("contact_emails")),
-        bool(row.get("contact_phones")),
-        bool(row.get("website")),
-        bool(row.get("province")),
-        bool(row.get("address")),
-    ]
-    return sum(1 for present in checks if present)
+def _ranked_indices(row_metadata: Sequence[RowMetadata]) -> list[int]:
+    return sorted(
+        range(len(row_metadata)),
+        key=lambda idx: _sort_key(row_metadata[idx]),
+        reverse=True,
+    )
 
 
 def _aggregate_group(
@@ -178,6 +146,7 @@ def _aggregate_group(
     country_code: str,
     intent_summaries: Mapping[str, IntentOrganizationSummary] | None = None,
     lead_scorer: LeadScorer = DEFAULT_LEAD_SCORER,
+    policy: SurvivorshipPolicy = DEFAULT_SURVIVORSHIP_POLICY,
 ) -> dict[str, object | None]:
     if not rows:
         raise ValueError("Cannot aggregate empty group")
@@ -187,13 +156,14 @@ def _aggregate_group(
 
     row_metadata: list[RowMetadata] = []
     for idx, entry in enumerate(entries):
-        raw_dataset = entry.get("source_dataset")
-        dataset = clean_string(raw_dataset)
-        if not dataset:
-            dataset = str(raw_dataset).strip() if raw_dataset else "Unknown"
+        dataset = _dataset_label(entry.get("source_dataset"))
         record_id = clean_string(entry.get("source_record_id"))
-        priority = SOURCE_PRIORITY.get(dataset, 0)
-        last_interaction = _parse_last_interaction(entry.get("last_interaction_date"))
+        priority = policy.rules[0].get(dataset, 0)
+        if PARSED_INTERACTION_COLUMN in entry:
+            nanos = entry[PARSED_INTERACTION_COLUMN]
+            last_interaction = pd.Timestamp(nanos, tz="UTC") if nanos is not None else None
+        else:
+            last_interaction = _parse_last_interaction(entry.get("last_interaction_date"))
         quality_score = _row_quality_score(entry)
         row_metadata.append(
             RowMetadata(
@@ -206,44 +176,22 @@ def _aggregate_group(
             )
         )
 
-    def _sort_key(meta: RowMetadata) -> tuple[Any, ...]:
-        timestamp_value = (
-            meta.last_interaction.value
-            if meta.last_interaction is not None
-            else pd.Timestamp.min.value
-        )
-        return (
-            meta.source_priority,
-            meta.quality_score,
-            timestamp_value,
-            -meta.index,
-            meta.source_record_id or "",
-        )
-
-    sorted_indices = sorted(
-        range(len(row_metadata)),
-        key=lambda idx: _sort_key(row_metadata[idx]),
-        reverse=True,
-    )
+    # Each priority rule re-ranks the rows; field metadata carries that rule's priority.
+    metadata_by_rule = [row_metadata] + [
+        [replace(meta, source_priority=rule.get(meta.source_dataset, 0)) for meta in row_metadata]
+        for rule in policy.rules[1:]
+    ]
+    ranked_by_rule = [_ranked_indices(metadata) for metadata in metadata_by_rule]
 
     provenance: dict[str, dict[str, Any]] = {}
     conflicts: list[dict[str, Any]] = []
 
-    def _normalise_scalar(value: object | None) -> str | None:
-        if isinstance(value, str):
-            cleaned = clean_string(value)
-            return cleaned if cleaned is not None else None
-        if value is None:
-            return None
-        if isinstance(value, float) and pd.isna(value):
-            return None
-        cleaned = clean_string(str(value))
-        return cleaned if cleaned is not None else None
-
-    def _iter_values(column: str, treat_list: bool = False) -> list[ValueSelection]:
+    def _iter_values(column: str, field: str, treat_list: bool = False) -> list[ValueSelection]:
+        rule = policy.rule_for(field)
+        metadata = metadata_by_rule[rule]
         selections: list[ValueSelection] = []
         seen: set[str] = set()
-        for idx in sorted_indices:
+        for idx in ranked_by_rule[rule]:
             row = entries[idx]
             raw_value = row.get(column)
             values: Iterable[object | None]
@@ -256,7 +204,7 @@ def _aggregate_group(
                 if not normalised or normalised in seen:
                     continue
                 seen.add(normalised)
-                selections.append(ValueSelection(normalised, row_metadata[idx]))
+                selections.append(ValueSelection(normalised, metadata[idx]))
         return selections
 
     def _build_provenance(
@@ -314,22 +262,22 @@ def _aggregate_group(
     def _column_values(column: str) -> list[object | None]:
         return [entry.get(column) for entry in entries]
 
-    provinces = _iter_values("province")
-    areas = _iter_values("area")
-    addresses = _iter_values("address")
-    categories = _iter_values("category")
-    org_types = _iter_values("organization_type")
-    statuses = _iter_values("status")
-    websites = _iter_values("website")
-    planes = _iter_values("planes")
-    descriptions = _iter_values("description")
-    notes = _iter_values("notes")
-    priorities = _iter_values("priority")
-
-    email_values = _iter_values("contact_emails", treat_list=True)
-    phone_values = _iter_values("contact_phones", treat_list=True)
-    name_values = _iter_values("contact_names", treat_list=True)
-    role_values = _iter_values("contact_roles", treat_list=True)
+    provinces = _iter_values("province", "province")
+    areas = _iter_values("area", "area")
+    addresses = _iter_values("address", "address_primary")
+    categories = _iter_values("category", "organization_category")
+    org_types = _iter_values("organization_type", "organization_type")
+    statuses = _iter_values("status", "status")
+    websites = _iter_values("website", "website")
+    planes = _iter_values("planes", "planes")
+    descriptions = _iter_values("description", "description")
+    notes = _iter_values("notes", "notes")
+    priorities = _iter_values("priority", "priority")
+
+    email_values = _iter_values("contact_emails", "contact_primary_email", treat_list=True)
+    phone_values = _iter_values("contact_phones", "contact_primary_phone", treat_list=True)
+    name_values = _iter_values("contact_names", "contact_primary_name", treat_list=True)
+    role_values = _iter_values("contact_roles", "contact_primary_role", treat_list=True)
 
     dataset_labels = [
         clean_string(value) or (str(value).strip() if value else None)
@@ -410,13 +358,12 @@ def _aggregate_group(
             return None
         row = entries[selection.row_metadata.index]
         raw_value = row.get(column)
-        if isinstance(raw_value, list):
-            for item in raw_value:
-                candidate = _normalise_scalar(item)
-                if candidate:
-                    return candidate
-            return None
-        return _normalise_scalar(raw_value)
+        candidates = raw_value if isinstance(raw_value, list) else [raw_value]
+        for item in candidates:
+            candidate: str | None = _normalise_scalar(item)
+            if candidate:
+                return candidate
+        return None
 
     primary_contact_meta = primary_email_selection or primary_phone_selection
     primary_name = _first_value_from_row(primary_contact_meta, "contact_names")
@@ -435,160 +382,62 @@ def _aggregate_group(
         if primary_role:
             _record_provenance("contact_primary_role", role_values, primary_role)
 
-    validation_summary = CONTACT_VALIDATION.validate_contact(
-        email=primary_email,
-        phone=primary_phone,
-        country_code=country_code,
-    )
-    email_confidence = validation_summary.email.confidence if validation_summary.email else None
-    phone_confidence = validation_summary.phone.confidence if validation_summary.phone else None
-    email_status = validation_summary.email.status.value if validation_summary.email else None
-    phone_status = validation_summary.phone.status.value if validation_summary.phone else None
-    validation_flags = validation_summary.flags()
-    deliverability_score = validation_summary.deliverability_score()
-    completeness_inputs = [primary_name, primary_email, primary_phone, primary_role]
-    completeness = (
-        sum(1 for value in completeness_inputs if value) / len(completeness_inputs)
-        if completeness_inputs
-        else 0.0
-    )
     primary_meta = primary_email_selection or primary_phone_selection
     if primary_meta is None and name_values:
         primary_meta = name_values[0]
-    max_priority = max(SOURCE_PRIORITY.values()) if SOURCE_PRIORITY else 1
-    source_priority_norm = (
-        primary_meta.row_metadata.source_priority / max_priority
-        if primary_meta and max_priority
-        else 0.0
-    )
-    intent_summary = _resolve_intent_summary(intent_summaries, slug, organization_name)
-    intent_score = intent_summary.score if intent_summary else 0.0
-
-    lead_score = lead_scorer.score(
-        completeness=completeness,
-        email_confidence=email_confidence or 0.0,
-        phone_confidence=phone_confidence or 0.0,
-        source_priority=source_priority_norm,
-        intent_score=intent_score,
-    ).value
 
-    last_interaction = _latest_iso_date(_column_values("last_interaction_date"))
+    latest_interaction = max(
+        (meta.last_interaction for meta in row_metadata if meta.last_interaction is not None),
+        default=None,
+    )
 
-    quality = _summarise_quality(
+    record: dict[str, object | None] = _finalise_record(
+        slug,
+        organization_name,
         {
-            "contact_primary_email": primary_email,
-            "contact_primary_phone": primary_phone,
-            "website": website,
             "province": province,
+            "area": area,
             "address_primary": address_primary,
-        }
-    )
-
-    selection_provenance = json.dumps(provenance, sort_keys=True)
-
-    result = {
-        "organization_name": organization_name,
-        "organization_slug": slug,
-        "province": province,
-        "country": "South Africa",
-        "area": area,
-        "address_primary": address_primary,
-        "organization_category": organization_category,
-        "organization_type": organization_type,
-        "status": status,
-        "website": website,
-        "planes": planes_value,
-        "description": description_value,
-        "notes": notes_value,
-        "source_datasets": source_datasets,
-        "source_record_ids": source_record_ids,
-        "contact_primary_name": primary_name,
-        "contact_primary_role": primary_role,
-        "contact_primary_email": primary_email,
-        "contact_primary_phone": primary_phone,
-        "contact_primary_email_confidence": email_confidence,
-        "contact_primary_email_status": email_status,
-        "contact_primary_phone_confidence": phone_confidence,
-        "contact_primary_phone_status": phone_status,
-        "contact_primary_lead_score": (
-            lead_score if primary_name or primary_email or primary_phone else None
-        ),
-        "contact_email_confidence_avg": email_confidence,
-        "contact_phone_confidence_avg": phone_confidence,
-        "contact_verification_score_avg": (deliverability_score if deliverability_score else None),
-        "contact_lead_score_avg": lead_score if lead_score else None,
-        "intent_signal_score": round(intent_score, 6) if intent_summary else 0.0,
-        "intent_signal_count": intent_summary.signal_count if intent_summary else 0,
-        "intent_signal_types": (
-            ";".join(intent_summary.signal_types)
-            if intent_summary and intent_summary.signal_types
-            else None
-        ),
-        "intent_last_observed_at": (
-            intent_summary.last_observed_at.isoformat()
-            if intent_summary and intent_summary.last_observed_at
-            else None
-        ),
-        "intent_top_insights": (
-            "; ".join(intent_summary.top_insights)
-            if intent_summary and intent_summary.top_insights
-            else None
-        ),
-        "contact_validation_flags": (
-            ";".join(sorted(set(validation_flags))) if validation_flags else None
+            "organization_category": organization_category,
+            "organization_type": organization_type,
+            "status": status,
+            "website": website,
+            "planes": planes_value,
+            "description": description_value,
+            "notes": notes_value,
+            "priority": priority_value,
+            "source_datasets": source_datasets,
+            "source_record_ids": source_record_ids,
+            "contact_primary_name": primary_name,
+            "contact_primary_role": primary_role,
+            "contact_primary_email": primary_email,
+            "contact_primary_phone": primary_phone,
+            "contact_secondary_emails": secondary_emails,
+            "contact_secondary_phones": secondary_phones,
+            "last_interaction_date": (
+                latest_interaction.date().isoformat() if latest_interaction is not None else None
+            ),
+        },
+        primary_source_priority=(
+            row_metadata[primary_meta.row_metadata.index].source_priority if primary_meta else None
         ),
-        "contact_secondary_emails": secondary_emails,
-        "contact_secondary_phones": secondary_phones,
-        "data_quality_score": quality["score"],
-        "data_quality_flags": quality["flags"],
-        "selection_provenance": selection_provenance,
-        "last_interaction_date": last_interaction,
-        "priority": priority_value,
-        "privacy_basis": "Legitimate Interest",
-        "_conflicts": conflicts,
-    }
-    return result
-
-
-def _parse_last_interaction(value: object | None) -> pd.Timestamp | None:
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return None
-    if isinstance(value, pd.Timestamp):
-        timestamp = pd.to_datetime(value, utc=True)
-        return timestamp if pd.notna(timestamp) else None
-    text = str(value).strip()
-    if not text:
-        return None
-    prefer_dayfirst = not YEAR_FIRST_PATTERN.match(text)
-    timestamp = pd.to_datetime(
-        text,
-        errors="coerce",
-        dayfirst=prefer_dayfirst,
-        utc=True,
+        max_source_priority=policy.max_priority,
+        provenance=provenance,
+        conflicts=conflicts,
+        country_code=country_code,
+        intent_summaries=intent_summaries,
+        lead_scorer=lead_scorer,
     )
-    if pd.isna(timestamp):
-        timestamp = pd.to_datetime(
-            text,
-            errors="coerce",
-            dayfirst=not prefer_dayfirst,
-            utc=True,
-        )
-    if pd.isna(timestamp):
-        return None
-    return timestamp
+    return record
 
 
-def aggregate_records(
-    config: PipelineConfig,
-    combined: pd.DataFrame,
-    intent_summaries: Mapping[str, Any] | None,
-    notify_progress: Callable[[str, dict[str, Any]], None],
-) -> AggregationResult:
-    hooks = config.runtime_hooks
-    perf_counter = hooks.perf_counter
-
-    combined_polars = pl.from_pandas(combined, include_index=False)
-    combined_polars = combined_polars.with_row_count("_row_index")
+def _iter_python_records(
+    combined_polars: pl.DataFrame,
+    *,
+    country_code: str,
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    policy: SurvivorshipPolicy = DEFAULT_SURVIVORSHIP_POLICY,
+) -> Iterator[dict[str, object | None]]:
     null_slug = "__HOTPASS_NULL_SLUG__"
     group_table = (
         combined_polars.with_columns(
@@ -608,8 +457,97 @@ def aggregate_records(
         .select(["organization_slug", "_row_index"])
         .rename({"_row_index": "groups"})
     )
+    for slug, indices in group_table.iter_rows():
+        yield _aggregate_group(
+            slug,
+            combined_polars[indices].to_dicts(),
+            country_code=country_code,
+            intent_summaries=intent_summaries,
+            policy=policy,
+        )
+
+
+def _pandas_sort_comparison(
+    aggregated_rows: Sequence[Mapping[str, Any]],
+    dataset: PolarsDataset,
+    perf_counter: Callable[[], float],
+) -> dict[str, float]:
+    """Time the equivalent pandas sort; only run when benchmarking."""
+
+    pandas_sort_start = perf_counter()
+    _ = (
+        pd.DataFrame(aggregated_rows, columns=SSOT_COLUMNS)
+        .sort_values("organization_name")
+        .reset_index(drop=True)
+    )
+    pandas_sort_seconds = perf_counter() - pandas_sort_start
+    if dataset.timings.sort_seconds > 0:
+        speedup = pandas_sort_seconds / dataset.timings.sort_seconds
+    else:
+        speedup = float("inf") if pandas_sort_seconds > 0 else 0.0
+    return {"pandas_sort_seconds": pandas_sort_seconds, "polars_sort_speedup": speedup}
+
+
+def _with_parsed_interactions(combined_polars: pl.DataFrame) -> pl.DataFrame:
+    """Parse ``last_interaction_date`` once for the whole frame before grouping."""
+
+    values: list[object | None]
+    if "last_interaction_date" in combined_polars.columns:
+        values = combined_polars.get_column("last_interaction_date").to_list()
+    else:
+        values = [None] * combined_polars.height
+    return combined_polars.with_columns(
+        pl.Series(PARSED_INTERACTION_COLUMN, parse_datetime_values(values), dtype=pl.Int64)
+    )
+
+
+def _survivorship_policy(config: PipelineConfig) -> SurvivorshipPolicy:
+    """Resolve the run's policy: explicit config, then the profile's rules, then defaults."""
+
+    policy: SurvivorshipPolicy | None = config.survivorship_policy
+    if policy is None:
+        rules = getattr(config.industry_profile, "survivorship", None)
+        policy = rules.to_policy() if rules is not None else DEFAULT_SURVIVORSHIP_POLICY
+    return policy
+
+
+def aggregate_records(
+    config: PipelineConfig,
+    combined: pd.DataFrame,
+    intent_summaries: Mapping[str, Any] | None,
+    notify_progress: Callable[[str, dict[str, Any]], None],
+    *,
+    checkpoint: IncrementalCheckpoint | None = None,
+) -> AggregationResult:
+    """Aggregate the combined rows into one SSOT record per organisation slug.
+
+    With an incremental ``checkpoint``, slugs whose rows and intent summary are
+    unchanged since the checkpointed run reuse that run's records, conflicts
+    and provenance; only the remaining slugs are aggregated. Reused and fresh
+    records are merged back in group order, so the output matches a full run.
+    """
+
+    engine = config.aggregation_engine
+    if engine not in AGGREGATION_ENGINES:
+        msg = f"aggregation_engine must be one of {', '.join(AGGREGATION_ENGINES)}"
+        raise ValueError(msg)
+    hooks = config.runtime_hooks
+    perf_counter = hooks.perf_counter
+    policy = _survivorship_policy(config)
+
+    combined_polars = PolarsDataset.from_pandas(combined, stage="aggregate").frame
+    plan = (
+        checkpoint.plan_groups(combined_polars, intent_summaries)
+        if checkpoint is not None
+        else None
+    )
+    combined_polars = combined_polars.with_row_index("_row_index")
+    combined_polars = _with_parsed_interactions(combined_polars)
+    work_polars = plan.work_frame(combined_polars) if plan is not None else combined_polars
 
-    group_total = int(group_table.height)
+    group_total = int(combined_polars.get_column("organization_slug").n_unique())
+    work_total = plan.aggregated if plan is not None else group_total
+    workers = resolve_aggregation_workers(config.aggregation_workers, work_total)
     notify_progress("aggregate_started", {"total": group_total})
 
     metrics: dict[str, Any] = {}
@@ -619,69 +557,92 @@ def aggregate_records(
         {
             "groups": group_total,
             "records": int(combined_polars.height),
+            "engine": engine,
+            "workers": workers,
+            "priority_rules": len(policy.rules),
         },
     ):
         aggregated_rows = []
-        all_conflicts: list[dict[str, Any]] = []
-        slug_series = group_table.get_column("organization_slug") if group_total else None
-        index_series = group_table.get_column("groups") if group_total else None
-
-        for index in range(group_total):
-            slug = slug_series[index] if slug_series is not None else None
-            indices = index_series[index] if index_series is not None else []
-            group_frame = combined_polars[indices]
-            row_dict = _aggregate_group(
-                slug,
-                group_frame.to_dicts(),
+        ledger = ConflictLedger(config.conflict_ledger_path)
+        documents: list[tuple[str | None, Mapping[str, Any]]] = []
+        iter_records = iter_polars_records if engine == "polars" else _iter_python_records
+        records: Iterator[dict[str, object | None]]
+        if work_total == 0:
+            records = iter(())
+        elif workers > 1:
+            records = iter_sharded_records(
+                work_polars,
+                iter_records,
+                workers=workers,
                 country_code=config.country_code,
                 intent_summaries=intent_summaries,
+                policy=policy,
             )
-            conflicts_obj = row_dict.pop("_conflicts", [])
-            if isinstance(conflicts_obj, list):
-                all_conflicts.extend(conflicts_obj)
-            aggregated_rows.append(row_dict)
-            if group_total > 0:
-                completed = index + 1
+        else:
+            records = iter_records(
+                work_polars,
+                country_code=config.country_code,
+                intent_summaries=intent_summaries,
+                policy=policy,
+            )
+        if plan is not None:
+            records = plan.merge(records)
+
+        with ledger:
+            for completed, row_dict in enumerate(records, start=1):
+                slug = cast(str | None, row_dict["organization_slug"])
+                conflicts_obj = row_dict.pop("_conflicts", [])
+                if isinstance(conflicts_obj, list):
+                    ledger.extend(slug, conflicts_obj)
+                provenance_obj = row_dict.pop("_provenance", {})
+                document = provenance_obj if isinstance(provenance_obj, Mapping) else {}
+                documents.append((slug, document))
+                if checkpoint is not None:
+                    checkpoint.record_group(
+                        slug,
+                        row_dict,
+                        conflicts_obj if isinstance(conflicts_obj, list) else [],
+                        document,
+                    )
+                aggregated_rows.append(row_dict)
                 if completed == group_total or completed % max(group_total // 10, 1) == 0:
                     notify_progress(
                         "aggregate_progress",
                         {
                             "completed": completed,
                             "total": group_total,
-                            "slug": str(slug),
+                            "slug": str(row_dict["organization_slug"]),
                         },
                     )
 
         dataset = PolarsDataset.from_rows(aggregated_rows, SSOT_COLUMNS)
+        provenance_start = perf_counter()
+        provenance = ProvenanceTable.from_documents(documents)
+        metrics["provenance_seconds"] = perf_counter() - provenance_start
+        metrics["provenance_rows"] = int(provenance.frame.height)
+
         dataset.sort("organization_name")
-        pandas_sort_start = perf_counter()
-        _ = (
-            pd.DataFrame(aggregated_rows, columns=SSOT_COLUMNS)
-            .sort_values("organization_name")
-            .reset_index(drop=True)
-        )
-        pandas_sort_seconds = perf_counter() - pandas_sort_start
-        metrics["pandas_sort_seconds"] = pandas_sort_seconds
         metrics["polars_transform_seconds"] = (
             dataset.timings.construction_seconds + dataset.timings.sort_seconds
         )
-        if dataset.timings.sort_seconds > 0:
-            metrics["polars_sort_speedup"] = pandas_sort_seconds / dataset.timings.sort_seconds
-        else:
-            metrics["polars_sort_speedup"] = float("inf") if pandas_sort_seconds > 0 else 0.0
-
-        materialize_start = perf_counter()
-        refined_df = dataset.to_pandas().reset_index(drop=True)
-        metrics["polars_materialize_seconds"] = perf_counter() - materialize_start
+        if config.benchmark_sort_comparison:
+            metrics.update(_pandas_sort_comparison(aggregated_rows, dataset, perf_counter))
 
     metrics["aggregation_seconds"] = perf_counter() - aggregation_start
+    metrics["aggregation_workers"] = workers
+    if plan is not None:
+        metrics["incremental_groups_reused"] = group_total - plan.aggregated
+        metrics["incremental_groups_aggregated"] = plan.aggregated
+    metrics["conflict_count"] = ledger.total
+    if ledger.path is not None:
+        metrics["conflict_ledger_path"] = str(ledger.path)
 
     notify_progress(
         "aggregate_completed",
         {
             "total": group_total,
-            "aggregated_records": len(refined_df),
-            "conflicts": len(all_conflicts),
+            "aggregated_records": dataset.frame.height,
+            "conflicts": ledger.total,
         },
     )
 
@@ -696,11 +657,13 @@ def aggregate_records(
     }
 
     return AggregationResult(
-        refined_df=refined_df,
         combined_polars=combined_polars,
-        conflicts=all_conflicts,
+        conflicts=ledger.conflicts(),
         metrics=metrics,
         source_breakdown=source_breakdown,
+        provenance=provenance,
+        conflict_ledger=ledger,
+        refined_frame=dataset.frame,
     )
 
 
@@ -0,0 +1,397 @@
+"""Columnar slug-group aggregation built on Polars expressions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+import pandas as pd
+import polars as pl
+
+from ..enrichment.intent import IntentOrganizationSummary
+from ..normalization import clean_string, normalize_values
+from ..transform.scoring import LeadScorer
+from .config import DEFAULT_LEAD_SCORER
+from .survivorship import (
+    DEFAULT_SURVIVORSHIP_POLICY,
+    PARSED_INTERACTION_COLUMN,
+    QUALITY_COLUMNS,
+    SurvivorshipPolicy,
+    dataset_label,
+    finalise_record,
+    normalise_scalar,
+    parse_datetime_values,
+)
+
+_SELECTED_FIELDS: tuple[tuple[str, str], ...] = (
+    ("province", "province"),
+    ("area", "area"),
+    ("address_primary", "address"),
+    ("organization_category", "category"),
+    ("organization_type", "organization_type"),
+    ("status", "status"),
+    ("website", "website"),
+    ("planes", "planes"),
+    ("description", "description"),
+    ("notes", "notes"),
+    ("priority", "priority"),
+)
+_JOINED_FIELDS = frozenset({"planes", "description", "notes"})
+_CONTACT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("contact_primary_email", "contact_emails"),
+    ("contact_primary_phone", "contact_phones"),
+    ("contact_primary_name", "contact_names"),
+    ("contact_primary_role", "contact_roles"),
+)
+
+
+def _source_label(value: object | None) -> str | None:
+    return clean_string(clean_string(value) or (str(value).strip() if value else None))
+
+
+def _interactions(frame: pl.DataFrame) -> pl.Series:
+    """Return parsed interaction timestamps, reusing the pre-grouping column when present."""
+
+    if PARSED_INTERACTION_COLUMN in frame.columns:
+        return frame.get_column(PARSED_INTERACTION_COLUMN)
+    values = _column(frame, "last_interaction_date").to_list()
+    return pl.Series(PARSED_INTERACTION_COLUMN, parse_datetime_values(values), dtype=pl.Int64)
+
+
+def _column(frame: pl.DataFrame, name: str) -> pl.Series:
+    if name in frame.columns:
+        return frame.get_column(name)
+    return pl.Series(name, [None] * frame.height, dtype=pl.Null)
+
+
+def _map_column(series: pl.Series, func: Callable[[Any], Any], dtype: pl.DataType) -> pl.Series:
+    """Evaluate ``func`` once per distinct value of ``series``, nulls included."""
+
+    if series.dtype.is_nested() or series.dtype == pl.Object:
+        return pl.Series(series.name, normalize_values(func, series.to_list()), dtype=dtype)
+    distinct = series.unique(maintain_order=True)
+    mapped = pl.Series(normalize_values(func, distinct.to_list()), dtype=dtype)
+    return series.replace_strict(distinct, mapped, return_dtype=dtype)
+
+
+def _truthy(schema: pl.Schema, column: str) -> pl.Expr:
+    """Mirror ``bool(row.get(column))`` as a column expression."""
+
+    dtype = schema.get(column)
+    if dtype is None or dtype == pl.Null:
+        return pl.lit(False)
+    value = pl.col(column)
+    if isinstance(dtype, pl.List):
+        return value.list.len().fill_null(0) > 0
+    if dtype == pl.String:
+        return value.str.len_bytes().fill_null(0) > 0
+    if dtype == pl.Boolean:
+        return value.fill_null(False)
+    if dtype.is_numeric():
+        return value.fill_null(0) != 0
+    return value.map_elements(bool, return_dtype=pl.Boolean, skip_nulls=False)
+
+
+def _priority_column(rule: int) -> str:
+    return "_priority" if rule == 0 else f"_priority_{rule}"
+
+
+def _order_column(rule: int) -> str:
+    return "_rank" if rule == 0 else f"_order_{rule}"
+
+
+def _priority_expr(priorities: Mapping[str, int]) -> pl.Expr:
+    if not priorities:
+        return pl.lit(0, dtype=pl.Int64)
+    return pl.col("_dataset").replace_strict(dict(priorities), default=0, return_dtype=pl.Int64)
+
+
+def _ranking(priority: str) -> tuple[list[pl.Expr], list[bool]]:
+    """Return the sort keys that rank rows for one priority rule, best first."""
+
+    keys = [
+        pl.col("_group"),
+        pl.col(priority),
+        pl.col("_quality"),
+        pl.col("_interaction").fill_null(pd.Timestamp.min.value),
+        pl.col("_row_index"),
+    ]
+    return keys, [False, True, True, True, False]
+
+
+def _normalised_cells(rows: pl.DataFrame, column: str, order: str = "_rank") -> pl.DataFrame:
+    """Return one ``(_group, _rank, _value)`` row per non-empty normalised value.
+
+    List cells are exploded so each element competes on its own, matching
+    ``_aggregate_group``. Cells follow the ``order`` rank column of the
+    field's priority rule; ``_rank`` still addresses the source row.
+    """
+
+    keys = ["_group", "_rank"] if order == "_rank" else ["_group", "_rank", order]
+    cells = rows.select(*keys, _column(rows, column).alias("_value"))
+    if isinstance(cells.schema["_value"], pl.List):
+        cells = cells.explode("_value")
+    if order != "_rank":
+        cells = cells.sort(order, maintain_order=True).drop(order)
+    normalised = _map_column(cells.get_column("_value"), normalise_scalar, pl.String())
+    return cells.with_columns(normalised).filter(pl.col("_value").str.len_bytes() > 0)
+
+
+def iter_polars_records(
+    combined_polars: pl.DataFrame,
+    *,
+    country_code: str,
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    lead_scorer: LeadScorer = DEFAULT_LEAD_SCORER,
+    policy: SurvivorshipPolicy = DEFAULT_SURVIVORSHIP_POLICY,
+) -> Iterator[dict[str, object | None]]:
+    """Aggregate every slug group with ``group_by().agg()`` expressions.
+
+    Rows are ranked once per priority rule of ``policy`` by source priority,
+    quality, recency and position. Each rule becomes an integer order column,
+    and every field collapses to its distinct values in its rule's order. Only
+    the provenance documents, contact validation and scoring stay per group,
+    and they share :func:`finalise_record` with the row-wise engine.
+    """
+
+    if combined_polars.is_empty():
+        return
+    schema = combined_polars.schema
+    default_keys, descending = _ranking("_priority")
+    rows = (
+        combined_polars.with_columns(
+            pl.col("_row_index").min().over("organization_slug").alias("_group"),
+            _map_column(
+                _column(combined_polars, "source_dataset"), dataset_label, pl.String()
+            ).alias("_dataset"),
+            _map_column(
+                _column(combined_polars, "source_dataset"), _source_label, pl.String()
+            ).alias("dataset_label"),
+            _map_column(
+                _column(combined_polars, "source_record_id"), clean_string, pl.String()
+            ).alias("_record_id"),
+            _map_column(
+                _column(combined_polars, "source_record_id"), _source_label, pl.String()
+            ).alias("_record_label"),
+            _interactions(combined_polars).alias("_interaction"),
+            pl.sum_horizontal(
+                [_truthy(schema, column).cast(pl.Int64) for column in QUALITY_COLUMNS]
+            ).alias("_quality"),
+        )
+        .with_columns(
+            *(
+                _priority_expr(priorities).alias(_priority_column(rule))
+                for rule, priorities in enumerate(policy.rules)
+            ),
+            pl.from_epoch("_interaction", time_unit="ns")
+            .dt.date()
+            .cast(pl.String)
+            .alias("_interaction_day"),
+        )
+        .sort(default_keys, descending=descending)
+        .with_row_index("_rank")
+    )
+    if len(policy.rules) > 1:
+        # Inverting each rule's sort permutation yields a per-row rank, so a
+        # field's winner is the lowest rank in its group.
+        rows = rows.with_columns(
+            *(
+                pl.arg_sort_by(_ranking(_priority_column(rule))[0], descending=descending)
+                .arg_sort()
+                .alias(_order_column(rule))
+                for rule in range(1, len(policy.rules))
+            )
+        )
+
+    groups = rows.group_by("_group", maintain_order=True).agg(
+        pl.col("organization_slug").first(),
+        pl.col("dataset_label")
+        .drop_nulls()
+        .unique()
+        .sort()
+        .str.join("; ")
+        .alias("source_datasets"),
+        pl.col("_record_label")
+        .drop_nulls()
+        .unique()
+        .sort()
+        .str.join("; ")
+        .alias("source_record_ids"),
+        pl.from_epoch(pl.col("_interaction").max(), time_unit="ns")
+        .dt.date()
+        .cast(pl.String)
+        .alias("last_interaction_date"),
+    )
+    if "organization_name" in schema:
+        names = (
+            rows.sort("_row_index")
+            .filter(_truthy(schema, "organization_name"))
+            .group_by("_group")
+            .agg(pl.col("organization_name").first())
+        )
+        groups = groups.join(names, on="_group", how="left", maintain_order="left")
+    else:
+        groups = groups.with_columns(pl.lit(None).alias("organization_name"))
+
+    first_in_row: dict[str, pl.DataFrame] = {}
+    for name, column in _SELECTED_FIELDS + _CONTACT_FIELDS:
+        cells = _normalised_cells(rows, column, _order_column(policy.rule_for(name)))
+        ranked = (
+            cells.unique(subset=["_group", "_value"], keep="first", maintain_order=True)
+            .group_by("_group", maintain_order=True)
+            .agg(
+                pl.col("_value").alias(f"{column}_values"),
+                pl.col("_rank").alias(f"{column}_ranks"),
+            )
+        )
+        groups = groups.join(ranked, on="_group", how="left", maintain_order="left")
+        if column in ("contact_names", "contact_roles"):
+            first_in_row[column] = cells.group_by("_rank").agg(
+                pl.col("_value").first().alias(f"{column}_anchor")
+            )
+
+    # The contact name and role follow the row that supplied the primary email,
+    # falling back to the primary phone row and then to the best-ranked value.
+    groups = groups.with_columns(
+        pl.coalesce(
+            pl.col("contact_emails_ranks").list.first(),
+            pl.col("contact_phones_ranks").list.first(),
+        ).alias("_anchor")
+    )
+    for anchors in first_in_row.values():
+        groups = groups.join(
+            anchors.rename({"_rank": "_anchor"}), on="_anchor", how="left", maintain_order="left"
+        )
+    groups = groups.with_columns(
+        *(
+            (
+                pl.col(f"{column}_values").list.join("; ")
+                if field in _JOINED_FIELDS
+                else pl.col(f"{column}_values").list.first()
+            ).alias(field)
+            for field, column in _SELECTED_FIELDS
+        ),
+        pl.col("contact_emails_values").list.first().alias("contact_primary_email"),
+        pl.col("contact_emails_values")
+        .list.slice(1)
+        .list.join(";")
+        .fill_null("")
+        .alias("contact_secondary_emails"),
+        pl.col("contact_phones_values").list.first().alias("contact_primary_phone"),
+        pl.col("contact_phones_values")
+        .list.slice(1)
+        .list.join(";")
+        .fill_null("")
+        .alias("contact_secondary_phones"),
+        pl.coalesce("contact_names_anchor", pl.col("contact_names_values").list.first()).alias(
+            "contact_primary_name"
+        ),
+        pl.coalesce("contact_roles_anchor", pl.col("contact_roles_values").list.first()).alias(
+            "contact_primary_role"
+        ),
+        pl.coalesce("_anchor", pl.col("contact_names_ranks").list.first()).alias("_primary_rank"),
+    )
+
+    datasets = rows.get_column("_dataset").to_list()
+    record_ids = rows.get_column("_record_id").to_list()
+    priorities = [
+        rows.get_column(_priority_column(rule)).to_list() for rule in range(len(policy.rules))
+    ]
+    quality_scores = rows.get_column("_quality").to_list()
+    interaction_days = rows.get_column("_interaction_day").to_list()
+
+    for group in groups.iter_rows(named=True):
+        provenance: dict[str, dict[str, Any]] = {}
+        conflicts: list[dict[str, Any]] = []
+
+        def _record_provenance(
+            field: str,
+            values: list[str] | None,
+            ranks: list[int] | None,
+            value: str | None,
+            provenance: dict[str, dict[str, Any]] = provenance,
+            conflicts: list[dict[str, Any]] = conflicts,
+        ) -> None:
+            if not values or not ranks:
+                return
+            primary = values.index(value) if value in values else 0
+            rank = ranks[primary]
+            rule = policy.rule_for(field)
+            entry: dict[str, Any] = {
+                "field": field,
+                "value": value,
+                "source_dataset": datasets[rank],
+                "source_record_id": record_ids[rank],
+                "source_priority": priorities[rule][rank],
+                "quality_score": quality_scores[rank],
+                "last_interaction_date": interaction_days[rank],
+            }
+            contributors = [position for position in range(len(values)) if position != primary]
+            if contributors:
+                entry["contributors"] = [
+                    {
+                        "source_dataset": datasets[ranks[position]],
+                        "source_record_id": record_ids[ranks[position]],
+                        "value": values[position],
+                    }
+                    for position in contributors
+                ]
+                conflicts.append(
+                    {
+                        "field": field,
+                        "chosen_source": datasets[rank],
+                        "value": value,
+                        "alternatives": [
+                            {"source": datasets[ranks[position]], "value": values[position]}
+                            for position in contributors
+                        ],
+                    }
+                )
+            provenance[field] = entry
+
+        for field, column in _SELECTED_FIELDS:
+            if field in _JOINED_FIELDS and not group[field]:
+                continue
+            _record_provenance(
+                field, group[f"{column}_values"], group[f"{column}_ranks"], group[field]
+            )
+        for kind, column in (("email", "contact_emails"), ("phone", "contact_phones")):
+            values = group[f"{column}_values"] or []
+            ranks = group[f"{column}_ranks"] or []
+            _record_provenance(
+                f"contact_primary_{kind}", values, ranks, group[f"contact_primary_{kind}"]
+            )
+            if group[f"contact_secondary_{kind}s"]:
+                _record_provenance(
+                    f"contact_secondary_{kind}s",
+                    values[1:],
+                    ranks[1:],
+                    group[f"contact_secondary_{kind}s"],
+                )
+        for kind, column in (("name", "contact_names"), ("role", "contact_roles")):
+            if group[f"contact_primary_{kind}"]:
+                _record_provenance(
+                    f"contact_primary_{kind}",
+                    group[f"{column}_values"],
+                    group[f"{column}_ranks"],
+                    group[f"contact_primary_{kind}"],
+                )
+
+        primary_rank = group["_primary_rank"]
+        yield finalise_record(
+            group["organization_slug"],
+            group["organization_name"],
+            group,
+            primary_source_priority=(
+                priorities[0][primary_rank] if primary_rank is not None else None
+            ),
+            max_source_priority=policy.max_priority,
+            provenance=provenance,
+            conflicts=conflicts,
+            country_code=country_code,
+            intent_summaries=intent_summaries,
+            lead_scorer=lead_scorer,
+        )
+
+
+__all__ = ["iter_polars_records"]
@@ -0,0 +1,149 @@
+"""Slug-hash sharding of the aggregation stage across worker processes."""
+
+from __future__ import annotations
+
+import heapq
+import io
+import os
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+import polars as pl
+
+from ..enrichment.intent import IntentOrganizationSummary
+from ..parallel import worker_context
+from .survivorship import SurvivorshipPolicy
+
+RecordIterator = Callable[..., Iterator[dict[str, object | None]]]
+
+MIN_GROUPS_PER_WORKER = 2_000
+"""Smallest shard worth a worker process when ``aggregation_workers`` is ``"auto"``."""
+
+_NULL_SLUG = "__HOTPASS_NULL_SLUG__"
+
+
+def resolve_aggregation_workers(setting: int | str | None, group_total: int) -> int:
+    """Return how many worker processes should aggregate ``group_total`` slug groups.
+
+    ``None`` keeps aggregation in-process. ``"auto"`` sizes the pool from
+    ``os.cpu_count()`` so that every worker receives at least
+    :data:`MIN_GROUPS_PER_WORKER` groups. Explicit counts are capped at the
+    number of groups.
+    """
+
+    if setting is None:
+        return 1
+    if setting == "auto":
+        return max(1, min(os.cpu_count() or 1, group_total // MIN_GROUPS_PER_WORKER))
+    if isinstance(setting, bool) or not isinstance(setting, int) or setting < 1:
+        msg = "aggregation_workers must be a positive integer or 'auto'"
+        raise ValueError(msg)
+    return max(1, min(setting, group_total))
+
+
+def _aggregate_shard_task(
+    iter_records: RecordIterator,
+    payload: bytes,
+    country_code: str,
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    policy: SurvivorshipPolicy,
+) -> list[dict[str, object | None]]:
+    # Engines address rows by ``_row_index`` position, so renumber the shard.
+    # The renumbering is monotonic and keeps every positional tie-break intact.
+    shard = pl.read_ipc(io.BytesIO(payload)).drop("_row_index").with_row_index("_row_index")
+    return list(
+        iter_records(
+            shard, country_code=country_code, intent_summaries=intent_summaries, policy=policy
+        )
+    )
+
+
+def _partition(
+    combined_polars: pl.DataFrame, shards: int
+) -> list[tuple[list[int], bytes]]:
+    """Split rows by slug hash into ``(group order keys, Arrow IPC payload)`` shards.
+
+    A group's order key is its first ``_row_index``; the serial engines emit
+    groups in ascending order of that key, which is what the merge restores.
+    """
+
+    keyed = combined_polars.with_columns(
+        (
+            pl.col("organization_slug").fill_null(_NULL_SLUG).hash(seed=0) % shards
+        ).alias("_shard")
+    )
+    group_keys = (
+        keyed.group_by("organization_slug")
+        .agg(pl.col("_row_index").min().alias("_first"), pl.col("_shard").first())
+        .sort("_first")
+    )
+    partitions: list[tuple[list[int], bytes]] = []
+    for shard_id in range(shards):
+        keys = group_keys.filter(pl.col("_shard") == shard_id).get_column("_first").to_list()
+        if not keys:
+            continue
+        rows = keyed.filter(pl.col("_shard") == shard_id).drop("_shard")
+        buffer = io.BytesIO()
+        rows.write_ipc(buffer)
+        partitions.append((keys, buffer.getvalue()))
+    return partitions
+
+
+def iter_sharded_records(
+    combined_polars: pl.DataFrame,
+    iter_records: RecordIterator,
+    *,
+    workers: int,
+    country_code: str,
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    policy: SurvivorshipPolicy,
+) -> Iterator[dict[str, object | None]]:
+    """Aggregate slug groups in ``workers`` processes and merge them in serial order.
+
+    ``iter_records`` must be a module-level engine such as
+    :func:`~hotpass.pipeline.aggregation_polars.iter_polars_records` so it can be
+    sent to the workers. Records, and therefore conflicts and progress events,
+    come back in exactly the order the in-process engine would produce.
+    """
+
+    partitions = _partition(combined_polars, workers)
+    with ProcessPoolExecutor(
+        max_workers=len(partitions), mp_context=worker_context(__name__)
+    ) as executor:
+        futures = [
+            (
+                keys,
+                executor.submit(
+                    _aggregate_shard_task,
+                    iter_records,
+                    payload,
+                    country_code,
+                    intent_summaries,
+                    policy,
+                ),
+            )
+            for keys, payload in partitions
+        ]
+        try:
+            shard_records = [(keys, future.result()) for keys, future in futures]
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+    for keys, records in shard_records:
+        if len(keys) != len(records):
+            msg = f"Aggregation shard returned {len(records)} records for {len(keys)} groups"
+            raise RuntimeError(msg)
+    merged = heapq.merge(
+        *(zip(keys, records, strict=True) for keys, records in shard_records),
+        key=lambda item: item[0],
+    )
+    for _key, record in merged:
+        yield record
+
+
+__all__ = [
+    "MIN_GROUPS_PER_WORKER",
+    "iter_sharded_records",
+    "resolve_aggregation_workers",
+]
@@ -7,8 +7,12 @@ from typing import Any
 
 import numpy as np
 
+from ..expectation_runtime import get_expectation_runtime
 from ..imports.preprocess import apply_import_preprocessing
+from ..observability import get_pipeline_metrics
 from ..pipeline_reporting import generate_recommendations
+from ..storage import DuckDBSettings, get_duckdb_session
+from ..transform.phone import get_phone_service
 from .aggregation import aggregate_records
 from .config import (
     PipelineConfig,
@@ -39,6 +43,7 @@ from .helpers import (
     persist_contract_notices,
     relay_progress,
 )
+from .incremental import IncrementalCheckpoint
 from .ingestion import apply_redaction, ingest_sources
 from .validation import validate_dataset
 
@@ -58,6 +63,20 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
         np.random.seed(config.random_seed)
 
     pipeline_start = perf_counter()
+    expectation_runtime = get_expectation_runtime()
+    expectation_setup_start = expectation_runtime.setup_seconds
+    pipeline_metrics = get_pipeline_metrics()
+    conversions_start = pipeline_metrics.frame_conversion_count
+    phone_service = get_phone_service()
+    if config.phone_cache_path is not None:
+        phone_service.attach_cache(config.phone_cache_path)
+    get_duckdb_session().configure(
+        DuckDBSettings(
+            threads=config.duckdb_threads,
+            memory_limit=config.duckdb_memory_limit,
+            temp_directory=config.duckdb_temp_directory,
+        )
+    )
 
     audit_trail: list[dict[str, Any]] = []
     redaction_events: list[dict[str, Any]] = []
@@ -65,6 +84,7 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
         "load_seconds": 0.0,
         "aggregation_seconds": 0.0,
         "expectations_seconds": 0.0,
+        "expectations_setup_seconds": 0.0,
         "write_seconds": 0.0,
         "total_seconds": 0.0,
         "rows_per_second": 0.0,
@@ -103,10 +123,16 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
         },
     )
 
+    checkpoint = IncrementalCheckpoint.load(config) if config.incremental else None
+    stage_options: dict[str, Any] = {"checkpoint": checkpoint} if checkpoint is not None else {}
+
     notify_progress(config, PIPELINE_EVENT_LOAD_STARTED)
     ingest_start = perf_counter()
-    combined, source_timings, contract_notices = ingest_sources(config)
+    combined, source_timings, contract_notices = ingest_sources(config, **stage_options)
     metrics["source_load_seconds"] = dict(source_timings)
+    if checkpoint is not None:
+        metrics["incremental_resumed"] = checkpoint.resumed
+        metrics["incremental_sources_reused"] = checkpoint.sources_reused
     load_seconds = perf_counter() - ingest_start
     metrics["load_seconds"] = load_seconds
     if load_seconds > 0 and not combined.empty:
@@ -227,6 +253,7 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
                 "aggregate_completed": PIPELINE_EVENT_AGGREGATE_COMPLETED,
             },
         ),
+        **stage_options,
     )
     metrics.update({k: v for k, v in aggregation_result.metrics.items() if v is not None})
 
@@ -236,8 +263,8 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
                 "timestamp": time_fn(),
                 "event": "aggregation_complete",
                 "details": {
-                    "aggregated_records": len(aggregation_result.refined_df),
-                    "conflicts_resolved": len(aggregation_result.conflicts),
+                    "aggregated_records": aggregation_result.record_count,
+                    "conflicts_resolved": aggregation_result.conflict_total,
                     "aggregation_seconds": metrics["aggregation_seconds"],
                 },
             }
@@ -245,13 +272,13 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
 
     logger.info(
         "Aggregated %s records with %s conflict resolutions",
-        len(aggregation_result.refined_df),
-        len(aggregation_result.conflicts),
+        aggregation_result.record_count,
+        aggregation_result.conflict_total,
     )
 
     validation_result = validate_dataset(
         config,
-        aggregation_result.refined_df,
+        aggregation_result.refined,
         lambda event, payload: relay_progress(
             config,
             event,
@@ -263,11 +290,10 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
                 "expectations_completed": PIPELINE_EVENT_EXPECTATIONS_COMPLETED,
             },
         ),
+        provenance=aggregation_result.provenance,
     )
     metrics.update(validation_result.metrics)
-    invalid_record_count = int(
-        len(aggregation_result.refined_df) - len(validation_result.validated_df)
-    )
+    invalid_record_count = aggregation_result.record_count - validation_result.record_count
 
     if config.enable_audit_trail and validation_result.schema_errors:
         audit_trail.append(
@@ -283,8 +309,10 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
 
     if config.pii_redaction.enabled:
         validated_df, post_redaction = apply_redaction(config, validation_result.validated_df)
-        validation_result.validated_df = validated_df
         if post_redaction:
+            # Redaction rewrote the pandas view, so the Polars frame is now stale.
+            validation_result.validated_df = validated_df
+            validation_result.validated_frame = None
             redaction_events.extend(post_redaction)
             metrics["redacted_cells"] = metrics.get("redacted_cells", 0) + len(post_redaction)
             if config.enable_audit_trail:
@@ -300,13 +328,12 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
                     }
                 )
 
-    else:
-        validated_df = validation_result.validated_df
-
+    if aggregation_result.provenance is not None:
+        validation_result.attach_provenance(aggregation_result.provenance)
     export_metrics, party_store, daily_list_df = publish_outputs(
         config,
-        validated_df,
-        aggregation_result.refined_df,
+        validation_result.validated,
+        aggregation_result.refined,
         validation_result.expectation_summary,
         metrics,
         pipeline_start,
@@ -320,8 +347,16 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
             },
         ),
         intent_result=intent_result,
+        provenance=aggregation_result.provenance,
     )
     metrics.update(export_metrics)
+    if checkpoint is not None:
+        checkpoint.save(hooks.datetime_factory())
+    metrics["expectations_setup_seconds"] = (
+        expectation_runtime.setup_seconds - expectation_setup_start
+    )
+    if config.phone_cache_path is not None:
+        phone_service.save()
 
     sanitized_notices: list[dict[str, Any]] = []
     if contract_notices:
@@ -347,7 +382,7 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
                     notice["artifact_path"] or "n/a",
                 )
 
-    total_records = int(len(aggregation_result.refined_df))
+    total_records = aggregation_result.record_count
     invalid_records = invalid_record_count
 
     recommendations: list[str] = []
@@ -373,6 +408,7 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
                 message += f" Duplicate rows exported to {artifact_path}."
             recommendations.append(message)
 
+    metrics["frame_conversions"] = pipeline_metrics.frame_conversion_count - conversions_start
     metrics_copy = dict(metrics)
     if config.enable_audit_trail:
         audit_trail.append(
@@ -399,6 +435,7 @@ def execute_pipeline(config: PipelineConfig) -> PipelineResult:
         recommendations=recommendations,
         audit_trail=audit_trail if config.enable_audit_trail else [],
         conflict_resolutions=aggregation_result.conflicts,
+        conflict_total=aggregation_result.conflict_total,
     )
 
     notify_progress(
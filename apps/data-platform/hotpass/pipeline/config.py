@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import html
+import random
 import time
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
@@ -33,15 +34,21 @@ class PipelineRuntimeHooks:
     time_fn: Callable[[], float] = time.time
     perf_counter: Callable[[], float] = time.perf_counter
     datetime_factory: Callable[[], datetime] = _default_datetime_factory
+    random_fn: Callable[[], float] = random.random
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from ..data_sources.agents.runner import AgentTiming
     from ..domain.party import PartyStore
     from ..linkage import LinkageResult
+    from .survivorship import SurvivorshipPolicy
 
 ProgressListener = Callable[[str, dict[str, Any]], None]
 
+AGGREGATION_ENGINES: tuple[str, ...] = ("polars", "python")
+VALIDATION_BACKENDS: tuple[str, ...] = ("pandas", "polars")
+"""Supported implementations of the slug-group aggregation stage."""
+
 
 SSOT_COLUMNS: list[str] = [
     "organization_name",
@@ -123,11 +130,30 @@ class PipelineConfig:
     backfill: bool = False
     incremental: bool = False
     since: datetime | None = None
+    incremental_state_dir: Path | None = None
     random_seed: int | None = None
     run_id: str | None = None
     import_mappings: list[Mapping[str, Any]] = field(default_factory=list)
     import_rules: list[Mapping[str, Any]] = field(default_factory=list)
     dist_dir: Path = field(default_factory=lambda: Path.cwd() / "dist")
+    phone_cache_path: Path | None = None
+    aggregation_engine: str = "polars"
+    aggregation_workers: int | str | None = None
+    conflict_ledger_path: Path | None = None
+    survivorship_policy: SurvivorshipPolicy | None = None
+    validation_backend: str = "pandas"
+    strict_ge: bool = False
+    ge_audit_rate: float = 0.0
+    duckdb_threads: int | None = None
+    duckdb_memory_limit: str | None = None
+    duckdb_temp_directory: Path | None = None
+    excel_writer: str = "openpyxl"
+    export_workers: int | None = None
+    parquet_partition_by: list[str] = field(default_factory=list)
+    parquet_sort_by: list[str] = field(default_factory=list)
+    parquet_row_group_size: int | None = None
+    parquet_bloom_filters: bool = False
+    benchmark_sort_comparison: bool = False
     s3_endpoint_url: str | None = None
     aws_endpoint_url: str | None = None
 
@@ -145,6 +171,7 @@ class QualityReport:
     recommendations: list[str] = field(default_factory=list)
     audit_trail: list[dict[str, Any]] = field(default_factory=list)
     conflict_resolutions: list[dict[str, Any]] = field(default_factory=list)
+    conflict_total: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -159,8 +186,17 @@ class QualityReport:
             "recommendations": list(self.recommendations),
             "audit_trail": list(self.audit_trail),
             "conflict_resolutions": list(self.conflict_resolutions),
+            "conflict_total": self.resolved_conflict_count,
         }
 
+    @property
+    def resolved_conflict_count(self) -> int:
+        """Total conflicts, including any streamed to a ledger rather than listed."""
+
+        if self.conflict_total is not None:
+            return self.conflict_total
+        return len(self.conflict_resolutions)
+
     def to_markdown(self) -> str:
         lines = ["# Hotpass Quality Report", ""]
         lines.extend(
@@ -222,8 +258,8 @@ class QualityReport:
                 value = str(conflict.get("value", ""))[:50]
                 alt_count = len(conflict.get("alternatives", []))
                 lines.append(f"| {field} | {source} | {value} | {alt_count} alternatives |")
-            if len(self.conflict_resolutions) > 10:
-                remaining = len(self.conflict_resolutions) - 10
+            if self.resolved_conflict_count > 10:
+                remaining = self.resolved_conflict_count - 10
                 lines.append(f"| ... | ... | ... | {remaining} more conflicts |")
             lines.append("")
 
@@ -241,6 +277,10 @@ class QualityReport:
                     "Expectations seconds",
                     self.performance_metrics.get("expectations_seconds"),
                 ),
+                (
+                    "Expectations setup seconds",
+                    self.performance_metrics.get("expectations_setup_seconds"),
+                ),
                 ("Write seconds", self.performance_metrics.get("write_seconds")),
                 ("Total seconds", self.performance_metrics.get("total_seconds")),
                 ("Rows per second", self.performance_metrics.get("rows_per_second")),
@@ -0,0 +1,177 @@
+"""Append-only ledger for the field conflicts resolved during aggregation."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import polars as pl
+import pyarrow as pa
+
+CONFLICT_SCHEMA = pa.schema(
+    [
+        ("sequence", pa.int64()),
+        ("organization_slug", pa.string()),
+        ("field", pa.string()),
+        ("chosen_source", pa.string()),
+        ("value", pa.string()),
+        (
+            "alternatives",
+            pa.list_(pa.struct([("source", pa.string()), ("value", pa.string())])),
+        ),
+    ]
+)
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_SAMPLE_SIZE = 10
+
+
+class ConflictLedger:
+    """Collect aggregation conflicts in memory or stream them to an Arrow IPC file.
+
+    Without a ``path`` every conflict is kept in memory, as before. With a path,
+    conflicts are written in record batches of ``batch_size`` and only the
+    running counts and the first ``sample_size`` conflicts stay resident.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ) -> None:
+        if batch_size <= 0:
+            msg = "batch_size must be greater than zero"
+            raise ValueError(msg)
+        self.path = path
+        self.total = 0
+        self.field_counts: Counter[str] = Counter()
+        self.source_counts: Counter[str] = Counter()
+        self._batch_size = batch_size
+        self._sample_size = sample_size
+        self._sample: list[dict[str, Any]] = []
+        self._retained: list[dict[str, Any]] = []
+        self._pending: list[dict[str, Any]] = []
+        self._writer: pa.ipc.RecordBatchFileWriter | None = None
+        self._sink: pa.NativeFile | None = None
+        self._closed = False
+
+    @property
+    def streaming(self) -> bool:
+        return self.path is not None
+
+    def __enter__(self) -> ConflictLedger:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def extend(self, slug: str | None, conflicts: Iterable[Mapping[str, Any]]) -> None:
+        """Record the conflicts of one SSOT record in aggregation order."""
+
+        for conflict in conflicts:
+            entry = dict(conflict)
+            self.field_counts[str(entry.get("field"))] += 1
+            self.source_counts[str(entry.get("chosen_source"))] += 1
+            if len(self._sample) < self._sample_size:
+                self._sample.append(entry)
+            if not self.streaming:
+                self._retained.append(entry)
+            else:
+                self._pending.append(
+                    {
+                        "sequence": self.total,
+                        "organization_slug": slug,
+                        "field": entry.get("field"),
+                        "chosen_source": entry.get("chosen_source"),
+                        "value": entry.get("value"),
+                        "alternatives": list(entry.get("alternatives", [])),
+                    }
+                )
+                if len(self._pending) >= self._batch_size:
+                    self._flush()
+            self.total += 1
+
+    def _open_writer(self, path: Path) -> pa.ipc.RecordBatchFileWriter:
+        if self._writer is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._sink = pa.OSFile(str(path), "wb")
+            self._writer = pa.ipc.new_file(self._sink, CONFLICT_SCHEMA)
+        return self._writer
+
+    def _flush(self) -> None:
+        if not self._pending or self.path is None:
+            return
+        writer = self._open_writer(self.path)
+        writer.write_batch(pa.RecordBatch.from_pylist(self._pending, schema=CONFLICT_SCHEMA))
+        self._pending = []
+
+    def close(self) -> None:
+        """Flush buffered conflicts and finalise the IPC file.
+
+        The file is written even when nothing conflicted so readers can rely on it.
+        """
+
+        if self.path is None or self._closed:
+            return
+        self._flush()
+        self._open_writer(self.path).close()
+        if self._sink is not None:
+            self._sink.close()
+        self._writer = None
+        self._sink = None
+        self._closed = True
+
+    def conflicts(self) -> list[dict[str, Any]]:
+        """Return every conflict when held in memory, otherwise the retained sample."""
+
+        return self._retained if not self.streaming else list(self._sample)
+
+    def summary(self) -> dict[str, Any]:
+        summary: dict[str, Any] = {
+            "total": self.total,
+            "by_field": dict(self.field_counts),
+            "by_chosen_source": dict(self.source_counts),
+        }
+        if self.path is not None:
+            summary["path"] = str(self.path)
+        return summary
+
+
+def query_conflicts(
+    path: Path,
+    *,
+    slug: str | None = None,
+    field: str | None = None,
+    source: str | None = None,
+    limit: int | None = None,
+) -> pl.DataFrame:
+    """Lazily filter a conflict ledger written by :class:`ConflictLedger`."""
+
+    frame = pl.scan_ipc(path)
+    if slug is not None:
+        frame = frame.filter(pl.col("organization_slug") == slug)
+    if field is not None:
+        frame = frame.filter(pl.col("field") == field)
+    if source is not None:
+        frame = frame.filter(pl.col("chosen_source") == source)
+    frame = frame.sort("sequence")
+    if limit is not None:
+        frame = frame.head(limit)
+    return frame.collect()
+
+
+__all__ = [
+    "CONFLICT_SCHEMA",
+    "ConflictLedger",
+    "query_conflicts",
+]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+import logging
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -9,15 +11,31 @@ import pandas as pd
 import polars as pl
 
 from ..domain.party import PartyStore, build_party_store_from_refined
-from ..formatting import OutputFormat, apply_excel_formatting, create_summary_sheet
-from ..storage import DuckDBAdapter, PolarsDataset
+from ..formatting import (
+    OutputFormat,
+    create_summary_sheet,
+    write_formatted_workbook,
+    xlsxwriter_available,
+)
+from ..storage import (
+    DuckDBAdapter,
+    ExportBuffer,
+    ExportCoordinator,
+    ParquetLayout,
+    PolarsDataset,
+    write_csv,
+    write_parquet,
+)
 from ..transform.scoring import build_daily_list
 from .config import PipelineConfig
 from .enrichment import write_intent_digest
+from .provenance import ProvenanceTable
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from ..enrichment.intent import IntentRunResult
 
+logger = logging.getLogger(__name__)
+
 
 def _write_csvw_metadata(output_path: Path) -> None:
     from ..validation import load_schema_descriptor  # Local import to avoid cycle
@@ -34,19 +52,33 @@ def _write_csvw_metadata(output_path: Path) -> None:
 
 def publish_outputs(
     config: PipelineConfig,
-    validated_df: pd.DataFrame,
-    refined_df: pd.DataFrame,
+    validated_df: pd.DataFrame | pl.DataFrame,
+    refined_df: pd.DataFrame | pl.DataFrame,
     expectation_summary: Any,
     metrics: dict[str, Any],
     pipeline_start: float,
     notify_progress: Callable[[str, dict[str, Any]], None],
     intent_result: IntentRunResult | None = None,
+    provenance: ProvenanceTable | None = None,
 ) -> tuple[dict[str, Any], PartyStore, pd.DataFrame | None]:
-    validated_dataset = PolarsDataset.from_pandas(validated_df)
-    parquet_path = config.output_path.with_suffix(".parquet")
-    validated_dataset.write_parquet(parquet_path)
-    metrics["parquet_path"] = str(parquet_path)
-    metrics["polars_write_seconds"] = validated_dataset.timings.parquet_seconds
+    """Write the validated records and derived artefacts.
+
+    ``validated_df`` may be the Polars frame from validation: the DuckDB
+    ordering then runs on it directly. The ordered records are held once as an
+    Arrow table; the Parquet snapshot and the configured output are written
+    from it concurrently, and a single pandas view is shared by the workbook,
+    CSV and party-store writers.
+    """
+
+    validated_dataset = (
+        PolarsDataset(validated_df)
+        if isinstance(validated_df, pl.DataFrame)
+        else PolarsDataset.from_pandas(validated_df, stage="publish")
+    )
+    if provenance is not None:
+        provenance_path = config.output_path.with_suffix(".provenance.parquet")
+        provenance.write_parquet(provenance_path)
+        metrics["provenance_path"] = str(provenance_path)
 
     ordered_frame = validated_dataset.query(
         DuckDBAdapter(),
@@ -54,7 +86,8 @@ def publish_outputs(
     )
     validated_dataset.replace(ordered_frame)
     metrics["duckdb_sort_seconds"] = validated_dataset.timings.query_seconds
-    validated_df = validated_dataset.to_pandas().reset_index(drop=True)
+    export_buffer = ExportBuffer(validated_dataset.to_arrow(), stage="publish")
+    validated_df = export_buffer.to_pandas()
 
     hooks = config.runtime_hooks
     perf_counter = hooks.perf_counter
@@ -63,34 +96,65 @@ def publish_outputs(
         validated_df,
         default_country=config.country_code,
         execution_time=hooks.datetime_factory(),
+        selections=(
+            provenance.documents_for(validated_df["organization_slug"])
+            if provenance is not None and "organization_slug" in validated_df.columns
+            else None
+        ),
     )
 
-    suffix = config.output_path.suffix.lower()
-    notify_progress("write_started", {"path": str(config.output_path)})
-    write_start = perf_counter()
-    config.output_path.parent.mkdir(parents=True, exist_ok=True)
+    parquet_path = config.output_path.with_suffix(".parquet")
+    coordinator = ExportCoordinator(export_buffer, max_workers=config.export_workers)
+    parquet_layout = ParquetLayout(
+        partition_by=tuple(config.parquet_partition_by),
+        sort_by=tuple(config.parquet_sort_by),
+        row_group_size=config.parquet_row_group_size or ParquetLayout.row_group_size,
+        bloom_filters=config.parquet_bloom_filters,
+    )
+    coordinator.add(
+        "parquet", parquet_path, functools.partial(write_parquet, layout=parquet_layout)
+    )
 
+    suffix = config.output_path.suffix.lower()
     if config.enable_formatting and suffix in {".xlsx", ".xls"}:
-        with pd.ExcelWriter(config.output_path, engine="openpyxl") as writer:
-            validated_df.to_excel(writer, sheet_name="Data", index=False)
-            output_format: OutputFormat = config.output_format or OutputFormat()
-            apply_excel_formatting(writer, "Data", validated_df, output_format)
-
-            quality_report_dict = {
-                "total_records": len(refined_df),
-                "invalid_records": len(refined_df) - len(validated_df),
-                "expectations_passed": expectation_summary.success,
-            }
-            summary_df = create_summary_sheet(validated_df, quality_report_dict)
-            summary_df.to_excel(writer, sheet_name="Summary", index=False, header=False)
+        output_format: OutputFormat = config.output_format or OutputFormat()
+        quality_report_dict = {
+            "total_records": len(refined_df),
+            "invalid_records": len(refined_df) - len(validated_df),
+            "expectations_passed": expectation_summary.success,
+        }
+        summary_df = create_summary_sheet(validated_df, quality_report_dict)
+        excel_writer = config.excel_writer
+        if excel_writer == "xlsxwriter" and not xlsxwriter_available():
+            logger.warning("xlsxwriter not installed; writing the workbook with openpyxl")
+            excel_writer = "openpyxl"
+
+        def _write_workbook(buffer: ExportBuffer, path: Path) -> None:
+            write_formatted_workbook(
+                path,
+                buffer.to_pandas(),
+                output_format,
+                summary_df,
+                engine=excel_writer,
+            )
+
+        coordinator.add("xlsx", config.output_path, _write_workbook)
     elif suffix == ".csv":
-        validated_df.to_csv(config.output_path, index=False)
-        _write_csvw_metadata(config.output_path)
-    elif suffix == ".parquet":
-        pl.from_pandas(validated_df, include_index=False).write_parquet(config.output_path)
-    else:
-        validated_df.to_excel(config.output_path, index=False)
+        coordinator.add("csv", config.output_path, write_csv)
+    elif suffix != ".parquet":
+
+        def _write_excel(buffer: ExportBuffer, path: Path) -> None:
+            buffer.to_pandas().to_excel(path, index=False)
+
+        coordinator.add("excel", config.output_path, _write_excel)
 
+    notify_progress("write_started", {"path": str(config.output_path)})
+    write_start = perf_counter()
+    export_timings = coordinator.run()
+    if suffix == ".csv":
+        _write_csvw_metadata(config.output_path)
+    metrics["parquet_path"] = str(parquet_path)
+    metrics["polars_write_seconds"] = export_timings["parquet"].seconds
     metrics["write_seconds"] = perf_counter() - write_start
     metrics["total_seconds"] = perf_counter() - pipeline_start
     if metrics["total_seconds"] > 0:
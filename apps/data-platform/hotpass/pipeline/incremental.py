@@ -0,0 +1,448 @@
+"""Checkpoints that let incremental runs refine only what changed since the last run."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as package_version
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..data_sources import source_fingerprints
+from ..enrichment.intent import IntentOrganizationSummary
+from ..normalization import slugify
+from ..storage import write_atomic
+from .aggregation_shards import _NULL_SLUG
+from .config import PipelineConfig
+from .survivorship import PARSED_INTERACTION_COLUMN
+
+CHECKPOINT_VERSION = 1
+STATE_FILE = "state.json"
+GROUPS_FILE = "groups.parquet"
+SOURCES_DIR = "sources"
+
+GROUPS_SCHEMA: dict[str, pl.DataType] = {
+    "slug_key": pl.String(),
+    "fingerprint": pl.String(),
+    "record": pl.String(),
+    "conflicts": pl.String(),
+    "provenance": pl.String(),
+}
+"""One row per slug group: its input fingerprint and the JSON outputs aggregated from it."""
+
+# Two independently seeded 64-bit row hashes give each row a 128-bit digest.
+_ROW_HASH_SEEDS: tuple[tuple[int, int, int, int], ...] = (
+    (0x9E3779B9, 0x85EBCA6B, 0xC2B2AE35, 0x27D4EB2F),
+    (0x165667B1, 0xD3A2646C, 0xFD7046C5, 0xB55A4F09),
+)
+_DERIVED_COLUMNS = ("_row_index", PARSED_INTERACTION_COLUMN)
+
+_GroupPayload = tuple[str, str, str]
+
+
+def _package_version(name: str) -> str:
+    try:
+        return package_version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def config_fingerprint(config: PipelineConfig) -> str:
+    """Digest the settings, besides the input rows, that shape a run's records.
+
+    Checkpoints written under another fingerprint are ignored, so changing the
+    inputs directory, reader options, profile or survivorship policy, or
+    upgrading Hotpass or Polars, forces a full run.
+    """
+
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "hotpass": _package_version("hotpass"),
+        "polars": pl.__version__,
+        "input_dir": str(Path(config.input_dir).resolve()),
+        "country_code": config.country_code,
+        "excel_options": repr(config.excel_options),
+        "industry_profile": repr(config.industry_profile),
+        "survivorship_policy": repr(config.survivorship_policy),
+        "aggregation_engine": config.aggregation_engine,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _slug_key(slug: object | None) -> str:
+    return _NULL_SLUG if slug is None else str(slug)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _frame_from_arrow(table: pa.Table) -> pd.DataFrame:
+    """Rebuild a source frame with plain Python cells, as the loaders produce them."""
+
+    frame = pl.from_arrow(table)
+    if isinstance(frame, pl.Series):  # pragma: no cover - tables give frames
+        frame = frame.to_frame()
+    return pd.DataFrame({name: frame.get_column(name).to_list() for name in frame.columns})
+
+
+def _intent_candidates(
+    intent_summaries: Mapping[str, IntentOrganizationSummary],
+    key: str,
+    names: Sequence[str],
+) -> list[str]:
+    """Every summary the group's record could resolve, whatever name it ends up with."""
+
+    candidates = [] if key == _NULL_SLUG else [key.lower()]
+    for name in names:
+        candidates.extend((slugify(name) or "", name.lower()))
+    return [
+        repr(intent_summaries[candidate])
+        for candidate in candidates
+        if candidate in intent_summaries
+    ]
+
+
+def group_fingerprints(
+    frame: pl.DataFrame,
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None = None,
+) -> dict[str, str]:
+    """Fingerprint each slug group's rows, in order, and the intent summaries it can use.
+
+    Keys are slugs, with null slugs under the aggregation engines' sentinel, in
+    order of first appearance. Derived columns added during aggregation are
+    ignored.
+    """
+
+    content = frame.drop([column for column in _DERIVED_COLUMNS if column in frame.columns])
+    hashed = pl.DataFrame(
+        {
+            "slug_key": frame.get_column("organization_slug")
+            .cast(pl.String)
+            .fill_null(_NULL_SLUG),
+            "first": content.hash_rows(*_ROW_HASH_SEEDS[0]),
+            "second": content.hash_rows(*_ROW_HASH_SEEDS[1]),
+            "organization_name": frame.get_column("organization_name").cast(pl.String),
+        }
+    )
+    groups = hashed.group_by("slug_key", maintain_order=True).agg(
+        pl.col("first"),
+        pl.col("second"),
+        pl.col("organization_name").drop_nulls().unique(maintain_order=True),
+    )
+    fingerprints: dict[str, str] = {}
+    for key, first, second, names in groups.iter_rows():
+        digest = hashlib.sha256(np.asarray(first, dtype=np.uint64).tobytes())
+        digest.update(np.asarray(second, dtype=np.uint64).tobytes())
+        if intent_summaries:
+            digest.update(repr(_intent_candidates(intent_summaries, key, names)).encode())
+        fingerprints[key] = digest.hexdigest()
+    return fingerprints
+
+
+def _decode(payload: _GroupPayload) -> dict[str, object | None]:
+    record_json, conflicts_json, provenance_json = payload
+    record: dict[str, object | None] = json.loads(record_json)
+    record["_conflicts"] = json.loads(conflicts_json)
+    record["_provenance"] = json.loads(provenance_json)
+    return record
+
+
+@dataclass(frozen=True)
+class GroupPlan:
+    """The slug groups of an incremental run, in group order, and those it reuses."""
+
+    keys: tuple[str, ...]
+    reused: Mapping[str, _GroupPayload]
+
+    @property
+    def aggregated(self) -> int:
+        return len(self.keys) - len(self.reused)
+
+    def work_frame(self, frame: pl.DataFrame) -> pl.DataFrame:
+        """Keep the rows of groups that must be aggregated again.
+
+        Engines address rows by ``_row_index`` position, so the rows are
+        renumbered; the renumbering is monotonic and keeps positional tie-breaks.
+        """
+
+        if not self.reused:
+            return frame
+        slug_key = pl.col("organization_slug").cast(pl.String).fill_null(_NULL_SLUG)
+        return (
+            frame.filter(~slug_key.is_in(list(self.reused)))
+            .drop("_row_index")
+            .with_row_index("_row_index")
+        )
+
+    def merge(
+        self, fresh: Iterator[dict[str, object | None]]
+    ) -> Iterator[dict[str, object | None]]:
+        """Yield reused and freshly aggregated records in the order of a full run."""
+
+        for key in self.keys:
+            payload = self.reused.get(key)
+            if payload is not None:
+                yield _decode(payload)
+                continue
+            record = next(fresh, None)
+            if record is None or _slug_key(record.get("organization_slug")) != key:
+                msg = f"Incremental aggregation expected a record for '{key}' next"
+                raise RuntimeError(msg)
+            yield record
+
+
+class IncrementalCheckpoint:
+    """What an incremental run reuses from the previous run and saves for the next.
+
+    The checkpoint directory holds ``state.json`` (when it was saved, the
+    configuration fingerprint and the digest of each source workbook), the
+    normalised frame of each source under ``sources/`` and ``groups.parquet``,
+    which stores every slug group's fingerprint next to the record, conflicts
+    and provenance aggregated from it. Unchanged workbooks are restored instead
+    of being read and validated again, and unchanged groups reuse their stored
+    outputs instead of being aggregated again.
+
+    A checkpoint saved under another configuration fingerprint, or before
+    ``since``, is ignored and the run starts from scratch.
+    """
+
+    def __init__(
+        self, directory: Path, fingerprint: str, state: Mapping[str, Any] | None = None
+    ) -> None:
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self._state = dict(state) if state is not None else None
+        self._sources: dict[str, str] = {}
+        self._fingerprints: dict[str, str] | None = None
+        self._reused: dict[str, _GroupPayload] = {}
+        self._groups: dict[str, _GroupPayload] = {}
+        self.sources_reused = 0
+
+    @classmethod
+    def load(cls, config: PipelineConfig) -> IncrementalCheckpoint:
+        directory = config.incremental_state_dir or config.dist_dir / "incremental"
+        fingerprint = config_fingerprint(config)
+        state = cls._read_state(directory / STATE_FILE)
+        if state is not None and not cls._usable(state, fingerprint, config.since):
+            state = None
+        return cls(directory, fingerprint, state)
+
+    @staticmethod
+    def _read_state(path: Path) -> dict[str, Any] | None:
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    @staticmethod
+    def _usable(state: Mapping[str, Any], fingerprint: str, since: datetime | None) -> bool:
+        if state.get("version") != CHECKPOINT_VERSION:
+            return False
+        if state.get("config_fingerprint") != fingerprint:
+            return False
+        try:
+            created_at = _as_utc(datetime.fromisoformat(str(state["created_at"])))
+        except (KeyError, ValueError):
+            return False
+        return since is None or created_at >= _as_utc(since)
+
+    @property
+    def resumed(self) -> bool:
+        """Whether a previous run's checkpoint is being reused."""
+
+        return self._state is not None
+
+    def _source_path(self, label: str, digest: str) -> Path:
+        name = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")
+        return self.directory / SOURCES_DIR / f"{name}__{digest[:16]}.parquet"
+
+    def restore_source(self, label: str, digest: str) -> pd.DataFrame | None:
+        """Return the checkpointed frame of ``label`` if its workbook digest is unchanged."""
+
+        if self._state is None or self._state.get("sources", {}).get(label) != digest:
+            return None
+        started = time.perf_counter()
+        try:
+            frame = _frame_from_arrow(pq.read_table(self._source_path(label, digest)))
+        except (OSError, pa.ArrowException):
+            return None
+        frame.attrs["load_seconds"] = time.perf_counter() - started
+        self._sources[label] = digest
+        self.sources_reused += 1
+        return frame
+
+    def store_source(self, label: str, digest: str, frame: pd.DataFrame) -> None:
+        """Checkpoint a freshly loaded source frame.
+
+        Frames that do not round-trip through Arrow unchanged, such as columns
+        mixing numbers and strings, are not stored and are loaded again next run.
+        """
+
+        try:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if not _frame_from_arrow(table).equals(frame):
+                return
+        except (TypeError, ValueError, pa.ArrowException):
+            return
+        path = self._source_path(label, digest)
+        write_atomic(path, lambda target: pq.write_table(table, target, compression="zstd"))
+        self._sources[label] = digest
+
+    def load_sources(
+        self, config: PipelineConfig, load: Callable[..., Mapping[str, pd.DataFrame]]
+    ) -> dict[str, pd.DataFrame]:
+        """Restore the unchanged source workbooks and ``load`` the others.
+
+        ``load`` is called like :func:`hotpass.pipeline.ingestion.load_sources`
+        with the labels of the workbooks to read again; their frames are
+        checkpointed for the next run. Frames come back in loader order, and
+        restored ones carry no contract notices as the earlier run reported them.
+        """
+
+        digests = source_fingerprints(config.input_dir)
+        restored: dict[str, pd.DataFrame] = {}
+        for label, digest in digests.items():
+            frame = self.restore_source(label, digest)
+            if frame is not None:
+                restored[label] = frame
+        pending = [label for label in digests if label not in restored]
+        loaded = (
+            load(config.input_dir, config.country_code, config.excel_options, labels=pending)
+            if pending
+            else {}
+        )
+        frames: dict[str, pd.DataFrame] = {}
+        for label, digest in digests.items():
+            if label in restored:
+                frames[label] = restored[label]
+            elif label in loaded:
+                frames[label] = loaded[label]
+                self.store_source(label, digest, loaded[label])
+        return frames
+
+    def plan_groups(
+        self,
+        frame: pl.DataFrame,
+        intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    ) -> GroupPlan | None:
+        """Fingerprint the run's slug groups and match them against the checkpoint.
+
+        Returns ``None`` when the rows cannot be hashed; every group is then
+        aggregated and none is checkpointed.
+        """
+
+        try:
+            fingerprints = group_fingerprints(frame, intent_summaries)
+        except pl.exceptions.PolarsError:
+            return None
+        self._fingerprints = fingerprints
+        self._reused = self._matching_groups(fingerprints)
+        return GroupPlan(keys=tuple(fingerprints), reused=self._reused)
+
+    def _matching_groups(self, fingerprints: Mapping[str, str]) -> dict[str, _GroupPayload]:
+        path = self.directory / GROUPS_FILE
+        if self._state is None or not fingerprints or not path.exists():
+            return {}
+        current = pl.DataFrame(
+            {"slug_key": list(fingerprints), "fingerprint": list(fingerprints.values())},
+            schema={"slug_key": pl.String, "fingerprint": pl.String},
+        )
+        try:
+            previous = pl.read_parquet(path, columns=list(GROUPS_SCHEMA))
+            matched = current.join(previous, on=["slug_key", "fingerprint"], how="inner")
+        except (OSError, pl.exceptions.PolarsError):
+            return {}
+        return {
+            key: (record, conflicts, provenance)
+            for key, _fingerprint, record, conflicts, provenance in matched.iter_rows()
+        }
+
+    def record_group(
+        self,
+        slug: str | None,
+        record: Mapping[str, object | None],
+        conflicts: Sequence[Mapping[str, Any]],
+        provenance: Mapping[str, Any],
+    ) -> None:
+        """Keep an aggregated group's outputs for :meth:`save`.
+
+        Groups whose outputs are not JSON serialisable are skipped and simply
+        aggregated again next run.
+        """
+
+        if self._fingerprints is None:
+            return
+        key = _slug_key(slug)
+        payload = self._reused.get(key)
+        if payload is None:
+            try:
+                payload = (json.dumps(record), json.dumps(conflicts), json.dumps(provenance))
+            except (TypeError, ValueError):
+                return
+        self._groups[key] = payload
+
+    def save(self, created_at: datetime) -> None:
+        """Persist the checkpoint for the next incremental run.
+
+        ``state.json`` is removed first and written last, so an interrupted save
+        leaves no state that could vouch for the other files.
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        state_path = self.directory / STATE_FILE
+        state_path.unlink(missing_ok=True)
+
+        groups_path = self.directory / GROUPS_FILE
+        fingerprints = self._fingerprints or {}
+        rows = [
+            (key, fingerprints[key], *payload)
+            for key, payload in self._groups.items()
+            if key in fingerprints
+        ]
+        if rows:
+            groups = pl.DataFrame(rows, schema=GROUPS_SCHEMA, orient="row")
+            write_atomic(groups_path, lambda target: groups.write_parquet(target))
+        else:
+            groups_path.unlink(missing_ok=True)
+
+        kept = {self._source_path(label, digest) for label, digest in self._sources.items()}
+        for path in (self.directory / SOURCES_DIR).glob("*.parquet"):
+            if path not in kept:
+                path.unlink(missing_ok=True)
+
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "created_at": _as_utc(created_at).isoformat(),
+            "config_fingerprint": self.fingerprint,
+            "sources": dict(sorted(self._sources.items())),
+        }
+        payload = json.dumps(state, indent=2, sort_keys=True)
+
+        def _write_state(target: Path) -> None:
+            target.write_text(payload, encoding="utf-8")
+
+        write_atomic(state_path, _write_state)
+
+
+__all__ = [
+    "CHECKPOINT_VERSION",
+    "GroupPlan",
+    "IncrementalCheckpoint",
+    "config_fingerprint",
+    "group_fingerprints",
+]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -12,10 +12,12 @@ from ..data_sources import (
     load_contact_database,
     load_reachout_database,
     load_sacaa_cleaned,
+    load_sources_parallel,
 )
 from ..data_sources.agents import run_plan as run_acquisition_plan
-from ..normalization import normalize_province, slugify
+from ..normalization import normalize_province, normalize_series, slugify
 from .config import PipelineConfig
+from .incremental import IncrementalCheckpoint
 
 _SOURCE_COLUMNS: list[str] = [
     "organization_name",
@@ -123,18 +125,27 @@ def load_sources(
     input_dir: Path,
     country_code: str,
     excel_options: ExcelReadOptions | None,
+    *,
+    labels: Collection[str] | None = None,
 ) -> Mapping[str, pd.DataFrame]:
     loaders = {
         "Reachout Database": load_reachout_database,
         "Contact Database": load_contact_database,
         "SACAA Cleaned": load_sacaa_cleaned,
     }
+    if labels is not None:
+        loaders = {label: loader for label, loader in loaders.items() if label in labels}
+    loaded: dict[str, pd.DataFrame] = {}
+    if excel_options is not None and excel_options.should_parallelise():
+        loaded = load_sources_parallel(input_dir, country_code, excel_options, labels=list(loaders))
+    else:
+        for label, loader in loaders.items():
+            try:
+                loaded[label] = loader(input_dir, country_code, excel_options)
+            except FileNotFoundError:
+                continue
     frames: dict[str, pd.DataFrame] = {}
-    for label, loader in loaders.items():
-        try:
-            frame = loader(input_dir, country_code, excel_options)
-        except FileNotFoundError:
-            continue
+    for label, frame in loaded.items():
         if frame.empty:
             continue
         frames[label] = _normalise_source_frame(frame)
@@ -142,7 +153,7 @@ def load_sources(
 
 
 def ingest_sources(
-    config: PipelineConfig,
+    config: PipelineConfig, *, checkpoint: IncrementalCheckpoint | None = None
 ) -> tuple[pd.DataFrame, dict[str, float], list[dict[str, Any]]]:
     agent_frame, agent_timings = _load_agent_frame(config)
 
@@ -152,9 +163,11 @@ def ingest_sources(
         frames.append(agent_frame)
 
     contract_notices: list[dict[str, Any]] = []
-    for label, frame in load_sources(
-        config.input_dir, config.country_code, config.excel_options
-    ).items():
+    if checkpoint is None:
+        sources = load_sources(config.input_dir, config.country_code, config.excel_options)
+    else:
+        sources = checkpoint.load_sources(config, load_sources)
+    for label, frame in sources.items():
         frames.append(frame)
         source_timings[label] = frame.attrs.get("load_seconds", 0.0)
         notices = frame.attrs.get("contract_notices", [])
@@ -168,8 +181,8 @@ def ingest_sources(
 
     combined = pd.concat(frames, ignore_index=True, sort=False)
     combined = _normalise_source_frame(combined)
-    combined["organization_slug"] = combined["organization_name"].apply(slugify)
-    combined["province"] = combined["province"].apply(normalize_province)
+    combined["organization_slug"] = normalize_series(combined["organization_name"], slugify)
+    combined["province"] = normalize_series(combined["province"], normalize_province)
     return combined, source_timings, contract_notices
 
 
@@ -0,0 +1,190 @@
+"""Columnar store for the per-field selection provenance of SSOT records."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+PROVENANCE_SCHEMA: dict[str, pl.DataType] = {
+    "organization_slug": pl.String(),
+    "field": pl.String(),
+    "role": pl.String(),
+    "position": pl.Int32(),
+    "value": pl.String(),
+    "source_dataset": pl.String(),
+    "source_record_id": pl.String(),
+    "source_priority": pl.Int64(),
+    "quality_score": pl.Int64(),
+    "last_interaction_date": pl.String(),
+}
+"""One row per (organisation, field, source) with ``role`` of ``selected`` or ``contributor``."""
+
+_SELECTED = "selected"
+_CONTRIBUTOR = "contributor"
+_SELECTION_KEYS: tuple[str, ...] = (
+    "value",
+    "source_dataset",
+    "source_record_id",
+    "source_priority",
+    "quality_score",
+    "last_interaction_date",
+)
+_CONTRIBUTOR_KEYS: tuple[str, ...] = ("source_dataset", "source_record_id", "value")
+_JSON_COLUMN = "selection_provenance"
+
+
+class ProvenanceTable:
+    """Normalised selection provenance keyed by ``organization_slug``.
+
+    Aggregation emits one table per run instead of a JSON document per SSOT
+    row. Each slug appears on exactly one SSOT row, so lookups by slug stay
+    valid after the refined frame is filtered or re-sorted. The JSON documents
+    of the legacy ``selection_provenance`` column are rebuilt on demand.
+    """
+
+    def __init__(self, frame: pl.DataFrame) -> None:
+        self._frame = frame
+        self._documents: dict[str | None, dict[str, dict[str, Any]]] | None = None
+
+    @classmethod
+    def from_documents(
+        cls, documents: Iterable[tuple[str | None, Mapping[str, Mapping[str, Any]]]]
+    ) -> ProvenanceTable:
+        """Flatten ``(slug, provenance document)`` pairs produced by the aggregation engines."""
+
+        columns: dict[str, list[Any]] = {name: [] for name in PROVENANCE_SCHEMA}
+
+        def _append(
+            slug: str | None,
+            field: str,
+            role: str,
+            position: int,
+            entry: Mapping[str, Any],
+        ) -> None:
+            columns["organization_slug"].append(slug)
+            columns["field"].append(field)
+            columns["role"].append(role)
+            columns["position"].append(position)
+            for key in _SELECTION_KEYS:
+                columns[key].append(entry.get(key))
+
+        for slug, document in documents:
+            for field, selection in document.items():
+                _append(slug, field, _SELECTED, 0, selection)
+                for position, contributor in enumerate(selection.get("contributors", ()), start=1):
+                    _append(slug, field, _CONTRIBUTOR, position, contributor)
+        return cls(pl.DataFrame(columns, schema=PROVENANCE_SCHEMA))
+
+    @classmethod
+    def read_parquet(cls, path: Path) -> ProvenanceTable:
+        return cls(pl.read_parquet(path))
+
+    @property
+    def frame(self) -> pl.DataFrame:
+        return self._frame
+
+    def write_parquet(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._frame.write_parquet(path, statistics=True)
+
+    def documents(self) -> dict[str | None, dict[str, dict[str, Any]]]:
+        """Return the provenance document of every slug, built once and cached."""
+
+        if self._documents is None:
+            documents: dict[str | None, dict[str, dict[str, Any]]] = {}
+            for row in self._frame.iter_rows(named=True):
+                document = documents.setdefault(row["organization_slug"], {})
+                if row["role"] == _SELECTED:
+                    entry = {"field": row["field"]}
+                    entry.update({key: row[key] for key in _SELECTION_KEYS})
+                    document[row["field"]] = entry
+                else:
+                    contributor = {key: row[key] for key in _CONTRIBUTOR_KEYS}
+                    document[row["field"]].setdefault("contributors", []).append(contributor)
+            self._documents = documents
+        return self._documents
+
+    def for_slug(self, slug: str | None) -> dict[str, dict[str, Any]]:
+        return self.documents().get(slug, {})
+
+    def selection(self, slug: str | None, field: str) -> dict[str, Any] | None:
+        return self.for_slug(slug).get(field)
+
+    def documents_for(self, slugs: Iterable[object | None]) -> list[dict[str, dict[str, Any]]]:
+        """Return documents aligned with ``slugs``, e.g. a refined frame's slug column."""
+
+        documents = self.documents()
+        return [documents.get(_slug_key(slug), {}) for slug in slugs]
+
+    def json_documents(self) -> pl.DataFrame:
+        """Return each slug's provenance document as compact JSON with sorted keys.
+
+        The documents are encoded by one Polars query rather than a
+        ``json.dumps`` call per SSOT row.
+        """
+
+        contributors = (
+            self._frame.filter(pl.col("role") == _CONTRIBUTOR)
+            .sort("position")
+            .group_by("organization_slug", "field", maintain_order=True)
+            .agg(pl.struct(*_CONTRIBUTOR_KEYS).alias("contributors"))
+        )
+        entry_keys = sorted(("contributors", "field", *_SELECTION_KEYS))
+        return (
+            self._frame.filter(pl.col("role") == _SELECTED)
+            .join(contributors, on=["organization_slug", "field"], how="left", nulls_equal=True)
+            .select(
+                "organization_slug",
+                "field",
+                pl.struct(*entry_keys)
+                .struct.json_encode()
+                # "contributors" sorts first, so a field without any is a prefix.
+                .str.replace('{"contributors":null,', "{", literal=True)
+                .alias("entry"),
+            )
+            .sort("organization_slug", "field")
+            .group_by("organization_slug", maintain_order=True)
+            .agg(pl.format('"{}":{}', "field", "entry").str.join(",").alias(_JSON_COLUMN))
+            .with_columns(pl.format("{{}}", _JSON_COLUMN).alias(_JSON_COLUMN))
+        )
+
+    def attach_json(self, frame: pl.DataFrame) -> pl.DataFrame:
+        """Fill ``selection_provenance`` of ``frame`` from the table, keeping row order."""
+
+        return (
+            frame.drop(_JSON_COLUMN)
+            # An all-null slug column has the Null dtype, which cannot be joined.
+            .with_columns(pl.col("organization_slug").cast(pl.String).alias("_slug_key"))
+            .join(
+                self.json_documents(),
+                left_on="_slug_key",
+                right_on="organization_slug",
+                how="left",
+                nulls_equal=True,
+                maintain_order="left",
+            )
+            .with_columns(pl.col(_JSON_COLUMN).fill_null("{}"))
+            .select(frame.columns)
+        )
+
+    def json_for(self, slugs: Iterable[object | None]) -> list[str]:
+        """Return JSON documents aligned with ``slugs``, the pandas form of :meth:`attach_json`."""
+
+        encoded = self.json_documents()
+        slugs_encoded = encoded.get_column("organization_slug").to_list()
+        lookup: dict[str | None, str] = dict(
+            zip(slugs_encoded, encoded.get_column(_JSON_COLUMN).to_list(), strict=True)
+        )
+        return [lookup.get(_slug_key(slug), "{}") for slug in slugs]
+
+
+def _slug_key(slug: object | None) -> str | None:
+    if slug is None or not isinstance(slug, str):
+        return None
+    return slug
+
+
+__all__ = ["PROVENANCE_SCHEMA", "ProvenanceTable"]
@@ -0,0 +1,127 @@
+"""SSOT schema validation that quarantines invalid rows in a single pass."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from pandera.errors import SchemaErrors
+
+_SCHEMA_CACHE: dict[tuple[str, tuple[str, ...]], tuple[Callable[[], Any], Any]] = {}
+
+
+def get_ssot_schema(backend: str = "pandas", *, without: tuple[str, ...] = ()) -> Any:
+    """Return the compiled SSOT schema for ``backend``, building it once.
+
+    ``without`` names columns left out of the schema, such as one that is only
+    materialised after validation. The cache is keyed on the builder, so patching
+    ``hotpass.pipeline.build_ssot_schema`` still takes effect on the next run.
+    """
+
+    # Local import to avoid circular dependency
+    from . import build_ssot_polars_schema, build_ssot_schema
+
+    builder = build_ssot_polars_schema if backend == "polars" else build_ssot_schema
+    cached = _SCHEMA_CACHE.get((backend, without))
+    if cached is not None and cached[0] is builder:
+        return cached[1]
+    schema = builder()
+    if without:
+        schema = schema.remove_columns(list(without))
+    _SCHEMA_CACHE[(backend, without)] = (builder, schema)
+    return schema
+
+
+def _all_failed(total_records: int) -> str:
+    return (
+        f"CRITICAL: All {total_records} records failed schema validation. "
+        "Output contains unvalidated data."
+    )
+
+
+def _pandas_quarantine(
+    exc: SchemaErrors, refined_df: pd.DataFrame
+) -> tuple[list[str], np.ndarray, bool]:
+    """Return the errors, the valid-row mask and whether any value failed coercion."""
+
+    failure_cases = exc.failure_cases
+    schema_errors = (
+        failure_cases["column"].astype(str) + ": " + failure_cases["failure_case"].astype(str)
+    ).tolist()
+    indices = failure_cases["index"]
+    if indices.isna().any():
+        # Frame-level failures (for example a missing column) have no row index.
+        valid: np.ndarray = np.zeros(len(refined_df), dtype=bool)
+    else:
+        valid = ~refined_df.index.isin(indices.unique())
+    coercion_failed = bool(failure_cases["check"].astype(str).str.startswith("coerce_dtype").any())
+    return schema_errors, valid, coercion_failed
+
+
+def _polars_quarantine(exc: SchemaErrors, height: int) -> tuple[list[str], pl.Series, bool]:
+    """Polars counterpart of :func:`_pandas_quarantine`; failure indices are row positions."""
+
+    failure_cases = exc.failure_cases
+    schema_errors = failure_cases.select(
+        pl.format(
+            "{}: {}",
+            pl.col("column").cast(pl.String).fill_null("None"),
+            pl.col("failure_case").cast(pl.String).fill_null("None"),
+        )
+    ).to_series()
+    indices = failure_cases.get_column("index")
+    if indices.null_count():
+        valid = pl.repeat(False, height, eager=True)
+    else:
+        valid = ~pl.int_range(height, eager=True).is_in(indices.unique().cast(pl.Int64).implode())
+    coercion_failed = bool(
+        failure_cases.get_column("check").cast(pl.String).str.starts_with("coerce_dtype").any()
+    )
+    return schema_errors.to_list(), valid, coercion_failed
+
+
+def validate_pandas(schema: Any, refined_df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    """Validate ``refined_df``, dropping the rows named by the failure cases.
+
+    The kept rows come from the coerced frame attached to the lazy validation's
+    errors; they are only validated again when a value failed dtype coercion.
+    When every row fails, the unvalidated frame is returned with a critical error.
+    """
+
+    schema_errors: list[str] = []
+    try:
+        validated: pd.DataFrame = schema.validate(refined_df, lazy=True)
+    except SchemaErrors as exc:
+        schema_errors, valid_rows, coercion_failed = _pandas_quarantine(exc, refined_df)
+        if not valid_rows.any():
+            validated = refined_df
+            schema_errors.append(_all_failed(len(refined_df)))
+        elif coercion_failed:
+            validated = schema.validate(refined_df.loc[valid_rows], lazy=False)
+        else:
+            validated = exc.data.loc[valid_rows]
+    return validated, schema_errors
+
+
+def validate_polars(schema: Any, frame: pl.DataFrame) -> tuple[pl.DataFrame, list[str]]:
+    """Polars counterpart of :func:`validate_pandas`."""
+
+    schema_errors: list[str] = []
+    try:
+        validated: pl.DataFrame = schema.validate(frame, lazy=True)
+    except SchemaErrors as exc:
+        schema_errors, valid_rows, coercion_failed = _polars_quarantine(exc, frame.height)
+        if not valid_rows.any():
+            validated = frame
+            schema_errors.append(_all_failed(frame.height))
+        elif coercion_failed:
+            validated = schema.validate(frame.filter(valid_rows), lazy=False)
+        else:
+            validated = exc.data.lazy().collect().filter(valid_rows)
+    return validated, schema_errors
+
+
+__all__ = ["get_ssot_schema", "validate_pandas", "validate_polars"]
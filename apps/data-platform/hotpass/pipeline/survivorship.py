@@ -0,0 +1,415 @@
+"""Value-selection rules shared by the aggregation engines.
+
+Both engines rank the rows of a slug group with the same source priority,
+quality and recency rules and hand the surviving values to
+:func:`finalise_record`, which keeps their SSOT output identical. Source
+priorities come from a :class:`SurvivorshipPolicy`, which may trust a
+different source for individual fields.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from ..enrichment.intent import IntentOrganizationSummary
+from ..enrichment.validators import ContactValidationService
+from ..normalization import clean_string, slugify
+from ..transform.scoring import LeadScorer
+from .quality_summary import summarise_quality as _summarise_quality
+
+CONTACT_VALIDATION = ContactValidationService()
+SOURCE_PRIORITY: dict[str, int] = {
+    "SACAA Cleaned": 3,
+    "Reachout Database": 2,
+    "Contact Database": 1,
+}
+YEAR_FIRST_PATTERN = re.compile(r"^\s*\d{4}")
+_LAYOUT_SAMPLE_SIZE = 32
+_MAX_LAYOUTS = 4
+PARSED_INTERACTION_COLUMN = "_last_interaction_ns"
+QUALITY_COLUMNS: tuple[str, ...] = (
+    "contact_emails",
+    "contact_phones",
+    "website",
+    "province",
+    "address",
+)
+SURVIVORSHIP_FIELDS: tuple[str, ...] = (
+    "province",
+    "area",
+    "address_primary",
+    "organization_category",
+    "organization_type",
+    "status",
+    "website",
+    "planes",
+    "description",
+    "notes",
+    "priority",
+    "contact_primary_email",
+    "contact_primary_phone",
+    "contact_primary_name",
+    "contact_primary_role",
+)
+"""SSOT fields that accept per-field source priorities."""
+_SECONDARY_FIELDS = {
+    "contact_secondary_emails": "contact_primary_email",
+    "contact_secondary_phones": "contact_primary_phone",
+}
+
+
+@dataclass(frozen=True)
+class SurvivorshipPolicy:
+    """Source priorities used to rank the rows of a slug group.
+
+    ``field_priorities`` overrides ``source_priorities`` for individual
+    :data:`SURVIVORSHIP_FIELDS`; sources missing from both rank as ``0``. The
+    policy is compiled on construction into :attr:`rules`, the distinct
+    priority maps in use, so engines rank rows once per rule rather than once
+    per field. Rule ``0`` is always the plain ``source_priorities`` map.
+    """
+
+    source_priorities: Mapping[str, int] = field(default_factory=lambda: dict(SOURCE_PRIORITY))
+    field_priorities: Mapping[str, Mapping[str, int]] = field(default_factory=dict)
+    rules: tuple[Mapping[str, int], ...] = field(init=False, repr=False, compare=False)
+    field_rules: Mapping[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        unknown = sorted(set(self.field_priorities) - set(SURVIVORSHIP_FIELDS))
+        if unknown:
+            msg = f"Unknown survivorship fields: {', '.join(unknown)}"
+            raise ValueError(msg)
+        rules: list[dict[str, int]] = [dict(self.source_priorities)]
+        field_rules: dict[str, int] = {}
+        for name in SURVIVORSHIP_FIELDS:
+            merged = {**self.source_priorities, **self.field_priorities.get(name, {})}
+            if merged not in rules:
+                rules.append(merged)
+            field_rules[name] = rules.index(merged)
+        object.__setattr__(self, "rules", tuple(rules))
+        object.__setattr__(self, "field_rules", field_rules)
+
+    @property
+    def max_priority(self) -> int:
+        """Scale used to normalise the primary contact's source priority for scoring."""
+
+        return max(self.source_priorities.values()) if self.source_priorities else 1
+
+    def rule_for(self, name: str) -> int:
+        """Return the index into :attr:`rules` that ranks ``name``.
+
+        Secondary emails and phones follow the rule of the matching primary field.
+        """
+
+        return self.field_rules.get(_SECONDARY_FIELDS.get(name, name), 0)
+
+
+DEFAULT_SURVIVORSHIP_POLICY = SurvivorshipPolicy()
+
+
+def latest_iso_date(values: Iterable[object | None]) -> str | None:
+    parsed = [nanos for nanos in parse_datetime_values(values) if nanos is not None]
+    return iso_date_from_nanos(max(parsed)) if parsed else None
+
+
+def resolve_intent_summary(
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    slug: str | None,
+    organization_name: str | None,
+) -> IntentOrganizationSummary | None:
+    if not intent_summaries:
+        return None
+    candidates: list[str] = []
+    if slug:
+        candidates.append(str(slug).lower())
+    if organization_name:
+        slug_candidate = slugify(organization_name)
+        if slug_candidate:
+            candidates.append(slug_candidate)
+        candidates.append(organization_name.lower())
+    for candidate in candidates:
+        summary = intent_summaries.get(candidate)
+        if summary:
+            return summary
+    return None
+
+
+def row_quality_score(row: Mapping[str, object | None]) -> int:
+    return sum(1 for column in QUALITY_COLUMNS if row.get(column))
+
+
+def normalise_scalar(value: object | None) -> str | None:
+    if isinstance(value, str):
+        cleaned = clean_string(value)
+        return cleaned if cleaned is not None else None
+    if value is None:
+        return None
+    if isinstance(value, float) and pd.isna(value):
+        return None
+    cleaned = clean_string(str(value))
+    return cleaned if cleaned is not None else None
+
+
+def dataset_label(value: object | None) -> str:
+    dataset: str | None = clean_string(value)
+    if not dataset:
+        dataset = str(value).strip() if value else "Unknown"
+    return dataset
+
+
+def parse_last_interaction(value: object | None) -> pd.Timestamp | None:
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        timestamp = pd.to_datetime(value, utc=True)
+        return timestamp if pd.notna(timestamp) else None
+    text = str(value).strip()
+    if not text:
+        return None
+    prefer_dayfirst = not YEAR_FIRST_PATTERN.match(text)
+    timestamp = pd.to_datetime(
+        text,
+        errors="coerce",
+        dayfirst=prefer_dayfirst,
+        utc=True,
+    )
+    if pd.isna(timestamp):
+        timestamp = pd.to_datetime(
+            text,
+            errors="coerce",
+            dayfirst=not prefer_dayfirst,
+            utc=True,
+        )
+    if pd.isna(timestamp):
+        return None
+    return timestamp
+
+
+def _timestamp_nanos(timestamp: pd.Timestamp | None) -> int | None:
+    return int(timestamp.value) if timestamp is not None else None
+
+
+def _layout_sample(texts: pd.Series) -> str | None:
+    """Return the layout guessed for most of the first few distinct ``texts``."""
+
+    guesses = [
+        guess_datetime_format(text, dayfirst=not YEAR_FIRST_PATTERN.match(text))
+        for text in texts.drop_duplicates().head(_LAYOUT_SAMPLE_SIZE)
+    ]
+    layouts = Counter(layout for layout in guesses if layout is not None)
+    return layouts.most_common(1)[0][0] if layouts else None
+
+
+def parse_datetime_values(values: Iterable[object | None]) -> list[int | None]:
+    """Parse a whole column with :func:`parse_last_interaction` semantics.
+
+    Returns UTC epoch nanoseconds (``None`` when unparseable). A layout is
+    guessed from a sample of the strings and the column is parsed with one
+    vectorised ``pd.to_datetime`` call per layout, trying up to
+    ``_MAX_LAYOUTS`` layouts on the rows still unparsed. A parse is only kept
+    when its day/month order is the one the scalar parser would choose for
+    that string (day first unless the string starts with the year); other
+    strings, and non-string values, fall back to the scalar parser so results
+    are identical.
+    """
+
+    items = list(values)
+    texts = pd.Series(
+        [item.strip() if isinstance(item, str) else None for item in items], dtype=object
+    )
+    pending = texts[texts.notna() & texts.astype(bool)]
+    prefers_dayfirst = ~pending.str.match(YEAR_FIRST_PATTERN).astype(bool)
+    resolved: dict[int, int] = {}
+    for _ in range(_MAX_LAYOUTS):
+        layout = _layout_sample(pending) if not pending.empty else None
+        if layout is None:
+            break
+        stamps = pd.to_datetime(pending, format=layout, errors="coerce", utc=True)
+        accepted = stamps.notna()
+        if "%d" in layout and "%m" in layout:
+            layout_dayfirst = layout.index("%d") < layout.index("%m")
+            accepted &= (prefers_dayfirst == layout_dayfirst) | (stamps.dt.day > 12)
+        if not accepted.any():
+            break
+        nanos = stamps[accepted].dt.as_unit("ns").array.asi8
+        resolved.update(zip(stamps.index[accepted], nanos, strict=True))
+        pending = pending[~accepted]
+        prefers_dayfirst = prefers_dayfirst[~accepted]
+
+    fallback: dict[str, int | None] = {}
+    parsed: list[int | None] = []
+    for index, item in enumerate(items):
+        if index in resolved:
+            parsed.append(int(resolved[index]))
+        elif isinstance(item, str):
+            if item not in fallback:
+                fallback[item] = _timestamp_nanos(parse_last_interaction(item))
+            parsed.append(fallback[item])
+        else:
+            parsed.append(_timestamp_nanos(parse_last_interaction(item)))
+    return parsed
+
+
+def iso_date_from_nanos(nanos: int | None) -> str | None:
+    if nanos is None:
+        return None
+    return str(pd.Timestamp(nanos, tz="UTC").date().isoformat())
+
+
+def finalise_record(
+    slug: str | None,
+    organization_name: str | None,
+    selected: Mapping[str, str | None],
+    *,
+    primary_source_priority: int | None,
+    max_source_priority: int,
+    provenance: Mapping[str, Any],
+    conflicts: list[dict[str, Any]],
+    country_code: str,
+    intent_summaries: Mapping[str, IntentOrganizationSummary] | None,
+    lead_scorer: LeadScorer,
+) -> dict[str, object | None]:
+    """Validate, score and assemble the SSOT record from the selected values."""
+
+    primary_name = selected["contact_primary_name"]
+    primary_role = selected["contact_primary_role"]
+    primary_email = selected["contact_primary_email"]
+    primary_phone = selected["contact_primary_phone"]
+    province = selected["province"]
+    address_primary = selected["address_primary"]
+    website = selected["website"]
+
+    validation_summary = CONTACT_VALIDATION.validate_contact(
+        email=primary_email,
+        phone=primary_phone,
+        country_code=country_code,
+    )
+    email_confidence = validation_summary.email.confidence if validation_summary.email else None
+    phone_confidence = validation_summary.phone.confidence if validation_summary.phone else None
+    email_status = validation_summary.email.status.value if validation_summary.email else None
+    phone_status = validation_summary.phone.status.value if validation_summary.phone else None
+    validation_flags = validation_summary.flags()
+    deliverability_score = validation_summary.deliverability_score()
+    completeness_inputs = [primary_name, primary_email, primary_phone, primary_role]
+    completeness = (
+        sum(1 for value in completeness_inputs if value) / len(completeness_inputs)
+        if completeness_inputs
+        else 0.0
+    )
+    source_priority_norm = (
+        primary_source_priority / max_source_priority
+        if primary_source_priority is not None and max_source_priority
+        else 0.0
+    )
+    intent_summary = resolve_intent_summary(intent_summaries, slug, organization_name)
+    intent_score = intent_summary.score if intent_summary else 0.0
+
+    lead_score = lead_scorer.score(
+        completeness=completeness,
+        email_confidence=email_confidence or 0.0,
+        phone_confidence=phone_confidence or 0.0,
+        source_priority=source_priority_norm,
+        intent_score=intent_score,
+    ).value
+
+    quality = _summarise_quality(
+        {
+            "contact_primary_email": primary_email,
+            "contact_primary_phone": primary_phone,
+            "website": website,
+            "province": province,
+            "address_primary": address_primary,
+        }
+    )
+
+    result = {
+        "organization_name": organization_name,
+        "organization_slug": slug,
+        "province": province,
+        "country": "South Africa",
+        "area": selected["area"],
+        "address_primary": address_primary,
+        "organization_category": selected["organization_category"],
+        "organization_type": selected["organization_type"],
+        "status": selected["status"],
+        "website": website,
+        "planes": selected["planes"],
+        "description": selected["description"],
+        "notes": selected["notes"],
+        "source_datasets": selected["source_datasets"],
+        "source_record_ids": selected["source_record_ids"],
+        "contact_primary_name": primary_name,
+        "contact_primary_role": primary_role,
+        "contact_primary_email": primary_email,
+        "contact_primary_phone": primary_phone,
+        "contact_primary_email_confidence": email_confidence,
+        "contact_primary_email_status": email_status,
+        "contact_primary_phone_confidence": phone_confidence,
+        "contact_primary_phone_status": phone_status,
+        "contact_primary_lead_score": (
+            lead_score if primary_name or primary_email or primary_phone else None
+        ),
+        "contact_email_confidence_avg": email_confidence,
+        "contact_phone_confidence_avg": phone_confidence,
+        "contact_verification_score_avg": (deliverability_score if deliverability_score else None),
+        "contact_lead_score_avg": lead_score if lead_score else None,
+        "intent_signal_score": round(intent_score, 6) if intent_summary else 0.0,
+        "intent_signal_count": intent_summary.signal_count if intent_summary else 0,
+        "intent_signal_types": (
+            ";".join(intent_summary.signal_types)
+            if intent_summary and intent_summary.signal_types
+            else None
+        ),
+        "intent_last_observed_at": (
+            intent_summary.last_observed_at.isoformat()
+            if intent_summary and intent_summary.last_observed_at
+            else None
+        ),
+        "intent_top_insights": (
+            "; ".join(intent_summary.top_insights)
+            if intent_summary and intent_summary.top_insights
+            else None
+        ),
+        "contact_validation_flags": (
+            ";".join(sorted(set(validation_flags))) if validation_flags else None
+        ),
+        "contact_secondary_emails": selected["contact_secondary_emails"],
+        "contact_secondary_phones": selected["contact_secondary_phones"],
+        "data_quality_score": quality["score"],
+        "data_quality_flags": quality["flags"],
+        "selection_provenance": None,
+        "last_interaction_date": selected["last_interaction_date"],
+        "priority": selected["priority"],
+        "privacy_basis": "Legitimate Interest",
+        "_conflicts": conflicts,
+        "_provenance": provenance,
+    }
+    return result
+
+
+__all__ = [
+    "CONTACT_VALIDATION",
+    "DEFAULT_SURVIVORSHIP_POLICY",
+    "PARSED_INTERACTION_COLUMN",
+    "QUALITY_COLUMNS",
+    "SOURCE_PRIORITY",
+    "SURVIVORSHIP_FIELDS",
+    "SurvivorshipPolicy",
+    "YEAR_FIRST_PATTERN",
+    "dataset_label",
+    "finalise_record",
+    "iso_date_from_nanos",
+    "latest_iso_date",
+    "normalise_scalar",
+    "parse_datetime_values",
+    "parse_last_interaction",
+    "resolve_intent_summary",
+    "row_quality_score",
+]
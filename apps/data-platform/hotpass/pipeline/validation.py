@@ -5,65 +5,117 @@ from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
-from pandera.errors import SchemaErrors
+import polars as pl
 
-from ..quality import run_expectations
-from ..storage import PolarsDataset
+from ..quality import audit_expectations, run_expectations
+from ..storage import PandasView, PolarsDataset
 from ..telemetry import pipeline_stage
-from .config import PipelineConfig
-
-
-def _get_ssot_schema() -> Any:
-    from . import build_ssot_schema  # Local import to avoid circular dependency
-
-    return build_ssot_schema()
+from .config import VALIDATION_BACKENDS, PipelineConfig
+from .provenance import ProvenanceTable
+from .schema_validation import get_ssot_schema, validate_pandas, validate_polars
 
 
 @dataclass
 class ValidationResult:
-    validated_df: pd.DataFrame
+    """Output of the validation stage.
+
+    The Polars backend leaves ``validated_frame`` as the canonical output and
+    ``validated_df`` as a pandas view of it built on first access.
+    """
+
     schema_errors: list[str]
     expectation_summary: Any
     quality_distribution: dict[str, float]
     metrics: dict[str, Any]
+    validated_frame: pl.DataFrame | None = None
+    validated_df: PandasView = PandasView("validated_frame", stage="validate")
+
+    @property
+    def validated(self) -> pl.DataFrame | pd.DataFrame:
+        """The validated records, preferring the Polars frame over the pandas view."""
+
+        return self.validated_frame if self.validated_frame is not None else self.validated_df
+
+    @property
+    def record_count(self) -> int:
+        return len(self.validated)
+
+    def attach_provenance(self, provenance: ProvenanceTable) -> None:
+        """Build the ``selection_provenance`` column of the validated records, once."""
+
+        if self.validated_frame is not None:
+            self.validated_frame = provenance.attach_json(self.validated_frame)
+            self.validated_df = None
+        else:
+            frame = self.validated_df
+            self.validated_df = frame.assign(
+                selection_provenance=provenance.json_for(frame["organization_slug"])
+            )
 
 
 def validate_dataset(
     config: PipelineConfig,
-    refined_df: pd.DataFrame,
+    refined_df: pd.DataFrame | pl.DataFrame,
     notify_progress: Callable[[str, dict[str, Any]], None],
+    *,
+    provenance: ProvenanceTable | None = None,
 ) -> ValidationResult:
+    """Validate the refined records against the SSOT schema and expectations.
+
+    Invalid rows are dropped using the failure cases of a single lazy
+    validation; rows are only validated again when a value failed dtype
+    coercion. ``refined_df`` may be the aggregation's Polars frame: the
+    ``polars`` backend validates it without a pandas copy, while the
+    ``pandas`` backend converts it once. With the aggregation's ``provenance``
+    table, the unmaterialised ``selection_provenance`` column is not validated;
+    :meth:`ValidationResult.attach_provenance` builds it afterwards.
+
+    Expectations run on the native Polars engine. Great Expectations also runs
+    when ``strict_ge`` is set or a run is sampled by ``ge_audit_rate``; its
+    summary is then reported and parity with the native engine recorded.
+    """
+
+    backend = config.validation_backend
+    if backend not in VALIDATION_BACKENDS:
+        msg = f"validation_backend must be one of {', '.join(VALIDATION_BACKENDS)}"
+        raise ValueError(msg)
     metrics: dict[str, Any] = {}
-    schema = _get_ssot_schema()
-    schema_errors: list[str] = []
-    validated_df = refined_df
-
-    notify_progress("schema_started", {"total_records": len(refined_df)})
-    with pipeline_stage("validate", {"records": len(refined_df)}):
-        try:
-            validated_df = schema.validate(refined_df, lazy=True)
-        except SchemaErrors as exc:
-            schema_errors = [
-                f"{row['column']}: {row['failure_case']}" for _, row in exc.failure_cases.iterrows()
-            ]
-            invalid_indices = exc.failure_cases["index"].unique().tolist()
-            valid_indices = [idx for idx in refined_df.index if idx not in invalid_indices]
-            if not valid_indices:
-                validated_df = refined_df
-                schema_errors.append(
-                    f"CRITICAL: All {len(refined_df)} records failed schema validation. "
-                    "Output contains unvalidated data."
-                )
+    schema = get_ssot_schema(
+        backend, without=("selection_provenance",) if provenance is not None else ()
+    )
+    total_records = len(refined_df)
+    validated_df: pd.DataFrame | None = None
+    validated_frame: pl.DataFrame | None = None
+    validated: pd.DataFrame | pl.DataFrame
+
+    notify_progress("schema_started", {"total_records": total_records})
+    with pipeline_stage("validate", {"records": total_records, "backend": backend}):
+        if backend == "polars":
+            frame = (
+                refined_df
+                if isinstance(refined_df, pl.DataFrame)
+                else PolarsDataset.from_pandas(refined_df, stage="validate").frame
+            )
+            validated_frame, schema_errors = validate_polars(schema, frame)
+            validated = validated_frame
+        else:
+            pandas_df = (
+                PolarsDataset(refined_df).to_pandas(stage="validate")
+                if isinstance(refined_df, pl.DataFrame)
+                else refined_df
+            )
+            validated_df, schema_errors = validate_pandas(schema, pandas_df)
+            validated = validated_df
+        if len(validated) == 0 and total_records > 0:
+            if backend == "polars":
+                validated_frame = validated = frame
             else:
-                validated_df = schema.validate(refined_df.loc[valid_indices], lazy=False)
-        if len(validated_df) == 0 and len(refined_df) > 0:
-            validated_df = refined_df
-            if "CRITICAL: Schema validation resulted in complete data loss" not in schema_errors:
-                schema_errors.append(
-                    f"CRITICAL: Schema validation resulted in complete data loss. "
-                    f"All {len(refined_df)} records would have been filtered out. "
-                    "Writing original data to prevent empty output file."
-                )
+                validated_df = validated = pandas_df
+            schema_errors.append(
+                f"CRITICAL: Schema validation resulted in complete data loss. "
+                f"All {total_records} records would have been filtered out. "
+                "Writing original data to prevent empty output file."
+            )
     notify_progress("schema_completed", {"errors": len(schema_errors)})
 
     profile = config.industry_profile
@@ -71,16 +123,30 @@ def validate_dataset(
     phone_threshold = profile.phone_validation_threshold if profile else 0.85
     website_threshold = profile.website_validation_threshold if profile else 0.85
 
-    notify_progress("expectations_started", {"total_records": len(validated_df)})
-    perf_counter = config.runtime_hooks.perf_counter
+    notify_progress("expectations_started", {"total_records": len(validated)})
+    hooks = config.runtime_hooks
+    perf_counter = hooks.perf_counter
+    thresholds = {
+        "email_mostly": email_threshold,
+        "phone_mostly": phone_threshold,
+        "website_mostly": website_threshold,
+    }
     expectation_start = perf_counter()
-    expectation_summary = run_expectations(
-        validated_df,
-        email_mostly=email_threshold,
-        phone_mostly=phone_threshold,
-        website_mostly=website_threshold,
-    )
+    expectation_summary = run_expectations(validated, engine="native", **thresholds)
     metrics["expectations_seconds"] = perf_counter() - expectation_start
+    metrics["expectations_engine"] = "native"
+    if config.strict_ge or (config.ge_audit_rate > 0 and hooks.random_fn() < config.ge_audit_rate):
+        # Parity/audit run: Great Expectations is authoritative whenever it runs.
+        audit_start = perf_counter()
+        if isinstance(validated, pl.DataFrame):
+            validated_df = validated = PolarsDataset(validated).to_pandas(stage="validate")
+        expectation_summary, parity = audit_expectations(
+            validated, expectation_summary, **thresholds
+        )
+        metrics["expectations_ge_seconds"] = perf_counter() - audit_start
+        metrics["expectations_engine"] = "ge"
+        if parity is not None:
+            metrics["expectations_parity"] = parity
     notify_progress(
         "expectations_completed",
         {
@@ -89,13 +155,18 @@ def validate_dataset(
         },
     )
 
-    dataset = PolarsDataset.from_pandas(validated_df)
+    dataset = (
+        PolarsDataset(validated_frame)
+        if validated_frame is not None
+        else PolarsDataset.from_pandas(validated_df, stage="validate")
+    )
     quality_distribution = dataset.column_stats("data_quality_score")
 
     return ValidationResult(
-        validated_df=validated_df,
         schema_errors=schema_errors,
         expectation_summary=expectation_summary,
         quality_distribution=quality_distribution,
         metrics=metrics,
+        validated_frame=validated_frame,
+        validated_df=validated_df,
     )
@@ -21,6 +21,7 @@ def html_performance_rows(metrics: dict[str, Any]) -> str:
         ("Load seconds", metrics.get("load_seconds")),
         ("Aggregation seconds", metrics.get("aggregation_seconds")),
         ("Expectations seconds", metrics.get("expectations_seconds")),
+        ("Expectations setup seconds", metrics.get("expectations_setup_seconds")),
         ("Write seconds", metrics.get("write_seconds")),
         ("Total seconds", metrics.get("total_seconds")),
         ("Rows per second", metrics.get("rows_per_second")),
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import logging
 import warnings
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, cast
 
 import pandas as pd
 import pandera.pandas as pa
+import polars as pl
 from pandera.pandas import Column, DataFrameSchema
 
 from hotpass.enrichment.validators import ValidationStatus
+from hotpass.expectation_runtime import get_expectation_runtime
 
 try:  # pragma: no cover - import guard exercised via unit tests
     from great_expectations.core.batch import Batch
@@ -41,12 +45,144 @@ else:
     }
 
 
+logger = logging.getLogger(__name__)
+
+EXPECTATION_ENGINES: tuple[str, ...] = ("native", "ge")
+
+_CONTACT_COLUMNS = ("contact_primary_email", "contact_primary_phone", "website")
+_SAMPLE_SIZE = 3
+
+_EXPECTATION_TYPES = {
+    "not_null": "expect_column_values_to_not_be_null",
+    "unique": "expect_column_values_to_be_unique",
+    "between": "expect_column_values_to_be_between",
+    "match_regex": "expect_column_values_to_match_regex",
+    "in_set": "expect_column_values_to_be_in_set",
+}
+
+
 @dataclass
 class ExpectationSummary:
     success: bool
     failures: list[str]
 
 
+@dataclass(frozen=True)
+class _Expectation:
+    """One column expectation, evaluated by either engine."""
+
+    kind: str
+    column: str
+    mostly: float = 1.0
+    pattern: str = ""
+    values: frozenset[str] = frozenset()
+    min_value: float = 0.0
+    max_value: float = 1.0
+
+    @property
+    def type(self) -> str:
+        return _EXPECTATION_TYPES[self.kind]
+
+
+def _expectation_suite(
+    *, email_mostly: float, phone_mostly: float, website_mostly: float
+) -> tuple[_Expectation, ...]:
+    """Return the SSOT expectation suite in evaluation order."""
+
+    allowed_statuses = frozenset(status.value for status in ValidationStatus)
+    return (
+        _Expectation("not_null", "organization_name"),
+        _Expectation("not_null", "organization_slug"),
+        _Expectation("between", "data_quality_score"),
+        _Expectation(
+            "match_regex",
+            "contact_primary_email",
+            mostly=email_mostly,
+            pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+        ),
+        _Expectation(
+            "match_regex", "contact_primary_phone", mostly=phone_mostly, pattern=r"^\+\d{6,}$"
+        ),
+        _Expectation("match_regex", "website", mostly=website_mostly, pattern=r"^https?://"),
+        _Expectation("in_set", "country", values=frozenset({"South Africa"})),
+        _Expectation("in_set", "contact_primary_email_status", values=allowed_statuses),
+        _Expectation("in_set", "contact_primary_phone_status", values=allowed_statuses),
+        _Expectation("between", "contact_primary_email_confidence"),
+        _Expectation("between", "contact_primary_phone_confidence"),
+        _Expectation("between", "contact_email_confidence_avg"),
+        _Expectation("between", "contact_phone_confidence_avg"),
+        _Expectation("between", "contact_verification_score_avg"),
+    )
+
+
+def _apply_expectation(validator: Any, expectation: _Expectation) -> None:
+    """Register ``expectation`` on a Great Expectations validator."""
+
+    column = expectation.column
+    if expectation.kind == "not_null":
+        validator.expect_column_values_to_not_be_null(column)
+    elif expectation.kind == "unique":
+        validator.expect_column_values_to_be_unique(column)
+    elif expectation.kind == "between":
+        validator.expect_column_values_to_be_between(
+            column,
+            min_value=expectation.min_value,
+            max_value=expectation.max_value,
+            mostly=expectation.mostly,
+        )
+    elif expectation.kind == "match_regex":
+        validator.expect_column_values_to_match_regex(
+            column, expectation.pattern, mostly=expectation.mostly
+        )
+    else:
+        validator.expect_column_values_to_be_in_set(column, set(expectation.values))
+
+
+def _failure_message(expectation: str, column: str | None, unexpected: Any) -> str:
+    if column:
+        expectation = f"{expectation} ({column})"
+    if unexpected:
+        sample = list(unexpected)[:_SAMPLE_SIZE]
+        return f"{expectation}: unexpected {sample}"
+    return str(expectation)
+
+
+def great_expectations_available() -> bool:
+    """Return whether the Great Expectations engine can run in this environment."""
+
+    return _GE_RUNTIME is not None
+
+
+@contextmanager
+def _ephemeral_context(runtime: Mapping[str, Any]) -> Iterator[Any]:
+    """Activate a throwaway data context built from injected runtime components."""
+
+    config = runtime["DataContextConfig"](
+        config_version=4,
+        expectations_store_name="expectations_store",
+        validation_results_store_name="validation_results_store",
+        checkpoint_store_name="checkpoint_store",
+        data_docs_sites={},
+        analytics_enabled=False,
+        store_backend_defaults=runtime["InMemoryStoreBackendDefaults"](init_temp_docs_sites=False),
+    )
+    context = runtime["EphemeralDataContext"](project_config=config)
+    project_manager = runtime["project_manager"]
+    previous_project = project_manager.get_project()
+    project_manager.set_project(context)
+    try:
+        yield context
+    finally:
+        project_manager.set_project(previous_project)
+        cleanup_manager = getattr(context, "_temp_dir_manager", None)
+        if cleanup_manager is not None:
+            exit_method = getattr(cleanup_manager, "__exit__", None)
+            if callable(exit_method):
+                exit_method(None, None, None)
+            elif hasattr(cleanup_manager, "cleanup"):
+                cleanup_manager.cleanup()
+
+
 def _run_with_great_expectations(
     sanitized: pd.DataFrame,
     *,
@@ -70,7 +206,8 @@ def _run_with_great_expectations(
         The minimum fraction of valid website URLs required to pass the expectation.
     runtime_override : Mapping[str, Any] or None, optional
         Optional runtime components override for testing. Used internally to inject stub
-        implementations or mock Great Expectations components.
+        implementations or mock Great Expectations components. Without an override the
+        process-wide expectation runtime supplies a reused data context.
 
     Returns
     -------
@@ -81,16 +218,6 @@ def _run_with_great_expectations(
     if runtime is None:
         return None
 
-    config = runtime["DataContextConfig"](
-        config_version=4,
-        expectations_store_name="expectations_store",
-        validation_results_store_name="validation_results_store",
-        checkpoint_store_name="checkpoint_store",
-        data_docs_sites={},
-        analytics_enabled=False,
-        store_backend_defaults=runtime["InMemoryStoreBackendDefaults"](init_temp_docs_sites=False),
-    )
-
     with warnings.catch_warnings():
         warnings.filterwarnings(
             "ignore",
@@ -103,12 +230,12 @@ def _run_with_great_expectations(
             message=("`result_format` configured at the Validator-level will not be persisted"),
         )
 
-        context = runtime["EphemeralDataContext"](project_config=config)
-        project_manager = runtime["project_manager"]
-        previous_project = project_manager.get_project()
-        project_manager.set_project(context)
+        if runtime_override is None:
+            scope = get_expectation_runtime().activate()
+        else:
+            scope = _ephemeral_context(runtime)
 
-        try:
+        with scope as context:
             validator = runtime["Validator"](
                 execution_engine=runtime["PandasExecutionEngine"](),
                 expectation_suite=runtime["ExpectationSuite"](name="hotpass"),
@@ -117,67 +244,14 @@ def _run_with_great_expectations(
             )
             validator.set_default_expectation_argument("catch_exceptions", True)
 
-            validator.expect_column_values_to_not_be_null("organization_name")
-            validator.expect_column_values_to_not_be_null("organization_slug")
-            validator.expect_column_values_to_be_between(
-                "data_quality_score", min_value=0.0, max_value=1.0, mostly=1.0
-            )
-            validator.expect_column_values_to_match_regex(
-                "contact_primary_email",
-                r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
-                mostly=email_mostly,
-            )
-            validator.expect_column_values_to_match_regex(
-                "contact_primary_phone",
-                r"^\+\d{6,}$",
-                mostly=phone_mostly,
-            )
-            validator.expect_column_values_to_match_regex(
-                "website", r"^https?://", mostly=website_mostly
-            )
-            validator.expect_column_values_to_be_in_set("country", {"South Africa"})
-            allowed_statuses = {status.value for status in ValidationStatus}
-            validator.expect_column_values_to_be_in_set(
-                "contact_primary_email_status", allowed_statuses
-            )
-            validator.expect_column_values_to_be_in_set(
-                "contact_primary_phone_status", allowed_statuses
-            )
-            validator.expect_column_values_to_be_between(
-                "contact_primary_email_confidence",
-                min_value=0.0,
-                max_value=1.0,
-                mostly=1.0,
-            )
-            validator.expect_column_values_to_be_between(
-                "contact_primary_phone_confidence",
-                min_value=0.0,
-                max_value=1.0,
-                mostly=1.0,
-            )
-            validator.expect_column_values_to_be_between(
-                "contact_email_confidence_avg", min_value=0.0, max_value=1.0, mostly=1.0
-            )
-            validator.expect_column_values_to_be_between(
-                "contact_phone_confidence_avg", min_value=0.0, max_value=1.0, mostly=1.0
-            )
-            validator.expect_column_values_to_be_between(
-                "contact_verification_score_avg",
-                min_value=0.0,
-                max_value=1.0,
-                mostly=1.0,
-            )
+            for expectation in _expectation_suite(
+                email_mostly=email_mostly,
+                phone_mostly=phone_mostly,
+                website_mostly=website_mostly,
+            ):
+                _apply_expectation(validator, expectation)
 
             validation = validator.validate()
-        finally:
-            project_manager.set_project(previous_project)
-            cleanup_manager = getattr(context, "_temp_dir_manager", None)
-            if cleanup_manager is not None:
-                exit_method = getattr(cleanup_manager, "__exit__", None)
-                if callable(exit_method):
-                    exit_method(None, None, None)
-                elif hasattr(cleanup_manager, "cleanup"):
-                    cleanup_manager.cleanup()
 
     failures: list[str] = []
     for result in validation.results:
@@ -186,83 +260,242 @@ def _run_with_great_expectations(
         expectation_config = cast(dict[str, Any], result.expectation_config)
         expectation = expectation_config.get("type", "unknown_expectation")
         kwargs = cast(dict[str, Any], expectation_config.get("kwargs", {}))
-        column = kwargs.get("column")
-        if column:
-            expectation = f"{expectation} ({column})"
         ge_result = cast(dict[str, Any], result.result)
         unexpected = ge_result.get("unexpected_list") or ge_result.get("partial_unexpected_list")
-        if unexpected:
-            sample = list(unexpected)[:3]
-            failures.append(f"{expectation}: unexpected {sample}")
-        else:
-            failures.append(str(expectation))
+        failures.append(_failure_message(expectation, kwargs.get("column"), unexpected))
 
     return ExpectationSummary(success=bool(validation.success), failures=failures)
 
 
-def build_ssot_schema() -> DataFrameSchema:
-    def string_col(nullable: bool = True) -> Column:
-        return Column(pa.String, nullable=nullable)
+SSOT_SCHEMA_FIELDS: dict[str, tuple[str, bool]] = {
+    "organization_name": ("string", False),
+    "organization_slug": ("string", False),
+    "province": ("string", True),
+    "country": ("string", False),
+    "area": ("string", True),
+    "address_primary": ("string", True),
+    "organization_category": ("string", True),
+    "organization_type": ("string", True),
+    "status": ("string", True),
+    "website": ("string", True),
+    "planes": ("string", True),
+    "description": ("string", True),
+    "notes": ("string", True),
+    "source_datasets": ("string", False),
+    "source_record_ids": ("string", False),
+    "contact_primary_name": ("string", True),
+    "contact_primary_role": ("string", True),
+    "contact_primary_email": ("string", True),
+    "contact_primary_phone": ("string", True),
+    "contact_primary_email_confidence": ("float", True),
+    "contact_primary_email_status": ("string", True),
+    "contact_primary_phone_confidence": ("float", True),
+    "contact_primary_phone_status": ("string", True),
+    "contact_primary_lead_score": ("float", True),
+    "contact_validation_flags": ("string", True),
+    "contact_secondary_emails": ("string", True),
+    "contact_secondary_phones": ("string", True),
+    "contact_email_confidence_avg": ("float", True),
+    "contact_phone_confidence_avg": ("float", True),
+    "contact_verification_score_avg": ("float", True),
+    "contact_lead_score_avg": ("float", True),
+    "data_quality_score": ("float", False),
+    "data_quality_flags": ("string", False),
+    "selection_provenance": ("string", False),
+    "last_interaction_date": ("string", True),
+    "priority": ("string", True),
+    "privacy_basis": ("string", False),
+}
+"""SSOT columns as ``(kind, nullable)`` pairs shared by the pandas and Polars schemas."""
 
+
+def build_ssot_schema() -> DataFrameSchema:
+    dtypes = {"string": pa.String, "float": pa.Float}
     return DataFrameSchema(
         {
-            "organization_name": Column(pa.String, nullable=False),
-            "organization_slug": Column(pa.String, nullable=False),
-            "province": string_col(),
-            "country": Column(pa.String, nullable=False),
-            "area": string_col(),
-            "address_primary": string_col(),
-            "organization_category": string_col(),
-            "organization_type": string_col(),
-            "status": string_col(),
-            "website": string_col(),
-            "planes": string_col(),
-            "description": string_col(),
-            "notes": string_col(),
-            "source_datasets": Column(pa.String, nullable=False),
-            "source_record_ids": Column(pa.String, nullable=False),
-            "contact_primary_name": string_col(),
-            "contact_primary_role": string_col(),
-            "contact_primary_email": string_col(),
-            "contact_primary_phone": string_col(),
-            "contact_primary_email_confidence": Column(pa.Float, nullable=True),
-            "contact_primary_email_status": string_col(),
-            "contact_primary_phone_confidence": Column(pa.Float, nullable=True),
-            "contact_primary_phone_status": string_col(),
-            "contact_primary_lead_score": Column(pa.Float, nullable=True),
-            "contact_validation_flags": string_col(),
-            "contact_secondary_emails": string_col(),
-            "contact_secondary_phones": string_col(),
-            "contact_email_confidence_avg": Column(pa.Float, nullable=True),
-            "contact_phone_confidence_avg": Column(pa.Float, nullable=True),
-            "contact_verification_score_avg": Column(pa.Float, nullable=True),
-            "contact_lead_score_avg": Column(pa.Float, nullable=True),
-            "data_quality_score": Column(pa.Float, nullable=False),
-            "data_quality_flags": Column(pa.String, nullable=False),
-            "selection_provenance": Column(pa.String, nullable=False),
-            "last_interaction_date": string_col(),
-            "priority": string_col(),
-            "privacy_basis": Column(pa.String, nullable=False),
+            column: Column(dtypes[kind], nullable=nullable)
+            for column, (kind, nullable) in SSOT_SCHEMA_FIELDS.items()
+        },
+        coerce=True,
+        name="hotpass_ssot",
+    )
+
+
+def build_ssot_polars_schema() -> Any:
+    """Return the SSOT schema for pandera's Polars backend.
+
+    It declares the same columns as :func:`build_ssot_schema`, so a refined
+    Polars frame validates without a round trip through pandas.
+    """
+
+    import pandera.polars as pap
+    import polars as pl
+
+    dtypes = {"string": pl.String, "float": pl.Float64}
+    return pap.DataFrameSchema(
+        {
+            column: pap.Column(dtypes[kind], nullable=nullable)
+            for column, (kind, nullable) in SSOT_SCHEMA_FIELDS.items()
         },
         coerce=True,
         name="hotpass_ssot",
     )
 
 
+def _expectation_frame(df: pd.DataFrame | pl.DataFrame, columns: set[str]) -> pl.DataFrame:
+    """Return the expectation columns of ``df`` as a Polars frame.
+
+    Pandas columns holding mixed Python objects cannot be mapped to an Arrow
+    type; they are compared as strings instead.
+    """
+
+    if isinstance(df, pl.DataFrame):
+        return df.select([column for column in df.columns if column in columns])
+    series: list[pl.Series] = []
+    for column in df.columns:
+        if column not in columns:
+            continue
+        values = df[column]
+        try:
+            series.append(pl.from_pandas(values).alias(column))
+        except (TypeError, ValueError):
+            strings = values.astype(str).where(values.notna(), None)
+            series.append(pl.Series(column, strings.tolist(), dtype=pl.String))
+    return pl.DataFrame(series)
+
+
+def _pandas_values(df: pd.DataFrame | pl.DataFrame, column: str, rows: list[int]) -> list[Any]:
+    """Return ``df[column]`` at ``rows`` as the Great Expectations pandas engine sees them.
+
+    Missing values keep the sentinel of the pandas column (``None``, ``NaN`` or
+    ``pd.NA``), so native not-null samples render exactly like Great
+    Expectations' ``unexpected_list``.
+    """
+
+    series = df[column].to_pandas() if isinstance(df, pl.DataFrame) else df[column]
+    return list(series.iloc[rows].tolist())
+
+
+def _unexpected_expr(expectation: _Expectation, dtype: pl.DataType) -> pl.Expr:
+    """Return a mask of the values of ``dtype`` that fail ``expectation``.
+
+    Range checks on non-numeric columns (all-null pandas object columns arrive
+    as strings) compare the values as floats; values that do not parse are
+    unexpected and nulls are ignored.
+    """
+
+    column = pl.col(expectation.column)
+    if expectation.kind == "not_null":
+        return column.is_null()
+    if expectation.kind == "unique":
+        return column.is_duplicated() & column.is_not_null()
+    if expectation.kind == "between":
+        numbers = column if dtype.is_numeric() else column.cast(pl.Float64, strict=False)
+        outside = numbers.is_between(expectation.min_value, expectation.max_value).not_()
+        return outside.fill_null(column.is_not_null())
+    if expectation.kind == "match_regex":
+        return column.cast(pl.String).str.contains(expectation.pattern).not_()
+    return column.cast(pl.String).is_in(sorted(expectation.values)).not_()
+
+
+def _run_native_expectations(
+    df: pd.DataFrame | pl.DataFrame, suite: tuple[_Expectation, ...]
+) -> ExpectationSummary:
+    """Evaluate ``suite`` as a single lazy Polars query.
+
+    Results follow Great Expectations semantics: nulls are ignored except by
+    ``not_null``, ``mostly`` is measured against the non-null values and each
+    failure samples the first unexpected values in row order.
+    """
+
+    frame = _expectation_frame(df, {expectation.column for expectation in suite})
+    schema = frame.schema
+    lazy = frame.lazy().with_columns(
+        pl.when(pl.col(column).cast(pl.String).str.contains(r"^\s*$"))
+        .then(None)
+        .otherwise(pl.col(column).cast(pl.String))
+        .alias(column)
+        for column in _CONTACT_COLUMNS
+        if column in schema
+    )
+    schema = lazy.collect_schema()
+
+    aggregates: list[pl.Expr] = []
+    evaluated: dict[int, _Expectation] = {}
+    for index, expectation in enumerate(suite):
+        if expectation.column not in schema:
+            continue
+        unexpected = _unexpected_expr(expectation, schema[expectation.column]).fill_null(False)
+        considered = (
+            pl.len()
+            if expectation.kind == "not_null"
+            else pl.col(expectation.column).is_not_null().sum()
+        )
+        aggregates.extend(
+            [
+                considered.alias(f"considered_{index}"),
+                unexpected.sum().alias(f"unexpected_{index}"),
+                pl.col(expectation.column)
+                .filter(unexpected)
+                .head(_SAMPLE_SIZE)
+                .implode()
+                .alias(f"sample_{index}"),
+                pl.int_range(pl.len())
+                .filter(unexpected)
+                .head(_SAMPLE_SIZE)
+                .implode()
+                .alias(f"rows_{index}"),
+            ]
+        )
+        evaluated[index] = expectation
+    counts = lazy.select(aggregates).collect().row(0, named=True) if aggregates else {}
+
+    failures: list[str] = []
+    for index, expectation in enumerate(suite):
+        if index not in evaluated:
+            # Great Expectations reports a missing column as a failed
+            # expectation without a sample.
+            failures.append(_failure_message(expectation.type, expectation.column, None))
+            continue
+        considered = counts[f"considered_{index}"]
+        unexpected_count = counts[f"unexpected_{index}"]
+        if not considered or (considered - unexpected_count) / considered >= expectation.mostly:
+            continue
+        sample = counts[f"sample_{index}"]
+        if expectation.kind == "not_null":
+            sample = _pandas_values(df, expectation.column, counts[f"rows_{index}"])
+        failures.append(_failure_message(expectation.type, expectation.column, sample))
+    return ExpectationSummary(success=not failures, failures=failures)
+
+
 def run_expectations(
-    df: pd.DataFrame,
+    df: pd.DataFrame | pl.DataFrame,
     *,
     email_mostly: float = 0.85,
     phone_mostly: float = 0.85,
     website_mostly: float = 0.85,
+    engine: str = "ge",
 ) -> ExpectationSummary:
+    """Run the SSOT expectation suite against ``df``.
+
+    ``ge`` runs the suite through Great Expectations and falls back to
+    row-wise pandas checks when the library is not installed; ``native``
+    evaluates it with Polars.
+    """
+
+    if engine not in EXPECTATION_ENGINES:
+        msg = f"engine must be one of {', '.join(EXPECTATION_ENGINES)}"
+        raise ValueError(msg)
+    if engine == "native":
+        suite = _expectation_suite(
+            email_mostly=email_mostly, phone_mostly=phone_mostly, website_mostly=website_mostly
+        )
+        return _run_native_expectations(df, suite)
+
+    if isinstance(df, pl.DataFrame):
+        df = df.to_pandas()
     sanitized = df.copy()
-    contact_columns = [
-        "contact_primary_email",
-        "contact_primary_phone",
-        "website",
-    ]
-    for column in contact_columns:
+    for column in _CONTACT_COLUMNS:
         sanitized[column] = (
             sanitized[column]
             .astype(str)
@@ -350,3 +583,26 @@ def run_expectations(
                 )
 
     return ExpectationSummary(success=success, failures=failures)
+
+
+def audit_expectations(
+    df: pd.DataFrame | pl.DataFrame, native: ExpectationSummary, **thresholds: float
+) -> tuple[ExpectationSummary, bool | None]:
+    """Re-run the suite on ``df`` with Great Expectations and compare it to ``native``.
+
+    Returns the Great Expectations summary, which is authoritative whenever it
+    runs, and whether it matched ``native``. Parity is ``None`` when the library
+    is not installed and the row-wise fallback produced the summary.
+    """
+
+    summary = run_expectations(df, engine="ge", **thresholds)
+    if not great_expectations_available():
+        return summary, None
+    parity = summary == native
+    if not parity:
+        logger.warning(
+            "Native expectation results differ from Great Expectations: %s vs %s",
+            native.failures,
+            summary.failures,
+        )
+    return summary, parity
@@ -1,12 +1,35 @@
 """Storage helpers for Polars and DuckDB backed pipeline operations."""
 
 from .adapters import QueryAdapter
-from .dataset import DatasetTimings, PolarsDataset
-from .duckdb import DuckDBAdapter
+from .dataset import DatasetTimings, PandasView, PolarsDataset
+from .duckdb import DuckDBAdapter, DuckDBSession, DuckDBSettings, get_duckdb_session
+from .export import (
+    ExportBuffer,
+    ExportCoordinator,
+    ExportTiming,
+    write_atomic,
+    write_csv,
+    write_json,
+    write_parquet,
+)
+from .parquet import ParquetLayout, write_parquet_layout
 
 __all__ = [
     "DatasetTimings",
+    "PandasView",
     "PolarsDataset",
     "QueryAdapter",
     "DuckDBAdapter",
+    "DuckDBSession",
+    "DuckDBSettings",
+    "get_duckdb_session",
+    "ExportBuffer",
+    "ExportCoordinator",
+    "ExportTiming",
+    "write_atomic",
+    "write_csv",
+    "write_json",
+    "write_parquet",
+    "ParquetLayout",
+    "write_parquet_layout",
 ]
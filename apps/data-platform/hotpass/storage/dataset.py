@@ -12,7 +12,13 @@ import pandas as pd
 import polars as pl
 import pyarrow as pa
 
+from ..observability import get_pipeline_metrics
 from .adapters import QueryAdapter
+from .parquet import ParquetLayout, write_parquet_layout
+
+
+def _record_conversion(target: str, stage: str) -> None:
+    get_pipeline_metrics().record_frame_conversion(target=target, stage=stage)
 
 
 @dataclass
@@ -40,10 +46,11 @@ class PolarsDataset:
         return cls(frame, DatasetTimings(construction_seconds=duration))
 
     @classmethod
-    def from_pandas(cls, frame: pd.DataFrame) -> PolarsDataset:
+    def from_pandas(cls, frame: pd.DataFrame, *, stage: str = "unknown") -> PolarsDataset:
         start = time.perf_counter()
         polars_frame = pl.from_pandas(frame, include_index=False)
         duration = time.perf_counter() - start
+        _record_conversion("polars", stage)
         return cls(polars_frame, DatasetTimings(construction_seconds=duration))
 
     @property
@@ -70,21 +77,56 @@ class PolarsDataset:
         self.timings.sort_seconds += time.perf_counter() - start
         return self
 
-    def to_pandas(self) -> pd.DataFrame:
+    def to_pandas(self, *, stage: str = "unknown") -> pd.DataFrame:
+        _record_conversion("pandas", stage)
         return self._frame.to_pandas(use_pyarrow_extension_array=True)
 
     def to_arrow(self) -> pa.Table:
         return self._frame.to_arrow()
 
-    def write_parquet(self, path: Path, *, compression: CompressionType | None = None) -> None:
+    def write_parquet(
+        self,
+        path: Path,
+        *,
+        compression: CompressionType | None = None,
+        layout: ParquetLayout | None = None,
+    ) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         start = time.perf_counter()
-        if compression is not None:
+        if layout is not None:
+            write_parquet_layout(self.to_arrow(), path, layout)
+        elif compression is not None:
             self._frame.write_parquet(str(path), compression=compression)
         else:
             self._frame.write_parquet(str(path))
         self.timings.parquet_seconds += time.perf_counter() - start
 
+    @classmethod
+    def read_parquet(
+        cls,
+        path: Path,
+        *,
+        filters: pl.Expr | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> PolarsDataset:
+        """Read a Parquet file or hive-partitioned directory, pruning while scanning.
+
+        ``filters`` and ``columns`` are pushed into the scan, so partitions whose
+        directory values fail the filter are never opened and row groups whose
+        statistics rule it out are skipped.
+        """
+
+        start = time.perf_counter()
+        partitioned = path.is_dir()
+        source = str(path / "**" / "*.parquet") if partitioned else str(path)
+        lazy = pl.scan_parquet(source, hive_partitioning=partitioned)
+        if filters is not None:
+            lazy = lazy.filter(filters)
+        if columns is not None:
+            lazy = lazy.select(list(columns))
+        frame = lazy.collect()
+        return cls(frame, DatasetTimings(construction_seconds=time.perf_counter() - start))
+
     def value_counts(self, column: str) -> dict[str, int]:
         if column not in self._frame.columns:
             return {}
@@ -117,6 +159,38 @@ class PolarsDataset:
         return result
 
 
+class PandasView:
+    """Dataclass field holding a pandas copy of a Polars frame, built on first read.
+
+    Assigning a pandas frame stores it unchanged. Reading the field while it is
+    unset converts the Polars frame held in ``frame_attribute`` once and caches
+    the result, so stages that stay in Polars never pay for the conversion.
+    """
+
+    def __init__(self, frame_attribute: str, *, stage: str) -> None:
+        self._frame_attribute = frame_attribute
+        self._stage = stage
+        self._slot = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = f"_{name}_view"
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return None
+        cached = instance.__dict__.get(self._slot)
+        if cached is None:
+            frame = getattr(instance, self._frame_attribute, None)
+            if frame is None:
+                return None
+            cached = PolarsDataset(frame).to_pandas(stage=self._stage)
+            instance.__dict__[self._slot] = cached
+        return cached
+
+    def __set__(self, instance: object, value: pd.DataFrame | None) -> None:
+        instance.__dict__[self._slot] = value
+
+
 CompressionType = Literal[
     "lz4",
     "uncompressed",
@@ -1,8 +1,13 @@
-"""DuckDB-backed query adapter for Polars datasets."""
+"""DuckDB-backed query adapter and process-wide session for Polars datasets."""
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import duckdb
@@ -12,26 +17,203 @@ import pyarrow as pa
 from .adapters import QueryAdapter
 
 
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+@dataclass(frozen=True)
+class DuckDBSettings:
+    """Engine settings for the shared DuckDB database; ``None`` keeps DuckDB's default."""
+
+    threads: int | None = None
+    memory_limit: str | None = None
+    temp_directory: Path | None = None
+
+    def statements(self, *, reset_unset: bool = False) -> list[str]:
+        """Return the ``SET`` statements; ``reset_unset`` also resets unset options."""
+
+        values = {
+            "threads": (
+                str(int(self.threads)) if self.threads is not None and self.threads > 0 else None
+            ),
+            "memory_limit": _quote(self.memory_limit) if self.memory_limit is not None else None,
+            "temp_directory": (
+                _quote(str(self.temp_directory)) if self.temp_directory is not None else None
+            ),
+        }
+        statements: list[str] = []
+        for name, value in values.items():
+            if value is not None:
+                statements.append(f"SET {name} = {value}")
+            elif reset_unset:
+                statements.append(f"RESET {name}")
+        return statements
+
+
+@dataclass
+class DuckDBLease:
+    """A pooled cursor and the session datasets already registered on it."""
+
+    cursor: duckdb.DuckDBPyConnection
+    registered: dict[str, int] = field(default_factory=dict)
+
+
+class DuckDBSession:
+    """One in-memory DuckDB database shared by every query in the process.
+
+    The connection is opened on first use with the configured settings. Callers
+    lease cursors, which DuckDB allows to run concurrently from different
+    threads; released cursors are kept for reuse up to ``max_idle_cursors``.
+    Datasets registered on the session are Arrow tables attached to each cursor
+    on lease, so a run's data is registered once and visible to every query.
+    ``setup_seconds`` accumulates the time spent opening the database.
+    """
+
+    def __init__(
+        self, settings: DuckDBSettings | None = None, *, max_idle_cursors: int = 8
+    ) -> None:
+        self._lock = threading.RLock()
+        self._settings = settings or DuckDBSettings()
+        self._max_idle_cursors = max_idle_cursors
+        self._connection: duckdb.DuckDBPyConnection | None = None
+        self._idle: list[DuckDBLease] = []
+        self._datasets: dict[str, tuple[int, pa.Table]] = {}
+        self._version = 0
+        self.setup_seconds = 0.0
+
+    @property
+    def settings(self) -> DuckDBSettings:
+        return self._settings
+
+    def configure(self, settings: DuckDBSettings) -> None:
+        """Apply ``settings``, updating the open database in place.
+
+        Options left unset return to DuckDB's defaults, so settings from an
+        earlier run in the same process do not carry over.
+        """
+
+        with self._lock:
+            self._settings = settings
+            if self._connection is not None:
+                for statement in settings.statements(reset_unset=True):
+                    self._connection.execute(statement)
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        if self._connection is None:
+            started = time.perf_counter()
+            connection = duckdb.connect(database=":memory:")
+            for statement in self._settings.statements():
+                connection.execute(statement)
+            self._connection = connection
+            self.setup_seconds += time.perf_counter() - started
+        return self._connection
+
+    def register(self, name: str, data: pl.DataFrame | pa.Table) -> None:
+        """Make ``data`` queryable as ``name`` from every cursor of the session."""
+
+        table = data.to_arrow() if isinstance(data, pl.DataFrame) else data
+        with self._lock:
+            self._version += 1
+            self._datasets[name] = (self._version, table)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._datasets.pop(name, None)
+
+    def datasets(self) -> list[str]:
+        with self._lock:
+            return sorted(self._datasets)
+
+    def acquire(self) -> DuckDBLease:
+        """Lease a cursor with the session datasets registered on it."""
+
+        with self._lock:
+            lease = (
+                self._idle.pop() if self._idle else DuckDBLease(self._connect().cursor())
+            )
+            datasets = dict(self._datasets)
+        for name in [name for name in lease.registered if name not in datasets]:
+            lease.cursor.unregister(name)
+            del lease.registered[name]
+        for name, (version, table) in datasets.items():
+            if lease.registered.get(name) != version:
+                lease.cursor.register(name, table)
+                lease.registered[name] = version
+        return lease
+
+    def release(self, lease: DuckDBLease) -> None:
+        with self._lock:
+            if self._connection is not None and len(self._idle) < self._max_idle_cursors:
+                self._idle.append(lease)
+                return
+        lease.cursor.close()
+
+    @contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Lease a cursor for the duration of a block."""
+
+        lease = self.acquire()
+        try:
+            yield lease.cursor
+        finally:
+            self.release(lease)
+
+    def close(self) -> None:
+        """Close pooled cursors and the database; the next lease reopens it."""
+
+        with self._lock:
+            for lease in self._idle:
+                lease.cursor.close()
+            self._idle.clear()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_SESSION = DuckDBSession()
+
+
+def get_duckdb_session() -> DuckDBSession:
+    """Return the process-wide DuckDB session."""
+
+    return _SESSION
+
+
 class DuckDBAdapter(QueryAdapter):
-    """Execute ad-hoc SQL queries against in-memory datasets using DuckDB."""
+    """Execute ad-hoc SQL queries against in-memory datasets using DuckDB.
+
+    Queries run on a cursor leased from the process-wide session unless
+    ``session`` is given. Datasets registered through the adapter are only
+    visible to its own queries and are dropped when it closes. Passing
+    ``threads`` runs the adapter on a private database with that thread count.
+    """
 
-    def __init__(self, *, threads: int | None = None) -> None:
-        self._connection = duckdb.connect(database=":memory:")
+    def __init__(
+        self, *, threads: int | None = None, session: DuckDBSession | None = None
+    ) -> None:
+        self._owns_session = session is None and threads is not None and threads > 0
+        if session is None:
+            session = (
+                DuckDBSession(DuckDBSettings(threads=threads))
+                if self._owns_session
+                else get_duckdb_session()
+            )
+        self._session = session
+        self._lease: DuckDBLease | None = session.acquire()
         self._registered: set[str] = set()
-        if threads is not None and threads > 0:
-            try:  # pragma: no cover - dependent on DuckDB build
-                self._connection.execute("PRAGMA threads=?", [threads])
-            except duckdb.Error:
-                self._connection.execute(f"PRAGMA threads={threads}")
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        if self._lease is None:
+            msg = "DuckDBAdapter is closed"
+            raise RuntimeError(msg)
+        return self._lease.cursor
 
     def register(self, name: str, data: pl.DataFrame | pa.Table | str) -> None:
+        cursor = self._cursor()
         if isinstance(data, pl.DataFrame):
-            arrow_obj = data.to_arrow()
-            self._connection.register(name, arrow_obj)
-        elif isinstance(data, pa.Table):
-            self._connection.register(name, data)
-        elif isinstance(data, str):
-            self._connection.register(name, data)
+            cursor.register(name, data.to_arrow())
+        elif isinstance(data, pa.Table | str):
+            cursor.register(name, data)
         else:  # pragma: no cover - defensive branch
             msg = f"Unsupported dataset type for DuckDB registration: {type(data)!r}"
             raise TypeError(msg)
@@ -39,9 +221,9 @@ class DuckDBAdapter(QueryAdapter):
 
     def execute(self, sql: str, *, parameters: Sequence[Any] | None = None) -> pl.DataFrame:
         if parameters:
-            cursor = self._connection.execute(sql, parameters)
+            cursor = self._cursor().execute(sql, parameters)
         else:
-            cursor = self._connection.execute(sql)
+            cursor = self._cursor().execute(sql)
         arrow_obj = cursor.arrow()
         result = pl.from_arrow(arrow_obj)
         if isinstance(result, pl.Series):  # pragma: no cover - depends on query shape
@@ -49,10 +231,17 @@ class DuckDBAdapter(QueryAdapter):
         return result
 
     def close(self) -> None:  # pragma: no cover - exercised via adapter lifecycle
+        lease, self._lease = self._lease, None
+        if lease is None:
+            return
         for name in list(self._registered):
             try:
-                self._connection.unregister(name)
+                lease.cursor.unregister(name)
             except duckdb.Error:
                 pass
+            # A local registration may have shadowed a session dataset.
+            lease.registered.pop(name, None)
         self._registered.clear()
-        self._connection.close()
+        self._session.release(lease)
+        if self._owns_session:
+            self._session.close()
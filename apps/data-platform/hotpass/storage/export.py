@@ -0,0 +1,180 @@
+"""Concurrent, atomic export of one dataset to several output formats."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from ..observability import get_pipeline_metrics
+from .dataset import PolarsDataset, _record_conversion
+from .parquet import ParquetLayout, write_parquet_layout
+
+ExportWriter = Callable[["ExportBuffer", Path], None]
+
+
+@dataclass(frozen=True)
+class ExportTiming:
+    """Outcome of writing one output format."""
+
+    path: Path
+    seconds: float
+    bytes_written: int
+
+
+class ExportBuffer:
+    """A dataset materialised once as an Arrow table and shared by every writer.
+
+    Arrow-native writers read :attr:`table`; writers that need pandas share a
+    single view. Whichever form the buffer was not built from is converted on
+    first use and reused by every other writer.
+    """
+
+    def __init__(
+        self,
+        table: pa.Table | None = None,
+        *,
+        pandas_view: pd.DataFrame | None = None,
+        stage: str = "export",
+    ) -> None:
+        if table is None and pandas_view is None:
+            msg = "ExportBuffer needs an Arrow table or a pandas frame"
+            raise ValueError(msg)
+        self._table = table
+        self._pandas = pandas_view
+        self._stage = stage
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(
+        cls, frame: pd.DataFrame | pl.DataFrame, *, stage: str = "export"
+    ) -> ExportBuffer:
+        if isinstance(frame, pl.DataFrame):
+            return cls(frame.to_arrow(), stage=stage)
+        return cls(pandas_view=frame, stage=stage)
+
+    @property
+    def table(self) -> pa.Table:
+        with self._lock:
+            if self._table is None:
+                self._table = pa.Table.from_pandas(self._pandas, preserve_index=False)
+                _record_conversion("arrow", self._stage)
+            return self._table
+
+    def to_pandas(self) -> pd.DataFrame:
+        with self._lock:
+            if self._pandas is None:
+                frame = pl.from_arrow(self._table)
+                if isinstance(frame, pl.Series):  # pragma: no cover - tables give frames
+                    frame = frame.to_frame()
+                self._pandas = PolarsDataset(frame).to_pandas(stage=self._stage)
+            return self._pandas
+
+
+def _output_size(path: Path) -> int:
+    if path.is_dir():
+        return sum(entry.stat().st_size for entry in path.rglob("*") if entry.is_file())
+    return path.stat().st_size
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def write_atomic(path: Path, write: Callable[[Path], None]) -> int:
+    """Write ``path`` via a sibling temporary path renamed into place.
+
+    The temporary path keeps ``path``'s suffix so writers that infer the format
+    from the extension still work. Writers may create a directory, such as a
+    partitioned Parquet dataset; it replaces any previous output as a whole.
+    Returns the number of bytes written.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    token = uuid.uuid4().hex
+    temp_path = path.with_name(f".{path.stem}.{token}{path.suffix}")
+    try:
+        write(temp_path)
+        if temp_path.is_dir() or path.is_dir():
+            previous = path.with_name(f".{path.stem}.{token}.previous")
+            if path.exists():
+                os.replace(path, previous)
+            os.replace(temp_path, path)
+            _remove(previous)
+        else:
+            os.replace(temp_path, path)
+    except BaseException:
+        _remove(temp_path)
+        raise
+    return _output_size(path)
+
+
+def write_parquet(buffer: ExportBuffer, path: Path, layout: ParquetLayout | None = None) -> None:
+    write_parquet_layout(buffer.table, path, layout or ParquetLayout())
+
+
+def write_csv(buffer: ExportBuffer, path: Path) -> None:
+    buffer.to_pandas().to_csv(path, index=False)
+
+
+def write_json(buffer: ExportBuffer, path: Path) -> None:
+    buffer.to_pandas().to_json(path, orient="records", indent=2)
+
+
+class ExportCoordinator:
+    """Write one :class:`ExportBuffer` to several outputs concurrently.
+
+    Outputs are written on a thread pool: the Arrow and Parquet writers release
+    the GIL, and threads share the buffer without copying it to other
+    processes. Every output goes through :func:`write_atomic`, so a failed
+    writer never leaves a partial file behind. Per-format timings and sizes
+    are returned and recorded on the pipeline metrics.
+    """
+
+    def __init__(self, buffer: ExportBuffer, *, max_workers: int | None = None) -> None:
+        self._buffer = buffer
+        self._max_workers = max_workers
+        self._jobs: dict[str, tuple[Path, ExportWriter]] = {}
+
+    @property
+    def buffer(self) -> ExportBuffer:
+        return self._buffer
+
+    def add(self, name: str, path: Path, writer: ExportWriter) -> None:
+        if name in self._jobs:
+            msg = f"Export format '{name}' is already scheduled"
+            raise ValueError(msg)
+        self._jobs[name] = (path, writer)
+
+    def _write(self, name: str, path: Path, writer: ExportWriter) -> ExportTiming:
+        start = time.perf_counter()
+        size = write_atomic(path, lambda target: writer(self._buffer, target))
+        seconds = time.perf_counter() - start
+        get_pipeline_metrics().record_export(
+            output_format=name, seconds=seconds, bytes_written=size
+        )
+        return ExportTiming(path=path, seconds=seconds, bytes_written=size)
+
+    def run(self) -> dict[str, ExportTiming]:
+        """Write every scheduled output and return their timings by format."""
+
+        jobs, self._jobs = self._jobs, {}
+        workers = min(len(jobs), self._max_workers or len(jobs))
+        if workers <= 1:
+            return {name: self._write(name, *job) for name, job in jobs.items()}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hotpass-export") as pool:
+            futures = {name: pool.submit(self._write, name, *job) for name, job in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
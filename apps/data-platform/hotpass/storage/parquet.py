@@ -0,0 +1,153 @@
+"""Parquet layouts for refined datasets: partitioning, statistics and pruning."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+_PART_FILE = "part-0.parquet"
+
+
+@dataclass(frozen=True)
+class ParquetLayout:
+    """How a refined dataset is written to Parquet.
+
+    The default is one zstd-compressed file with column statistics and page
+    indexes. ``partition_by`` writes a hive-partitioned directory instead
+    (``province=Gauteng/part-0.parquet``). Rows are sorted by ``sort_by`` within
+    each file and the order is recorded in the metadata, so min/max statistics
+    let readers skip row groups and pages for point lookups.
+
+    ``bloom_filters`` writes through DuckDB, which adds a bloom filter to every
+    dictionary-encoded column. The dictionary limit is raised to the row-group
+    size so unique keys such as ``organization_slug`` keep their dictionaries,
+    and their filters. PyArrow cannot write bloom filters, and DuckDB does not
+    write page indexes.
+    """
+
+    partition_by: tuple[str, ...] = ()
+    sort_by: tuple[str, ...] = ()
+    compression: str = "zstd"
+    compression_level: int | None = None
+    row_group_size: int = 128 * 1024
+    statistics: bool = True
+    page_index: bool = True
+    bloom_filters: bool = False
+
+    @property
+    def partitioned(self) -> bool:
+        return bool(self.partition_by)
+
+
+def _sort_keys(table: pa.Table, layout: ParquetLayout) -> list[tuple[str, str]]:
+    return [(column, "ascending") for column in layout.sort_by if column in table.column_names]
+
+
+def _partition_segment(column: str, value: object) -> str:
+    text = HIVE_NULL_PARTITION if value is None else quote(str(value), safe="")
+    return f"{column}={text}"
+
+
+def _write_file(table: pa.Table, path: Path, layout: ParquetLayout) -> None:
+    sort_keys = _sort_keys(table, layout)
+    if sort_keys:
+        table = table.sort_by(sort_keys)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(
+        table,
+        path,
+        row_group_size=layout.row_group_size,
+        compression=layout.compression,
+        compression_level=layout.compression_level,
+        write_statistics=layout.statistics,
+        write_page_index=layout.page_index,
+        sorting_columns=(
+            pq.SortingColumn.from_ordering(table.schema, sort_keys) if sort_keys else None
+        ),
+    )
+
+
+def _write_with_duckdb(table: pa.Table, path: Path, layout: ParquetLayout) -> None:
+    from .duckdb import _quote, get_duckdb_session  # Only needed for bloom filters
+
+    def _identifier(column: str) -> str:
+        return '"' + column.replace('"', '""') + '"'
+
+    # Leading with the partition columns groups each partition's rows together;
+    # DuckDB 1.4 also rejects partitioned copies ordered on other columns alone.
+    sort_columns = [column for column, _ in _sort_keys(table, layout)]
+    if sort_columns:
+        sort_columns = list(layout.partition_by) + sort_columns
+    order = (
+        " ORDER BY " + ", ".join(_identifier(column) for column in sort_columns)
+        if sort_columns
+        else ""
+    )
+    options = [
+        "FORMAT parquet",
+        f"COMPRESSION {layout.compression}",
+        f"ROW_GROUP_SIZE {int(layout.row_group_size)}",
+        f"DICTIONARY_SIZE_LIMIT {int(layout.row_group_size)}",
+    ]
+    if layout.compression_level is not None:
+        options.append(f"COMPRESSION_LEVEL {int(layout.compression_level)}")
+    if layout.partitioned:
+        columns = ", ".join(_identifier(column) for column in layout.partition_by)
+        options.append(f"PARTITION_BY ({columns})")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with get_duckdb_session().cursor() as cursor:
+        cursor.register("parquet_layout_source", table)
+        try:
+            cursor.execute(
+                f"COPY (SELECT * FROM parquet_layout_source{order}) "
+                f"TO {_quote(str(path))} ({', '.join(options)})"
+            )
+        finally:
+            cursor.unregister("parquet_layout_source")
+
+
+def write_parquet_layout(table: pa.Table, path: Path, layout: ParquetLayout) -> None:
+    """Write ``table`` to ``path`` as described by ``layout``.
+
+    Partitioned layouts create ``path`` as a directory; partition columns are
+    stored in the directory names rather than in the files.
+    """
+
+    missing = [column for column in layout.partition_by if column not in table.column_names]
+    if missing:
+        msg = f"Partition columns not in dataset: {', '.join(missing)}"
+        raise ValueError(msg)
+
+    if layout.bloom_filters:
+        _write_with_duckdb(table, path, layout)
+        return
+    if not layout.partitioned:
+        _write_file(table, path, layout)
+        return
+
+    path.mkdir(parents=True, exist_ok=True)
+    frame = pl.from_arrow(table)
+    if isinstance(frame, pl.Series):  # pragma: no cover - tables give frames
+        frame = frame.to_frame()
+    if frame.is_empty():
+        # Keep the schema readable even when there is nothing to partition.
+        _write_file(table, path / _PART_FILE, layout)
+        return
+    partitions = frame.partition_by(
+        list(layout.partition_by), as_dict=True, include_key=False, maintain_order=True
+    )
+    for key, partition in partitions.items():
+        directory = path.joinpath(
+            *(
+                _partition_segment(column, value)
+                for column, value in zip(layout.partition_by, key, strict=True)
+            )
+        )
+        _write_file(partition.to_arrow(), directory / _PART_FILE, layout)
@@ -86,6 +86,25 @@ class PipelineMetrics:
             unit="warnings",
         )
 
+        self.frame_conversions = meter.create_counter(
+            name="hotpass.frame.conversions",
+            description="Copies of a dataset between pandas and Arrow-backed Polars frames",
+            unit="conversions",
+        )
+        self.frame_conversion_count = 0
+
+        self.export_duration = meter.create_histogram(
+            name="hotpass.export.duration",
+            description="Duration of writing one export format",
+            unit="seconds",
+        )
+
+        self.export_bytes = meter.create_counter(
+            name="hotpass.export.bytes",
+            description="Bytes written per export format",
+            unit="bytes",
+        )
+
         self.data_quality_score = meter.create_observable_gauge(
             name="hotpass.data.quality_score",
             description="Overall data quality score",
@@ -115,6 +134,15 @@ class PipelineMetrics:
     def record_write_duration(self, seconds: float) -> None:
         self.write_duration.record(seconds)
 
+    def record_frame_conversion(self, *, target: str, stage: str) -> None:
+        self.frame_conversion_count += 1
+        self.frame_conversions.add(1, {"target": target, "stage": stage})
+
+    def record_export(self, *, output_format: str, seconds: float, bytes_written: int) -> None:
+        attributes = {"format": output_format}
+        self.export_duration.record(seconds, attributes)
+        self.export_bytes.add(bytes_written, attributes)
+
     def update_quality_score(self, score: float) -> None:
         self._latest_quality_score = score
 
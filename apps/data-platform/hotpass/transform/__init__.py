@@ -11,10 +11,14 @@ from .normalize import (
     normalize_website,
     parse_person_name,
 )
+from .phone import ParsedPhone, PhoneBatchService, get_phone_service
 
 __all__ = [
     "NormalizedName",
+    "ParsedPhone",
+    "PhoneBatchService",
     "clean_text",
+    "get_phone_service",
     "normalise_identifier",
     "normalize_email",
     "normalize_phone",
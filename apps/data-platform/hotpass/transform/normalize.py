@@ -11,9 +11,8 @@ from types import ModuleType
 from typing import cast
 from urllib.parse import urlparse, urlunparse
 
-import phonenumbers
-
 from .._compat_nameparser import HumanName
+from .phone import get_phone_service
 
 StdnumCleanFunc = Callable[[str, str], str]
 
@@ -143,13 +142,10 @@ def normalize_phone(value: object | None, *, country_code: str = "ZA") -> str |
     digits = re.sub(r"[^0-9+]+", "", text)
     if not digits:
         return None
-    try:
-        parsed = phonenumbers.parse(digits, country_code)
-    except phonenumbers.NumberParseException:
-        return None
-    if not phonenumbers.is_possible_number(parsed) or not phonenumbers.is_valid_number(parsed):
+    parsed = get_phone_service().parse(digits, country_code)
+    if not parsed.possible or not parsed.valid:
         return None
-    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    return parsed.e164
 
 
 def normalize_website(value: object | None) -> str | None:
@@ -0,0 +1,206 @@
+"""Batch phone parsing shared by normalisation and contact validation."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+import phonenumbers
+import polars as pl
+from phonenumbers import PhoneNumberType, carrier, geocoder, number_type
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PHONE_CACHE_SIZE = 262_144
+"""Upper bound on the number of parsed ``(raw, region)`` pairs kept in memory."""
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedPhone:
+    """Everything the pipeline derives from a single ``phonenumbers.parse`` call."""
+
+    e164: str | None
+    possible: bool
+    valid: bool
+    number_type: str | None = None
+    carrier: str | None = None
+    region_code: str | None = None
+    error: str | None = None
+
+
+_RESULT_SCHEMA: dict[str, pl.DataType] = {
+    "e164": pl.String(),
+    "possible": pl.Boolean(),
+    "valid": pl.Boolean(),
+    "number_type": pl.String(),
+    "carrier": pl.String(),
+    "region_code": pl.String(),
+    "error": pl.String(),
+}
+_CACHE_SCHEMA: dict[str, pl.DataType] = {
+    "raw": pl.String(),
+    "region": pl.String(),
+    **_RESULT_SCHEMA,
+    "phonenumbers_version": pl.String(),
+}
+_RESULT_FIELDS = tuple(field.name for field in fields(ParsedPhone))
+
+
+def _parse_phone(raw: str, region: str) -> ParsedPhone:
+    try:
+        parsed = phonenumbers.parse(raw, region)
+    except phonenumbers.NumberParseException as exc:
+        error = getattr(exc.error_type, "name", "unknown").lower()
+        return ParsedPhone(e164=None, possible=False, valid=False, error=error)
+    region_lookup = getattr(geocoder, "region_code_for_number", None)
+    return ParsedPhone(
+        e164=phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+        possible=phonenumbers.is_possible_number(parsed),
+        valid=phonenumbers.is_valid_number(parsed),
+        number_type=PhoneNumberType.to_string(number_type(parsed)),
+        carrier=carrier.name_for_number(parsed, "en") or None,
+        region_code=region_lookup(parsed) if callable(region_lookup) else None,
+    )
+
+
+class PhoneBatchService:
+    """Parse each distinct ``(raw, region)`` pair once and reuse the result.
+
+    The in-memory memo is bounded and evicts the oldest entries first. When a
+    ``cache_path`` is attached, entries parsed by the same ``phonenumbers``
+    release are loaded from it and :meth:`save` writes the memo back.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_path: Path | None = None,
+        max_entries: int = DEFAULT_PHONE_CACHE_SIZE,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.cache_path: Path | None = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple[str, str], ParsedPhone] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if cache_path is not None:
+            self.attach_cache(cache_path)
+
+    def parse(self, raw: str, region: str) -> ParsedPhone:
+        """Return the parsed view of ``raw`` using ``region`` as the default region."""
+
+        key = (raw, region)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+        result = _parse_phone(raw, region)
+        with self._lock:
+            self._store(key, result)
+            self._dirty = True
+        return result
+
+    def parse_many(self, values: Iterable[str | None], region: str) -> pl.DataFrame:
+        """Parse a column of raw numbers into one columnar result.
+
+        Rows follow ``values``; missing or blank inputs produce null rows.
+        """
+
+        distinct: dict[str, ParsedPhone] = {}
+        rows: list[ParsedPhone | None] = []
+        for value in values:
+            if value is None or not value.strip():
+                rows.append(None)
+                continue
+            parsed = distinct.get(value)
+            if parsed is None:
+                parsed = self.parse(value, region)
+                distinct[value] = parsed
+            rows.append(parsed)
+        columns = {
+            name: [getattr(row, name) if row is not None else None for row in rows]
+            for name in _RESULT_FIELDS
+        }
+        return pl.DataFrame(columns, schema=_RESULT_SCHEMA)
+
+    def attach_cache(self, path: Path) -> None:
+        """Load entries persisted at ``path`` and write future saves there."""
+
+        self.cache_path = path
+        if not path.exists():
+            return
+        try:
+            frame = pl.read_parquet(path)
+        except (OSError, pl.exceptions.PolarsError) as exc:
+            logger.warning("Ignoring unreadable phone cache %s: %s", path, exc)
+            return
+        if frame.schema != pl.Schema(_CACHE_SCHEMA):
+            logger.warning("Ignoring phone cache %s with an unexpected layout", path)
+            return
+        current = frame.filter(pl.col("phonenumbers_version") == phonenumbers.__version__)
+        with self._lock:
+            for row in current.iter_rows(named=True):
+                key = (row["raw"], row["region"])
+                if key not in self._entries:
+                    self._store(key, ParsedPhone(**{name: row[name] for name in _RESULT_FIELDS}))
+
+    def save(self) -> None:
+        """Persist the memo to the attached cache path when it has new entries."""
+
+        if self.cache_path is None or (not self._dirty and self.cache_path.exists()):
+            return
+        with self._lock:
+            entries = list(self._entries.items())
+            self._dirty = False
+        frame = pl.DataFrame(
+            {
+                "raw": [raw for (raw, _), _ in entries],
+                "region": [region for (_, region), _ in entries],
+                **{
+                    name: [getattr(parsed, name) for _, parsed in entries]
+                    for name in _RESULT_FIELDS
+                },
+                "phonenumbers_version": [phonenumbers.__version__] * len(entries),
+            },
+            schema=_CACHE_SCHEMA,
+        )
+        path = self.cache_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            frame.write_parquet(temp_path)
+            temp_path.replace(path)
+        except OSError as exc:
+            logger.warning("Unable to persist phone cache %s: %s", path, exc)
+            temp_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget every parsed number held in memory."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._dirty = False
+
+    def _store(self, key: tuple[str, str], result: ParsedPhone) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = result
+
+
+_SERVICE = PhoneBatchService()
+
+
+def get_phone_service() -> PhoneBatchService:
+    """Return the process-wide phone service used by the normalisers and validators."""
+
+    return _SERVICE
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import cache
 from importlib import resources
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import pandas as pd
 
+from .contracts import DATASET_CONTRACTS, DatasetContract
 from .error_handling import DataContractError
+from .expectation_runtime import get_expectation_runtime
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from frictionless import Schema
@@ -18,22 +21,10 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 logger = logging.getLogger(__name__)
 
 try:  # pragma: no cover - Great Expectations is an optional dependency
-    from great_expectations.core.batch import Batch
     from great_expectations.core.expectation_suite import ExpectationSuite
     from great_expectations.core.expectation_validation_result import (
         ExpectationSuiteValidationResult,
     )
-    from great_expectations.data_context.data_context import context_factory as ge_context_factory
-    from great_expectations.data_context.data_context.ephemeral_data_context import (
-        EphemeralDataContext,
-    )
-    from great_expectations.data_context.types.base import (
-        DataContextConfig,
-        InMemoryStoreBackendDefaults,
-    )
-    from great_expectations.execution_engine.pandas_execution_engine import PandasExecutionEngine
-    from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
-    from great_expectations.validator.validator import Validator
 except ImportError as exc:  # pragma: no cover - handled via tests when GE absent
     raise RuntimeError("Great Expectations must be installed for contract validation") from exc
 
@@ -69,6 +60,18 @@ def _load_schema(name: str) -> Schema:
     return Schema(descriptor=descriptor)
 
 
+@cache
+def _load_contract(name: str) -> DatasetContract:
+    """Return the dataset contract behind a frictionless schema descriptor."""
+
+    for contract in DATASET_CONTRACTS:
+        if contract.schema_filename == name:
+            return contract
+    schema_path = _resource_path("schemas", name)
+    with schema_path.open("r", encoding="utf-8") as handle:
+        return DatasetContract.from_frictionless(json.load(handle))
+
+
 def _load_expectation_suite(name: str) -> ExpectationSuite:
     # Support both new canonical layout (suites/name.json) and legacy layout (path/name.json)
     # Try new layout first
@@ -78,22 +81,7 @@ def _load_expectation_suite(name: str) -> ExpectationSuite:
         # Fall back to legacy layout for backward compatibility
         suite_path = _resource_path("data_expectations", name)
 
-    with suite_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-    expectations = [
-        ExpectationConfiguration(
-            type=item["expectation_type"],
-            kwargs=item.get("kwargs", {}),
-            meta=item.get("meta"),
-        )
-        for item in payload.get("expectations", [])
-    ]
-    suite = ExpectationSuite(
-        name=payload["expectation_suite_name"],
-        expectations=expectations,
-        meta=payload.get("meta", {}),
-    )
-    return suite
+    return get_expectation_runtime().load_suite(suite_path)
 
 
 def _load_checkpoint_config(name: str) -> dict[str, object]:
@@ -114,13 +102,63 @@ def _normalise_duplicate_keys(frame: pd.DataFrame, subset: list[str]) -> list[st
     return unique[:5]
 
 
+def _drop_primary_key_duplicates(
+    df: pd.DataFrame,
+    primary_key: list[str],
+    *,
+    table_name: str,
+    source_file: str,
+) -> None:
+    """Record a contract notice for duplicate primary keys and keep the first row."""
+
+    if not primary_key:
+        return
+    duplicate_mask = df.duplicated(subset=primary_key, keep=False)
+    if not duplicate_mask.any():
+        return
+    duplicate_rows = df.loc[duplicate_mask].copy()
+    duplicate_count = int(duplicate_mask.sum())
+    sample_keys = _normalise_duplicate_keys(duplicate_rows, primary_key)
+    notice = {
+        "table_name": table_name,
+        "source_file": source_file,
+        "primary_key": primary_key,
+        "duplicate_count": duplicate_count,
+        "sample_keys": sample_keys,
+        "duplicate_rows": duplicate_rows.reset_index(drop=True),
+    }
+    notices = df.attrs.setdefault("contract_notices", [])
+    notices.append(notice)
+    logger.warning(
+        "Detected %s duplicate row(s) in %s (primary key: %s). Keeping first occurrence.",
+        duplicate_count,
+        table_name,
+        ", ".join(primary_key),
+    )
+    if sample_keys:
+        logger.warning(
+            "Sample duplicate keys for %s: %s",
+            table_name,
+            "; ".join(sample_keys),
+        )
+    # Ensure downstream consumers observe the deduplicated frame
+    df.drop_duplicates(subset=primary_key, keep="first", inplace=True)
+
+
 def validate_with_frictionless(
     df: pd.DataFrame,
     *,
     schema_descriptor: str,
     table_name: str,
     source_file: str,
+    batch_size: int | None = None,
 ) -> None:
+    """Validate ``df`` against a frictionless table schema.
+
+    When ``batch_size`` is provided the frame is handed to frictionless in
+    slices of that many rows so only one batch is materialised as records at a
+    time. Primary-key duplicates are still detected across the whole frame.
+    """
     from frictionless.exception import FrictionlessException
     from frictionless.resources import TableResource
 
@@ -132,65 +170,76 @@ def validate_with_frictionless(
         else:
             primary_key = [str(schema.primary_key)]
 
-    duplicate_rows: pd.DataFrame | None = None
-    if primary_key:
-        duplicate_mask = df.duplicated(subset=primary_key, keep=False)
-        if duplicate_mask.any():
-            duplicate_rows = df.loc[duplicate_mask].copy()
-            duplicate_count = int(duplicate_mask.sum())
-            sample_keys = _normalise_duplicate_keys(duplicate_rows, primary_key)
-            notice = {
-                "table_name": table_name,
-                "source_file": source_file,
-                "primary_key": primary_key,
-                "duplicate_count": duplicate_count,
-                "sample_keys": sample_keys,
-                "duplicate_rows": duplicate_rows.reset_index(drop=True),
-            }
-            notices = df.attrs.setdefault("contract_notices", [])
-            notices.append(notice)
-            logger.warning(
-                "Detected %s duplicate row(s) in %s (primary key: %s). Keeping first occurrence.",
-                duplicate_count,
-                table_name,
-                ", ".join(primary_key),
-            )
-            if sample_keys:
-                logger.warning(
-                    "Sample duplicate keys for %s: %s",
-                    table_name,
-                    "; ".join(sample_keys),
-                )
-            # Ensure downstream consumers observe the deduplicated frame
-            df.drop_duplicates(subset=primary_key, keep="first", inplace=True)
-
-    sanitized = df.where(pd.notnull(df), None).copy()
-    for field in schema.fields:
-        if field.type == "string" and field.name in sanitized.columns:
-            sanitized[field.name] = sanitized[field.name].astype("string")
-    resource = TableResource(data=sanitized.to_dict(orient="records"), schema=schema)
-    try:
-        report = resource.validate()
-    except FrictionlessException as exc:  # pragma: no cover - surfaced via report
-        raise DataContractError.from_frictionless(
-            table_name,
-            expected_fields=[field.name for field in schema.fields],
-            actual_fields=list(df.columns),
-            issues=[str(exc)],
-            source_file=source_file,
-        ) from exc
+    _drop_primary_key_duplicates(df, primary_key, table_name=table_name, source_file=source_file)
 
-    if report.valid:
+    step = batch_size if batch_size and batch_size > 0 else max(len(df), 1)
+    valid = True
+    issues: list[str] = []
+    for start in range(0, max(len(df), 1), step):
+        batch = df.iloc[start : start + step]
+        sanitized = batch.where(pd.notnull(batch), None).copy()
+        for field in schema.fields:
+            if field.type == "string" and field.name in sanitized.columns:
+                sanitized[field.name] = sanitized[field.name].astype("string")
+        resource = TableResource(data=sanitized.to_dict(orient="records"), schema=schema)
+        try:
+            report = resource.validate()
+        except FrictionlessException as exc:  # pragma: no cover - surfaced via report
+            raise DataContractError.from_frictionless(
+                table_name,
+                expected_fields=[field.name for field in schema.fields],
+                actual_fields=list(df.columns),
+                issues=[str(exc)],
+                source_file=source_file,
+            ) from exc
+        valid = valid and report.valid
+        for task in report.tasks:
+            for error in task.errors:
+                issues.append(error.note)
+
+    if valid:
         return
 
+    raise DataContractError.from_frictionless(
+        table_name,
+        expected_fields=[field.name for field in schema.fields],
+        actual_fields=list(df.columns),
+        issues=issues,
+        source_file=source_file,
+    )
+
+
+def validate_with_contract(
+    df: pd.DataFrame,
+    *,
+    schema_descriptor: str,
+    table_name: str,
+    source_file: str,
+    batch_size: int | None = None,
+) -> None:
+    """Validate ``df`` with the vectorised engine compiled from its dataset contract.
+
+    Reports the same issues as :func:`validate_with_frictionless`, which stays
+    available as the parity/audit engine, and applies the same primary-key
+    de-duplication and batching.
+    """
+
+    contract = _load_contract(schema_descriptor)
+    primary_key = list(contract.primary_key)
+    _drop_primary_key_duplicates(df, primary_key, table_name=table_name, source_file=source_file)
+
+    step = batch_size if batch_size and batch_size > 0 else max(len(df), 1)
     issues: list[str] = []
-    for task in report.tasks:
-        for error in task.errors:
-            issues.append(error.note)
+    for start in range(0, max(len(df), 1), step):
+        batch = df.iloc[start : start + step]
+        issues.extend(issue.note for issue in contract.validator.validate(batch))
+
+    if not issues:
+        return
 
     raise DataContractError.from_frictionless(
         table_name,
-        expected_fields=[field.name for field in schema.fields],
+        expected_fields=[field.name for field in contract.fields],
         actual_fields=list(df.columns),
         issues=issues,
         source_file=source_file,
@@ -204,32 +253,7 @@ def validate_with_expectations(
     source_file: str,
 ) -> None:
     suite = _load_expectation_suite(suite_descriptor)
-    config = DataContextConfig(
-        config_version=4,
-        expectations_store_name="expectations_store",
-        validation_results_store_name="validation_results_store",
-        checkpoint_store_name="checkpoint_store",
-        data_docs_sites={},
-        analytics_enabled=False,
-        store_backend_defaults=InMemoryStoreBackendDefaults(init_temp_docs_sites=False),
-    )
-
-    context = EphemeralDataContext(project_config=config)
-    project_manager = ge_context_factory.project_manager
-    previous_project = project_manager.get_project()
-    project_manager.set_project(context)
-
-    try:
-        validator = Validator(
-            execution_engine=PandasExecutionEngine(),
-            expectation_suite=suite,
-            batches=[Batch(data=df)],
-            data_context=context,
-        )
-        validator.set_default_expectation_argument("catch_exceptions", True)
-        results = cast(ExpectationSuiteValidationResult, validator.validate())
-    finally:
-        project_manager.set_project(previous_project)
+    (results,) = get_expectation_runtime().validate(suite, [df])
     if results.success:
         return
 
@@ -292,46 +316,12 @@ def run_checkpoint(
 
     suite = _load_expectation_suite(f"{suite_name}.json")
 
-    # Configure Data Context with optional Data Docs site
-    data_docs_sites = {}
+    runtime = get_expectation_runtime()
     if data_docs_dir is not None:
         data_docs_dir.mkdir(parents=True, exist_ok=True)
-        data_docs_sites = {
-            "local_site": {
-                "class_name": "SiteBuilder",
-                "store_backend": {
-                    "class_name": "TupleFilesystemStoreBackend",
-                    "base_directory": str(data_docs_dir),
-                },
-                "site_index_builder": {
-                    "class_name": "DefaultSiteIndexBuilder",
-                },
-            }
-        }
-
-    config = DataContextConfig(
-        config_version=4,
-        expectations_store_name="expectations_store",
-        validation_results_store_name="validation_results_store",
-        checkpoint_store_name="checkpoint_store",
-        data_docs_sites=data_docs_sites,
-        analytics_enabled=False,
-        store_backend_defaults=InMemoryStoreBackendDefaults(init_temp_docs_sites=False),
-    )
 
-    context = EphemeralDataContext(project_config=config)
-    project_manager = ge_context_factory.project_manager
-    previous_project = project_manager.get_project()
-    project_manager.set_project(context)
-
-    try:
-        validator = Validator(
-            execution_engine=PandasExecutionEngine(),
-            expectation_suite=suite,
-            batches=[Batch(data=df)],
-            data_context=context,
-        )
-        validator.set_default_expectation_argument("catch_exceptions", True)
+    with runtime.activate(data_docs_dir) as context:
+        validator = runtime.validator(context, df, suite)
         results = cast(ExpectationSuiteValidationResult, validator.validate())
 
         # Build Data Docs if configured
@@ -340,13 +330,7 @@ def run_checkpoint(
                 context.build_data_docs()
             except Exception as e:  # pragma: no cover - non-critical
                 # Log but don't fail the validation if Data Docs generation fails
-                import logging
-
-                logging.getLogger(__name__).warning(
-                    f"Failed to build Data Docs for {checkpoint_name}: {e}"
-                )
-    finally:
-        project_manager.set_project(previous_project)
+                logger.warning(f"Failed to build Data Docs for {checkpoint_name}: {e}")
 
     if not results.success:
         failures: list[str] = []
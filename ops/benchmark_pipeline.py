@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+
 from hotpass import benchmarks
 from hotpass.data_sources import ExcelReadOptions
 
@@ -29,6 +31,11 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--excel-chunk-size", type=int)
     parser.add_argument("--excel-engine", type=str)
     parser.add_argument("--excel-stage-dir", type=Path)
+    parser.add_argument(
+        "--sort-dataset",
+        type=Path,
+        help="Also run the sort microbenchmark against this refined Parquet or CSV file",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON results")
     return parser
 
@@ -58,8 +65,19 @@ def main(argv: list[str] | None = None) -> int:
         excel_options=excel_options,
     )
 
+    sort_result = None
+    if args.sort_dataset is not None:
+        if args.sort_dataset.suffix.lower() == ".csv":
+            sort_frame = pd.read_csv(args.sort_dataset)
+        else:
+            sort_frame = pd.read_parquet(args.sort_dataset)
+        sort_result = benchmarks.run_sort_benchmark(sort_frame, runs=args.runs)
+
     if args.json:
-        print(json.dumps(result.to_dict(), indent=2))
+        payload = result.to_dict()
+        if sort_result is not None:
+            payload["sort"] = sort_result.to_dict()
+        print(json.dumps(payload, indent=2))
         return 0
 
     print(_format_line("Runs", result.runs))
@@ -73,6 +91,11 @@ def main(argv: list[str] | None = None) -> int:
         for loader, seconds in sorted(result.metrics["source_load_seconds"].items()):
             print(f"  - {loader}: {seconds:.4f}s")
 
+    if sort_result is not None:
+        print("Sort Microbenchmark:")
+        for label, key in benchmarks.sort_benchmark_fields():
+            print(f"  - {_format_line(label, sort_result.metrics[key])}")
+
     return 0
 
 
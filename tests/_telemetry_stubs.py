@@ -179,6 +179,10 @@ class DummyMetrics:
         self.acquisition_duration = self._histogram("hotpass.acquisition.duration")
         self.acquisition_records = self._counter("hotpass.acquisition.records")
         self.acquisition_warnings = self._counter("hotpass.acquisition.warnings")
+        self.frame_conversions = self._counter("hotpass.frame.conversions")
+        self.frame_conversion_count = 0
+        self.export_duration = self._histogram("hotpass.export.duration")
+        self.export_bytes = self._counter("hotpass.export.bytes")
         self.data_quality_score = meter.create_observable_gauge(
             name="hotpass.data.quality_score",
             callbacks=[self._observe_quality_score],
@@ -226,6 +230,15 @@ class DummyMetrics:
     def record_write_duration(self, seconds: float) -> None:
         self.write_duration.record(seconds)
 
+    def record_frame_conversion(self, *, target: str, stage: str) -> None:
+        self.frame_conversion_count += 1
+        self.frame_conversions.add(1, {"target": target, "stage": stage})
+
+    def record_export(self, *, output_format: str, seconds: float, bytes_written: int) -> None:
+        attributes = {"format": output_format}
+        self.export_duration.record(seconds, attributes)
+        self.export_bytes.add(bytes_written, attributes)
+
     def update_quality_score(self, score: float) -> None:
         self._latest_quality_score = score
 
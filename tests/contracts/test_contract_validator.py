@@ -0,0 +1,128 @@
+"""Parity tests for the vectorised contract validator."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("frictionless")
+
+from tests.helpers.assertions import expect  # noqa: E402
+from tests.helpers.pytest_marks import parametrize  # noqa: E402
+
+from hotpass.contracts import DatasetContract, FieldContract  # noqa: E402
+from hotpass.error_handling import DataContractError  # noqa: E402
+from hotpass.validation import validate_with_contract, validate_with_frictionless  # noqa: E402
+
+_CASES: dict[str, tuple[str, pd.DataFrame]] = {
+    "valid": (
+        "contact_company_cat.schema.json",
+        pd.DataFrame({"C_ID": [1.0, 2.0], "Company": ["Alpha", "Beta"]}),
+    ),
+    "required_and_types": (
+        "contact_company_cat.schema.json",
+        pd.DataFrame(
+            {
+                "C_ID": [1.0, "abc", True, " 4 ", "1,000"],
+                "Company": ["Alpha", None, "", "Delta", "Echo"],
+            }
+        ),
+    ),
+    "missing_column": (
+        "contact_company_addresses.schema.json",
+        pd.DataFrame({"C_ID": [1.0, 2.0], "Type": ["Head Office", None]}),
+    ),
+    "blank_rows_and_null_keys": (
+        "sacaa_cleaned.schema.json",
+        pd.DataFrame(
+            {
+                "Name of Organisation": [None, "Sky", None],
+                "Province": [None, "Gauteng", "Western Cape"],
+                "Extra": ["kept", None, None],
+            }
+        ),
+    ),
+    "nan_numbers_and_timestamps": (
+        "reachout_organisation.schema.json",
+        pd.DataFrame(
+            {
+                "ID": [np.nan, 2.0, pd.Timestamp("2024-01-01")],
+                "Organisation Name": ["Alpha", "Beta", "Gamma"],
+            }
+        ),
+    ),
+    "empty": (
+        "sacaa_cleaned.schema.json",
+        pd.DataFrame({"Name of Organisation": pd.Series(dtype="object")}),
+    ),
+}
+
+
+def _issues(validate, schema: str, frame: pd.DataFrame, batch_size: int | None) -> list[str]:
+    try:
+        validate(
+            frame.copy(),
+            schema_descriptor=schema,
+            table_name="Parity",
+            source_file="parity.xlsx#Sheet",
+            batch_size=batch_size,
+        )
+    except DataContractError as exc:
+        return list(exc.context.details["issues"])
+    return []
+
+
+@parametrize("case", sorted(_CASES))
+@parametrize("batch_size", [None, 2])
+def test_contract_validator_matches_frictionless(case: str, batch_size: int | None) -> None:
+    schema, frame = _CASES[case]
+
+    expected = _issues(validate_with_frictionless, schema, frame, batch_size)
+    actual = _issues(validate_with_contract, schema, frame, batch_size)
+
+    expect(actual == expected, f"{case}: {actual!r} != {expected!r}")
+
+
+def test_contract_validator_orders_issues_like_frictionless() -> None:
+    contract = DatasetContract(
+        name="ordering",
+        title="Ordering",
+        description="Enum, pattern and composite key checks",
+        primary_key=("Code", "Kind"),
+        fields=(
+            FieldContract(name="Label", field_type="string", pattern="[a-z]+"),
+            FieldContract(name="Code", field_type="integer", required=True),
+            FieldContract(name="Kind", field_type="string", enum=("a", "b")),
+        ),
+    )
+    frame = pd.DataFrame({"Label": ["ok", "BAD", "ok"], "Code": [1, 1, 1], "Kind": ["a", "c", "a"]})
+
+    issues = contract.validator.validate(frame)
+
+    expect(
+        [(issue.row_number, issue.field_name, issue.note) for issue in issues]
+        == [
+            (3, "Kind", "constraint \"enum\" is \"['a', 'b']\""),
+            (3, "Label", 'constraint "pattern" is "[a-z]+"'),
+            (4, None, "the same as in the row at position 2"),
+        ],
+        "Primary-key cells should be reported first and duplicates should cite the prior row",
+    )
+
+
+def test_contract_from_frictionless_round_trips_constraints() -> None:
+    contract = DatasetContract(
+        name="constraints",
+        title="Constraints",
+        description="Constraint round trip",
+        primary_key=("Code",),
+        fields=(
+            FieldContract(name="Code", field_type="string", required=True, pattern="[A-Z]{3}"),
+            FieldContract(name="Status", field_type="string", enum=("active", "closed")),
+        ),
+    )
+
+    rebuilt = DatasetContract.from_frictionless(contract.to_frictionless())
+
+    expect(rebuilt.to_frictionless() == contract.to_frictionless(), "Constraints should survive")
@@ -59,3 +59,36 @@ def test_validate_with_frictionless_deduplicates_primary_key() -> None:
         isinstance(duplicate_rows, pd.DataFrame) and not duplicate_rows.empty,
         "Duplicate rows should be attached for downstream artefacts",
     )
+
+
+def test_validate_with_frictionless_batches_report_late_failures() -> None:
+    from hotpass.error_handling import DataContractError
+
+    frame = pd.DataFrame(
+        {
+            "Name of Organisation": ["Alpha Flight", "Beta Flyers", None],
+            "Province": ["GAU", "WC", "KZN"],
+            "Status": ["Approved", "Approved", "Approved"],
+            "Website URL": ["https://alpha.example", "https://beta.example", None],
+            "Contact Person": ["Jane", "Ben", "Kim"],
+            "Contact Number": ["123", "456", "789"],
+            "Contact Email Address": ["a@alpha.example", "b@beta.example", None],
+        }
+    )
+
+    with pytest.raises(DataContractError):
+        validate_with_frictionless(
+            frame,
+            schema_descriptor="sacaa_cleaned.schema.json",
+            table_name="SACAA Cleaned",
+            source_file="test.xlsx#Cleaned",
+            batch_size=2,
+        )
+
+    validate_with_frictionless(
+        frame.iloc[:2].copy(),
+        schema_descriptor="sacaa_cleaned.schema.json",
+        table_name="SACAA Cleaned",
+        source_file="test.xlsx#Cleaned",
+        batch_size=1,
+    )
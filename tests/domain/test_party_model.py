@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import uuid
 from datetime import UTC, datetime
+from pathlib import Path
 
 import pandas as pd
 import pytest
@@ -13,6 +15,7 @@ from hotpass.domain.party import (
     ContactMethodType,
     PartyKind,
     build_party_store_from_refined,
+    generate_uuid7_array,
     render_dictionary,
 )
 
@@ -151,3 +154,117 @@ def test_render_dictionary_includes_party_fields() -> None:
     expect("Party" in markdown, "Dictionary should include Party entity")
     expect("Alias" in markdown, "Dictionary should include Alias entity")
     expect("ContactMethod" in markdown, "Dictionary should include ContactMethod entity")
+
+
+def test_party_store_is_columnar_and_exports_in_bulk(tmp_path: Path) -> None:
+    import pyarrow.parquet as pq
+
+    refined = pd.DataFrame(
+        [
+            {
+                "organization_name": "Aero School",
+                "organization_slug": "aero-school",
+                "contact_primary_name": "Jane Doe",
+                "contact_primary_email": "jane.doe@aero.example",
+                "source_datasets": "SACAA Cleaned",
+                "website": "https://aero.example",
+                "selection_provenance": _selection_payload(),
+            },
+            {
+                "organization_name": "Aero School",
+                "organization_slug": "aero-school",
+                "contact_primary_name": "John Roe",
+                "selection_provenance": "{}",
+            },
+        ]
+    )
+    store = build_party_store_from_refined(
+        refined,
+        default_country="ZA",
+        execution_time=datetime(2025, 1, 20, tzinfo=UTC),
+    )
+    from tests.helpers.assertions import expect
+
+    party_table = store.tables["party"]
+    expect(party_table.num_rows == 3, "Parties should be held as one Arrow table")
+    expect(
+        party_table.column("kind").to_pylist() == ["organisation", "person", "person"],
+        "Organisations should precede people",
+    )
+    party_ids = set(party_table.column("party_id").to_pylist())
+    expect(
+        set(store.tables["party_role"].column("object_party_id").to_pylist()) <= party_ids,
+        "Role references should resolve to generated party identifiers",
+    )
+
+    records = {
+        "party": store.parties,
+        "party_alias": store.aliases,
+        "party_role": store.roles,
+        "contact_method": store.contact_methods,
+    }
+    expect(
+        store.as_dict()
+        == {
+            name: [record.model_dump(mode="json") for record in models]
+            for name, models in records.items()
+        },
+        "The bulk JSON export should match the Pydantic serialisation",
+    )
+    expect(store.parties is store.parties, "Materialised records should be cached")
+
+    paths = store.write_parquet(tmp_path / "party-store")
+    expect(
+        pq.read_table(paths["contact_method"]).num_rows == len(store.contact_methods),
+        "Each table should be written to its own Parquet file",
+    )
+    store.write_json(tmp_path / "party-store.json")
+    expect(
+        json.loads((tmp_path / "party-store.json").read_text(encoding="utf-8"))
+        == store.as_dict(),
+        "The JSON file should hold the store document",
+    )
+
+
+def test_generate_uuid7_array_is_sortable() -> None:
+    identifiers = generate_uuid7_array(64).to_pylist()
+    from tests.helpers.assertions import expect
+
+    expect(len(set(identifiers)) == 64, "Identifiers should be unique")
+    expect(identifiers == sorted(identifiers), "A batch should sort in generation order")
+    expect(
+        all(uuid.UUID(value).version == 7 for value in identifiers),
+        "Identifiers should be UUIDv7",
+    )
+
+
+def test_provenance_timestamps_keep_their_utc_offset() -> None:
+    refined = pd.DataFrame(
+        [
+            {
+                "organization_name": "Aero School",
+                "organization_slug": "aero-school",
+                "last_interaction_date": "2025-01-12T10:00:00+02:00",
+            }
+        ]
+    )
+    selections = [
+        {
+            "organization_name": {
+                "source_dataset": "SACAA Cleaned",
+                "last_interaction_date": "2025-01-12T10:00:00+02:00",
+            }
+        }
+    ]
+    store = build_party_store_from_refined(
+        refined,
+        execution_time=datetime(2025, 1, 20, tzinfo=UTC),
+        selections=selections,
+    )
+    from tests.helpers.assertions import expect
+
+    expect(
+        store.tables["party"].column("provenance_captured_at").to_pylist()
+        == [datetime(2025, 1, 12, 8, 0, tzinfo=UTC)],
+        "Offsets should be converted to UTC rather than dropped",
+    )
@@ -0,0 +1,316 @@
+"""Parity tests for the row-wise and Polars aggregation engines."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+from tests.helpers.assertions import expect
+from tests.helpers.hypothesis import HealthCheck, given, settings, st
+
+from hotpass.pipeline.aggregation import AggregationResult, aggregate_records
+from hotpass.pipeline.aggregation_shards import (
+    MIN_GROUPS_PER_WORKER,
+    resolve_aggregation_workers,
+)
+from hotpass.config import get_default_profile
+from hotpass.config_schema import SurvivorshipSettings
+from hotpass.pipeline.config import PipelineConfig
+from hotpass.pipeline.survivorship import SurvivorshipPolicy
+
+_CONFIG = PipelineConfig(input_dir=Path("."), output_path=Path("refined.xlsx"))
+
+
+def _aggregate(
+    frame: pd.DataFrame,
+    engine: str,
+    *,
+    workers: int | str | None = None,
+    events: list[tuple[str, dict[str, Any]]] | None = None,
+    policy: SurvivorshipPolicy | None = None,
+) -> AggregationResult:
+    def _notify(event: str, payload: dict[str, Any]) -> None:
+        if events is not None:
+            events.append((event, payload))
+
+    return aggregate_records(
+        replace(
+            _CONFIG,
+            aggregation_engine=engine,
+            aggregation_workers=workers,
+            survivorship_policy=policy,
+        ),
+        frame,
+        intent_summaries=None,
+        notify_progress=_notify,
+    )
+
+
+def _expect_parity(frame: pd.DataFrame, policy: SurvivorshipPolicy | None = None) -> None:
+    python = _aggregate(frame, "python", policy=policy)
+    polars = _aggregate(frame, "polars", policy=policy)
+
+    pd.testing.assert_frame_equal(polars.refined_df, python.refined_df)
+    expect(polars.conflicts == python.conflicts, "Conflicts should match the row-wise engine")
+
+
+def _row(**overrides: Any) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "organization_name": "Aero School",
+        "organization_slug": "aero-school",
+        "source_dataset": "Contact Database",
+        "source_record_id": None,
+        "province": None,
+        "area": None,
+        "address": None,
+        "category": None,
+        "organization_type": None,
+        "status": None,
+        "website": None,
+        "planes": None,
+        "description": None,
+        "notes": None,
+        "priority": None,
+        "last_interaction_date": None,
+        "contact_names": [],
+        "contact_roles": [],
+        "contact_emails": [],
+        "contact_phones": [],
+    }
+    row.update(overrides)
+    return row
+
+
+def test_engines_agree_on_priority_conflicts_and_contact_anchoring() -> None:
+    frame = pd.DataFrame(
+        [
+            _row(
+                source_record_id="contact:1",
+                province="Gauteng",
+                website="https://contact.example",
+                planes="C172",
+                last_interaction_date="2025-04-01",
+                contact_names=["  ", "Older Ops"],
+                contact_roles=["Operations"],
+                contact_emails=["ops@contact.example", "ops@contact.example"],
+                contact_phones=["+27820001111"],
+            ),
+            _row(
+                source_dataset="Reachout Database",
+                source_record_id="reachout:1",
+                province=" gauteng ",
+                website="https://reachout.example",
+                planes="PA28",
+                last_interaction_date="10/03/2025",
+                contact_names=["Jane Doe", "Older Ops"],
+                contact_phones=["+27825550000"],
+            ),
+            _row(
+                organization_name="",
+                organization_slug=None,
+                source_dataset="   ",
+                notes="Unslugged",
+                contact_emails=["orphan@example.com"],
+            ),
+            _row(
+                organization_name="Heli Ops",
+                organization_slug="heli-ops",
+                source_dataset="SACAA Cleaned",
+                source_record_id="sacaa:7",
+                status="Active",
+                contact_names=["Regulator"],
+            ),
+            _row(
+                organization_name="Second Orphan",
+                organization_slug=None,
+                source_dataset=None,
+                notes="Also unslugged",
+            ),
+        ]
+    )
+
+    _expect_parity(frame)
+
+
+def test_engines_agree_when_optional_columns_are_missing() -> None:
+    frame = pd.DataFrame(
+        [
+            {"organization_slug": "aero", "source_dataset": "Other", "website": "a.example"},
+            {"organization_slug": "aero", "source_dataset": "Other", "website": "b.example"},
+        ]
+    )
+
+    _expect_parity(frame)
+
+
+_CONTACTS_FROM_REACHOUT = SurvivorshipPolicy(
+    field_priorities={
+        field: {"Reachout Database": 4}
+        for field in ("contact_primary_email", "contact_primary_phone", "contact_primary_name")
+    }
+)
+
+
+def _field_priority_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            _row(
+                source_dataset="SACAA Cleaned",
+                source_record_id="sacaa:1",
+                province="Gauteng",
+                contact_names=["Registrar"],
+                contact_emails=["registry@sacaa.example", "desk@sacaa.example"],
+            ),
+            _row(
+                source_dataset="Reachout Database",
+                source_record_id="reachout:1",
+                province="Western Cape",
+                contact_names=["Jane Doe"],
+                contact_emails=["jane@aero.example"],
+                contact_phones=["+27825550000"],
+            ),
+        ]
+    )
+
+
+@pytest.mark.parametrize("engine", ["polars", "python"])
+def test_field_priorities_override_source_ranking_per_field(engine: str) -> None:
+    result = _aggregate(_field_priority_frame(), engine, policy=_CONTACTS_FROM_REACHOUT)
+    record = result.refined_df.iloc[0]
+
+    expect(record["province"] == "Gauteng", "Unlisted fields should keep the default ranking")
+    expect(
+        record["contact_primary_email"] == "jane@aero.example",
+        "Contacts should prefer Reachout",
+    )
+    expect(
+        record["contact_secondary_emails"] == "registry@sacaa.example;desk@sacaa.example",
+        "Secondary emails should follow the primary email rule",
+    )
+    expect(record["contact_primary_name"] == "Jane Doe", "Name should follow the email row")
+    email = next(item for item in result.conflicts if item["field"] == "contact_primary_email")
+    expect(email["chosen_source"] == "Reachout Database", "Conflicts should name the rule winner")
+
+
+def test_engines_agree_under_field_priorities() -> None:
+    _expect_parity(_field_priority_frame(), _CONTACTS_FROM_REACHOUT)
+
+
+def test_survivorship_policy_compiles_distinct_rules() -> None:
+    policy = SurvivorshipPolicy(
+        field_priorities={
+            "website": {"Reachout Database": 4},
+            "contact_primary_email": {"Reachout Database": 4},
+            "status": {"SACAA Cleaned": 3},
+        }
+    )
+
+    expect(len(policy.rules) == 2, "Identical and no-op overrides should share a rule")
+    expect(policy.rule_for("status") == 0, "A no-op override should use the default rule")
+    expect(
+        policy.rule_for("contact_secondary_emails") == policy.rule_for("website") == 1,
+        "Fields with the same effective priorities should share a rule",
+    )
+    with pytest.raises(ValueError, match="Unknown survivorship fields"):
+        SurvivorshipPolicy(field_priorities={"contact_emails": {"SACAA Cleaned": 1}})
+
+
+def test_profile_survivorship_rules_drive_aggregation() -> None:
+    settings = SurvivorshipSettings(fields={"province": {"Reachout Database": 4}})
+    profile = get_default_profile("aviation").model_copy(update={"survivorship": settings})
+    result = aggregate_records(
+        replace(_CONFIG, industry_profile=profile),
+        _field_priority_frame(),
+        intent_summaries=None,
+        notify_progress=lambda _event, _payload: None,
+    )
+
+    expect(
+        result.refined_df.loc[0, "province"] == "Western Cape",
+        "Profile rules should apply when the config sets no policy",
+    )
+
+
+def test_unknown_engine_is_rejected() -> None:
+    with pytest.raises(ValueError, match="aggregation_engine"):
+        _aggregate(pd.DataFrame([_row()]), "spark")
+
+
+@pytest.mark.parametrize("engine", ["polars", "python"])
+def test_sharded_aggregation_matches_serial_order(engine: str) -> None:
+    rows = [
+        _row(
+            organization_name=f"Org {index % 7}",
+            organization_slug=None if index % 11 == 0 else f"org-{index % 7}",
+            source_dataset=["SACAA Cleaned", "Reachout Database", "Contact Database"][index % 3],
+            source_record_id=f"r{index}",
+            province=f"Province {index % 4}",
+            contact_emails=[f"ops{index % 5}@example.com"],
+        )
+        for index in range(40)
+    ]
+    frame = pd.DataFrame(rows)
+    serial_events: list[tuple[str, dict[str, Any]]] = []
+    sharded_events: list[tuple[str, dict[str, Any]]] = []
+
+    serial = _aggregate(frame, engine, events=serial_events)
+    sharded = _aggregate(frame, engine, workers=3, events=sharded_events)
+
+    pd.testing.assert_frame_equal(sharded.refined_df, serial.refined_df)
+    expect(sharded.conflicts == serial.conflicts, "Sharded conflicts should keep serial order")
+    expect(sharded_events == serial_events, "Progress events should match the serial run")
+    expect(sharded.metrics["aggregation_workers"] == 3, "Worker count should be reported")
+
+
+def test_resolve_aggregation_workers() -> None:
+    expect(resolve_aggregation_workers(None, 10_000) == 1, "None keeps aggregation serial")
+    expect(resolve_aggregation_workers(8, 3) == 3, "Workers are capped at the group count")
+    expect(
+        resolve_aggregation_workers("auto", MIN_GROUPS_PER_WORKER - 1) == 1,
+        "Auto mode stays serial for small inputs",
+    )
+    with pytest.raises(ValueError, match="aggregation_workers"):
+        resolve_aggregation_workers(0, 10)
+
+
+_TEXT = st.sampled_from([None, "", "  ", "Alpha", " alpha ", "Beta", "Gamma"])
+_LIST = st.lists(_TEXT.filter(lambda value: value is not None), max_size=3)
+_ROWS = st.lists(
+    st.fixed_dictionaries(
+        {
+            "organization_name": st.sampled_from([None, "", "Aero", "Heli"]),
+            "organization_slug": st.sampled_from([None, "aero", "heli"]),
+            "source_dataset": st.sampled_from(
+                [None, "", "SACAA Cleaned", "Reachout Database", "Contact Database", "Other"]
+            ),
+            "source_record_id": st.sampled_from([None, "", "r1", "r2"]),
+            "province": _TEXT,
+            "address": _TEXT,
+            "website": _TEXT,
+            "planes": _TEXT,
+            "priority": _TEXT,
+            "last_interaction_date": st.sampled_from(
+                [None, "", "2024-01-05", "05/01/2024", "2023-12-31", "not a date"]
+            ),
+            "contact_names": _LIST,
+            "contact_roles": _LIST,
+            "contact_emails": st.lists(
+                st.sampled_from(["a@example.com", "b@example.com", "bad-email"]), max_size=2
+            ),
+            "contact_phones": st.lists(
+                st.sampled_from(["+27820001111", "082 555 0000", "12"]), max_size=2
+            ),
+        }
+    ),
+    min_size=1,
+    max_size=8,
+)
+
+
+@settings(max_examples=25, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(rows=_ROWS)
+def test_engines_agree_on_generated_groups(rows: list[dict[str, Any]]) -> None:
+    _expect_parity(pd.DataFrame(rows))
@@ -0,0 +1,79 @@
+"""Tests for the streamed aggregation conflict ledger."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+from tests.helpers.assertions import expect
+
+from hotpass.pipeline.aggregation import aggregate_records
+from hotpass.pipeline.config import PipelineConfig
+from hotpass.pipeline.conflicts import ConflictLedger, query_conflicts
+
+_CONFLICT = {
+    "field": "province",
+    "chosen_source": "SACAA Cleaned",
+    "value": "Gauteng",
+    "alternatives": [{"source": "Reachout Database", "value": "Western Cape"}],
+}
+
+
+def test_streaming_ledger_keeps_only_counts_and_sample(tmp_path: Path) -> None:
+    path = tmp_path / "conflicts.arrow"
+    with ConflictLedger(path, batch_size=2, sample_size=1) as ledger:
+        ledger.extend("aero", [_CONFLICT, {**_CONFLICT, "field": "website"}])
+        ledger.extend("heli", [_CONFLICT])
+
+    expect(ledger.total == 3, "Every conflict should be counted")
+    expect(ledger.conflicts() == [_CONFLICT], "Only the sample should stay in memory")
+    expect(ledger.summary()["by_field"] == {"province": 2, "website": 1}, "Counts by field")
+
+    heli = query_conflicts(path, slug="heli")
+    expect(heli.height == 1, "Query should filter by slug")
+    expect(heli.row(0, named=True)["sequence"] == 2, "Sequence should follow write order")
+    expect(query_conflicts(path, field="province").height == 2, "Query should filter by field")
+
+
+def test_empty_streaming_ledger_is_readable(tmp_path: Path) -> None:
+    path = tmp_path / "conflicts.arrow"
+    ConflictLedger(path).close()
+
+    expect(query_conflicts(path).height == 0, "An empty ledger should still be queryable")
+
+
+def test_aggregation_streams_conflicts_to_ledger(tmp_path: Path) -> None:
+    frame = pd.DataFrame(
+        [
+            {
+                "organization_name": "Aero School",
+                "organization_slug": "aero-school",
+                "source_dataset": source,
+                "province": province,
+                "website": website,
+            }
+            for source, province, website in (
+                ("SACAA Cleaned", "Gauteng", "https://a.example"),
+                ("Reachout Database", "Western Cape", "https://b.example"),
+            )
+        ]
+    )
+    config = PipelineConfig(input_dir=Path("."), output_path=tmp_path / "refined.xlsx")
+
+    def _run(ledger_path: Path | None) -> list[dict[str, object]]:
+        result = aggregate_records(
+            replace(config, conflict_ledger_path=ledger_path),
+            frame,
+            intent_summaries=None,
+            notify_progress=lambda _event, _payload: None,
+        )
+        expect(result.conflict_total == 2, "Both conflicting fields should be counted")
+        return result.conflicts
+
+    in_memory = _run(None)
+    ledger_path = tmp_path / "conflicts.arrow"
+    _run(ledger_path)
+
+    streamed = query_conflicts(ledger_path).drop("sequence", "organization_slug").to_dicts()
+    expect(streamed == in_memory, "Streamed conflicts should match the in-memory list")
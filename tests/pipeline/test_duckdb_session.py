@@ -0,0 +1,62 @@
+"""Tests for the shared DuckDB session and its pooled cursors."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import pytest
+from tests.helpers.assertions import expect
+
+from hotpass.storage import DuckDBAdapter, DuckDBSession, DuckDBSettings
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame({"organization_name": ["Heli Ops", "Aero School"], "score": [1, 2]})
+
+
+def test_session_datasets_are_visible_to_concurrent_adapters() -> None:
+    session = DuckDBSession(DuckDBSettings(threads=2, memory_limit="256MB"))
+    session.register("refined", _frame())
+
+    def _count(_index: int) -> int:
+        with DuckDBAdapter(session=session) as adapter:
+            return int(adapter.execute("SELECT COUNT(*) AS n FROM refined")["n"][0])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        counts = list(executor.map(_count, range(8)))
+
+    expect(counts == [2] * 8, "Every adapter should see the registered run dataset")
+    with session.cursor() as cursor:
+        threads = cursor.execute("SELECT current_setting('threads')").fetchone()
+    expect(threads is not None and int(threads[0]) == 2, "Settings should apply to the session")
+    session.close()
+
+
+def test_adapter_registrations_do_not_leak_into_pooled_cursors() -> None:
+    session = DuckDBSession(max_idle_cursors=1)
+    with DuckDBAdapter(session=session) as adapter:
+        adapter.register("scratch", _frame())
+        expect(len(adapter.execute("SELECT * FROM scratch")) == 2, "Local data should be queryable")
+
+    with DuckDBAdapter(session=session) as adapter, pytest.raises(Exception, match="scratch"):
+        adapter.execute("SELECT * FROM scratch")
+
+    session.register("refined", _frame())
+    session.unregister("refined")
+    expect(session.datasets() == [], "Unregistered datasets should be forgotten")
+    session.close()
+
+
+def test_configure_resets_options_left_unset() -> None:
+    session = DuckDBSession()
+    with session.cursor() as cursor:
+        default = cursor.execute("SELECT current_setting('threads')").fetchone()
+
+    session.configure(DuckDBSettings(threads=1))
+    session.configure(DuckDBSettings())
+    with session.cursor() as cursor:
+        threads = cursor.execute("SELECT current_setting('threads')").fetchone()
+
+    expect(threads == default, "A later run without settings should get DuckDB's defaults")
+    session.close()
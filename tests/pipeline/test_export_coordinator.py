@@ -0,0 +1,69 @@
+"""Tests for the concurrent export coordinator and its atomic writes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+from tests.helpers.assertions import expect
+
+from hotpass.observability import get_pipeline_metrics
+from hotpass.storage import (
+    ExportBuffer,
+    ExportCoordinator,
+    write_csv,
+    write_json,
+    write_parquet,
+)
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {"organization_name": ["Aero School", "Heli Ops"], "data_quality_score": [0.9, 0.4]}
+    )
+
+
+def test_formats_share_one_buffer_and_report_sizes(tmp_path: Path) -> None:
+    coordinator = ExportCoordinator(ExportBuffer.from_frame(_frame()))
+    coordinator.add("parquet", tmp_path / "out.parquet", write_parquet)
+    coordinator.add("csv", tmp_path / "out.csv", write_csv)
+    coordinator.add("json", tmp_path / "out.json", write_json)
+
+    before = get_pipeline_metrics().frame_conversion_count
+    timings = coordinator.run()
+
+    expect(list(timings) == ["parquet", "csv", "json"], "Timings should follow scheduling order")
+    expect(
+        get_pipeline_metrics().frame_conversion_count == before + 1,
+        "CSV and JSON should share a single pandas view",
+    )
+    for timing in timings.values():
+        expect(timing.bytes_written == timing.path.stat().st_size, "Sizes should be reported")
+    expect(pl.read_parquet(tmp_path / "out.parquet").equals(_frame()), "Parquet should round-trip")
+    expect(
+        sorted(path.name for path in tmp_path.iterdir()) == ["out.csv", "out.json", "out.parquet"],
+        "No temporary files should remain",
+    )
+
+
+def test_failed_writer_keeps_the_previous_output(tmp_path: Path) -> None:
+    target = tmp_path / "out.csv"
+    target.write_text("previous", encoding="utf-8")
+
+    def _broken(_buffer: ExportBuffer, path: Path) -> None:
+        path.write_text("partial", encoding="utf-8")
+        raise OSError("disk full")
+
+    coordinator = ExportCoordinator(ExportBuffer.from_frame(_frame()), max_workers=2)
+    coordinator.add("csv", target, _broken)
+    coordinator.add("parquet", tmp_path / "out.parquet", write_parquet)
+
+    with pytest.raises(OSError, match="disk full"):
+        coordinator.run()
+
+    expect(target.read_text(encoding="utf-8") == "previous", "Failed writes must not replace")
+    expect(
+        sorted(path.name for path in tmp_path.iterdir()) == ["out.csv", "out.parquet"],
+        "The failed temporary file should be removed",
+    )
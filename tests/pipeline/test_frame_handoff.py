@@ -0,0 +1,101 @@
+"""Tests for the Polars-first hand-off between aggregation, validation and publish."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+from tests.helpers.assertions import expect
+
+from hotpass.observability import get_pipeline_metrics
+from hotpass.pipeline.aggregation import aggregate_records
+from hotpass.pipeline.config import PipelineConfig
+from hotpass.pipeline.export import publish_outputs
+from hotpass.pipeline.validation import validate_dataset
+
+
+def _noop(_event: str, _payload: dict[str, object]) -> None:
+    return None
+
+
+def _conversions() -> int:
+    return get_pipeline_metrics().frame_conversion_count
+
+
+def _combined() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "organization_name": name,
+                "organization_slug": slug,
+                "source_dataset": "SACAA Cleaned",
+                "source_record_id": f"sacaa:{index}",
+                "province": "Gauteng",
+            }
+            for index, (name, slug) in enumerate(
+                (("Heli Ops", "heli-ops"), ("Aero School", "aero-school"))
+            )
+        ]
+    )
+
+
+def test_refined_pandas_view_is_built_once_on_demand(tmp_path: Path) -> None:
+    config = PipelineConfig(input_dir=Path("."), output_path=tmp_path / "refined.parquet")
+    result = aggregate_records(config, _combined(), intent_summaries=None, notify_progress=_noop)
+
+    before = _conversions()
+    expect(result.record_count == 2, "Counting records should not need pandas")
+    expect(_conversions() == before, "No pandas view should be built until it is read")
+
+    view = result.refined_df
+    expect(result.refined_df is view, "The pandas view should be cached")
+    expect(_conversions() == before + 1, "Reading the view should convert exactly once")
+    expect(
+        view["organization_slug"].tolist() == result.refined_frame["organization_slug"].to_list(),
+        "The view should mirror the Polars frame",
+    )
+
+
+def test_polars_backend_hands_frames_through_to_publish(tmp_path: Path) -> None:
+    config = replace(
+        PipelineConfig(input_dir=Path("."), output_path=tmp_path / "refined.parquet"),
+        validation_backend="polars",
+    )
+    aggregation = aggregate_records(
+        config, _combined(), intent_summaries=None, notify_progress=_noop
+    )
+
+    before = _conversions()
+    validation = validate_dataset(
+        config, aggregation.refined, _noop, provenance=aggregation.provenance
+    )
+    expect(validation.schema_errors == [], "The unmaterialised provenance should not fail")
+    assert aggregation.provenance is not None
+    validation.attach_provenance(aggregation.provenance)
+    expect(_conversions() == before, "Polars validation should not copy to pandas")
+    expect(isinstance(validation.validated, pl.DataFrame), "Validation should keep the frame")
+
+    publish_outputs(
+        config,
+        validation.validated,
+        aggregation.refined,
+        validation.expectation_summary,
+        {},
+        0.0,
+        _noop,
+    )
+
+    expect(_conversions() == before + 1, "Publishing should build a single pandas view")
+    written = pl.read_parquet(config.output_path)
+    expect(
+        written.get_column("organization_slug").to_list() == ["aero-school", "heli-ops"],
+        "The output should be written in organisation order",
+    )
+    slugs = written.get_column("organization_slug").to_list()
+    expect(
+        written.get_column("selection_provenance").to_list()
+        == aggregation.provenance.json_for(slugs),
+        "The published output should carry the JSON column built from the table",
+    )
@@ -0,0 +1,154 @@
+"""Tests for incremental refinement checkpoints."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from tests.helpers.assertions import expect
+
+from hotpass.pipeline.aggregation import AggregationResult, aggregate_records
+from hotpass.pipeline.config import PipelineConfig
+from hotpass.pipeline.incremental import IncrementalCheckpoint
+from hotpass.pipeline.ingestion import ingest_sources
+
+SAVED_AT = datetime(2025, 3, 1, 6, 0, tzinfo=UTC)
+
+
+def _noop(_event: str, _payload: dict[str, object]) -> None:
+    return None
+
+
+def _config(tmp_path: Path, input_dir: Path | None = None, **overrides: object) -> PipelineConfig:
+    config = PipelineConfig(
+        input_dir=input_dir or tmp_path,
+        output_path=tmp_path / "refined.parquet",
+        incremental=True,
+        incremental_state_dir=tmp_path / "incremental",
+    )
+    return replace(config, **overrides)
+
+
+def _combined(count: int = 12) -> pd.DataFrame:
+    rows = []
+    for index in range(count):
+        group = index % 5
+        name = None if group == 0 else f"School {group}"
+        rows.append(
+            {
+                "organization_name": name,
+                "organization_slug": None if name is None else f"school-{group}",
+                "source_dataset": ("SACAA Cleaned", "Contact Database")[index % 2],
+                "source_record_id": f"record:{index}",
+                "province": ("Gauteng", "Western Cape", None)[index % 3],
+                "website": f"https://school{index % 3}.example",
+                "contact_emails": [f"ops{index % 4}@school.example"],
+                "contact_phones": [],
+                "contact_names": ["Jane Doe"] if index % 2 else [],
+                "contact_roles": [],
+                "last_interaction_date": "2025-01-0" + str(1 + index % 9),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _aggregate(
+    config: PipelineConfig, combined: pd.DataFrame, **kwargs: object
+) -> AggregationResult:
+    return aggregate_records(config, combined, None, _noop, **kwargs)
+
+
+@pytest.mark.parametrize("engine", ["polars", "python"])
+def test_incremental_aggregation_matches_a_full_run(tmp_path: Path, engine: str) -> None:
+    config = _config(tmp_path, aggregation_engine=engine)
+    checkpoint = IncrementalCheckpoint.load(config)
+    _aggregate(config, _combined(), checkpoint=checkpoint)
+    checkpoint.save(SAVED_AT)
+
+    changed = _combined()
+    changed.loc[3, "website"] = "https://changed.example"
+    changed = pd.concat(
+        [changed, _combined(1).assign(source_record_id="record:new")], ignore_index=True
+    )
+
+    full = _aggregate(config, changed)
+    checkpoint = IncrementalCheckpoint.load(config)
+    incremental = _aggregate(config, changed, checkpoint=checkpoint)
+
+    expect(checkpoint.resumed, "The saved checkpoint should be reused")
+    expect(
+        incremental.metrics["incremental_groups_aggregated"] == 2,
+        "Only the edited group and the group with a new row should be aggregated",
+    )
+    expect(incremental.metrics["incremental_groups_reused"] == 3, "Other groups are reused")
+    expect(
+        incremental.refined_frame.equals(full.refined_frame),
+        "The merged records should match a full run",
+    )
+    expect(incremental.conflicts == full.conflicts, "Conflicts should match a full run")
+    expect(
+        incremental.provenance is not None
+        and full.provenance is not None
+        and incremental.provenance.frame.equals(full.provenance.frame),
+        "Provenance should match a full run",
+    )
+
+
+def test_checkpoint_is_ignored_before_since_or_after_config_changes(tmp_path: Path) -> None:
+    config = _config(tmp_path)
+    checkpoint = IncrementalCheckpoint.load(config)
+    _aggregate(config, _combined(), checkpoint=checkpoint)
+    checkpoint.save(SAVED_AT)
+
+    expect(IncrementalCheckpoint.load(config).resumed, "A fresh checkpoint should be used")
+    expect(
+        IncrementalCheckpoint.load(replace(config, since=SAVED_AT - timedelta(days=1))).resumed,
+        "A checkpoint saved after 'since' should be used",
+    )
+    later = replace(config, since=SAVED_AT + timedelta(hours=1))
+    expect(
+        not IncrementalCheckpoint.load(later).resumed,
+        "A checkpoint saved before 'since' should be ignored",
+    )
+    expect(
+        not IncrementalCheckpoint.load(replace(config, country_code="GB")).resumed,
+        "A checkpoint from another configuration should be ignored",
+    )
+
+    rerun = _aggregate(config, _combined(), checkpoint=IncrementalCheckpoint.load(config))
+    expect(rerun.metrics["incremental_groups_aggregated"] == 0, "Nothing changed")
+
+
+def test_unchanged_workbooks_are_restored_from_the_checkpoint(
+    tmp_path: Path, sample_data_dir: Path
+) -> None:
+    config = _config(tmp_path, input_dir=sample_data_dir)
+    full, _, _ = ingest_sources(config)
+
+    checkpoint = IncrementalCheckpoint.load(config)
+    ingest_sources(config, checkpoint=checkpoint)
+    checkpoint.save(SAVED_AT)
+
+    checkpoint = IncrementalCheckpoint.load(config)
+    restored, timings, _ = ingest_sources(config, checkpoint=checkpoint)
+    expect(checkpoint.sources_reused == 3, "Every unchanged workbook should be restored")
+    expect(restored.equals(full), "Restored sources should match freshly loaded ones")
+    expect(
+        set(timings) == {"Reachout Database", "Contact Database", "SACAA Cleaned"},
+        "Restored sources should still report their timings",
+    )
+    checkpoint.save(SAVED_AT)
+
+    sacaa = sample_data_dir / "SACAA Flight Schools - Refined copy__CLEANED.xlsx"
+    frame = pd.read_excel(sacaa, sheet_name="Cleaned")
+    frame.loc[0, "Status"] = "Suspended"
+    with pd.ExcelWriter(sacaa) as writer:
+        frame.to_excel(writer, sheet_name="Cleaned", index=False)
+
+    checkpoint = IncrementalCheckpoint.load(config)
+    reloaded, _, _ = ingest_sources(config, checkpoint=checkpoint)
+    expect(checkpoint.sources_reused == 2, "Only the edited workbook should be read again")
+    expect(reloaded.equals(ingest_sources(config)[0]), "The edit should be picked up")
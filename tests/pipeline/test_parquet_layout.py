@@ -0,0 +1,108 @@
+"""Tests for partitioned, statistics-rich Parquet layouts and pruned reads."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+from tests.helpers.assertions import expect
+
+from hotpass.storage import (
+    ExportBuffer,
+    ParquetLayout,
+    PolarsDataset,
+    write_atomic,
+    write_parquet,
+    write_parquet_layout,
+)
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "organization_slug": [f"org-{index:03d}" for index in reversed(range(30))],
+            "province": ["Gauteng", "Western Cape", None] * 10,
+            "data_quality_score": [index / 30 for index in range(30)],
+        }
+    )
+
+
+def test_default_layout_writes_one_file_with_page_indexes(tmp_path: Path) -> None:
+    path = tmp_path / "refined.parquet"
+    write_parquet_layout(_frame().to_arrow(), path, ParquetLayout(sort_by=("organization_slug",)))
+
+    metadata = pq.ParquetFile(path).metadata
+    column = metadata.row_group(0).column(0)
+    expect(column.compression == "ZSTD", "zstd should be the default codec")
+    expect(column.has_column_index, "Page indexes should be written")
+    expect(column.statistics.min == "org-000", "Rows should be sorted by the sort key")
+    expect(len(metadata.row_group(0).sorting_columns) == 1, "Sort order should be recorded")
+
+
+def test_partitioned_layout_is_pruned_when_read(tmp_path: Path) -> None:
+    path = tmp_path / "refined.parquet"
+    layout = ParquetLayout(partition_by=("province",), row_group_size=4)
+    write_parquet_layout(_frame().to_arrow(), path, layout)
+
+    expect(
+        sorted(entry.name for entry in path.iterdir())
+        == ["province=Gauteng", "province=Western%20Cape", "province=__HIVE_DEFAULT_PARTITION__"],
+        "Each province should get its own hive directory",
+    )
+    dataset = PolarsDataset.read_parquet(
+        path,
+        filters=(pl.col("province") == "Western Cape") & (pl.col("organization_slug") == "org-028"),
+        columns=["organization_slug", "province"],
+    )
+    expect(
+        dataset.frame.to_dicts() == [{"organization_slug": "org-028", "province": "Western Cape"}],
+        "Filtered reads should return only the matching rows",
+    )
+    nulls = PolarsDataset.read_parquet(path, filters=pl.col("province").is_null())
+    expect(nulls.frame.height == 10, "Null partition values should round-trip as nulls")
+
+
+def test_partitioned_output_replaces_previous_directory_atomically(tmp_path: Path) -> None:
+    path = tmp_path / "refined.parquet"
+    path.write_bytes(b"stale single-file snapshot")
+    layout = ParquetLayout(partition_by=("province",))
+    buffer = ExportBuffer.from_frame(_frame())
+
+    size = write_atomic(path, lambda target: write_parquet(buffer, target, layout))
+
+    expect(path.is_dir(), "The partitioned dataset should replace the old file")
+    expect(size == sum(f.stat().st_size for f in path.rglob("*.parquet")), "Size should add up")
+    expect([entry.name for entry in tmp_path.iterdir()] == ["refined.parquet"], "No leftovers")
+
+
+def test_unknown_partition_columns_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="priority_band"):
+        write_parquet_layout(
+            _frame().to_arrow(), tmp_path / "out", ParquetLayout(partition_by=("priority_band",))
+        )
+
+
+def test_bloom_filter_layout_writes_filters_for_dictionary_columns(tmp_path: Path) -> None:
+    duckdb = pytest.importorskip("duckdb")
+    path = tmp_path / "refined.parquet"
+    layout = ParquetLayout(sort_by=("organization_slug",), bloom_filters=True)
+    write_parquet_layout(_frame().to_arrow(), path, layout)
+
+    rows = duckdb.sql(
+        "SELECT path_in_schema, bloom_filter_offset, bloom_filter_length "
+        "FROM parquet_metadata(?)",
+        params=[str(path)],
+    ).fetchall()
+    filters = {column: (offset, length) for column, offset, length in rows}
+    offset, length = filters["organization_slug"]
+    expect(
+        offset is not None and length is not None and length > 0,
+        "A bloom filter should be written for the unique slug column",
+    )
+    expect(
+        pl.read_parquet(path)["organization_slug"].to_list()
+        == sorted(_frame()["organization_slug"].to_list()),
+        "Rows should still be sorted by the sort key",
+    )
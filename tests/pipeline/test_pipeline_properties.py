@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import string
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -11,9 +10,12 @@ from typing import Any, cast
 import hotpass.pipeline.aggregation as aggregation_module
 import pandas as pd
 import pytest
-from hotpass.pipeline.aggregation import YEAR_FIRST_PATTERN, _aggregate_group, _latest_iso_date
+from hotpass.pipeline.aggregation import _aggregate_group
 from hotpass.pipeline.base import execute_pipeline
 from hotpass.pipeline.config import PipelineConfig, PipelineRuntimeHooks
+from hotpass.pipeline.survivorship import YEAR_FIRST_PATTERN
+from hotpass.pipeline.survivorship import latest_iso_date as _latest_iso_date
+from hotpass.pipeline.survivorship import parse_datetime_values, parse_last_interaction
 
 from tests.helpers.hypothesis import HealthCheck, given, settings, st
 
@@ -32,6 +34,7 @@ _NON_DETERMINISTIC_METRICS = {
     "polars_sort_speedup",
     "polars_transform_seconds",
     "polars_write_seconds",
+    "provenance_path",
 }
 
 
@@ -112,6 +115,33 @@ def test_latest_iso_date_handles_varied_formats(
     expect(result == expected, "ISO coercion should match Pandas reference implementation")
 
 
+@settings(max_examples=15, deadline=None)
+@given(
+    st.lists(
+        st.one_of(
+            st.none(),
+            st.sampled_from(["", "  ", "2024-02-03", "03/02/2024", "02/25/2024", "13-01-2024"]),
+            st.sampled_from(["2024-02-03T10:15:00+02:00", "3 Feb 2024", "not a date", "NaT"]),
+            st.datetimes(
+                min_value=datetime(2005, 1, 1),
+                max_value=datetime(2040, 12, 31),
+            ).map(lambda dt: dt.strftime("%d/%m/%Y")),
+        ),
+        max_size=12,
+    )
+)
+def test_parse_datetime_values_matches_scalar_parser(values: list[Any]) -> None:
+    expected = [
+        timestamp.value if timestamp is not None else None
+        for timestamp in map(parse_last_interaction, values)
+    ]
+
+    expect(
+        parse_datetime_values(values) == expected,
+        "Column parsing should match the scalar last-interaction parser",
+    )
+
+
 @settings(max_examples=12, deadline=None)
 @given(
     st.lists(
@@ -196,14 +226,8 @@ def test_aggregate_group_handles_missing_optional_columns(
 
     for column in SSOT_COLUMNS:
         expect(column in result, f"expected column '{column}' in aggregation output")
-    provenance_raw = result.get("selection_provenance")
-    expect(
-        isinstance(provenance_raw, str),
-        "selection provenance must serialise to JSON text",
-    )
-    assert isinstance(provenance_raw, str)
-    parsed = json.loads(provenance_raw)
-    expect(isinstance(parsed, dict), "selection provenance payload must be a JSON object")
+    provenance = result.get("_provenance")
+    expect(isinstance(provenance, dict), "selection provenance must be a document per field")
 
 
 class _DeterministicClock:
@@ -0,0 +1,131 @@
+"""Tests for the columnar selection provenance table."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import polars as pl
+from tests.helpers.assertions import expect
+
+from hotpass.pipeline.aggregation import aggregate_records
+from hotpass.pipeline.config import PipelineConfig
+from hotpass.pipeline.provenance import ProvenanceTable
+
+_DOCUMENTS: list[tuple[str | None, dict[str, dict[str, Any]]]] = [
+    (
+        "aero-school",
+        {
+            "province": {
+                "field": "province",
+                "value": "Gauteng",
+                "source_dataset": "SACAA Cleaned",
+                "source_record_id": "sacaa:1",
+                "source_priority": 3,
+                "quality_score": 4,
+                "last_interaction_date": "2025-04-01",
+                "contributors": [
+                    {
+                        "source_dataset": "Reachout Database",
+                        "source_record_id": None,
+                        "value": "Western Cape",
+                    }
+                ],
+            },
+            "website": {
+                "field": "website",
+                "value": "https://aero.example",
+                "source_dataset": "Contact Database",
+                "source_record_id": None,
+                "source_priority": 1,
+                "quality_score": 2,
+                "last_interaction_date": None,
+            },
+        },
+    ),
+    (None, {}),
+]
+
+
+def test_table_rebuilds_legacy_json_documents() -> None:
+    table = ProvenanceTable.from_documents(_DOCUMENTS)
+
+    expect(table.frame.height == 3, "One row per selection and contributor")
+    refined = pl.DataFrame(
+        {"organization_slug": [None, "aero-school"], "selection_provenance": [None, None]}
+    )
+    legacy = table.attach_json(refined)["selection_provenance"].to_list()
+    expect(
+        [json.loads(value) for value in legacy] == [{}, _DOCUMENTS[0][1]],
+        "JSON view should match the documents in row order",
+    )
+    expect(
+        legacy[1] == json.dumps(_DOCUMENTS[0][1], sort_keys=True, separators=(",", ":")),
+        "JSON view should keep sorted keys",
+    )
+    selection = table.selection("aero-school", "website")
+    expect(
+        selection is not None and selection["source_dataset"] == "Contact Database",
+        "Accessor should expose the selected source",
+    )
+
+
+def test_table_round_trips_through_parquet(tmp_path: Path) -> None:
+    path = tmp_path / "refined.provenance.parquet"
+    ProvenanceTable.from_documents(_DOCUMENTS).write_parquet(path)
+
+    restored = ProvenanceTable.read_parquet(path)
+
+    expect(restored.for_slug("aero-school") == _DOCUMENTS[0][1], "Documents should survive I/O")
+
+
+def test_aggregation_emits_provenance_alongside_ssot() -> None:
+    frame = pd.DataFrame(
+        [
+            {
+                "organization_name": "Aero School",
+                "organization_slug": "aero-school",
+                "source_dataset": "SACAA Cleaned",
+                "province": "Gauteng",
+            },
+            {
+                "organization_name": "Aero School",
+                "organization_slug": "aero-school",
+                "source_dataset": "Reachout Database",
+                "province": "Western Cape",
+            },
+        ]
+    )
+
+    result = aggregate_records(
+        PipelineConfig(input_dir=Path("."), output_path=Path("refined.xlsx")),
+        frame,
+        intent_summaries=None,
+        notify_progress=lambda _event, _payload: None,
+    )
+
+    assert result.provenance is not None
+    assert result.refined_frame is not None
+    expect(
+        result.refined_frame.get_column("selection_provenance").null_count() == 1,
+        "Aggregation should leave the JSON column unmaterialised",
+    )
+    legacy = json.loads(result.provenance.json_for(["aero-school"])[0])
+    expect(result.provenance.for_slug("aero-school") == legacy, "Table should back the column")
+    expect(
+        legacy["province"]["contributors"][0]["value"] == "Western Cape",
+        "Contributors should be recorded",
+    )
+
+
+def test_json_for_matches_attach_json() -> None:
+    table = ProvenanceTable.from_documents(_DOCUMENTS)
+    slugs = ["aero-school", None, "unknown"]
+    refined = pl.DataFrame({"organization_slug": slugs, "selection_provenance": [None] * 3})
+
+    expect(
+        table.json_for(slugs) == table.attach_json(refined)["selection_provenance"].to_list(),
+        "The pandas and Polars JSON views should agree",
+    )
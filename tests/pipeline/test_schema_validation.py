@@ -0,0 +1,136 @@
+"""Tests for the cached SSOT schema and single-pass quarantine in validation."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+from tests.helpers.assertions import expect
+
+import hotpass.pipeline as pipeline_module
+from hotpass.pipeline.aggregation import aggregate_records
+from hotpass.pipeline.config import PipelineConfig, PipelineRuntimeHooks
+from hotpass.pipeline.schema_validation import get_ssot_schema
+from hotpass.pipeline.validation import validate_dataset
+
+_CONFIG = PipelineConfig(input_dir=Path("."), output_path=Path("refined.xlsx"))
+
+
+def _refined() -> pd.DataFrame:
+    frame = pd.DataFrame(
+        [
+            {
+                "organization_name": name,
+                "organization_slug": slug,
+                "source_dataset": "SACAA Cleaned",
+                "source_record_id": f"sacaa:{index}",
+                "province": "Gauteng",
+            }
+            for index, (name, slug) in enumerate(
+                (("Aero School", "aero-school"), ("Heli Ops", "heli-ops"))
+            )
+        ]
+    )
+    result = aggregate_records(
+        _CONFIG, frame, intent_summaries=None, notify_progress=lambda _event, _payload: None
+    )
+    assert result.provenance is not None
+    refined = result.refined_df.astype({"organization_name": object})
+    refined["selection_provenance"] = result.provenance.json_for(refined["organization_slug"])
+    refined.loc[refined["organization_slug"] == "heli-ops", "organization_name"] = None
+    return refined
+
+
+def _validate(refined: pd.DataFrame, backend: str) -> Any:
+    return validate_dataset(
+        replace(_CONFIG, validation_backend=backend),
+        refined,
+        lambda _event, _payload: None,
+    )
+
+
+def _records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    values = frame.reset_index(drop=True).astype(object)
+    return values.where(values.notna(), None).to_dict("records")
+
+
+def test_schema_is_compiled_once_until_the_builder_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    expect(get_ssot_schema() is get_ssot_schema(), "Schema should be cached")
+    expect(
+        get_ssot_schema("polars") is get_ssot_schema("polars"),
+        "Polars schema should be cached",
+    )
+
+    sentinel = object()
+    monkeypatch.setattr(pipeline_module, "build_ssot_schema", lambda: sentinel)
+
+    expect(get_ssot_schema() is sentinel, "A patched builder should replace the cache entry")
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_invalid_rows_are_quarantined_with_one_validation(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    refined = _refined()
+    schema = get_ssot_schema(backend)
+    calls: list[bool] = []
+    original = schema.validate
+
+    def _counting_validate(*args: Any, **kwargs: Any) -> Any:
+        calls.append(True)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(schema, "validate", _counting_validate)
+
+    result = _validate(refined, backend)
+
+    expect(len(calls) == 1, "Valid rows should not be validated a second time")
+    expect(result.validated_df["organization_slug"].tolist() == ["aero-school"], "Keep valid")
+    expect(
+        any(error.startswith("organization_name: ") for error in result.schema_errors),
+        "Failure cases should be reported per column",
+    )
+    expect(
+        (result.validated_frame is not None) == (backend == "polars"),
+        "Only the Polars backend should expose the validated frame",
+    )
+
+
+def test_backends_agree_on_validated_rows() -> None:
+    refined = _refined()
+
+    pandas_result = _validate(refined, "pandas")
+    polars_result = _validate(refined, "polars")
+
+    expect(
+        _records(polars_result.validated_df) == _records(pandas_result.validated_df),
+        "Both backends should keep the same values",
+    )
+    expect(
+        polars_result.quality_distribution == pandas_result.quality_distribution,
+        "Quality distribution should not depend on the backend",
+    )
+
+
+@pytest.mark.parametrize(("draw", "engine"), [(0.2, "ge"), (0.8, "native")])
+def test_audit_sampling_uses_the_runtime_random_hook(draw: float, engine: str) -> None:
+    config = replace(
+        _CONFIG, ge_audit_rate=0.5, runtime_hooks=PipelineRuntimeHooks(random_fn=lambda: draw)
+    )
+
+    result = validate_dataset(config, _refined(), lambda _event, _payload: None)
+
+    expect(
+        result.metrics["expectations_engine"] == engine,
+        "Runs drawn below ge_audit_rate should be audited with Great Expectations",
+    )
+
+
+def test_unknown_validation_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="validation_backend"):
+        _validate(_refined(), "spark")
@@ -125,6 +125,8 @@ def test_execute_pipeline_invokes_modular_stages_in_order(
         config: PipelineConfig,
         refined_df: pd.DataFrame,
         notify_progress: Any,
+        refined_frame: Any = None,
+        provenance: Any = None,
     ):
         stage_calls.append("validate")
         expect(
@@ -150,6 +152,7 @@ def test_execute_pipeline_invokes_modular_stages_in_order(
         notify_progress: Any,
         *,
         intent_result: Any = None,
+        provenance: Any = None,
     ):
         stage_calls.append("export")
         expect(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import tarfile
 import zipfile
 from datetime import UTC, datetime, tzinfo
 from pathlib import Path
@@ -73,3 +75,82 @@ def test_create_refined_archive_defaults_to_utc(
         archive_path.name == f"refined-data-20250102T154500Z-{digest}.zip",
         f"Archive name should match expected format with digest {digest}",
     )
+
+
+def test_create_refined_archive_writes_manifest_in_one_pass(tmp_path: Path) -> None:
+    excel_path = tmp_path / "refined_data.xlsx"
+    pd.DataFrame({"organization_name": ["Aero School"]}).to_excel(excel_path, index=False)
+    version_path = tmp_path / "version.json"
+    version_path.write_text('{"version": "1.0.0"}', encoding="utf-8")
+
+    archive_path = create_refined_archive(
+        excel_path,
+        tmp_path / "dist",
+        include_version_metadata=True,
+        version_metadata_path=version_path,
+    )
+
+    with zipfile.ZipFile(archive_path) as zf:
+        manifest = json.loads(zf.read(artifacts.MANIFEST_NAME))
+        packaged = zf.read(excel_path.name)
+
+    expect(packaged == excel_path.read_bytes(), "The workbook should be packaged unchanged")
+    expect(
+        manifest["files"]
+        == [
+            {
+                "name": excel_path.name,
+                "size": excel_path.stat().st_size,
+                "sha256": hashlib.sha256(excel_path.read_bytes()).hexdigest(),
+            },
+            {
+                "name": "version.json",
+                "size": version_path.stat().st_size,
+                "sha256": hashlib.sha256(version_path.read_bytes()).hexdigest(),
+            },
+        ],
+        "The manifest should list the full hash of every packaged file",
+    )
+    expect(
+        [path.name for path in (tmp_path / "dist").iterdir()] == [archive_path.name],
+        "No temporary files should be left behind",
+    )
+
+
+def test_create_refined_archive_supports_tar_zst(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    excel_path = tmp_path / "refined_data.xlsx"
+    pd.DataFrame({"organization_name": ["Heli Ops"]}).to_excel(excel_path, index=False)
+
+    archive_path = create_refined_archive(
+        excel_path, tmp_path, archive_format="tar.zst", compression_threads=2
+    )
+    digest = hashlib.sha256(excel_path.read_bytes()).hexdigest()
+
+    expect(archive_path.name.endswith(f"-{digest[:12]}.tar.zst"), "Name should carry the digest")
+    with (
+        archive_path.open("rb") as handle,
+        zstandard.ZstdDecompressor().stream_reader(handle) as reader,
+        tarfile.open(fileobj=reader, mode="r|") as tar,
+    ):
+        members = {}
+        for member in tar:
+            extracted = tar.extractfile(member)
+            members[member.name] = extracted.read() if extracted is not None else b""
+
+    expect(
+        members[excel_path.name] == excel_path.read_bytes(),
+        "The workbook should round-trip through the tar.zst archive",
+    )
+    expect(
+        json.loads(members[artifacts.MANIFEST_NAME])["files"][0]["sha256"] == digest,
+        "The manifest should record the workbook hash",
+    )
+
+
+def test_create_refined_archive_rejects_unknown_format(tmp_path: Path) -> None:
+    excel_path = tmp_path / "refined_data.xlsx"
+    excel_path.write_bytes(b"data")
+
+    with pytest.raises(ValueError, match="Unsupported archive format"):
+        create_refined_archive(excel_path, tmp_path, archive_format="rar")
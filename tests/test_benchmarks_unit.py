@@ -5,6 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+import pandas as pd
+import pytest
+
 from hotpass import benchmarks
 
 
@@ -28,6 +31,7 @@ def test_run_benchmark_averages_metrics(monkeypatch, tmp_path: Path) -> None:
     ]
 
     def fake_run_pipeline(config):  # noqa: ANN001
+        expect(config.benchmark_sort_comparison, "Benchmarks should opt into sort comparison")
         data = samples.pop(0)
         return SimpleNamespace(performance_metrics=data)
 
@@ -69,3 +73,25 @@ def test_benchmark_fields_returns_copy() -> None:
         ("Custom", "custom") not in benchmarks.benchmark_fields(),
         "Returned list should be a copy",
     )
+
+
+def test_run_sort_benchmark_compares_engines() -> None:
+    frame = pd.DataFrame({"organization_name": ["Charlie", "alpha", "Bravo", None]})
+
+    result = benchmarks.run_sort_benchmark(frame, runs=2)
+
+    expect(result.runs == 2, "Each run should be sampled")
+    for _, key in benchmarks.sort_benchmark_fields():
+        expect(result.metrics[key] >= 0.0, f"{key} should be recorded")
+
+
+def test_run_excel_benchmark_compares_writers(tmp_path: Path) -> None:
+    pytest.importorskip("xlsxwriter")
+    frame = pd.DataFrame({"organization_name": ["Aero", "Heli"], "data_quality_score": [0.9, 0.3]})
+
+    result = benchmarks.run_excel_benchmark(frame, tmp_path, runs=2)
+
+    expect(result.runs == 2, "Each run should be sampled")
+    for _, key in benchmarks.excel_benchmark_fields():
+        expect(result.metrics[key] >= 0.0, f"{key} should be recorded")
+    expect((tmp_path / "xlsxwriter.xlsx").exists(), "The streamed workbook should be written")
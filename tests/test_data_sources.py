@@ -5,28 +5,86 @@ import pytest
 
 pytest.importorskip("frictionless")
 
-from hotpass.data_sources import ExcelReadOptions, load_reachout_database  # noqa: E402
+from hotpass.data_sources import (  # noqa: E402
+    ExcelReadOptions,
+    iter_excel_batches,
+    load_reachout_database,
+)
 
 from tests.helpers.assertions import expect
 
 
-def test_load_reachout_database_chunk_size_applies(
+def test_load_reachout_database_chunk_size_streams_each_sheet_once(
     sample_data_dir: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    captured_rows: list[int | None] = []
-    original = pd.read_excel
+    import hotpass.data_sources as data_sources
 
-    def _spy_read_excel(*args, **kwargs):
-        captured_rows.append(kwargs.get("nrows"))
-        return original(*args, **kwargs)
+    opened: list[bool] = []
+    original_load_workbook = data_sources.load_workbook
 
-    monkeypatch.setattr(pd, "read_excel", _spy_read_excel)
+    def _spy_load_workbook(*args, **kwargs):
+        opened.append(bool(kwargs.get("read_only")))
+        return original_load_workbook(*args, **kwargs)
+
+    def _fail_read_excel(*args, **kwargs):
+        raise AssertionError("chunked reads should not call pd.read_excel")
+
+    monkeypatch.setattr(data_sources, "load_workbook", _spy_load_workbook)
+    monkeypatch.setattr(pd, "read_excel", _fail_read_excel)
 
     df = load_reachout_database(sample_data_dir, "ZA", ExcelReadOptions(chunk_size=1))
 
     expect(len(df) == 2, "DataFrame should have 2 rows")
-    # Both organisation and contact sheets should be streamed.
-    expect(captured_rows.count(1) >= 2, "Chunk size should be applied to both sheets")
+    # Organisation and contact sheets are each parsed in a single read-only pass.
+    expect(opened == [True, True], "Each sheet should be streamed exactly once")
+
+
+def test_iter_excel_batches_yields_fixed_size_batches(sample_data_dir: Path) -> None:
+    workbook = sample_data_dir / "Reachout Database.xlsx"
+    expected = pd.read_excel(workbook, sheet_name="Contact Info")
+
+    batches = list(iter_excel_batches(workbook, "Contact Info", batch_size=2))
+
+    expect([len(batch) for batch in batches] == [2, 1], "Batches should hold at most 2 rows")
+    expect(
+        all(list(batch.columns) == list(expected.columns) for batch in batches),
+        "Every batch should carry the sheet header",
+    )
+    combined = pd.concat(batches, ignore_index=True)
+    pd.testing.assert_frame_equal(combined, expected)
+
+
+def test_iter_excel_batches_adds_columns_for_wider_later_rows(tmp_path: Path) -> None:
+    from openpyxl import Workbook
+
+    from hotpass.data_sources import _read_excel
+
+    workbook_path = tmp_path / "Ragged.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    for row in (["name", "city"], ["a", "x"], ["b", "y"], ["c", "z", "extra"]):
+        sheet.append(row)
+    workbook.save(workbook_path)
+    expected = pd.read_excel(workbook_path, sheet_name="Sheet1")
+
+    batches = list(iter_excel_batches(workbook_path, "Sheet1", batch_size=2))
+
+    expect(list(batches[-1].columns) == list(expected.columns), "Wider rows add named columns")
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), expected)
+    pd.testing.assert_frame_equal(
+        _read_excel(workbook_path, "Sheet1", ExcelReadOptions(chunk_size=2)), expected
+    )
+
+
+def test_chunked_read_matches_read_excel(sample_data_dir: Path) -> None:
+    from hotpass.data_sources import _read_excel
+
+    workbook = sample_data_dir / "Contact Database.xlsx"
+    for sheet in pd.ExcelFile(workbook).sheet_names:
+        expected = pd.read_excel(workbook, sheet_name=sheet)
+        actual = _read_excel(workbook, sheet, ExcelReadOptions(chunk_size=1))
+        pd.testing.assert_frame_equal(actual, expected)
 
 
 def test_excel_stage_to_parquet_invoked(
@@ -35,11 +93,13 @@ def test_excel_stage_to_parquet_invoked(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     calls: list[Path] = []
+    original_to_parquet = pd.DataFrame.to_parquet
 
-    def _fake_to_parquet(self: pd.DataFrame, path: Path, *, index: bool = False) -> None:
+    def _spy_to_parquet(self: pd.DataFrame, path: Path, *, index: bool = False) -> None:
         calls.append(Path(path))
+        original_to_parquet(self, path, index=index)
 
-    monkeypatch.setattr(pd.DataFrame, "to_parquet", _fake_to_parquet, raising=False)
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", _spy_to_parquet, raising=False)
 
     load_reachout_database(
         sample_data_dir,
@@ -48,3 +108,97 @@ def test_excel_stage_to_parquet_invoked(
     )
 
     expect(bool(calls), "Expected staging to parquet when enabled")
+
+
+def test_excel_stage_cache_reads_parquet_on_hit(
+    sample_data_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    options = ExcelReadOptions(stage_dir=tmp_path, stage_to_parquet=True)
+    expected = load_reachout_database(sample_data_dir, "ZA", options)
+    staged = sorted(path.name for path in tmp_path.glob("*.parquet"))
+    expect(len(staged) == 2, "Each sheet should be staged once")
+
+    def _fail_read_excel(*args, **kwargs):
+        raise AssertionError("cache hits should not open the workbook")
+
+    monkeypatch.setattr(pd, "read_excel", _fail_read_excel)
+    actual = load_reachout_database(sample_data_dir, "ZA", options)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    expect(
+        sorted(path.name for path in tmp_path.glob("*.parquet")) == staged,
+        "Cache hits should not write new entries",
+    )
+
+
+def test_excel_stage_cache_evicts_stale_entries(sample_data_dir: Path, tmp_path: Path) -> None:
+    from hotpass.data_sources import _read_excel
+
+    workbook = tmp_path / "Book.xlsx"
+    pd.DataFrame({"name": ["a", "b"]}).to_excel(workbook, index=False)
+    options = ExcelReadOptions(stage_dir=tmp_path / "stage", stage_to_parquet=True)
+    _read_excel(workbook, "Sheet1", options)
+    first = list((tmp_path / "stage").glob("*.parquet"))
+
+    pd.DataFrame({"name": ["a", "b", "c"]}).to_excel(workbook, index=False)
+    refreshed = _read_excel(workbook, "Sheet1", options)
+    second = list((tmp_path / "stage").glob("*.parquet"))
+
+    expect(refreshed["name"].tolist() == ["a", "b", "c"], "Changed workbooks should be re-read")
+    expect(len(first) == 1 and len(second) == 1, "Only one entry per sheet should remain")
+    expect(first != second, "The stale entry should be replaced under a new key")
+
+
+@pytest.mark.parametrize(
+    "loader_name",
+    ["load_reachout_database", "load_contact_database", "load_sacaa_cleaned"],
+)
+def test_columnar_loaders_match_row_loaders(sample_data_dir: Path, loader_name: str) -> None:
+    import hotpass.data_sources as data_sources
+
+    loader = getattr(data_sources, loader_name)
+    expected = loader(sample_data_dir, "ZA", None)
+    actual = loader(sample_data_dir, "ZA", ExcelReadOptions(columnar=True))
+
+    pd.testing.assert_frame_equal(actual, expected)
+    expect(
+        list(actual.dtypes) == list(expected.dtypes),
+        "Columnar loader should preserve the row loader dtypes",
+    )
+
+
+def test_load_sources_parallel_matches_sequential_loaders(sample_data_dir: Path) -> None:
+    import hotpass.data_sources as data_sources
+
+    loaded = data_sources.load_sources_parallel(
+        sample_data_dir, "ZA", ExcelReadOptions(max_workers=2)
+    )
+
+    expect(
+        list(loaded) == ["Reachout Database", "Contact Database", "SACAA Cleaned"],
+        "Sources should keep the sequential loader order",
+    )
+    for label, loader in (
+        ("Reachout Database", data_sources.load_reachout_database),
+        ("Contact Database", data_sources.load_contact_database),
+        ("SACAA Cleaned", data_sources.load_sacaa_cleaned),
+    ):
+        pd.testing.assert_frame_equal(loaded[label], loader(sample_data_dir, "ZA", None))
+        expect(loaded[label].attrs["load_seconds"] > 0, f"{label} should record load time")
+
+
+def test_load_sources_parallel_skips_missing_and_reraises_contract_errors(
+    tmp_path: Path,
+) -> None:
+    from hotpass.data_sources import load_sources_parallel
+    from hotpass.error_handling import DataContractError
+
+    sacaa = tmp_path / "SACAA Flight Schools - Refined copy__CLEANED.xlsx"
+    pd.DataFrame({"Name of Organisation": [None], "Province": ["Gauteng"]}).to_excel(
+        sacaa, sheet_name="Cleaned", index=False
+    )
+
+    with pytest.raises(DataContractError):
+        load_sources_parallel(tmp_path, "ZA", ExcelReadOptions(max_workers=2))
@@ -0,0 +1,82 @@
+"""Tests for the shared Great Expectations runtime."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("great_expectations")
+
+from hotpass.expectation_runtime import ExpectationRuntime, get_expectation_runtime  # noqa: E402
+from hotpass.validation import validate_with_expectations  # noqa: E402
+
+
+def _write_suite(path: Path, column: str) -> None:
+    payload = {
+        "expectation_suite_name": "runtime_test",
+        "expectations": [
+            {
+                "expectation_type": "expect_column_values_to_not_be_null",
+                "kwargs": {"column": column},
+            }
+        ],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_load_suite_reparses_only_when_file_changes(tmp_path: Path) -> None:
+    runtime = ExpectationRuntime()
+    suite_path = tmp_path / "suite.json"
+    _write_suite(suite_path, "name")
+
+    first = runtime.load_suite(suite_path)
+    setup_seconds = runtime.setup_seconds
+    assert runtime.load_suite(suite_path) is first
+    assert runtime.setup_seconds == setup_seconds
+
+    _write_suite(suite_path, "email")
+    stat = suite_path.stat()
+    os.utime(suite_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = runtime.load_suite(suite_path)
+    assert reloaded is not first
+    assert reloaded.expectations[0].column == "email"
+
+
+def test_validate_reuses_one_context_across_batches(tmp_path: Path) -> None:
+    runtime = ExpectationRuntime()
+    suite_path = tmp_path / "suite.json"
+    _write_suite(suite_path, "name")
+    suite = runtime.load_suite(suite_path)
+
+    results = runtime.validate(
+        suite,
+        [pd.DataFrame({"name": ["a", "b"]}), pd.DataFrame({"name": ["c", None]})],
+    )
+
+    assert [result.success for result in results] == [True, False]
+    assert runtime.context() is runtime.context()
+    assert len(suite.expectations) == 1
+
+
+def test_validate_with_expectations_uses_shared_runtime() -> None:
+    frame = pd.DataFrame({"Organisation Name": ["Org"], "ID": [1], "Type": ["Flight School"]})
+
+    validate_with_expectations(
+        frame,
+        suite_descriptor="reachout_organisation.json",
+        source_file="test.xlsx#Organisation",
+    )
+    runtime = get_expectation_runtime()
+    setup_seconds = runtime.setup_seconds
+    validate_with_expectations(
+        frame,
+        suite_descriptor="reachout_organisation.json",
+        source_file="test.xlsx#Organisation",
+    )
+
+    assert runtime.setup_seconds == setup_seconds
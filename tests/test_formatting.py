@@ -10,6 +10,7 @@ from hotpass.formatting import (
     apply_excel_formatting,
     create_summary_sheet,
     export_to_multiple_formats,
+    write_formatted_workbook,
 )
 
 
@@ -304,3 +305,52 @@ def test_export_with_custom_format_config(tmp_path):
     )
 
     assert result["excel"].exists()
+
+
+def _styled_workbooks(tmp_path, df):
+    from openpyxl import load_workbook
+
+    summary_df = create_summary_sheet(df)
+    paths = {}
+    for engine in ("openpyxl", "xlsxwriter"):
+        paths[engine] = tmp_path / f"{engine}.xlsx"
+        write_formatted_workbook(paths[engine], df, summary_df=summary_df, engine=engine)
+    return {engine: load_workbook(path) for engine, path in paths.items()}
+
+
+def test_streaming_writer_matches_openpyxl_layout(tmp_path):
+    """The xlsxwriter path should write the same values, widths and sheet settings."""
+    pytest.importorskip("xlsxwriter")
+    df = pd.DataFrame(
+        {
+            "organization_name": ["Aero School", "Heli Ops", None],
+            "data_quality_score": [0.9, 0.5, 0.2],
+            "last_updated": [
+                pd.Timestamp("2024-01-01 10:00:00"),
+                pd.NaT,
+                pd.Timestamp("2024-03-01"),
+            ],
+        }
+    )
+
+    workbooks = _styled_workbooks(tmp_path, df)
+    baseline, streamed = workbooks["openpyxl"]["Data"], workbooks["xlsxwriter"]["Data"]
+
+    values = [[cell.value for cell in row] for row in baseline.iter_rows()]
+    assert [[cell.value for cell in row] for row in streamed.iter_rows()] == values
+    assert streamed.freeze_panes == baseline.freeze_panes == "A2"
+    assert streamed.auto_filter.ref == baseline.auto_filter.ref
+    for letter in ("A", "B", "C"):
+        assert streamed.column_dimensions[letter].width == pytest.approx(
+            baseline.column_dimensions[letter].width, abs=1
+        )
+    assert streamed["A1"].fill.fgColor.rgb.endswith("366092")
+    assert streamed["A1"].font.bold
+    assert sum(len(rule.rules) for rule in streamed.conditional_formatting) == 5
+    assert [[cell.value for cell in row] for row in workbooks["xlsxwriter"]["Summary"].iter_rows()]
+
+
+def test_write_formatted_workbook_rejects_unknown_engine(tmp_path):
+    """Unknown writers should be reported rather than silently ignored."""
+    with pytest.raises(ValueError, match="Unknown Excel writer"):
+        write_formatted_workbook(tmp_path / "out.xlsx", pd.DataFrame(), engine="calamine")
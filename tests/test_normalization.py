@@ -0,0 +1,81 @@
+"""Tests for the batch normalisation helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hotpass.normalization import (
+    clean_string,
+    clear_normalization_cache,
+    normalization_cache_info,
+    normalize_phone,
+    normalize_province,
+    normalize_series,
+    normalize_values,
+    slugify,
+)
+from tests.helpers.assertions import expect
+from tests.helpers.pytest_marks import parametrize
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    clear_normalization_cache()
+
+
+@parametrize(
+    "series",
+    [
+        pd.Series(["Gauteng", " gauteng ", None, np.nan, "KZN", "", 1, 1.0], dtype=object),
+        pd.Series(["Gauteng", "kzn", None, "kzn"], dtype="string"),
+        pd.Series(["Gauteng", "kzn", None, "kzn"], dtype="category"),
+        pd.Series([1.0, np.nan, 2.5, 1.0], index=[10, 11, 12, 13]),
+        pd.Series([], dtype=object),
+    ],
+)
+@parametrize("func", [slugify, normalize_province, clean_string])
+def test_normalize_series_matches_apply(series: pd.Series, func) -> None:
+    expected = series.astype(object).apply(func)
+    result = normalize_series(series, func)
+
+    expect(result.index.equals(series.index), "Index should be preserved")
+    expect(result.dtype == object, "Results should be an object column")
+    expect(
+        result.tolist() == expected.tolist(),
+        f"{func.__name__} should match apply for {series.dtype}",
+    )
+
+
+def test_normalize_values_evaluates_each_distinct_value_once() -> None:
+    calls: list[object] = []
+
+    def _record(value: object) -> object:
+        calls.append(value)
+        return clean_string(value)
+
+    result = normalize_values(_record, ["a", "a", 1, 1.0, "a", None, None])
+
+    expect(result == ["a", "a", "1", "1.0", "a", None, None], "Results should follow row order")
+    expect(calls == ["a", 1, 1.0, None], "1 and 1.0 should be normalised separately")
+
+
+def test_normalize_values_memo_persists_across_calls_and_keys_on_kwargs() -> None:
+    numbers = ["082 123 4567", "0821234567"]
+
+    first = normalize_values(normalize_phone, numbers, country_code="ZA")
+    second = normalize_values(normalize_phone, numbers, country_code="ZA")
+    info = normalization_cache_info()
+
+    expect(first == second, "Memoised results should be reused")
+    expect((info.hits, info.misses) == (2, 2), "Second call should be served by the memo")
+
+    normalize_values(normalize_phone, numbers, country_code="US")
+    expect(normalization_cache_info().misses == 4, "Keyword arguments should be part of the key")
+
+
+def test_normalize_values_handles_unhashable_cells() -> None:
+    result = normalize_values(lambda value: len(value), [["a", "b"], "abc"])
+
+    expect(result == [2, 3], "Unhashable values should be normalised directly")
@@ -49,6 +49,14 @@ class DummyTracer:
 class DummyMetrics:
     def __init__(self) -> None:
         self.records: list[str] = []
+        self.frame_conversion_count = 0
+
+    def record_frame_conversion(self, *, target: str, stage: str) -> None:
+        self.frame_conversion_count += 1
+        self.records.append(f"conversion:{stage}:{target}")
+
+    def record_export(self, *, output_format: str, seconds: float, bytes_written: int) -> None:
+        self.records.append(f"export:{output_format}")
 
 
 class StubStatusCode:
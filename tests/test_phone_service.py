@@ -0,0 +1,87 @@
+"""Tests for the batch phone parsing service."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import phonenumbers
+import polars as pl
+
+from hotpass.enrichment.validators import PhoneValidator, ValidationStatus
+from hotpass.transform import PhoneBatchService, normalize_phone
+from tests.helpers.assertions import expect
+
+
+def test_parse_many_returns_columnar_result_and_parses_each_number_once() -> None:
+    service = PhoneBatchService()
+
+    result = service.parse_many(["082 123 4567", None, "082 123 4567", "12", "   "], "ZA")
+
+    expect(result.height == 5, "One row should be returned per input value")
+    expect(
+        result["e164"].to_list() == ["+27821234567", None, "+27821234567", "+2712", None],
+        "E.164 values should follow the input order",
+    )
+    expect(result["valid"].to_list() == [True, None, True, False, None], "Validity per row")
+    expect(result["number_type"][0] == "MOBILE", "Number type should be resolved")
+    expect((service.hits, service.misses) == (0, 2), "Each distinct number parses once")
+
+
+def test_parse_records_parse_errors() -> None:
+    parsed = PhoneBatchService().parse("not a number", "ZA")
+
+    expect(parsed.e164 is None and not parsed.valid, "Unparseable input should be invalid")
+    expect(parsed.error is not None, "Parse errors should be recorded")
+
+
+def test_service_respects_max_entries() -> None:
+    service = PhoneBatchService(max_entries=2)
+
+    for number in ("0821234567", "0821234568", "0821234569"):
+        service.parse(number, "ZA")
+    service.parse("0821234567", "ZA")
+
+    expect(service.misses == 4, "The oldest entry should have been evicted")
+
+
+def test_disk_cache_round_trips_between_services(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache" / "phones.parquet"
+    first = PhoneBatchService(cache_path=cache_path)
+    expected = first.parse("0821234567", "ZA")
+    first.save()
+
+    second = PhoneBatchService(cache_path=cache_path)
+    cached = second.parse("0821234567", "ZA")
+
+    expect(cached == expected, "Cached entries should match the original parse")
+    expect((second.hits, second.misses) == (1, 0), "The disk cache should satisfy the lookup")
+
+
+def test_disk_cache_ignores_entries_from_other_phonenumbers_releases(tmp_path: Path) -> None:
+    cache_path = tmp_path / "phones.parquet"
+    service = PhoneBatchService(cache_path=cache_path)
+    service.parse("0821234567", "ZA")
+    service.save()
+    pl.read_parquet(cache_path).with_columns(
+        pl.lit("0.0.0").alias("phonenumbers_version")
+    ).write_parquet(cache_path)
+
+    reloaded = PhoneBatchService(cache_path=cache_path)
+    reloaded.parse("0821234567", "ZA")
+
+    expect(reloaded.misses == 1, f"Entries from other {phonenumbers.__name__} releases are stale")
+
+
+def test_normalisers_and_validators_share_parse_results() -> None:
+    service = PhoneBatchService()
+    validator = PhoneValidator(service)
+
+    result = validator.validate("+27821234567", country_code="ZA")
+
+    expect(result is not None and result.status is ValidationStatus.DELIVERABLE, "Valid number")
+    expect(result is not None and result.number_type == "MOBILE", "Type should be carried over")
+    expect(normalize_phone("082 123 4567") == "+27821234567", "normalize_phone should still work")
+    expect(
+        validator.validate("abc", country_code="ZA").reason == "parse_error:unknown",
+        "Parse failures should keep the historical reason",
+    )
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import polars as pl
 import pytest
 
 pytest.importorskip("frictionless")
@@ -170,12 +171,51 @@ def test_pipeline_exposes_performance_metrics(sample_data_dir: Path, tmp_path: P
     assert metrics["load_seconds"] >= 0.0
     assert metrics["rows_per_second"] > 0.0
     assert metrics["polars_transform_seconds"] >= 0.0
-    assert metrics["pandas_sort_seconds"] >= 0.0
+    assert "pandas_sort_seconds" not in metrics
     assert metrics["duckdb_sort_seconds"] >= 0.0
-    assert metrics["polars_sort_speedup"] >= 0.0
+    assert "polars_sort_speedup" not in metrics
+    assert 0.0 <= metrics["expectations_setup_seconds"] <= metrics["total_seconds"]
     assert result.quality_report.performance_metrics["total_seconds"] == metrics["total_seconds"]
 
 
+def test_pipeline_persists_phone_cache(sample_data_dir: Path, tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache" / "phones.parquet"
+    config = PipelineConfig(
+        input_dir=sample_data_dir,
+        output_path=tmp_path / "refined.xlsx",
+        pii_redaction=PIIRedactionConfig(enabled=False),
+        phone_cache_path=cache_path,
+    )
+
+    run_pipeline(config)
+
+    assert cache_path.exists()
+    assert "+27" in "".join(pl.read_parquet(cache_path)["e164"].drop_nulls().to_list())
+
+
+def test_pipeline_parallel_ingestion_matches_sequential(
+    sample_data_dir: Path, tmp_path: Path
+) -> None:
+    def _run(excel_options: ExcelReadOptions | None, name: str) -> PipelineResult:
+        config = PipelineConfig(
+            input_dir=sample_data_dir,
+            output_path=tmp_path / f"{name}.xlsx",
+            expectation_suite_name="default",
+            country_code="ZA",
+            excel_options=excel_options,
+            pii_redaction=PIIRedactionConfig(enabled=False),
+        )
+        return run_pipeline(config)
+
+    sequential = _run(None, "sequential")
+    parallel = _run(ExcelReadOptions(max_workers=2), "parallel")
+
+    pd.testing.assert_frame_equal(parallel.refined, sequential.refined)
+    load_seconds = parallel.performance_metrics["source_load_seconds"]
+    assert list(load_seconds) == list(sequential.performance_metrics["source_load_seconds"])
+    assert all(seconds > 0.0 for seconds in load_seconds.values())
+
+
 def test_pipeline_emits_progress_events(sample_data_dir: Path, tmp_path: Path) -> None:
     output_path = tmp_path / "refined.xlsx"
     events: list[tuple[str, dict[str, Any]]] = []
@@ -309,9 +349,8 @@ def test_aggregate_group_prioritises_reliable_and_recent_values() -> None:
     )
     assert aggregated["contact_primary_phone"] == "+27825550000"
     assert aggregated["contact_secondary_phones"] == "+27827777777;+27820001111"
-    aggregated_selection = aggregated["selection_provenance"]
-    assert isinstance(aggregated_selection, str)
-    provenance = json.loads(aggregated_selection)
+    provenance = aggregated["_provenance"]
+    assert isinstance(provenance, dict)
     assert provenance["website"]["source_dataset"] == "SACAA Cleaned"
     website_provenance = provenance["website"]
     phone_provenance = provenance["contact_primary_phone"]
@@ -343,7 +382,7 @@ def test_run_expectations_fallback_pass(monkeypatch: pytest.MonkeyPatch) -> None
         }
     )
 
-    summary = quality.run_expectations(df)
+    summary = quality.run_expectations(df, engine="ge")
 
     assert summary.success
     assert summary.failures == []
@@ -371,7 +410,7 @@ def test_run_expectations_fallback_failures(monkeypatch: pytest.MonkeyPatch) ->
         }
     )
 
-    summary = quality.run_expectations(df, email_mostly=0.9)
+    summary = quality.run_expectations(df, email_mostly=0.9, engine="ge")
 
     assert not summary.success
     assert any("contact_primary_email format" in failure for failure in summary.failures)
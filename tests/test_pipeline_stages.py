@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pytest
@@ -78,7 +77,8 @@ def test_aggregate_records_prioritises_high_quality_data(
     assert aero["contact_primary_email"] == "jane.doe@aero.example"
     assert "ops@aero.example" in str(aero["contact_secondary_emails"])
 
-    provenance = json.loads(str(aero["selection_provenance"]))
+    assert result.provenance is not None
+    provenance = result.provenance.for_slug(aero["organization_slug"])
     assert provenance["contact_primary_email"]["source_dataset"] == "SACAA Cleaned"
 
     assert result.source_breakdown == {
@@ -1,6 +1,7 @@
 """Tests for quality validation functionality."""
 
 import pandas as pd
+import polars as pl
 import pytest
 
 pytest.importorskip("frictionless")
@@ -810,3 +811,85 @@ def test_run_expectations_ge_with_boundary_quality_scores():
 
     result2 = run_expectations(df_invalid)
     assert result2.success is False
+
+
+def _mixed_quality_frame() -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "organization_name": ["Org A", None, "Org C"],
+            "organization_slug": ["org-a", "org-b", "org-c"],
+            "country": ["South Africa", "Namibia", "South Africa"],
+            "data_quality_score": [0.8, 1.4, 0.6],
+            "contact_primary_email": ["invalid", " ", "ops@org-c.example"],
+            "contact_primary_phone": ["+27123456789", "+27987654321", "0123"],
+            "website": ["https://org-a.example", None, "https://org-c.example"],
+        }
+    )
+    return _with_validation_defaults(df)
+
+
+def test_native_engine_reports_great_expectations_messages():
+    """Native failures use the Great Expectations message format and samples."""
+    df = _mixed_quality_frame()
+    # Great Expectations samples the missing name as the pandas column holds it:
+    # None in an object column, NaN under pandas' string dtype.
+    missing = df["organization_name"].iloc[1]
+
+    result = run_expectations(df, email_mostly=0.9, engine="native")
+
+    assert result.success is False
+    assert result.failures == [
+        f"expect_column_values_to_not_be_null (organization_name): unexpected [{missing!r}]",
+        "expect_column_values_to_be_between (data_quality_score): unexpected [1.4]",
+        "expect_column_values_to_match_regex (contact_primary_email): unexpected ['invalid']",
+        "expect_column_values_to_match_regex (contact_primary_phone): unexpected ['0123']",
+        "expect_column_values_to_be_in_set (country): unexpected ['Namibia']",
+    ]
+
+
+def test_native_engine_accepts_polars_frames():
+    frame = pl.from_pandas(_mixed_quality_frame())
+
+    native = run_expectations(frame, engine="native")
+
+    assert native == run_expectations(frame.to_pandas(), engine="native")
+
+
+def test_native_engine_reports_missing_columns():
+    df = _mixed_quality_frame().drop(columns=["contact_verification_score_avg"])
+
+    result = run_expectations(df, engine="native")
+
+    missing = "expect_column_values_to_be_between (contact_verification_score_avg)"
+    assert missing in result.failures
+
+
+def test_native_engine_range_checks_object_columns():
+    df = _mixed_quality_frame().iloc[[0]].assign(organization_name="Org A")
+    df["data_quality_score"] = 0.5
+    df["contact_primary_email"] = "ops@org-a.example"
+
+    passing = run_expectations(df, engine="native")
+    df["contact_phone_confidence_avg"] = pd.Series(["high"], dtype=object, index=df.index)
+    failing = run_expectations(df, engine="native")
+
+    assert passing.success is True
+    assert failing.failures == [
+        "expect_column_values_to_be_between (contact_phone_confidence_avg): unexpected ['high']"
+    ]
+
+
+def test_run_expectations_rejects_unknown_engine():
+    with pytest.raises(ValueError, match="engine"):
+        run_expectations(_mixed_quality_frame(), engine="spark")
+
+
+@pytest.mark.skipif(not HAS_GE, reason="Great Expectations not available")
+@pytest.mark.parametrize("email_mostly", [0.3, 0.9])
+def test_native_engine_matches_great_expectations(email_mostly: float):
+    df = _mixed_quality_frame()
+
+    native = run_expectations(df, email_mostly=email_mostly, engine="native")
+    ge = run_expectations(df, email_mostly=email_mostly, engine="ge")
+
+    assert native == ge
@@ -183,6 +183,21 @@ def validate_profile_structure(profile: dict[str, Any], profile_name: str) -> li
             if burst is not None and (not isinstance(burst, int) or burst <= 0):
                 errors.append("research_rate_limit.burst must be a positive integer when provided")
 
+    survivorship = profile.get("survivorship")
+    if survivorship is not None:
+        if not isinstance(survivorship, dict):
+            errors.append("survivorship must be a mapping when present")
+        else:
+            priorities = survivorship.get("source_priorities")
+            if priorities is not None and not isinstance(priorities, dict):
+                errors.append("survivorship.source_priorities must be a mapping")
+            fields = survivorship.get("fields")
+            if fields is not None and (
+                not isinstance(fields, dict)
+                or not all(isinstance(rules, dict) for rules in fields.values())
+            ):
+                errors.append("survivorship.fields must map field names to priority mappings")
+
     return errors
 
 
@@ -266,6 +281,7 @@ def main() -> int:
                 "authority_sources",
                 "research_backfill",
                 "research_rate_limit",
+                "survivorship",
             ],
             "ingest": {
                 "required": ["sources", "chunk_size"],
@@ -293,6 +309,10 @@ def main() -> int:
                 "min_interval_seconds": "float >= 0",
                 "burst": "int > 0",
             },
+            "survivorship": {
+                "source_priorities": "dict[str, int]",
+                "fields": "dict[str, dict[str, int]]",
+            },
         }
         print(json.dumps(schema, indent=2))
         return 0